@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the dice and build models.
+
+Run with ``uv run python -m benchmarks.run``; see ``benchmarks/README.md``.
+"""
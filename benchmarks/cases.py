@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmarked operations.
+
+Each case is a setup function registered with ``@benchmark``. Setup receives
+the data directory, does any loading that shouldn't be timed, and returns the
+zero-argument operation to time.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, Final, List
+
+from scripts.models.character import CharacterData, CommonPower
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.constants import Season
+from scripts.models.dice_probabilities import get_combined_stats
+from scripts.models.play_strategy import PlayStrategyAnalyzer
+
+# Checked-in character.json files that validate against CharacterData
+# (4 characters per season, locations flattened to their printed text)
+CHARACTER_POOL_FIXTURE_DIR: Final[Path] = Path(__file__).parent / "fixtures" / "character_pool"
+
+Operation = Callable[[], object]
+Setup = Callable[[Path], Operation]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function under a name."""
+
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def load_power_data(data_dir: Path) -> Dict[str, CommonPower]:
+    """Load common powers keyed by name."""
+    with open(data_dir / "common_powers.json", encoding="utf-8") as f:
+        return {entry["name"]: CommonPower.from_dict(entry) for entry in json.load(f)}
+
+
+def sample_build(data_dir: Path) -> CharacterBuild:
+    """A build with two dice-affecting common powers at level 2."""
+    character = CharacterData(name="Benchmark", common_powers=["Marksman", "Toughness"])
+    return CharacterBuild.from_character_data(
+        character,
+        special_power_level=2,
+        common_power_1_level=2,
+        common_power_2_level=2,
+        power_data=load_power_data(data_dir),
+    )
+
+
+@benchmark("get_combined_stats")
+def combined_stats(data_dir: Path) -> Operation:
+    """Combined statistics for a typical pool."""
+    return lambda: get_combined_stats(4, 2)
+
+
+@benchmark("character_build_statistics")
+def character_build_statistics(data_dir: Path) -> Operation:
+    """Full statistics of one build (recomputed on every access)."""
+    build = sample_build(data_dir)
+    return lambda: build.statistics
+
+
+@benchmark("character_pool_from_seasons")
+def character_pool_from_seasons(data_dir: Path) -> Operation:
+    """Cold load of every season of the fixture pool without the snapshot cache."""
+    seasons: List[Season] = list(Season)
+    power_data = load_power_data(data_dir)
+    pool = CharacterPool.from_seasons(seasons, CHARACTER_POOL_FIXTURE_DIR, power_data)
+    if not pool.characters:
+        raise ValueError(f"No characters loaded from {CHARACTER_POOL_FIXTURE_DIR}")
+    return lambda: CharacterPool.from_seasons(seasons, CHARACTER_POOL_FIXTURE_DIR, power_data)
+
+
+@benchmark("play_strategy_analyze")
+def play_strategy_analyze(data_dir: Path) -> Operation:
+    """Strategy analysis of one build, including its upgrade path."""
+    build = sample_build(data_dir)
+    analyzer = PlayStrategyAnalyzer(power_data=load_power_data(data_dir))
+    return lambda: analyzer.analyze(build)
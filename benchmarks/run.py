@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner.
+
+Times every registered benchmark with warmup and repeated runs, prints
+percentiles, and optionally saves a baseline or fails on regressions against one.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import click
+    from rich.console import Console
+    from rich.table import Table
+except ImportError as e:
+    print(
+        f"Error: Missing required dependency: {e.name}\n\n"
+        "To run the benchmarks, use one of:\n"
+        "  1. uv run python -m benchmarks.run [options]\n"
+        "  2. source .venv/bin/activate && python -m benchmarks.run [options]\n",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.timing import (
+    DEFAULT_MIN_RUN_SECONDS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_REPEAT_RUNS,
+    DEFAULT_WARMUP_RUNS,
+    find_regressions,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+console = Console()
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_DATA_DIR = PROJECT_ROOT / "data"
+DEFAULT_BASELINE = PROJECT_ROOT / ".generated" / "benchmarks" / "baseline.json"
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1.0:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+@click.command()
+@click.option(
+    "--benchmark",
+    "names",
+    multiple=True,
+    type=click.Choice(sorted(BENCHMARKS)),
+    help="Benchmark to run (repeatable; default: all)",
+)
+@click.option("--warmup", default=DEFAULT_WARMUP_RUNS, help="Discarded warmup runs")
+@click.option("--repeat", default=DEFAULT_REPEAT_RUNS, help="Measured runs")
+@click.option(
+    "--min-run-time",
+    default=DEFAULT_MIN_RUN_SECONDS,
+    help="Minimum seconds per run when calibrating calls per run",
+)
+@click.option(
+    "--data-dir",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_DATA_DIR,
+    help="Data directory used by the benchmarks",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_BASELINE,
+    help="Baseline JSON file",
+)
+@click.option("--save-baseline", "save", is_flag=True, help="Save this run as the baseline")
+@click.option(
+    "--threshold",
+    default=DEFAULT_REGRESSION_THRESHOLD,
+    help="Allowed median slowdown vs baseline before failing (0.25 = 25%)",
+)
+def main(
+    names: Tuple[str, ...],
+    warmup: int,
+    repeat: int,
+    min_run_time: float,
+    data_dir: Path,
+    baseline: Path,
+    save: bool,
+    threshold: float,
+):
+    """Run the model benchmarks."""
+    selected = list(names) or sorted(BENCHMARKS)
+    saved: Optional[dict] = None
+    if not save and baseline.exists():
+        saved = load_baseline(baseline)
+
+    results = []
+    for name in selected:
+        operation = BENCHMARKS[name](data_dir)
+        with console.status(f"Running {name}..."):
+            results.append(measure(name, operation, warmup, repeat, min_run_time))
+
+    table = Table(title="Benchmarks (per call)")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Calls/run", justify="right")
+    for column in ("min", "p50", "p90", "p99"):
+        table.add_column(column, justify="right")
+    if saved is not None:
+        table.add_column("vs baseline p50", justify="right")
+    for result in results:
+        row = [
+            result.name,
+            str(result.number),
+            format_seconds(result.min),
+            format_seconds(result.p50),
+            format_seconds(result.p90),
+            format_seconds(result.p99),
+        ]
+        if saved is not None:
+            previous = saved.get(result.name)
+            row.append(f"{result.p50 / previous['p50']:.2f}x" if previous else "-")
+        table.add_row(*row)
+    console.print(table)
+
+    if save:
+        path = save_baseline(results, baseline)
+        console.print(f"[green]Baseline saved to {path}[/green]")
+        return
+
+    if saved is None:
+        console.print(f"[yellow]No baseline at {baseline}; run with --save-baseline[/yellow]")
+        return
+
+    regressions = find_regressions(results, saved, threshold)
+    for regression in regressions:
+        console.print(
+            f"[red]Regression: {regression.name} p50 {format_seconds(regression.current)} "
+            f"vs {format_seconds(regression.baseline)} ({regression.ratio:.2f}x)[/red]"
+        )
+    if regressions:
+        sys.exit(1)
+    console.print(f"[green]No regressions beyond {threshold:.0%}[/green]")
+
+
+if __name__ == "__main__":
+    main()
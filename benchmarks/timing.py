@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Timing, percentile reporting and baseline comparison for benchmarks.
+
+A benchmark is a zero-argument callable. Each measured *run* calls it
+``number`` times, where ``number`` is calibrated so one run lasts at least
+``min_run_seconds``; warmup runs are discarded. Per-call times of the runs are
+summarized as percentiles, and the median is compared against a saved baseline.
+"""
+
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Final, List, Optional
+
+import numpy as np
+
+DEFAULT_WARMUP_RUNS: Final[int] = 3
+DEFAULT_REPEAT_RUNS: Final[int] = 20
+DEFAULT_MIN_RUN_SECONDS: Final[float] = 0.05
+DEFAULT_REGRESSION_THRESHOLD: Final[float] = 0.25  # Fail when the median is 25% slower
+PERCENTILES: Final[tuple] = (50, 90, 99)
+BASELINE_VERSION: Final[int] = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Per-call timings of one benchmark (seconds)."""
+
+    name: str
+    number: int
+    runs: List[float] = field(repr=False)
+    min: float = 0.0
+    mean: float = 0.0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+
+    @classmethod
+    def from_runs(cls, name: str, number: int, runs: List[float]) -> "BenchmarkResult":
+        """Summarize per-call times of each run."""
+        values = np.asarray(runs)
+        p50, p90, p99 = np.percentile(values, PERCENTILES)
+        return cls(
+            name=name,
+            number=number,
+            runs=list(runs),
+            min=float(values.min()),
+            mean=float(values.mean()),
+            p50=float(p50),
+            p90=float(p90),
+            p99=float(p99),
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serializable summary (without raw runs)."""
+        summary = asdict(self)
+        summary.pop("runs")
+        return summary
+
+
+@dataclass
+class Regression:
+    """A benchmark whose median got slower than the baseline allows."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median divided by baseline median."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def calibrate(func: Callable[[], object], min_run_seconds: float) -> int:
+    """Find how many calls make one run last at least ``min_run_seconds``."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_run_seconds:
+            return number
+        # Aim straight for the target, at least doubling
+        number = max(number * 2, int(number * min_run_seconds / max(elapsed, 1e-9)) + 1)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    warmup: int = DEFAULT_WARMUP_RUNS,
+    repeat: int = DEFAULT_REPEAT_RUNS,
+    min_run_seconds: float = DEFAULT_MIN_RUN_SECONDS,
+    number: Optional[int] = None,
+) -> BenchmarkResult:
+    """Time a callable.
+
+    Args:
+        name: Benchmark name
+        func: Operation to time
+        warmup: Runs executed and discarded before measuring
+        repeat: Measured runs
+        min_run_seconds: Minimum duration of one run when calibrating
+        number: Calls per run (default: calibrated)
+
+    Returns:
+        BenchmarkResult with per-call times
+    """
+    if repeat < 1:
+        raise ValueError(f"Repeat must be positive: {repeat}")
+    if number is None:
+        number = calibrate(func, min_run_seconds)
+
+    runs = []
+    for run in range(warmup + repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if run >= warmup:
+            runs.append(elapsed / number)
+    return BenchmarkResult.from_runs(name, number, runs)
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[Regression]:
+    """Compare medians against a baseline.
+
+    Benchmarks missing from the baseline are skipped.
+
+    Args:
+        results: Current results
+        baseline: Benchmark name -> saved summary (needs ``p50``)
+        threshold: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        Benchmarks whose median exceeds baseline * (1 + threshold)
+    """
+    regressions = []
+    for result in results:
+        saved = baseline.get(result.name)
+        if saved is None:
+            continue
+        if result.p50 > saved["p50"] * (1.0 + threshold):
+            regressions.append(Regression(result.name, saved["p50"], result.p50))
+    return regressions
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path) -> Path:
+    """Write result summaries to a baseline JSON file.
+
+    Existing entries for benchmarks not in ``results`` are kept.
+    """
+    benchmarks = load_baseline(path) if path.exists() else {}
+    benchmarks.update({result.name: result.to_dict() for result in results})
+    payload = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": benchmarks,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    """Read benchmark summaries from a baseline JSON file."""
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}: {payload.get('version')}")
+    return payload["benchmarks"]
@@ -27,3 +27,15 @@ test-watch:
 	@echo "Running tests in watch mode..."
 	uv run pytest-watch scripts/tests/ -v
 
+
+.PHONY: bench bench-baseline
+
+# Run model benchmarks and fail on regressions against the saved baseline
+bench:
+	@echo "Running benchmarks..."
+	uv run python -m benchmarks.run
+
+# Save the current benchmark timings as the baseline
+bench-baseline:
+	@echo "Saving benchmark baseline..."
+	uv run python -m benchmarks.run --save-baseline
@@ -63,6 +63,7 @@ try:
         WORD_PROXIMITY_THRESHOLD_FAR,
     )
     from scripts.core.parsing.ocr_engines import OCRStrategy, get_all_strategies
+    from scripts.core.parsing.strategy_executor import StrategyExecutor
     from scripts.models.character import BackCardData, CharacterData, FrontCardData
     from scripts.models.constants import FileExtension, Filename
 except ImportError as e:
@@ -573,7 +574,13 @@ def benchmark_strategy(
     default=True,
     help="Save results to .generated/benchmark/ directory (default: --save-results)",
 )
-def main(character: str, season: str, top: int, save_results: bool):
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Worker processes for running strategies (0 = CPU count, default: 1)",
+)
+def main(character: str, season: str, top: int, save_results: bool, workers: int):
     """Benchmark OCR strategies for character data extraction."""
 
     # Find character directory
@@ -636,10 +643,14 @@ def main(character: str, season: str, top: int, save_results: bool):
     ) as progress:
         task = progress.add_task("Testing strategies...", total=len(strategies))
 
-        for strategy in strategies:
-            progress.update(task, description=f"Testing: {strategy.name}")
-            result = benchmark_strategy(strategy, front_image, back_image, ground_truth)
+        # Results arrive in strategy order whatever the number of workers
+        executor = StrategyExecutor(workers or None)
+        names = [strategy.name for strategy in strategies]
+        for result in executor.map(
+            benchmark_strategy, names, front_image, back_image, ground_truth
+        ):
             results.append(result)
+            progress.update(task, description=f"Tested: {result.strategy_name}")
             progress.advance(task)
 
     # Sort by overall score
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fast-path dice statistics types against the pydantic models.
+
+Times one "query" (build the stats for a dice pool and read every derived
+value) through ``CombinedRollStats``/``PowerImpact`` and through their
+``dice_fast_stats`` counterparts, uncached and cached.
+"""
+
+import sys
+import time
+from typing import Callable
+
+try:
+    import click
+    from rich.console import Console
+    from rich.table import Table
+except ImportError as e:
+    print(
+        f"Error: Missing required dependency: {e.name}\n\n"
+        "Run with: uv run python scripts/cli/tools/benchmark_dice_stats.py [options]\n",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+from scripts.models.dice_fast_stats import (
+    FastCombinedRollStats,
+    FastPowerImpact,
+    get_fast_combined_stats,
+    get_fast_power_impact,
+    get_fast_single_die_stats,
+)
+from scripts.models.dice_probabilities import (
+    CombinedRollStats,
+    analyze_power_dice_impact,
+    get_combined_stats,
+    get_single_die_stats,
+)
+from scripts.models.game_mechanics import DiceType
+
+console = Console()
+
+
+def _read_combined(stats) -> float:
+    """Read every derived value of combined stats (as an inner loop would)."""
+    return (
+        stats.expected_successes
+        + stats.expected_tentacles
+        + stats.expected_elder_signs
+        + stats.prob_at_least_1_success
+        + stats.prob_at_least_1_tentacle
+        + stats.prob_at_least_1_elder
+        + stats.max_possible_successes
+    )
+
+
+def _time_per_query(query: Callable[[int], object], queries: int) -> float:
+    """Average microseconds per query."""
+    start = time.perf_counter()
+    for i in range(queries):
+        query(i)
+    return (time.perf_counter() - start) / queries * 1e6
+
+
+@click.command()
+@click.option("--queries", default=20000, show_default=True, help="Queries per measurement")
+def main(queries: int):
+    """Compare per-query cost of pydantic and fast-path dice statistics."""
+    black_model = get_single_die_stats(DiceType.BLACK)
+    green_model = get_single_die_stats(DiceType.GREEN)
+    black_fast = get_fast_single_die_stats(DiceType.BLACK)
+    green_fast = get_fast_single_die_stats(DiceType.GREEN)
+
+    cases = [
+        (
+            "Combined stats (construct + read)",
+            lambda i: _read_combined(
+                CombinedRollStats.from_counts(3 + i % 4, i % 5, black_model, green_model)
+            ),
+            lambda i: _read_combined(
+                FastCombinedRollStats.from_counts(3 + i % 4, i % 5, black_fast, green_fast)
+            ),
+        ),
+        (
+            "Combined stats (shared calculator / cache)",
+            lambda i: _read_combined(get_combined_stats(3 + i % 4, i % 5)),
+            lambda i: _read_combined(get_fast_combined_stats(3 + i % 4, i % 5)),
+        ),
+        (
+            "Power impact",
+            lambda i: (
+                analyze_power_dice_impact(
+                    3, i % 3, 1 + i % 2
+                ).improvement.expected_successes_increase
+            ),
+            lambda i: get_fast_power_impact(3, i % 3, 1 + i % 2).expected_successes_increase,
+        ),
+        (
+            "Power impact (construct from stats)",
+            lambda i: analyze_power_dice_impact(3, 0, 2).improvement.is_significant_improvement,
+            lambda i: (
+                FastPowerImpact.from_stats(
+                    get_fast_combined_stats(3, 0), get_fast_combined_stats(3, 2)
+                ).is_significant_improvement
+            ),
+        ),
+    ]
+
+    table = Table(title=f"Dice statistics per-query cost ({queries} queries)")
+    table.add_column("Query", style="cyan")
+    table.add_column("pydantic (µs)", justify="right")
+    table.add_column("fast path (µs)", justify="right")
+    table.add_column("Speedup", justify="right", style="green")
+
+    for name, model_query, fast_query in cases:
+        model_us = _time_per_query(model_query, queries)
+        fast_us = _time_per_query(fast_query, queries)
+        table.add_row(name, f"{model_us:.2f}", f"{fast_us:.2f}", f"{model_us / fast_us:.1f}x")
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed dice outcome table.
+
+Writes the exact joint outcome distribution for every (black, green) dice pool
+up to the given maximum into a versioned, memory-mappable ``.npy`` file. The
+table is keyed on the dice face definitions, so rerunning after editing
+``game_mechanics.py`` replaces the stale table.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+try:
+    import click
+    from rich.console import Console
+except ImportError as e:
+    print(
+        f"Error: Missing required dependency: {e.name}\n\n"
+        "Run with: uv run python scripts/cli/tools/build_dice_table.py [options]\n",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+from scripts.models.dice_outcome_table import (
+    DEFAULT_MAX_BLACK_DICE,
+    DEFAULT_MAX_GREEN_DICE,
+    DEFAULT_TABLE_DIR,
+    build_outcome_table,
+    dice_faces_fingerprint,
+)
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--max-black",
+    default=DEFAULT_MAX_BLACK_DICE,
+    show_default=True,
+    help="Largest black dice count to precompute",
+)
+@click.option(
+    "--max-green",
+    default=DEFAULT_MAX_GREEN_DICE,
+    show_default=True,
+    help="Largest green dice count to precompute",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_TABLE_DIR,
+    show_default=True,
+    help="Directory to write the table to",
+)
+def main(max_black: int, max_green: int, output_dir: Path):
+    """Precompute dice outcome distributions for every pool up to MAX_BLACK x MAX_GREEN."""
+    console.print("[bold cyan]Building Dice Outcome Table[/bold cyan]")
+    console.print(f"Face fingerprint: {dice_faces_fingerprint()[:16]}")
+
+    start = time.perf_counter()
+    path = build_outcome_table(max_black, max_green, output_dir)
+    elapsed = time.perf_counter() - start
+
+    size_mb = path.stat().st_size / (1024 * 1024)
+    console.print(
+        f"[green]✓ {(max_black + 1) * (max_green + 1)} pools "
+        f"({max_black} black x {max_green} green) in {elapsed:.2f}s[/green]"
+    )
+    console.print(f"[dim]Output: {path} ({size_mb:.1f} MB)[/dim]")
+
+
+if __name__ == "__main__":
+    main()
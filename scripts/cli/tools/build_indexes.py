@@ -6,6 +6,8 @@ Generates:
 - powers.json - Maps powers to character IDs
 - locations.json - Maps locations (city/administrative_division/country/region) to character IDs
 - characters.json - Full character data array (optional, for detailed lookups)
+- stats.json - Columnar CharacterStatistics for every character and level combination,
+  plus the elder sign conversion cap per row (0 = none, null = any number)
 
 These indexes enable O(1) lookups for search functionality.
 """
@@ -24,6 +26,13 @@ except ImportError:
     sys.exit(1)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.models.build_statistics import compute_pool_statistics  # noqa: E402
+from scripts.models.character_build import CharacterBuild  # noqa: E402
+from scripts.models.character_pool import CharacterPool  # noqa: E402
+
 DATA_DIR = PROJECT_ROOT / "data"
 INDEXES_DIR = DATA_DIR / "indexes"
 
@@ -168,6 +177,38 @@ def build_seasons_index(characters: List[Dict[str, Any]]) -> Dict[str, List[str]
     return {season: sorted(list(set(char_ids))) for season, char_ids in seasons_index.items()}
 
 
+def build_stats_index(characters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a columnar statistics index for every character and level combination.
+
+    All characters are computed in one vectorized batch. Row
+    ``character * 64 + combination`` holds the statistics of ``characters[character]``
+    at ``levels[combination]`` (special, common 1, common 2 level). Characters are
+    sorted by (season, id) so the index doesn't depend on filesystem order.
+    """
+
+    def character_id(char: Dict[str, Any]) -> str:
+        return str(char.get("id") or char.get("name", "").lower().replace(" ", "-"))
+
+    characters = sorted(characters, key=lambda char: (char.get("season") or "", character_id(char)))
+    builds = []
+    for char in characters:
+        common_powers = [power for power in char.get("common_powers", []) if power]
+        builds.append(
+            CharacterBuild(
+                character_name=char.get("name") or char["id"],
+                common_power_1_name=common_powers[0] if common_powers else None,
+                common_power_2_name=common_powers[1] if len(common_powers) > 1 else None,
+            )
+        )
+    pool = CharacterPool(characters=builds, data_dir=DATA_DIR)
+    table = compute_pool_statistics(pool)
+
+    index = table.to_columnar([character_id(char) for char in characters])
+    for entry, char in zip(index["characters"], characters):
+        entry["season"] = char.get("season")
+    return index
+
+
 def main():
     """Build all inverted index files."""
     console.print("[bold cyan]Building Inverted Indexes[/bold cyan]")
@@ -196,7 +237,7 @@ def main():
         TaskProgressColumn(),
         console=console,
     ) as progress:
-        task = progress.add_task("Building indexes...", total=4)
+        task = progress.add_task("Building indexes...", total=5)
 
         # Build powers index
         progress.update(task, description="Building powers index...")
@@ -237,6 +278,19 @@ def main():
         console.print(f"  [green]✓[/green] characters.json: {len(characters)} characters")
         progress.update(task, advance=1)
 
+        # Build columnar statistics index
+        progress.update(task, description="Building statistics index...")
+        stats_index = build_stats_index(characters)
+        stats_file = INDEXES_DIR / "stats.json"
+        with open(stats_file, "w", encoding="utf-8") as f:
+            json.dump(stats_index, f, separators=(",", ":"), ensure_ascii=False)
+        console.print(
+            f"  [green]✓[/green] stats.json: {len(stats_index['characters'])} characters x "
+            f"{stats_index['rows_per_character']} level combinations, "
+            f"{len(stats_index['columns'])} metrics"
+        )
+        progress.update(task, advance=1)
+
     console.print("\n[green]✓ All indexes built successfully![/green]")
     console.print(f"[dim]Output directory: {INDEXES_DIR}[/dim]")
 
@@ -3,15 +3,21 @@
 Power Combination Analysis Script
 
 Demonstrates how to combine multiple powers and calculate their combined effects.
+
+With ``--matrix`` it instead writes P(>= k successes) and P(>= k tentacles) for
+a grid of dice pools, with no power and with each selected power, as CSV/JSON.
 """
 
+import csv
+import io
 import json
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 try:
     import click
+    import numpy as np
     from rich.console import Console
     from rich.table import Table
 except ImportError as e:
@@ -26,16 +32,20 @@ except ImportError as e:
     sys.exit(1)
 
 from scripts.models.character import CommonPower as CommonPowerModel
+from scripts.models.dice_outcome_table import load_outcome_table
 from scripts.models.power_combination import (
     PowerCombination,
     PowerCombinationCalculator,
+    PowerEffect,
     create_power_effect_from_level,
 )
 
 console = Console()
 
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
 COMMON_POWERS_FILE = DATA_DIR / "common_powers.json"
+MATRIX_FORMATS = ("csv", "json")
+BASE_CONFIGURATION_NAME = "Base"
 
 
 def load_common_powers() -> List[CommonPowerModel]:
@@ -50,6 +60,211 @@ def load_common_powers() -> List[CommonPowerModel]:
     return [CommonPowerModel.from_dict(power_dict) for power_dict in data]
 
 
+def parse_power_spec(
+    power_spec: str, common_powers: List[CommonPowerModel]
+) -> Optional[PowerEffect]:
+    """Parse a 'PowerName:Level' specification into a power effect.
+
+    Prints an error and returns None if the specification is invalid.
+    """
+    if ":" not in power_spec:
+        console.print(f"[red]Error: Invalid power specification: {power_spec}[/red]")
+        console.print("Format: 'PowerName:Level' (e.g., 'Marksman:2')")
+        return None
+
+    power_name, level_str = power_spec.split(":", 1)
+    try:
+        level = int(level_str)
+    except ValueError:
+        console.print(f"[red]Error: Invalid level: {level_str}[/red]")
+        return None
+
+    # Find power
+    power_model = None
+    for p in common_powers:
+        if p.name == power_name:
+            power_model = p
+            break
+
+    if power_model is None:
+        available = ", ".join(p.name for p in common_powers)
+        console.print(f"[red]Error: Power '{power_name}' not found[/red]")
+        console.print(f"Available powers: {available}")
+        return None
+
+    # Find level
+    level_data = None
+    for level_item in power_model.levels:
+        if level_item.level == level:
+            level_data = level_item
+            break
+
+    if level_data is None:
+        available_levels = ", ".join(str(level_item.level) for level_item in power_model.levels)
+        console.print(f"[red]Error: Power '{power_name}' has no level {level}[/red]")
+        console.print(f"Available levels: {available_levels}")
+        return None
+
+    # Create effect
+    return create_power_effect_from_level(power_name, level_data)
+
+
+def build_threshold_matrix(
+    effects: List[PowerEffect],
+    black_counts: List[int],
+    green_counts: List[int],
+    elder_signs_as_successes: bool = False,
+) -> List[Dict[str, object]]:
+    """Compute threshold probabilities for every (configuration, black, green) pool.
+
+    Configurations are the base pool and the base pool with each power applied:
+    its dice are added and its own elder sign conversion (capped as the power
+    states) counts toward successes. Rerolls aren't modeled here; each row
+    reports the power's rerolls so they can be read alongside it. Each
+    configuration's grid is looked up from the outcome table in one pass.
+
+    Args:
+        effects: Powers to evaluate one at a time
+        black_counts: Base black dice counts of the grid
+        green_counts: Base green dice counts of the grid
+        elder_signs_as_successes: Count every elder sign as a success in the base
+            configuration
+
+    Returns:
+        One record per pool with ``p_successes_ge_k`` and ``p_tentacles_ge_k`` columns
+    """
+    # (name, level, added black, added green, elder sign cap, rerolls)
+    configurations: List[Tuple[str, int, int, int, Optional[int], int]] = [
+        (BASE_CONFIGURATION_NAME, 0, 0, 0, None if elder_signs_as_successes else 0, 0)
+    ]
+    for effect in effects:
+        added = PowerCombination(base_black_dice=0, base_green_dice=0, effects=[effect])
+        configurations.append(
+            (
+                effect.power_name,
+                effect.level,
+                added.total_black_dice,
+                added.total_green_dice,
+                added.elder_sign_conversion,
+                added.total_rerolls,
+            )
+        )
+
+    black_offsets = np.array([config[2] for config in configurations])
+    green_offsets = np.array([config[3] for config in configurations])
+    # (configurations, black, green) grids of actual dice rolled
+    black = np.asarray(black_counts)[None, :, None] + black_offsets[:, None, None]
+    green = np.asarray(green_counts)[None, None, :] + green_offsets[:, None, None]
+    black, green = np.broadcast_arrays(black, green)
+
+    table = load_outcome_table(int(black.max()), int(green.max()))
+    if table is None:
+        raise RuntimeError("Could not load or build the dice outcome table")
+    grids = [
+        table.threshold_matrix(black[c], green[c], config[4])
+        for c, config in enumerate(configurations)
+    ]
+    successes = _stack_thresholds([grid[0] for grid in grids])
+    tentacles = _stack_thresholds([grid[1] for grid in grids])
+
+    # Drop thresholds no pool in the grid can reach
+    success_columns = int(np.flatnonzero(successes.reshape(-1, successes.shape[-1]).max(0))[-1])
+    tentacle_columns = int(np.flatnonzero(tentacles.reshape(-1, tentacles.shape[-1]).max(0))[-1])
+
+    records: List[Dict[str, object]] = []
+    for c, (name, level, _, _, elder_cap, rerolls) in enumerate(configurations):
+        for i, base_black in enumerate(black_counts):
+            for j, base_green in enumerate(green_counts):
+                record: Dict[str, object] = {
+                    "power": name,
+                    "level": level,
+                    "black_dice": base_black,
+                    "green_dice": base_green,
+                    "total_black_dice": int(black[c, i, j]),
+                    "total_green_dice": int(green[c, i, j]),
+                    "elder_signs_as_successes": "any" if elder_cap is None else elder_cap,
+                    "rerolls": rerolls,
+                }
+                for k in range(1, success_columns + 1):
+                    record[f"p_successes_ge_{k}"] = float(successes[c, i, j, k])
+                for k in range(1, tentacle_columns + 1):
+                    record[f"p_tentacles_ge_{k}"] = float(tentacles[c, i, j, k])
+                records.append(record)
+    return records
+
+
+def _stack_thresholds(grids: List[np.ndarray]) -> np.ndarray:
+    """Stack per-configuration threshold grids, zero-padding unreachable thresholds."""
+    width = max(grid.shape[-1] for grid in grids)
+    padded = [
+        np.pad(grid, [(0, 0)] * (grid.ndim - 1) + [(0, width - grid.shape[-1])]) for grid in grids
+    ]
+    return np.stack(padded)
+
+
+def format_threshold_matrix(
+    records: List[Dict[str, object]], output_format: str, metadata: Dict[str, object]
+) -> str:
+    """Serialize threshold matrix records as CSV or JSON."""
+    if output_format == "json":
+        return json.dumps({**metadata, "rows": records}, indent=2) + "\n"
+
+    buffer = io.StringIO()
+    if records:
+        writer = csv.DictWriter(buffer, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+    return buffer.getvalue()
+
+
+def run_matrix_mode(
+    power: tuple,
+    common_powers: List[CommonPowerModel],
+    black_range: Tuple[int, int],
+    green_range: Tuple[int, int],
+    elder_signs_as_successes: bool,
+    output: Optional[Path],
+    output_format: Optional[str],
+) -> None:
+    """Write the threshold probability matrix for a grid of pools."""
+    if black_range[0] < 0 or green_range[0] < 0:
+        console.print("[red]Error: Dice counts must be non-negative[/red]")
+        return
+    if black_range[0] > black_range[1] or green_range[0] > green_range[1]:
+        console.print("[red]Error: Minimum dice count exceeds maximum[/red]")
+        return
+
+    effects = [parse_power_spec(spec, common_powers) for spec in power]
+    if any(effect is None for effect in effects):
+        return
+
+    black_counts = list(range(black_range[0], black_range[1] + 1))
+    green_counts = list(range(green_range[0], green_range[1] + 1))
+    records = build_threshold_matrix(
+        [effect for effect in effects if effect is not None],
+        black_counts,
+        green_counts,
+        elder_signs_as_successes,
+    )
+
+    if output_format is None:
+        output_format = "json" if output is not None and output.suffix == ".json" else "csv"
+    metadata: Dict[str, object] = {
+        "black_dice": black_counts,
+        "green_dice": green_counts,
+        "elder_signs_as_successes": elder_signs_as_successes,
+        "powers": list(power),
+    }
+    text = format_threshold_matrix(records, output_format, metadata)
+
+    if output is None:
+        click.echo(text, nl=False)
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text, encoding="utf-8")
+    console.print(f"[green]Wrote {len(records)} pools to {output}[/green]")
+
+
 @click.command()
 @click.option(
     "--power",
@@ -71,7 +286,54 @@ def load_common_powers() -> List[CommonPowerModel]:
     is_flag=True,
     help="List all available powers",
 )
-def main(power: tuple, base_black: int, base_green: int, list_powers: bool):
+@click.option(
+    "--matrix",
+    is_flag=True,
+    help="Write P(>=k successes/tentacles) for a grid of pools, base and per --power",
+)
+@click.option(
+    "--black-range",
+    type=(int, int),
+    default=(1, 8),
+    help="Matrix mode: min and max base black dice (default: 1 8)",
+)
+@click.option(
+    "--green-range",
+    type=(int, int),
+    default=(0, 4),
+    help="Matrix mode: min and max base green dice (default: 0 4)",
+)
+@click.option(
+    "--elder-as-success",
+    is_flag=True,
+    help="Matrix mode: count every elder sign as a success in the base rows "
+    "(power rows use the power's own conversion)",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Matrix mode: output file (default: stdout)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(MATRIX_FORMATS),
+    default=None,
+    help="Matrix mode: output format (default: from --output suffix, else csv)",
+)
+def main(
+    power: tuple,
+    base_black: int,
+    base_green: int,
+    list_powers: bool,
+    matrix: bool,
+    black_range: Tuple[int, int],
+    green_range: Tuple[int, int],
+    elder_as_success: bool,
+    output: Optional[Path],
+    output_format: Optional[str],
+):
     """Combine multiple powers and calculate their combined effects."""
     common_powers = load_common_powers()
 
@@ -88,6 +350,18 @@ def main(power: tuple, base_black: int, base_green: int, list_powers: bool):
         console.print(table)
         return
 
+    if matrix:
+        run_matrix_mode(
+            power,
+            common_powers,
+            black_range,
+            green_range,
+            elder_as_success,
+            output,
+            output_format,
+        )
+        return
+
     if not power:
         console.print("[yellow]No powers specified. Use --power to add powers.[/yellow]")
         console.print("Example: --power 'Marksman:2' --power 'Arcane Mastery:1'")
@@ -102,47 +376,9 @@ def main(power: tuple, base_black: int, base_green: int, list_powers: bool):
 
     # Parse power specifications
     for power_spec in power:
-        if ":" not in power_spec:
-            console.print(f"[red]Error: Invalid power specification: {power_spec}[/red]")
-            console.print("Format: 'PowerName:Level' (e.g., 'Marksman:2')")
-            continue
-
-        power_name, level_str = power_spec.split(":", 1)
-        try:
-            level = int(level_str)
-        except ValueError:
-            console.print(f"[red]Error: Invalid level: {level_str}[/red]")
-            continue
-
-        # Find power
-        power_model = None
-        for p in common_powers:
-            if p.name == power_name:
-                power_model = p
-                break
-
-        if power_model is None:
-            available = ", ".join(p.name for p in common_powers)
-            console.print(f"[red]Error: Power '{power_name}' not found[/red]")
-            console.print(f"Available powers: {available}")
-            continue
-
-        # Find level
-        level_data = None
-        for level_item in power_model.levels:
-            if level_item.level == level:
-                level_data = level_item
-                break
-
-        if level_data is None:
-            available_levels = ", ".join(str(level_item.level) for level_item in power_model.levels)
-            console.print(f"[red]Error: Power '{power_name}' has no level {level}[/red]")
-            console.print(f"Available levels: {available_levels}")
-            continue
-
-        # Create effect
-        effect = create_power_effect_from_level(power_name, level_data)
-        combination.effects.append(effect)
+        effect = parse_power_spec(power_spec, common_powers)
+        if effect is not None:
+            combination.effects.append(effect)
 
     if not combination.effects:
         console.print("[red]Error: No valid powers to combine[/red]")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Process-wide cache of decoded images and preprocessing intermediates.
+
+OCR strategies preprocess the same card image many times, and most of them
+start with the same steps (decode, grayscale, CLAHE, bilateral filter) or end
+with the same expensive denoise. Results are memoized here with LRU eviction
+bounded by total array bytes.
+
+Entries are keyed by ``(path, mtime_ns, size, signature)``, so editing or
+replacing an image file invalidates everything derived from it. A signature is
+a tuple of the steps (operation name and parameters) that produced the array
+from the decoded image, e.g. ``(("gray",), ("clahe", 2.0, 8))``. Cached arrays are read-only; copy before
+modifying one in place.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Final, Hashable, Optional, Tuple, Union
+
+try:
+    import cv2
+    import numpy as np
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
+    raise
+
+from scripts.models.ocr_settings_config import get_ocr_settings
+
+BYTES_PER_MB: Final[int] = 1024 * 1024
+
+Signature = Tuple[Hashable, ...]
+ImageKey = Tuple[str, int, int, Signature]
+
+# Signatures of the shared intermediates
+BGR: Final[Signature] = ()
+GRAY: Final[Signature] = (("gray",),)
+
+
+class ImageCache:
+    """LRU cache of image arrays bounded by total bytes.
+
+    Args:
+        max_bytes: Byte budget for cached arrays (0 = store nothing)
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[ImageKey, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached arrays."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(image_path: Union[str, Path], signature: Signature) -> ImageKey:
+        """Build the cache key of an image file and operation signature."""
+        stat = os.stat(image_path)
+        return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size, signature)
+
+    def get(
+        self,
+        image_path: Union[str, Path],
+        signature: Signature,
+        compute: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """Get a cached array, computing and storing it on a miss.
+
+        Args:
+            image_path: Source image file
+            signature: Operations and parameters that produce the array
+            compute: Zero-argument function producing the array
+
+        Returns:
+            Read-only array
+        """
+        key = self.key(image_path, signature)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Computed outside the lock; a concurrent miss may compute the same entry twice
+        value = compute()
+        value.setflags(write=False)
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _store(self, key: ImageKey, value: np.ndarray) -> None:
+        """Insert an entry and evict least recently used ones over the byte budget."""
+        if value.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.nbytes
+            self._entries[key] = value
+            self.current_bytes += value.nbytes
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+
+_default_cache: Optional[ImageCache] = None
+
+
+def get_image_cache() -> ImageCache:
+    """Get the shared process-wide image cache (sized from OCR settings)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ImageCache(
+            get_ocr_settings().ocr_preprocessing_cache_max_mb * BYTES_PER_MB
+        )
+    return _default_cache
+
+
+# Convenience functions
+def cached_image(
+    image_path: Union[str, Path], signature: Signature, compute: Callable[[], np.ndarray]
+) -> np.ndarray:
+    """Memoize a preprocessing result in the shared cache."""
+    return get_image_cache().get(image_path, signature, compute)
+
+
+def read_bgr(image_path: Union[str, Path]) -> np.ndarray:
+    """Decode an image once per process (BGR, read-only)."""
+
+    def decode() -> np.ndarray:
+        image = cv2.imread(str(image_path))
+        if image is None:
+            raise ValueError(f"Could not read image: {image_path}")
+        return image
+
+    return cached_image(image_path, BGR, decode)
+
+
+def read_gray(image_path: Union[str, Path]) -> np.ndarray:
+    """Grayscale version of an image (read-only)."""
+    return cached_image(
+        image_path, GRAY, lambda: cv2.cvtColor(read_bgr(image_path), cv2.COLOR_BGR2GRAY)
+    )
+
+
+def bilateral_gray(
+    image_path: Union[str, Path], diameter: int, sigma_color: float, sigma_space: float
+) -> np.ndarray:
+    """Bilateral-filtered grayscale image (read-only)."""
+    return cached_image(
+        image_path,
+        (*GRAY, ("bilateral", diameter, sigma_color, sigma_space)),
+        lambda: cv2.bilateralFilter(read_gray(image_path), diameter, sigma_color, sigma_space),
+    )
@@ -13,12 +13,11 @@ This module extracts text from specific regions based on the known card structur
 
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Final, List, Optional, Tuple
 
 try:
     import cv2
     import numpy as np
-    import pytesseract
 except ImportError as e:
     print(
         f"Error: Missing required dependency: {e.name}\n\n"
@@ -29,10 +28,43 @@ except ImportError as e:
 
 from pydantic import BaseModel, Field
 
+from scripts.core.parsing.ocr_cascade import CascadeResult, run_cascade
+from scripts.core.parsing.tesseract_engine import (
+    OCRReading,
+    tesseract_image_to_data,
+    tesseract_image_to_string,
+)
 from scripts.models.ocr_settings_config import get_ocr_settings
 
 _ocr_settings = get_ocr_settings()
 
+# Description validation for accepting a cascade result early
+DESCRIPTION_MIN_WORDS: Final[int] = 12
+DESCRIPTION_MAX_SPECIAL_CHAR_RATIO: Final[float] = 0.02
+OCR_NOISE_CHARS: Final[str] = "@#$%^&*|~`"
+
+
+def score_description_text(text: str) -> int:
+    """Rank description OCR output by length and quality.
+
+    Penalizes very short or garbled text and prefers results with more words.
+    """
+    if not text.strip():
+        return 0
+    special_chars = sum(1 for c in text if c in OCR_NOISE_CHARS)
+    return len(text) - special_chars * 2 + len(text.split()) * 5
+
+
+def is_valid_description(reading: OCRReading, min_confidence: float) -> bool:
+    """Check a description reading is confident and looks like prose."""
+    text = reading.text.strip()
+    if not text or reading.mean_confidence < min_confidence:
+        return False
+    if len(text.split()) < DESCRIPTION_MIN_WORDS:
+        return False
+    special_chars = sum(1 for c in text if c in OCR_NOISE_CHARS)
+    return special_chars / len(text) <= DESCRIPTION_MAX_SPECIAL_CHAR_RATIO
+
 
 class LayoutExtractionResults(BaseModel):
     """Results from layout-aware OCR extraction."""
@@ -141,9 +173,7 @@ class CardLayoutExtractor:
         roi = image[y : y + h, x : x + w]
 
         psm = psm_mode or self.psm_mode
-        config = f"--oem {self.oem_mode} --psm {psm}"
-
-        text = pytesseract.image_to_string(roi, config=config)
+        text = tesseract_image_to_string(roi, psm=psm, oem=self.oem_mode)
         return text.strip()
 
     def extract_name_location_region(
@@ -236,7 +266,8 @@ class CardLayoutExtractor:
         1. Multiple preprocessing strategies (invert, threshold, morphological)
         2. Enhanced contrast and denoising
         3. Multiple PSM modes for better extraction
-        4. Combines best results
+        4. Stops at the first confident, valid result (see ocr_cascade), or
+           combines the best results
 
         Args:
             image_path: Path to original image (needed for specialized preprocessing)
@@ -266,52 +297,81 @@ class CardLayoutExtractor:
         enhanced = clahe.apply(gray)
         inverted = cv2.bitwise_not(enhanced)
 
-        # Strategy 2: OTSU thresholding on inverted image
-        _, binary_otsu = cv2.threshold(inverted, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-        # Strategy 3: Adaptive thresholding (better for varying lighting)
-        adaptive = cv2.adaptiveThreshold(
-            inverted, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-        )
-
-        # Strategy 4: Morphological operations to clean up text
-        kernel = np.ones((2, 2), np.uint8)
-        morph = cv2.morphologyEx(binary_otsu, cv2.MORPH_CLOSE, kernel)
-        morph = cv2.morphologyEx(morph, cv2.MORPH_OPEN, kernel)
-
-        # Strategy 5: Denoise before thresholding
-        denoised = cv2.fastNlMeansDenoising(inverted, None, 10, 7, 21)
-        _, denoised_binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-        # Try all preprocessing strategies with multiple PSM modes
-        preprocessed_images = [
-            ("inverted", inverted),
-            ("binary_otsu", binary_otsu),
-            ("adaptive", adaptive),
-            ("morphological", morph),
-            ("denoised", denoised_binary),
-        ]
+        def binary_otsu() -> np.ndarray:
+            # Strategy 2: OTSU thresholding on inverted image
+            _, binary = cv2.threshold(inverted, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            return binary
+
+        def adaptive() -> np.ndarray:
+            # Strategy 3: Adaptive thresholding (better for varying lighting)
+            return cv2.adaptiveThreshold(
+                inverted, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            )
+
+        def morphological() -> np.ndarray:
+            # Strategy 4: Morphological operations to clean up text
+            kernel = np.ones((2, 2), np.uint8)
+            morph = cv2.morphologyEx(prepared("binary_otsu"), cv2.MORPH_CLOSE, kernel)
+            return cv2.morphologyEx(morph, cv2.MORPH_OPEN, kernel)
+
+        def denoised() -> np.ndarray:
+            # Strategy 5: Denoise before thresholding
+            denoised_gray = cv2.fastNlMeansDenoising(inverted, None, 10, 7, 21)
+            _, binary = cv2.threshold(denoised_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            return binary
+
+        # Preprocessed images are only computed when a candidate needs them
+        preprocessors: Dict[str, Callable[[], np.ndarray]] = {
+            "inverted": lambda: inverted,
+            "binary_otsu": binary_otsu,
+            "adaptive": adaptive,
+            "morphological": morphological,
+            "denoised": denoised,
+        }
+        preprocessed: Dict[str, np.ndarray] = {}
+
+        def prepared(prep_name: str) -> np.ndarray:
+            if prep_name not in preprocessed:
+                preprocessed[prep_name] = preprocessors[prep_name]()
+            return preprocessed[prep_name]
 
         psm_modes = [6, 11, 3, 7]  # Uniform block, sparse text, auto, single line
 
+        def read(prep_name: str, psm_mode: int) -> Callable[[], OCRReading]:
+            return lambda: tesseract_image_to_data(
+                prepared(prep_name), psm=psm_mode, oem=self.oem_mode
+            )
+
+        # Cascade over preprocessing x PSM mode, stopping at the first confident,
+        # valid description; otherwise rank everything tried as before
+        cascade_enabled = _ocr_settings.ocr_cascade_enabled
+        min_confidence = _ocr_settings.ocr_cascade_min_confidence
+        cascade: CascadeResult[OCRReading] = run_cascade(
+            "description",
+            [
+                (f"{prep_name}:psm{psm_mode}", read(prep_name, psm_mode))
+                for prep_name in preprocessors
+                for psm_mode in psm_modes
+            ],
+            accept=lambda reading: is_valid_description(reading, min_confidence),
+            score=lambda reading: score_description_text(reading.text),
+            exhaustive=not cascade_enabled,
+        )
+        if cascade_enabled and cascade.accepted and cascade.value is not None:
+            return cascade.value.text.strip()
+
         results = []
-        for prep_name, prep_img in preprocessed_images:
-            for psm_mode in psm_modes:
-                config = f"--oem {self.oem_mode} --psm {psm_mode}"
-                try:
-                    text = pytesseract.image_to_string(prep_img, config=config)
-                    if text.strip():
-                        # Score by length and quality (penalize very short or garbled text)
-                        score = len(text)
-                        # Penalize if too many special characters (likely OCR errors)
-                        special_chars = sum(1 for c in text if c in "@#$%^&*|~`")
-                        score -= special_chars * 2
-                        # Prefer results with more words
-                        word_count = len(text.split())
-                        score += word_count * 5
-                        results.append((score, text.strip(), prep_name, psm_mode))
-                except Exception:
-                    continue
+        for candidate_name, reading in cascade.results:
+            if reading.text.strip():
+                prep_name, psm_name = candidate_name.split(":psm")
+                results.append(
+                    (
+                        score_description_text(reading.text),
+                        reading.text.strip(),
+                        prep_name,
+                        int(psm_name),
+                    )
+                )
 
         # Also try the original (non-inverted) with white text detection
         # Sometimes OCR works better on original if contrast is good
@@ -322,9 +382,8 @@ class CardLayoutExtractor:
                 x, y, w, h = region
                 roi = gray[y : y + h, x : x + w]
                 for psm_mode in [6, 11]:
-                    config = f"--oem {self.oem_mode} --psm {psm_mode}"
                     try:
-                        text = pytesseract.image_to_string(roi, config=config)
+                        text = tesseract_image_to_string(roi, psm=psm_mode, oem=self.oem_mode)
                         if text.strip() and len(text.strip()) > 20:
                             score = len(text) + len(text.split()) * 5
                             results.append((score, text.strip(), "white_text_region", psm_mode))
@@ -19,7 +19,6 @@ from typing import Dict, List, Optional, Tuple
 try:
     import cv2
     import numpy as np
-    import pytesseract
     from PIL import Image
 except ImportError as e:
     print(
@@ -29,6 +28,7 @@ except ImportError as e:
     )
     raise
 
+from scripts.core.parsing.tesseract_engine import tesseract_image_to_string
 from scripts.models.ocr_settings_config import get_ocr_settings
 
 _ocr_settings = get_ocr_settings()
@@ -194,8 +194,7 @@ class OCRPipeline:
         else:
             roi = image
 
-        config = f"--oem {self.oem_mode} --psm {psm_mode}"
-        text = pytesseract.image_to_string(roi, config=config)
+        text = tesseract_image_to_string(roi, psm=psm_mode, oem=self.oem_mode)
         return text.strip()
 
     def extract_text_multi_strategy(
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Confidence-driven cascade scheduling of OCR attempts.
+
+Extracting a field used to run every preprocessing/PSM combination and keep
+the longest result. A cascade instead runs candidates one at a time and stops
+at the first result that passes the field's acceptance test (mean Tesseract
+word confidence plus field validation).
+
+Candidates are ordered by their history for that field: each candidate's
+smoothed acceptance rate divided by its mean cost in seconds. Trying
+candidates in decreasing probability-per-cost order minimizes the expected
+time until acceptance. Unseen candidates keep their declared order, so the
+order written at the call site is the cold-start schedule. History is kept in
+``.generated/ocr/cascade_stats.json`` and shared across runs.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Final, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from scripts.models.ocr_settings_config import get_ocr_settings
+
+DEFAULT_HISTORY_PATH: Final[Path] = (
+    Path(__file__).parent.parent.parent.parent / ".generated" / "ocr" / "cascade_stats.json"
+)
+
+# Laplace prior: an unseen candidate counts as one success in two attempts
+# costing PRIOR_SECONDS each
+PRIOR_SECONDS: Final[float] = 1.0
+
+T = TypeVar("T")
+
+Candidate = Tuple[str, Callable[[], T]]
+
+
+class CandidateHistory:
+    """Attempts, acceptances and time spent by one candidate on one field."""
+
+    def __init__(self, attempts: int = 0, accepted: int = 0, seconds: float = 0.0):
+        """Initialize counters."""
+        self.attempts = attempts
+        self.accepted = accepted
+        self.seconds = seconds
+
+    @property
+    def priority(self) -> float:
+        """Smoothed acceptance probability per second of cost."""
+        success_rate = (self.accepted + 1) / (self.attempts + 2)
+        mean_seconds = (self.seconds + PRIOR_SECONDS) / (self.attempts + 1)
+        return success_rate / mean_seconds
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {"attempts": self.attempts, "accepted": self.accepted, "seconds": self.seconds}
+
+
+class CascadeHistory:
+    """Per-field candidate history, optionally persisted as JSON.
+
+    Args:
+        path: JSON file (None = keep history in memory only)
+    """
+
+    def __init__(self, path: Optional[Path] = DEFAULT_HISTORY_PATH):
+        """Load existing history (a missing or unreadable file starts empty)."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._fields: Dict[str, Dict[str, CandidateHistory]] = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                self._fields = {
+                    field: {name: CandidateHistory(**stats) for name, stats in entries.items()}
+                    for field, entries in data.items()
+                }
+            except (OSError, ValueError, TypeError):
+                self._fields = {}
+
+    def get(self, field: str, name: str) -> CandidateHistory:
+        """History of a candidate (empty if never run)."""
+        with self._lock:
+            return self._fields.get(field, {}).get(name, CandidateHistory())
+
+    def order(self, field: str, names: Sequence[str]) -> List[str]:
+        """Sort candidate names by decreasing priority (stable for ties)."""
+        return sorted(names, key=lambda name: -self.get(field, name).priority)
+
+    def record(self, field: str, name: str, seconds: float, accepted: bool) -> None:
+        """Add one attempt to a candidate's history."""
+        with self._lock:
+            stats = self._fields.setdefault(field, {}).setdefault(name, CandidateHistory())
+            stats.attempts += 1
+            stats.accepted += int(accepted)
+            stats.seconds += seconds
+
+    def save(self) -> None:
+        """Write history to its JSON file (atomically; no-op when in memory)."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                field: {name: stats.to_dict() for name, stats in entries.items()}
+                for field, entries in self._fields.items()
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+class CascadeResult(Generic[T]):
+    """Outcome of a cascade.
+
+    Attributes:
+        value: First accepted value, or the best-scoring one if none was accepted
+            (always the best-scoring one in exhaustive mode)
+        name: Candidate that produced ``value`` (None if every candidate failed)
+        accepted: True if ``value`` passed the acceptance test
+        results: (name, value) of every candidate that ran without error
+        attempts: Number of candidates run
+    """
+
+    def __init__(
+        self,
+        value: Optional[T],
+        name: Optional[str],
+        accepted: bool,
+        results: List[Tuple[str, T]],
+        attempts: int,
+    ):
+        """Initialize result fields."""
+        self.value = value
+        self.name = name
+        self.accepted = accepted
+        self.results = results
+        self.attempts = attempts
+
+
+_default_history: Optional[CascadeHistory] = None
+
+
+def get_cascade_history() -> CascadeHistory:
+    """Get the shared cascade history."""
+    global _default_history
+    if _default_history is None:
+        _default_history = CascadeHistory()
+    return _default_history
+
+
+# Convenience functions
+def run_cascade(
+    field: str,
+    candidates: Sequence[Candidate],
+    accept: Callable[[T], bool],
+    score: Callable[[T], float],
+    history: Optional[CascadeHistory] = None,
+    exhaustive: Optional[bool] = None,
+) -> CascadeResult[T]:
+    """Run OCR candidates in history order until one is accepted.
+
+    Exceptions raised by a candidate count as a rejected attempt.
+
+    Args:
+        field: Field being extracted (history is kept per field)
+        candidates: (name, zero-argument function) pairs in cold-start order
+        accept: Acceptance test (confidence and validation) for a value
+        score: Ranking used when no value is accepted
+        history: History to order by and update (default: shared history)
+        exhaustive: Run every candidate and keep the best score, as before cascading
+            (default: when the cascade is disabled in OCR settings)
+
+    Returns:
+        CascadeResult with the accepted or best value
+    """
+    if history is None:
+        history = get_cascade_history()
+    if exhaustive is None:
+        exhaustive = not get_ocr_settings().ocr_cascade_enabled
+
+    functions = dict(candidates)
+    results: List[Tuple[str, T]] = []
+    attempts = 0
+    for name in history.order(field, list(functions)):
+        attempts += 1
+        start = time.perf_counter()
+        try:
+            value = functions[name]()
+            ok = accept(value)
+        except Exception:
+            history.record(field, name, time.perf_counter() - start, accepted=False)
+            continue
+        history.record(field, name, time.perf_counter() - start, accepted=ok)
+        results.append((name, value))
+        if ok and not exhaustive:
+            history.save()
+            return CascadeResult(value, name, True, results, attempts)
+    history.save()
+
+    if not results:
+        return CascadeResult(None, None, False, results, attempts)
+    name, value = max(results, key=lambda result: score(result[1]))
+    return CascadeResult(value, name, accept(value), results, attempts)
@@ -7,12 +7,11 @@ Tests different preprocessing + OCR engine combinations to find best results.
 
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Final, List, Optional, Union
 
 try:
     import cv2
     import numpy as np
-    import pytesseract
 except ImportError as e:
     print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
     raise
@@ -22,6 +21,14 @@ try:
 except ImportError:
     easyocr = None
 
+from scripts.core.parsing.ocr_result_cache import get_ocr_result_cache, hash_file, make_key
+from scripts.core.parsing.preprocessing_dag import (
+    Pipeline,
+    PreprocessingDAG,
+    run_pipeline,
+    validate_pipeline,
+)
+from scripts.core.parsing.tesseract_engine import get_tesseract_engine, tesseract_image_to_string
 from scripts.models.ocr_settings_config import get_ocr_settings
 
 _ocr_settings = get_ocr_settings()
@@ -46,7 +53,7 @@ class OCRStrategy:
     def __init__(
         self,
         name: str,
-        preprocess_fn,
+        preprocess_fn: Union[Pipeline, Callable[[Path], np.ndarray]],
         ocr_fn,
         description: str = "",
         use_nlp_postprocess: bool = False,
@@ -56,22 +63,43 @@ class OCRStrategy:
 
         Args:
             name: Strategy name
-            preprocess_fn: Function(image_path) -> np.ndarray
+            preprocess_fn: Pipeline of named operations, or Function(image_path) -> np.ndarray
             ocr_fn: Function(image) -> str
             description: Human-readable description
             use_nlp_postprocess: If True, apply NLP post-processing
             nlp_level: NLP post-processing level ("basic", "advanced", "enhanced")
         """
         self.name = name
-        self.preprocess_fn = preprocess_fn
+        self.pipeline: Optional[Pipeline] = None
+        if callable(preprocess_fn):
+            self.preprocess_fn = preprocess_fn
+        else:
+            pipeline = validate_pipeline(preprocess_fn)
+            self.pipeline = pipeline
+            self.preprocess_fn = lambda image_path: run_pipeline(image_path, pipeline)
         self.ocr_fn = ocr_fn
         self.description = description or name
         self.use_nlp_postprocess = use_nlp_postprocess
         self.nlp_level = nlp_level
 
+    @property
+    def config(self) -> str:
+        """Configuration string identifying this strategy's output in the result cache."""
+        preprocess = self.pipeline or _qualified_name(self.preprocess_fn)
+        return repr(
+            (preprocess, _qualified_name(self.ocr_fn), self.use_nlp_postprocess, self.nlp_level)
+        )
+
+    def cache_key(self, input_path: Path) -> str:
+        """OCR result cache key of this strategy on an image file."""
+        return make_key(hash_file(input_path), None, self.name, get_engine_version(), self.config)
+
     def extract(self, image_path: Path) -> str:
         """Extract text using this strategy.
 
+        Results are served from the persistent OCR result cache when the same
+        image content was read by the same strategy and engine version before.
+
         Args:
             image_path: Path to image file
 
@@ -79,377 +107,257 @@ class OCRStrategy:
             Extracted text
         """
         try:
-            # Convert to PNG if lossy format (improves OCR accuracy)
-            # PNG files are saved alongside originals for reuse (not auto-deleted)
-            optimized_path = image_path
-            try:
-                from scripts.utils.image_conversion import get_ocr_optimized_path
-
-                optimized_path = get_ocr_optimized_path(image_path, use_temp=False)
-            except ImportError:
-                # Fallback if conversion utility not available
-                pass
-
-            processed = self.preprocess_fn(optimized_path)
-            text = self.ocr_fn(processed)
-
-            # Apply NLP post-processing if enabled
-            if self.use_nlp_postprocess:
-                if self.nlp_level == "enhanced":
-                    text = ocr_with_enhanced_nlp_postprocess(text)
-                elif self.nlp_level == "advanced":
-                    text = ocr_with_advanced_nlp_postprocess(text)
-                else:  # basic
-                    text = ocr_with_nlp_postprocess(text)
-
-            return text.strip()
+            input_path = get_ocr_input_path(image_path)
+            return get_ocr_result_cache().get_or_compute(
+                self.cache_key(input_path),
+                lambda: self.recognize(self.preprocess_fn(input_path)),
+            )
         except Exception as e:
             print(f"Error in strategy {self.name}: {e}", file=sys.stderr)
             return ""
 
+    def recognize(self, processed: np.ndarray) -> str:
+        """Run OCR and post-processing on an already preprocessed image.
 
-# Preprocessing functions
-def preprocess_basic(image_path: Path) -> np.ndarray:
-    """Basic preprocessing: grayscale + OTSU."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    return binary
-
+        Args:
+            processed: Output of this strategy's preprocessing
 
-def preprocess_enhanced(image_path: Path) -> np.ndarray:
-    """Enhanced preprocessing: CLAHE + OTSU + denoise."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        Returns:
+            Extracted text
 
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(gray)
+        Raises:
+            Exception: Whatever the OCR engine or post-processing raises
+        """
+        text: str = self.ocr_fn(processed)
 
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # Apply NLP post-processing if enabled
+        if self.use_nlp_postprocess:
+            if self.nlp_level == "enhanced":
+                text = ocr_with_enhanced_nlp_postprocess(text)
+            elif self.nlp_level == "advanced":
+                text = ocr_with_advanced_nlp_postprocess(text)
+            else:  # basic
+                text = ocr_with_nlp_postprocess(text)
 
-    # Denoise
-    denoised = cv2.fastNlMeansDenoising(binary, None, 10, 7, 21)
-    return denoised
+        return text.strip()
 
 
-def preprocess_adaptive(image_path: Path) -> np.ndarray:
-    """Adaptive preprocessing: adaptive thresholding."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+def _qualified_name(fn: Callable) -> str:
+    """Module-qualified name of a function."""
+    return f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
 
-    # Adaptive thresholding (better for varying lighting)
-    adaptive = cv2.adaptiveThreshold(
-        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-    )
-    return adaptive
 
+def get_engine_version() -> str:
+    """Versions of the OCR engines strategies may use."""
+    version = f"tesseract {get_tesseract_engine().version}"
+    if easyocr is not None:
+        version += f"; easyocr {getattr(easyocr, '__version__', 'unknown')}"
+    return version
 
-def preprocess_color_enhanced(image_path: Path) -> np.ndarray:
-    """Color-enhanced preprocessing: keep color info, enhance contrast."""
-    img = cv2.imread(str(image_path))
 
-    # Convert to LAB color space
-    lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-    l, a, b = cv2.split(lab)
+def get_ocr_input_path(image_path: Path) -> Path:
+    """Path to preprocess for an image (lossy formats are converted to PNG).
 
-    # Enhance L channel (lightness)
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    l_enhanced = clahe.apply(l)
+    PNG files are saved alongside originals for reuse (not auto-deleted).
+    """
+    try:
+        from scripts.utils.image_conversion import get_ocr_optimized_path
 
-    # Merge back
-    lab_enhanced = cv2.merge([l_enhanced, a, b])
-    bgr_enhanced = cv2.cvtColor(lab_enhanced, cv2.COLOR_LAB2BGR)
+        return get_ocr_optimized_path(image_path, use_temp=False)
+    except ImportError:
+        # Fallback if conversion utility not available
+        return image_path
+
+
+# Preprocessing pipelines (named operations, see preprocessing_dag.OPERATIONS).
+# Strategies sharing a prefix share its intermediate when run together.
+PIPELINE_BASIC: Final[Pipeline] = (("gray",), ("otsu",))
+PIPELINE_ENHANCED: Final[Pipeline] = (
+    ("gray",),
+    ("clahe", 2.0, 8),
+    ("otsu",),
+    ("nl_means", 10, 7, 21),
+)
+PIPELINE_ADAPTIVE: Final[Pipeline] = (("gray",), ("adaptive", 11, 2))
+PIPELINE_COLOR_ENHANCED: Final[Pipeline] = (("lab_clahe", 2.0, 8), ("gray",), ("otsu",))
+PIPELINE_DESKEW: Final[Pipeline] = (("gray",), ("deskew", 0.5), ("otsu",))
+PIPELINE_SHARPENED: Final[Pipeline] = (
+    ("gray",),
+    ("unsharp", 2.0, 1.5),
+    ("clahe", 3.0, 8),
+    ("otsu",),
+    ("close", 2),
+)
+PIPELINE_BILATERAL: Final[Pipeline] = (
+    ("gray",),
+    ("bilateral", 9, 75, 75),
+    ("clahe", 2.5, 8),
+    ("otsu",),
+)
+PIPELINE_BILATERAL_AGGRESSIVE: Final[Pipeline] = (
+    ("gray",),
+    ("bilateral", 15, 100, 100),
+    ("clahe", 3.5, 8),
+    ("otsu",),
+    ("nl_means", 5, 7, 21),
+)
+PIPELINE_BILATERAL_SHARPENED: Final[Pipeline] = (
+    ("gray",),
+    ("bilateral", 9, 75, 75),
+    ("unsharp", 1.5, 1.8),
+    ("clahe", 3.0, 8),
+    ("otsu",),
+)
+PIPELINE_MORPHOLOGICAL: Final[Pipeline] = (
+    ("gray",),
+    ("clahe", 2.0, 8),
+    ("otsu",),
+    ("open", 2),
+    ("close", 2),
+)
+PIPELINE_HIGH_RES: Final[Pipeline] = (
+    ("gray",),
+    ("upscale", 2),
+    ("clahe", 2.0, 8),
+    ("otsu",),
+    ("nl_means", 8, 7, 21),
+)
+PIPELINE_HISTOGRAM_EQUALIZED: Final[Pipeline] = (("gray",), ("equalize",), ("otsu",))
+PIPELINE_COMBINED_ADVANCED: Final[Pipeline] = (
+    ("gray",),
+    ("bilateral", 9, 75, 75),
+    ("unsharp", 2.0, 1.5),
+    ("clahe", 3.0, 8),
+    ("otsu",),
+    ("close", 2),
+    ("nl_means", 10, 7, 21),
+)
+PIPELINE_COMBINED_ULTRA: Final[Pipeline] = (
+    ("gray",),
+    ("upscale", 2),
+    ("bilateral", 9, 75, 75),
+    ("unsharp", 1.5, 1.8),
+    ("clahe", 3.5, 8),
+    ("otsu",),
+    ("close", 2),
+)
 
-    # Convert to grayscale
-    gray = cv2.cvtColor(bgr_enhanced, cv2.COLOR_BGR2GRAY)
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-    return binary
+# Preprocessing functions
+def preprocess_basic(image_path: Path) -> np.ndarray:
+    """Basic preprocessing: grayscale + OTSU."""
+    return run_pipeline(image_path, PIPELINE_BASIC)
 
 
-def preprocess_deskew(image_path: Path) -> np.ndarray:
-    """Deskew preprocessing: rotate to align text."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Find angle
-    coords = np.column_stack(np.where(gray > 0))
-    if len(coords) > 0:
-        angle = cv2.minAreaRect(coords)[-1]
-        if angle < -45:
-            angle = -(90 + angle)
-        else:
-            angle = -angle
-
-        if abs(angle) > 0.5:
-            (h, w) = gray.shape[:2]
-            center = (w // 2, h // 2)
-            M = cv2.getRotationMatrix2D(center, angle, 1.0)
-            gray = cv2.warpAffine(
-                gray, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE
-            )
+def preprocess_enhanced(image_path: Path) -> np.ndarray:
+    """Enhanced preprocessing: CLAHE + OTSU + denoise."""
+    return run_pipeline(image_path, PIPELINE_ENHANCED)
 
-    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    return binary
 
+def preprocess_adaptive(image_path: Path) -> np.ndarray:
+    """Adaptive preprocessing: adaptive thresholding."""
+    return run_pipeline(image_path, PIPELINE_ADAPTIVE)
 
-def preprocess_sharpened(image_path: Path) -> np.ndarray:
-    """Sharpened preprocessing: unsharp mask + CLAHE + OTSU."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
-    # Apply Gaussian blur for unsharp mask
-    blurred = cv2.GaussianBlur(gray, (0, 0), 2.0)
-    # Unsharp mask: original + (original - blurred) * amount
-    sharpened = cv2.addWeighted(gray, 1.5, blurred, -0.5, 0)
+def preprocess_color_enhanced(image_path: Path) -> np.ndarray:
+    """Color-enhanced preprocessing: keep color info, enhance contrast."""
+    return run_pipeline(image_path, PIPELINE_COLOR_ENHANCED)
 
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(sharpened)
 
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+def preprocess_deskew(image_path: Path) -> np.ndarray:
+    """Deskew preprocessing: rotate to align text."""
+    return run_pipeline(image_path, PIPELINE_DESKEW)
 
-    # Morphological operations to clean up
-    kernel = np.ones((2, 2), np.uint8)
-    cleaned = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
 
-    return cleaned
+def preprocess_sharpened(image_path: Path) -> np.ndarray:
+    """Sharpened preprocessing: unsharp mask + CLAHE + OTSU."""
+    return run_pipeline(image_path, PIPELINE_SHARPENED)
 
 
 def preprocess_bilateral(image_path: Path) -> np.ndarray:
     """Bilateral filter preprocessing: edge-preserving denoising."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Bilateral filter (edge-preserving denoising)
-    filtered = cv2.bilateralFilter(gray, 9, 75, 75)
-
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8, 8))
-    enhanced = clahe.apply(filtered)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    return binary
+    return run_pipeline(image_path, PIPELINE_BILATERAL)
 
 
 def preprocess_bilateral_aggressive(image_path: Path) -> np.ndarray:
     """Aggressive bilateral filter preprocessing: stronger denoising."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Stronger bilateral filter
-    filtered = cv2.bilateralFilter(gray, 15, 100, 100)
-
-    # CLAHE with higher clip limit
-    clahe = cv2.createCLAHE(clipLimit=3.5, tileGridSize=(8, 8))
-    enhanced = clahe.apply(filtered)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    # Light denoising
-    denoised = cv2.fastNlMeansDenoising(binary, None, 5, 7, 21)
-
-    return denoised
+    return run_pipeline(image_path, PIPELINE_BILATERAL_AGGRESSIVE)
 
 
 def preprocess_bilateral_sharpened(image_path: Path) -> np.ndarray:
     """Bilateral filter + sharpening combination."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Bilateral filter
-    filtered = cv2.bilateralFilter(gray, 9, 75, 75)
-
-    # Unsharp mask
-    blurred = cv2.GaussianBlur(filtered, (0, 0), 1.5)
-    sharpened = cv2.addWeighted(filtered, 1.8, blurred, -0.8, 0)
-
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(sharpened)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    return binary
+    return run_pipeline(image_path, PIPELINE_BILATERAL_SHARPENED)
 
 
 def preprocess_morphological(image_path: Path) -> np.ndarray:
     """Morphological preprocessing: opening/closing operations."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(gray)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    # Morphological opening (removes noise)
-    kernel = np.ones((2, 2), np.uint8)
-    opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
-
-    # Morphological closing (fills gaps)
-    closed = cv2.morphologyEx(opened, cv2.MORPH_CLOSE, kernel)
-
-    return closed
+    return run_pipeline(image_path, PIPELINE_MORPHOLOGICAL)
 
 
 def preprocess_high_res(image_path: Path) -> np.ndarray:
     """High-resolution preprocessing: upscale + enhance."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Upscale by 2x using INTER_CUBIC (better quality than INTER_LINEAR)
-    h, w = gray.shape
-    upscaled = cv2.resize(gray, (w * 2, h * 2), interpolation=cv2.INTER_CUBIC)
-
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(upscaled)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    # Denoise
-    denoised = cv2.fastNlMeansDenoising(binary, None, 8, 7, 21)
-
-    return denoised
+    return run_pipeline(image_path, PIPELINE_HIGH_RES)
 
 
 def preprocess_histogram_equalized(image_path: Path) -> np.ndarray:
     """Histogram equalization preprocessing."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Histogram equalization
-    equalized = cv2.equalizeHist(gray)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(equalized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    return binary
+    return run_pipeline(image_path, PIPELINE_HISTOGRAM_EQUALIZED)
 
 
 def preprocess_combined_advanced(image_path: Path) -> np.ndarray:
     """Combined advanced preprocessing: multiple techniques."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Bilateral filter for edge-preserving denoising
-    filtered = cv2.bilateralFilter(gray, 9, 75, 75)
-
-    # Unsharp mask for sharpening
-    blurred = cv2.GaussianBlur(filtered, (0, 0), 2.0)
-    sharpened = cv2.addWeighted(filtered, 1.5, blurred, -0.5, 0)
-
-    # CLAHE contrast enhancement
-    clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-    enhanced = clahe.apply(sharpened)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    # Morphological operations
-    kernel = np.ones((2, 2), np.uint8)
-    cleaned = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-
-    # Final denoise
-    denoised = cv2.fastNlMeansDenoising(cleaned, None, 10, 7, 21)
-
-    return denoised
+    return run_pipeline(image_path, PIPELINE_COMBINED_ADVANCED)
 
 
 def preprocess_combined_ultra(image_path: Path) -> np.ndarray:
     """Ultra-combined preprocessing: all best techniques."""
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Upscale 2x for better detail
-    h, w = gray.shape
-    upscaled = cv2.resize(gray, (w * 2, h * 2), interpolation=cv2.INTER_CUBIC)
-
-    # Bilateral filter (edge-preserving)
-    filtered = cv2.bilateralFilter(upscaled, 9, 75, 75)
-
-    # Unsharp mask
-    blurred = cv2.GaussianBlur(filtered, (0, 0), 1.5)
-    sharpened = cv2.addWeighted(filtered, 1.8, blurred, -0.8, 0)
-
-    # CLAHE with higher clip limit
-    clahe = cv2.createCLAHE(clipLimit=3.5, tileGridSize=(8, 8))
-    enhanced = clahe.apply(sharpened)
-
-    # OTSU thresholding
-    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-    # Morphological cleanup
-    kernel = np.ones((2, 2), np.uint8)
-    cleaned = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-
-    return cleaned
+    return run_pipeline(image_path, PIPELINE_COMBINED_ULTRA)
 
 
 # OCR functions
 def ocr_tesseract_psm3(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 3 (automatic)."""
-    config = "--oem 3 --psm 3"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=3, oem=3)
 
 
 def ocr_tesseract_psm6(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 6 (uniform block)."""
-    config = "--oem 3 --psm 6"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=6, oem=3)
 
 
 def ocr_tesseract_psm7(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 7 (single line)."""
-    config = "--oem 3 --psm 7"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=7, oem=3)
 
 
 def ocr_tesseract_psm11(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 11 (sparse text)."""
-    config = "--oem 3 --psm 11"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=11, oem=3)
 
 
 def ocr_tesseract_psm4(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 4 (single column)."""
-    config = "--oem 3 --psm 4"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=4, oem=3)
 
 
 def ocr_tesseract_psm5(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 5 (single uniform block)."""
-    config = "--oem 3 --psm 5"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=5, oem=3)
 
 
 def ocr_tesseract_psm8(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 8 (single word)."""
-    config = "--oem 3 --psm 8"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=8, oem=3)
 
 
 def ocr_tesseract_psm12(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 12 (sparse text with OSD)."""
-    config = "--oem 3 --psm 12"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=12, oem=3)
 
 
 def ocr_tesseract_psm13(image: np.ndarray) -> str:
     """Tesseract OCR with PSM mode 13 (raw line, no OSD)."""
-    config = "--oem 3 --psm 13"
-    return pytesseract.image_to_string(image, config=config)
+    return tesseract_image_to_string(image, psm=13, oem=3)
 
 
 def ocr_easyocr(image: np.ndarray) -> str:
@@ -548,31 +456,31 @@ def get_all_strategies() -> List[OCRStrategy]:
         [
             OCRStrategy(
                 "tesseract_basic_psm3",
-                preprocess_basic,
+                PIPELINE_BASIC,
                 ocr_tesseract_psm3,
                 "Basic preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm3",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm3,
                 "Enhanced preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_adaptive_psm3",
-                preprocess_adaptive,
+                PIPELINE_ADAPTIVE,
                 ocr_tesseract_psm3,
                 "Adaptive preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_color_psm3",
-                preprocess_color_enhanced,
+                PIPELINE_COLOR_ENHANCED,
                 ocr_tesseract_psm3,
                 "Color-enhanced preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_deskew_psm3",
-                preprocess_deskew,
+                PIPELINE_DESKEW,
                 ocr_tesseract_psm3,
                 "Deskew preprocessing + Tesseract PSM 3",
             ),
@@ -584,55 +492,55 @@ def get_all_strategies() -> List[OCRStrategy]:
         [
             OCRStrategy(
                 "tesseract_sharpened_psm3",
-                preprocess_sharpened,
+                PIPELINE_SHARPENED,
                 ocr_tesseract_psm3,
                 "Sharpened preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_bilateral_psm3",
-                preprocess_bilateral,
+                PIPELINE_BILATERAL,
                 ocr_tesseract_psm3,
                 "Bilateral filter preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_morphological_psm3",
-                preprocess_morphological,
+                PIPELINE_MORPHOLOGICAL,
                 ocr_tesseract_psm3,
                 "Morphological preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_high_res_psm3",
-                preprocess_high_res,
+                PIPELINE_HIGH_RES,
                 ocr_tesseract_psm3,
                 "High-resolution preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_histogram_eq_psm3",
-                preprocess_histogram_equalized,
+                PIPELINE_HISTOGRAM_EQUALIZED,
                 ocr_tesseract_psm3,
                 "Histogram equalization + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_combined_advanced_psm3",
-                preprocess_combined_advanced,
+                PIPELINE_COMBINED_ADVANCED,
                 ocr_tesseract_psm3,
                 "Combined advanced preprocessing + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_bilateral_aggressive_psm3",
-                preprocess_bilateral_aggressive,
+                PIPELINE_BILATERAL_AGGRESSIVE,
                 ocr_tesseract_psm3,
                 "Aggressive bilateral filter + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_bilateral_sharpened_psm3",
-                preprocess_bilateral_sharpened,
+                PIPELINE_BILATERAL_SHARPENED,
                 ocr_tesseract_psm3,
                 "Bilateral + sharpening + Tesseract PSM 3",
             ),
             OCRStrategy(
                 "tesseract_combined_ultra_psm3",
-                preprocess_combined_ultra,
+                PIPELINE_COMBINED_ULTRA,
                 ocr_tesseract_psm3,
                 "Ultra-combined preprocessing + Tesseract PSM 3",
             ),
@@ -644,42 +552,42 @@ def get_all_strategies() -> List[OCRStrategy]:
         [
             OCRStrategy(
                 "tesseract_enhanced_psm3_nlp",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm3,
                 "Enhanced preprocessing + Tesseract PSM 3 + NLP",
                 use_nlp_postprocess=True,
             ),
             OCRStrategy(
                 "tesseract_sharpened_psm3_nlp",
-                preprocess_sharpened,
+                PIPELINE_SHARPENED,
                 ocr_tesseract_psm3,
                 "Sharpened preprocessing + Tesseract PSM 3 + NLP",
                 use_nlp_postprocess=True,
             ),
             OCRStrategy(
                 "tesseract_combined_advanced_psm3_nlp",
-                preprocess_combined_advanced,
+                PIPELINE_COMBINED_ADVANCED,
                 ocr_tesseract_psm3,
                 "Combined advanced preprocessing + Tesseract PSM 3 + NLP",
                 use_nlp_postprocess=True,
             ),
             OCRStrategy(
                 "tesseract_bilateral_psm3_nlp",
-                preprocess_bilateral,
+                PIPELINE_BILATERAL,
                 ocr_tesseract_psm3,
                 "Bilateral filter + Tesseract PSM 3 + NLP",
                 use_nlp_postprocess=True,
             ),
             OCRStrategy(
                 "tesseract_bilateral_sharpened_psm3_nlp",
-                preprocess_bilateral_sharpened,
+                PIPELINE_BILATERAL_SHARPENED,
                 ocr_tesseract_psm3,
                 "Bilateral + sharpening + Tesseract PSM 3 + NLP",
                 use_nlp_postprocess=True,
             ),
             OCRStrategy(
                 "tesseract_bilateral_psm3_advanced_nlp",
-                preprocess_bilateral,
+                PIPELINE_BILATERAL,
                 ocr_tesseract_psm3,
                 "Bilateral filter + Tesseract PSM 3 + Advanced NLP",
                 use_nlp_postprocess=True,
@@ -687,7 +595,7 @@ def get_all_strategies() -> List[OCRStrategy]:
             ),
             OCRStrategy(
                 "tesseract_bilateral_psm3_enhanced_nlp",
-                preprocess_bilateral,
+                PIPELINE_BILATERAL,
                 ocr_tesseract_psm3,
                 "Bilateral filter + Tesseract PSM 3 + Enhanced NLP",
                 use_nlp_postprocess=True,
@@ -695,7 +603,7 @@ def get_all_strategies() -> List[OCRStrategy]:
             ),
             OCRStrategy(
                 "tesseract_bilateral_sharpened_psm3_enhanced_nlp",
-                preprocess_bilateral_sharpened,
+                PIPELINE_BILATERAL_SHARPENED,
                 ocr_tesseract_psm3,
                 "Bilateral + sharpening + Tesseract PSM 3 + Enhanced NLP",
                 use_nlp_postprocess=True,
@@ -709,61 +617,61 @@ def get_all_strategies() -> List[OCRStrategy]:
         [
             OCRStrategy(
                 "tesseract_enhanced_psm4",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm4,
                 "Enhanced preprocessing + Tesseract PSM 4",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm5",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm5,
                 "Enhanced preprocessing + Tesseract PSM 5",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm6",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm6,
                 "Enhanced preprocessing + Tesseract PSM 6",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm7",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm7,
                 "Enhanced preprocessing + Tesseract PSM 7",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm8",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm8,
                 "Enhanced preprocessing + Tesseract PSM 8",
             ),
             OCRStrategy(
                 "tesseract_enhanced_psm11",
-                preprocess_enhanced,
+                PIPELINE_ENHANCED,
                 ocr_tesseract_psm11,
                 "Enhanced preprocessing + Tesseract PSM 11",
             ),
             OCRStrategy(
                 "tesseract_sharpened_psm6",
-                preprocess_sharpened,
+                PIPELINE_SHARPENED,
                 ocr_tesseract_psm6,
                 "Sharpened preprocessing + Tesseract PSM 6",
             ),
             OCRStrategy(
                 "tesseract_combined_advanced_psm6",
-                preprocess_combined_advanced,
+                PIPELINE_COMBINED_ADVANCED,
                 ocr_tesseract_psm6,
                 "Combined advanced preprocessing + Tesseract PSM 6",
             ),
             OCRStrategy(
                 "tesseract_bilateral_psm6",
-                preprocess_bilateral,
+                PIPELINE_BILATERAL,
                 ocr_tesseract_psm6,
                 "Bilateral filter + Tesseract PSM 6",
             ),
             OCRStrategy(
                 "tesseract_bilateral_sharpened_psm6",
-                preprocess_bilateral_sharpened,
+                PIPELINE_BILATERAL_SHARPENED,
                 ocr_tesseract_psm6,
                 "Bilateral + sharpening + Tesseract PSM 6",
             ),
@@ -815,43 +723,43 @@ def get_all_strategies() -> List[OCRStrategy]:
             [
                 OCRStrategy(
                     "easyocr_basic",
-                    preprocess_basic,
+                    PIPELINE_BASIC,
                     ocr_easyocr,
                     "Basic preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_enhanced",
-                    preprocess_enhanced,
+                    PIPELINE_ENHANCED,
                     ocr_easyocr,
                     "Enhanced preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_color",
-                    preprocess_color_enhanced,
+                    PIPELINE_COLOR_ENHANCED,
                     ocr_easyocr,
                     "Color-enhanced preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_sharpened",
-                    preprocess_sharpened,
+                    PIPELINE_SHARPENED,
                     ocr_easyocr,
                     "Sharpened preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_bilateral",
-                    preprocess_bilateral,
+                    PIPELINE_BILATERAL,
                     ocr_easyocr,
                     "Bilateral filter preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_combined_advanced",
-                    preprocess_combined_advanced,
+                    PIPELINE_COMBINED_ADVANCED,
                     ocr_easyocr,
                     "Combined advanced preprocessing + EasyOCR",
                 ),
                 OCRStrategy(
                     "easyocr_enhanced_nlp",
-                    preprocess_enhanced,
+                    PIPELINE_ENHANCED,
                     ocr_easyocr,
                     "Enhanced preprocessing + EasyOCR + NLP",
                     use_nlp_postprocess=True,
@@ -862,27 +770,65 @@ def get_all_strategies() -> List[OCRStrategy]:
     return strategies
 
 
-def test_all_strategies(image_path: Path) -> Dict[str, str]:
+def test_all_strategies(image_path: Path, workers: Optional[int] = 1) -> Dict[str, str]:
     """Test all OCR strategies on an image.
 
+    In a single process, pipeline strategies are compiled into one
+    preprocessing DAG, so each preprocessing step shared between strategies
+    runs once per image. With more workers, strategies run in a process pool
+    (see strategy_executor).
+
     Args:
         image_path: Path to image file
+        workers: Worker processes (None = CPU count, 1 = run in this process)
 
     Returns:
-        Dictionary mapping strategy name to extracted text
+        Dictionary mapping strategy name to extracted text (in strategy order)
     """
     strategies = get_all_strategies()
-    results = {}
+    if workers != 1:
+        from scripts.core.parsing.strategy_executor import StrategyExecutor
+
+        names = [strategy.name for strategy in strategies]
+        extracted = StrategyExecutor(workers).map(OCRStrategy.extract, names, image_path)
+        return dict(zip(names, extracted))
+
+    # Serve cached results first; only strategies that miss are preprocessed
+    cache = get_ocr_result_cache()
+    texts: Dict[str, str] = {}
+    keys: Dict[str, str] = {}
+    try:
+        input_path = get_ocr_input_path(image_path)
+        for strategy in strategies:
+            keys[strategy.name] = strategy.cache_key(input_path)
+            cached = cache.get(keys[strategy.name])
+            if cached is not None:
+                texts[strategy.name] = cached
+    except Exception as e:
+        print(f"Error reading {image_path}: {e}", file=sys.stderr)
+        keys = {}
+
+    pending = [strategy for strategy in strategies if strategy.name not in texts]
+    dag = PreprocessingDAG(s.pipeline for s in pending if s.pipeline is not None)
+    try:
+        preprocessed = dag.run(input_path) if keys else {}
+    except Exception as e:
+        print(f"Error preprocessing {image_path}: {e}", file=sys.stderr)
+        preprocessed = {}
 
-    for strategy in strategies:
+    for strategy in pending:
         try:
-            text = strategy.extract(image_path)
-            results[strategy.name] = text
+            if strategy.pipeline in preprocessed:
+                text = strategy.recognize(preprocessed[strategy.pipeline])
+                cache.put(keys[strategy.name], text)
+            else:
+                text = strategy.extract(image_path)
+            texts[strategy.name] = text
         except Exception as e:
             print(f"Error testing {strategy.name}: {e}", file=sys.stderr)
-            results[strategy.name] = ""
+            texts[strategy.name] = ""
 
-    return results
+    return {strategy.name: texts[strategy.name] for strategy in strategies}
 
 
 def combine_results(results: Dict[str, str], method: str = "longest") -> str:
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Content-addressed persistent cache of OCR results.
+
+OCR output is a pure function of the image content, the region read, the
+strategy, the engine version and the engine configuration, so results are
+stored in SQLite under a hash of exactly those inputs. Editing an image,
+upgrading Tesseract or changing a strategy's pipeline produces a new key; old
+entries age out through least-recently-used eviction once the database
+exceeds its size budget.
+
+The cache is process- and thread-safe: each thread (and forked worker) opens
+its own connection, and SQLite serializes writers. Each connection keeps a
+running total of stored bytes, adjusted on insert and eviction and re-read
+every SIZE_RESYNC_PUTS puts, so a put doesn't scan the table.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Final, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
+    raise
+
+from scripts.models.ocr_settings_config import get_ocr_settings
+
+DEFAULT_CACHE_PATH: Final[Path] = (
+    Path(__file__).parent.parent.parent.parent / ".generated" / "ocr" / "results.sqlite"
+)
+BYTES_PER_MB: Final[int] = 1024 * 1024
+
+# Bump when OCR output changes without any key input changing
+OCR_CACHE_SCHEMA_VERSION: Final[int] = 1
+
+# Approximate per-row storage beyond key and text
+ROW_OVERHEAD_BYTES: Final[int] = 64
+EVICTION_BATCH: Final[int] = 64
+# Puts between re-reading the exact stored size (picks up other processes' writes)
+SIZE_RESYNC_PUTS: Final[int] = 1024
+
+Box = Optional[Tuple[int, int, int, int]]
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS ocr_results (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ocr_results_last_used ON ocr_results (last_used);
+"""
+
+
+def hash_array(image: np.ndarray) -> str:
+    """Content hash of an in-memory image (pixels, shape and dtype)."""
+    digest = hashlib.sha256(f"{image.shape}|{image.dtype}|".encode())
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_file_version(path: str, mtime_ns: int, size: int) -> str:
+    """Content hash of one version of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(BYTES_PER_MB), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Content hash of a file (re-read only when its mtime or size changes)."""
+    stat = os.stat(path)
+    return _hash_file_version(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def make_key(content_hash: str, box: Box, strategy: str, engine_version: str, config: str) -> str:
+    """Build a cache key from every input that determines an OCR result.
+
+    Args:
+        content_hash: Hash of the image content (hash_file or hash_array)
+        box: (x, y, width, height) region read, or None for the whole image
+        strategy: Strategy or entry point name
+        engine_version: OCR engine version(s)
+        config: Engine/strategy configuration (hashed)
+
+    Returns:
+        Hex digest key
+    """
+    parts = [
+        OCR_CACHE_SCHEMA_VERSION,
+        content_hash,
+        list(box) if box is not None else None,
+        strategy,
+        engine_version,
+        hashlib.sha256(config.encode()).hexdigest(),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class OCRResultCache:
+    """SQLite-backed OCR result cache with LRU eviction bounded by size.
+
+    Args:
+        path: Database file (None = in-memory, per thread)
+        max_bytes: Size budget for stored results
+        enabled: If False, every lookup misses and nothing is stored
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = DEFAULT_CACHE_PATH,
+        max_bytes: int = 512 * BYTES_PER_MB,
+        enabled: bool = True,
+    ):
+        """Initialize settings (the database is opened lazily per thread)."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the current thread (reopened after a fork)."""
+        pid = os.getpid()
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != pid:
+            if self.path is None:
+                target = ":memory:"
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                target = str(self.path)
+            connection = sqlite3.connect(target, timeout=30.0, isolation_level=None)
+            if self.path is not None:
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+            self._local.pid = pid
+            self._resync_size(connection)
+        return connection
+
+    def _resync_size(self, connection: sqlite3.Connection) -> None:
+        """Re-read this thread's running total from the table."""
+        query = "SELECT COALESCE(SUM(size), 0) FROM ocr_results"
+        self._local.stored_bytes = connection.execute(query).fetchone()[0]
+        self._local.puts_since_resync = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached result (refreshing its recency on a hit)."""
+        if not self.enabled:
+            return None
+        connection = self._connection()
+        row = connection.execute("SELECT text FROM ocr_results WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        connection.execute(
+            "UPDATE ocr_results SET last_used = ? WHERE key = ?", (time.time_ns(), key)
+        )
+        return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        """Store a result and evict least recently used ones over the size budget."""
+        if not self.enabled:
+            return
+        size = len(key) + len(text.encode("utf-8")) + ROW_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+        connection = self._connection()
+        if self._local.puts_since_resync >= SIZE_RESYNC_PUTS:
+            self._resync_size(connection)
+        replaced = connection.execute(
+            "SELECT size FROM ocr_results WHERE key = ?", (key,)
+        ).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO ocr_results (key, text, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, text, size, time.time_ns()),
+        )
+        self._local.stored_bytes += size - (replaced[0] if replaced is not None else 0)
+        self._local.puts_since_resync += 1
+        self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete the oldest entries until the running total fits the budget."""
+        excess = self._local.stored_bytes - self.max_bytes
+        while excess > 0:
+            rows = connection.execute(
+                "SELECT key, size FROM ocr_results ORDER BY last_used LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                return
+            victims = []
+            for key, size in rows:
+                victims.append((key,))
+                excess -= size
+                self._local.stored_bytes -= size
+                if excess <= 0:
+                    break
+            connection.executemany("DELETE FROM ocr_results WHERE key = ?", victims)
+            with self._lock:
+                self.evictions += len(victims)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """Return the cached result for a key, computing and storing it on a miss.
+
+        Exceptions from ``compute`` propagate and nothing is stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        text = compute()
+        self.put(key, text)
+        return text
+
+    def entry_count(self) -> int:
+        """Number of stored results."""
+        if not self.enabled:
+            return 0
+        return self._connection().execute("SELECT COUNT(*) FROM ocr_results").fetchone()[0]
+
+    def total_bytes(self) -> int:
+        """Approximate storage used by results."""
+        if not self.enabled:
+            return 0
+        query = "SELECT COALESCE(SUM(size), 0) FROM ocr_results"
+        return self._connection().execute(query).fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete every stored result and reset statistics."""
+        if self.enabled:
+            connection = self._connection()
+            connection.execute("DELETE FROM ocr_results")
+            self._resync_size(connection)
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+
+_default_cache: Optional[OCRResultCache] = None
+
+
+def get_ocr_result_cache() -> OCRResultCache:
+    """Get the shared OCR result cache (configured from OCR settings)."""
+    global _default_cache
+    if _default_cache is None:
+        settings = get_ocr_settings()
+        _default_cache = OCRResultCache(
+            max_bytes=settings.ocr_result_cache_max_mb * BYTES_PER_MB,
+            enabled=settings.ocr_result_cache_enabled,
+        )
+    return _default_cache
+
+
+# Convenience functions
+def cached_ocr(
+    content_hash: str,
+    box: Box,
+    strategy: str,
+    engine_version: str,
+    config: Union[str, Sequence[object]],
+    compute: Callable[[], str],
+) -> str:
+    """Run an OCR computation through the shared result cache.
+
+    Args:
+        content_hash: Hash of the image content
+        box: Region read, or None for the whole image
+        strategy: Strategy or entry point name
+        engine_version: OCR engine version(s)
+        config: Configuration string, or values rendered with repr()
+        compute: Zero-argument function producing the text
+
+    Returns:
+        Recognized text
+    """
+    if not isinstance(config, str):
+        config = repr(tuple(config))
+    key = make_key(content_hash, box, strategy, engine_version, config)
+    return get_ocr_result_cache().get_or_compute(key, compute)
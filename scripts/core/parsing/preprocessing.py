@@ -24,6 +24,8 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from scripts.core.parsing.image_cache import bilateral_gray, read_bgr, read_gray  # noqa: E402
+
 
 def detect_font_characteristics(image: np.ndarray) -> dict:
     """Detect font characteristics from image.
@@ -82,11 +84,8 @@ def preprocess_for_serif_font(image_path: Path) -> np.ndarray:
     - Moderate contrast enhancement
     - Bilateral filtering to preserve edges
     """
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
     # Bilateral filter (preserve serif details)
-    filtered = cv2.bilateralFilter(gray, 9, 75, 75)
+    filtered = bilateral_gray(image_path, 9, 75, 75)
 
     # Moderate CLAHE (don't over-enhance)
     clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
@@ -106,8 +105,7 @@ def preprocess_for_sans_serif_font(image_path: Path) -> np.ndarray:
     - Higher contrast enhancement
     - Cleaner edges
     """
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = read_gray(image_path)
 
     # Unsharp mask for sharpening
     blurred = cv2.GaussianBlur(gray, (0, 0), 1.5)
@@ -135,8 +133,7 @@ def preprocess_for_small_font(image_path: Path) -> np.ndarray:
     - Aggressive sharpening
     - High contrast
     """
-    img = cv2.imread(str(image_path))
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = read_gray(image_path)
 
     # Upscale 3x for small fonts
     h, w = gray.shape
@@ -158,12 +155,12 @@ def preprocess_for_small_font(image_path: Path) -> np.ndarray:
 
 def preprocess_adaptive_font_aware(image_path: Path) -> np.ndarray:
     """Adaptive preprocessing based on detected font characteristics."""
-    img = cv2.imread(str(image_path))
+    img = read_bgr(image_path)
 
     # Detect font characteristics
     characteristics = detect_font_characteristics(img)
 
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = read_gray(image_path)
 
     # Choose preprocessing based on characteristics
     if characteristics["font_size"] == "small":
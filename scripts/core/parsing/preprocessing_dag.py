@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Preprocessing pipelines of named operations, executed as a shared DAG.
+
+A pipeline is a tuple of steps applied to the decoded BGR image, where each
+step is an operation name followed by its parameters, e.g.
+``(("gray",), ("clahe", 2.0, 8), ("otsu",))``. Pipelines that share a prefix
+share the intermediate it produces: compiling several pipelines into a
+``PreprocessingDAG`` merges common prefixes, and running it on an image
+executes each distinct prefix once.
+
+Every prefix is also memoized in the shared image cache under the prefix as
+its signature, so results are reused across runs and by the decode helpers in
+``image_cache`` (the empty pipeline is the decoded image itself).
+"""
+
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Final, Hashable, Iterable, List, Tuple, Union
+
+try:
+    import cv2
+    import numpy as np
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
+    raise
+
+from scripts.core.parsing.image_cache import cached_image, read_bgr
+
+Step = Tuple[Hashable, ...]
+Pipeline = Tuple[Step, ...]
+Operation = Callable[..., np.ndarray]
+
+
+# Operations
+def _gray(image: np.ndarray) -> np.ndarray:
+    """BGR to grayscale."""
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def _clahe(image: np.ndarray, clip_limit: float, tile_grid_size: int) -> np.ndarray:
+    """CLAHE contrast enhancement."""
+    tiles = (tile_grid_size, tile_grid_size)
+    return cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tiles).apply(image)
+
+
+def _lab_clahe(image: np.ndarray, clip_limit: float, tile_grid_size: int) -> np.ndarray:
+    """CLAHE on the lightness channel of a BGR image, keeping color."""
+    lightness, a, b = cv2.split(cv2.cvtColor(image, cv2.COLOR_BGR2LAB))
+    lab = cv2.merge([_clahe(lightness, clip_limit, tile_grid_size), a, b])
+    return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+
+
+def _otsu(image: np.ndarray) -> np.ndarray:
+    """OTSU binarization."""
+    _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def _adaptive(image: np.ndarray, block_size: int, c: float) -> np.ndarray:
+    """Gaussian adaptive thresholding (better for varying lighting)."""
+    return cv2.adaptiveThreshold(
+        image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, c
+    )
+
+
+def _bilateral(
+    image: np.ndarray, diameter: int, sigma_color: float, sigma_space: float
+) -> np.ndarray:
+    """Edge-preserving bilateral filter."""
+    return cv2.bilateralFilter(image, diameter, sigma_color, sigma_space)
+
+
+def _unsharp(image: np.ndarray, sigma: float, amount: float) -> np.ndarray:
+    """Unsharp mask: ``amount * image + (1 - amount) * blurred``."""
+    blurred = cv2.GaussianBlur(image, (0, 0), sigma)
+    return cv2.addWeighted(image, amount, blurred, 1.0 - amount, 0)
+
+
+def _upscale(image: np.ndarray, factor: int) -> np.ndarray:
+    """Cubic upscaling by an integer factor."""
+    h, w = image.shape[:2]
+    return cv2.resize(image, (w * factor, h * factor), interpolation=cv2.INTER_CUBIC)
+
+
+def _equalize(image: np.ndarray) -> np.ndarray:
+    """Histogram equalization."""
+    return cv2.equalizeHist(image)
+
+
+def _morphology(operation: int) -> Operation:
+    """Morphological operation with a square kernel of the given size."""
+
+    def apply(image: np.ndarray, kernel_size: int) -> np.ndarray:
+        kernel = np.ones((kernel_size, kernel_size), np.uint8)
+        return cv2.morphologyEx(image, operation, kernel)
+
+    return apply
+
+
+def _nl_means(
+    image: np.ndarray, strength: float, template_window: int, search_window: int
+) -> np.ndarray:
+    """Non-local means denoising."""
+    return cv2.fastNlMeansDenoising(image, None, strength, template_window, search_window)
+
+
+def _deskew(image: np.ndarray, min_angle: float) -> np.ndarray:
+    """Rotate a grayscale image to align text (skipped below ``min_angle`` degrees)."""
+    coords = np.column_stack(np.where(image > 0))
+    if len(coords) == 0:
+        return image
+
+    angle = cv2.minAreaRect(coords)[-1]
+    angle = -(90 + angle) if angle < -45 else -angle
+    if abs(angle) <= min_angle:
+        return image
+
+    h, w = image.shape[:2]
+    matrix = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
+    return cv2.warpAffine(
+        image, matrix, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE
+    )
+
+
+OPERATIONS: Final[Dict[str, Operation]] = {
+    "gray": _gray,
+    "clahe": _clahe,
+    "lab_clahe": _lab_clahe,
+    "otsu": _otsu,
+    "adaptive": _adaptive,
+    "bilateral": _bilateral,
+    "unsharp": _unsharp,
+    "upscale": _upscale,
+    "equalize": _equalize,
+    "open": _morphology(cv2.MORPH_OPEN),
+    "close": _morphology(cv2.MORPH_CLOSE),
+    "nl_means": _nl_means,
+    "deskew": _deskew,
+}
+
+
+def validate_pipeline(pipeline: Pipeline) -> Pipeline:
+    """Check every step names a known operation.
+
+    Args:
+        pipeline: Steps to validate
+
+    Returns:
+        The pipeline as a tuple of tuples
+
+    Raises:
+        ValueError: If a step is empty or names an unknown operation
+    """
+    steps = tuple(tuple(step) for step in pipeline)
+    for step in steps:
+        if not step or step[0] not in OPERATIONS:
+            raise ValueError(f"Unknown preprocessing operation: {step!r}")
+    return steps
+
+
+class PreprocessingDAG:
+    """Pipelines compiled into a DAG of their distinct prefixes.
+
+    Args:
+        pipelines: Pipelines to compile (duplicates are merged)
+    """
+
+    def __init__(self, pipelines: Iterable[Pipeline]):
+        """Compile pipelines, merging shared prefixes."""
+        self.pipelines: List[Pipeline] = []
+        self.nodes: Dict[Pipeline, Pipeline] = {}  # prefix -> parent prefix
+        for pipeline in pipelines:
+            steps = validate_pipeline(pipeline)
+            if steps in self.pipelines:
+                continue
+            self.pipelines.append(steps)
+            for length in range(1, len(steps) + 1):
+                self.nodes.setdefault(steps[:length], steps[: length - 1])
+
+    @property
+    def operation_count(self) -> int:
+        """Number of distinct operations executed per image (at most)."""
+        return len(self.nodes)
+
+    def run(self, image_path: Union[str, Path]) -> Dict[Pipeline, np.ndarray]:
+        """Run every compiled pipeline on an image.
+
+        Each distinct prefix is computed at most once; prefixes already in the
+        shared image cache are not recomputed at all.
+
+        Args:
+            image_path: Source image file
+
+        Returns:
+            Dictionary mapping each pipeline to its read-only output
+        """
+        computed: Dict[Pipeline, np.ndarray] = {}
+
+        def evaluate(prefix: Pipeline) -> np.ndarray:
+            if prefix in computed:
+                return computed[prefix]
+            if not prefix:
+                value = read_bgr(image_path)
+            else:
+                name, *params = prefix[-1]
+                value = cached_image(
+                    image_path,
+                    prefix,
+                    lambda: OPERATIONS[name](evaluate(prefix[:-1]), *params),
+                )
+            computed[prefix] = value
+            return value
+
+        return {pipeline: evaluate(pipeline) for pipeline in self.pipelines}
+
+
+# Convenience functions
+def run_pipeline(image_path: Union[str, Path], pipeline: Pipeline) -> np.ndarray:
+    """Run a single pipeline on an image (read-only result)."""
+    dag = PreprocessingDAG([pipeline])
+    return dag.run(image_path)[dag.pipelines[0]]
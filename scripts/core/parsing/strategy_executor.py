@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parallel execution of OCR strategies.
+
+Strategies hold closures and OCR engine state, so they aren't sent to worker
+processes. Each worker builds its own strategy list once in the pool
+initializer, together with warm EasyOCR, spaCy and Tesseract state, and tasks
+refer to strategies by name. Tesseract's internal OpenMP threads are capped
+(``OMP_THREAD_LIMIT``) so that N workers don't each start one thread per core.
+Results are yielded in the order of the requested strategy names.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, Final, Iterator, Optional, Sequence, TypeVar
+
+try:
+    import numpy as np
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
+    raise
+
+from scripts.core.parsing.ocr_engines import OCRStrategy, get_all_strategies
+
+DEFAULT_OMP_THREAD_LIMIT: Final[int] = 1
+
+T = TypeVar("T")
+
+# Strategies of the current worker process, keyed by name
+_worker_strategies: Optional[Dict[str, OCRStrategy]] = None
+
+
+def _init_worker(thread_limit: int) -> None:
+    """Pool initializer: cap OCR threads and warm per-process OCR/NLP state."""
+    global _worker_strategies
+    os.environ["OMP_THREAD_LIMIT"] = str(thread_limit)
+    _worker_strategies = {strategy.name: strategy for strategy in get_all_strategies()}
+
+    from scripts.core.parsing import ocr_engines
+    from scripts.core.parsing.tesseract_engine import get_tesseract_engine
+
+    get_tesseract_engine()
+    try:
+        from scripts.core.parsing.nlp_postprocessing import get_nlp_model
+
+        get_nlp_model()
+    except ImportError:
+        pass
+    if ocr_engines.easyocr is not None:
+        try:
+            ocr_engines.ocr_easyocr(np.zeros((8, 8), dtype=np.uint8))
+        except Exception:
+            # Strategies using EasyOCR report their own errors
+            pass
+
+
+def _call_in_worker(fn: Callable[..., T], name: str, args: tuple) -> T:
+    """Run ``fn(strategy, *args)`` with the worker's strategy of that name."""
+    if _worker_strategies is None:
+        raise RuntimeError("Strategy worker was not initialized (run it through StrategyExecutor)")
+    return fn(_worker_strategies[name], *args)
+
+
+class StrategyExecutor:
+    """Run a function over OCR strategies, optionally across processes.
+
+    Args:
+        workers: Worker processes (None = CPU count, 1 = run in this process)
+        thread_limit: OMP_THREAD_LIMIT for each worker's Tesseract
+    """
+
+    def __init__(self, workers: Optional[int] = 1, thread_limit: int = DEFAULT_OMP_THREAD_LIMIT):
+        """Initialize executor settings."""
+        if workers is not None and workers < 1:
+            raise ValueError(f"Workers must be positive: {workers}")
+        if thread_limit < 1:
+            raise ValueError(f"Thread limit must be positive: {thread_limit}")
+        self.workers = workers or os.cpu_count() or 1
+        self.thread_limit = thread_limit
+
+    def map(
+        self, fn: Callable[..., T], strategy_names: Sequence[str], *args: object
+    ) -> Iterator[T]:
+        """Yield ``fn(strategy, *args)`` for each named strategy, in order.
+
+        With more than one worker, ``fn`` and ``args`` must be picklable
+        (module-level functions and plain data).
+
+        Args:
+            fn: Function taking an OCRStrategy and ``args``
+            strategy_names: Names from get_all_strategies()
+            *args: Extra arguments passed to every call
+
+        Yields:
+            Results in the order of ``strategy_names``
+        """
+        if self.workers == 1:
+            strategies = {strategy.name: strategy for strategy in get_all_strategies()}
+            for name in strategy_names:
+                yield fn(strategies[name], *args)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, max(1, len(strategy_names))),
+            initializer=_init_worker,
+            initargs=(self.thread_limit,),
+        ) as executor:
+            yield from executor.map(_call_in_worker, repeat(fn), strategy_names, repeat(args))
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Persistent in-process Tesseract engine.
+
+``pytesseract.image_to_string`` writes each image to a temporary PNG and
+starts a tesseract process to read it, which dominates the cost of OCR on
+small region crops. ``TesseractEngine`` instead binds the installed
+libtesseract C API via ctypes and keeps one initialized API handle per thread
+(and OEM mode). Images are passed as in-memory pixel buffers, and the page
+segmentation mode is switched on the existing handle.
+
+When libtesseract or its language data can't be loaded (or the persistent
+engine is disabled in ``ocr_settings.toml``), calls fall back to pytesseract
+with the same ``--oem``/``--psm`` configuration.
+"""
+
+import atexit
+import ctypes
+import ctypes.util
+import sys
+import threading
+from typing import Dict, Final, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+try:
+    import numpy as np
+    import pytesseract
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e.name}\n", file=sys.stderr)
+    raise
+
+from scripts.core.parsing.ocr_result_cache import cached_ocr, hash_array
+from scripts.models.ocr_settings_config import get_ocr_settings
+
+DEFAULT_LANGUAGE: Final[str] = "eng"
+
+# Tried after ctypes.util.find_library when no library path is configured
+LIBRARY_CANDIDATES: Final[Tuple[str, ...]] = (
+    "libtesseract.so.5",
+    "libtesseract.so.4",
+    "libtesseract.dylib",
+    "/opt/homebrew/lib/libtesseract.dylib",
+    "/usr/local/lib/libtesseract.dylib",
+    "libtesseract-5.dll",
+)
+
+
+def load_library(path: str = "") -> Optional[ctypes.CDLL]:
+    """Load libtesseract and declare the C API functions used here.
+
+    Args:
+        path: Explicit library path (empty = search the usual names)
+
+    Returns:
+        Loaded library, or None if it can't be found
+    """
+    candidates: List[str] = [path] if path else []
+    if not path:
+        found = ctypes.util.find_library("tesseract")
+        if found:
+            candidates.append(found)
+        candidates.extend(LIBRARY_CANDIDATES)
+
+    for candidate in candidates:
+        try:
+            lib = ctypes.CDLL(candidate)
+        except OSError:
+            continue
+
+        handle = ctypes.c_void_p
+        lib.TessVersion.restype = ctypes.c_char_p
+        lib.TessVersion.argtypes = []
+        lib.TessBaseAPICreate.restype = handle
+        lib.TessBaseAPICreate.argtypes = []
+        lib.TessBaseAPIDelete.restype = None
+        lib.TessBaseAPIDelete.argtypes = [handle]
+        lib.TessBaseAPIInit2.restype = ctypes.c_int
+        lib.TessBaseAPIInit2.argtypes = [handle, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        lib.TessBaseAPISetPageSegMode.restype = None
+        lib.TessBaseAPISetPageSegMode.argtypes = [handle, ctypes.c_int]
+        lib.TessBaseAPISetImage.restype = None
+        lib.TessBaseAPISetImage.argtypes = [
+            handle,
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+        ]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        lib.TessBaseAPIGetUTF8Text.argtypes = [handle]
+        lib.TessDeleteText.restype = None
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIClear.restype = None
+        lib.TessBaseAPIClear.argtypes = [handle]
+        lib.TessBaseAPIAllWordConfidences.restype = ctypes.POINTER(ctypes.c_int)
+        lib.TessBaseAPIAllWordConfidences.argtypes = [handle]
+        lib.TessDeleteIntArray.restype = None
+        lib.TessDeleteIntArray.argtypes = [ctypes.POINTER(ctypes.c_int)]
+        lib.TessBaseAPIEnd.restype = None
+        lib.TessBaseAPIEnd.argtypes = [handle]
+        return lib
+    return None
+
+
+class OCRReading(BaseModel):
+    """Recognized text with Tesseract's per-word confidences."""
+
+    text: str = Field(default="", description="Recognized text")
+    word_confidences: List[float] = Field(
+        default_factory=list, description="Confidence (0-100) of each recognized word"
+    )
+
+    @property
+    def mean_confidence(self) -> float:
+        """Mean word confidence (0 when nothing was recognized)."""
+        if not self.word_confidences:
+            return 0.0
+        return sum(self.word_confidences) / len(self.word_confidences)
+
+
+def reading_from_data(data: Dict[str, list]) -> OCRReading:
+    """Build a reading from ``pytesseract.image_to_data`` dictionary output.
+
+    Words are joined with spaces within a line, lines with newlines, and
+    paragraphs and blocks with blank lines.
+    """
+    lines: List[str] = []
+    confidences: List[float] = []
+    current: Optional[Tuple[int, int, int]] = None
+    words: List[str] = []
+    for index, word in enumerate(data["text"]):
+        word = str(word).strip()
+        confidence = float(data["conf"][index])
+        if not word or confidence < 0:
+            continue
+        line = (data["block_num"][index], data["par_num"][index], data["line_num"][index])
+        if line != current:
+            if words:
+                lines.append(" ".join(words))
+                if current is not None and line[:2] != current[:2]:
+                    lines.append("")
+            current, words = line, []
+        words.append(word)
+        confidences.append(confidence)
+    if words:
+        lines.append(" ".join(words))
+    return OCRReading(text="\n".join(lines), word_confidences=confidences)
+
+
+class TesseractEngine:
+    """Long-lived Tesseract API handles, one per thread and OEM mode.
+
+    Args:
+        language: Tesseract language code(s), e.g. ``"eng"``
+        library_path: Explicit libtesseract path (empty = search)
+        persistent: If False, always use the pytesseract fallback
+    """
+
+    def __init__(
+        self,
+        language: str = DEFAULT_LANGUAGE,
+        library_path: str = "",
+        persistent: bool = True,
+    ):
+        """Load the library (handles are created lazily per thread)."""
+        self.language = language
+        self._lib = load_library(library_path) if persistent else None
+        self._version: Optional[str] = None
+        self._local = threading.local()
+        self._handles: List[int] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_native(self) -> bool:
+        """True if calls go through libtesseract rather than pytesseract."""
+        return self._lib is not None
+
+    @property
+    def version(self) -> str:
+        """Tesseract version string ("unknown" if no tesseract is installed)."""
+        if self._version is None:
+            try:
+                if self._lib is not None:
+                    self._version = self._lib.TessVersion().decode()
+                else:
+                    self._version = str(pytesseract.get_tesseract_version())
+            except Exception:
+                self._version = "unknown"
+        return self._version
+
+    def _handle(self, oem: int) -> Optional[int]:
+        """Initialized API handle of the current thread for an OEM mode."""
+        lib = self._lib
+        if lib is None:
+            raise RuntimeError("libtesseract is not loaded")
+        handles: Optional[Dict[int, Optional[int]]] = getattr(self._local, "handles", None)
+        if handles is None:
+            handles = self._local.handles = {}
+        if oem in handles:
+            return handles[oem]
+
+        created: int = lib.TessBaseAPICreate()
+        handle: Optional[int] = created
+        if lib.TessBaseAPIInit2(created, None, self.language.encode(), oem) != 0:
+            # Missing language data: fall back for this OEM mode on this thread
+            lib.TessBaseAPIDelete(created)
+            handle = None
+        else:
+            with self._lock:
+                self._handles.append(created)
+        handles[oem] = handle
+        return handle
+
+    def image_to_string(self, image: np.ndarray, psm: int, oem: int = 3) -> str:
+        """Recognize text in an in-memory image.
+
+        Args:
+            image: Grayscale (H, W) or color (H, W, C) uint8 image
+            psm: Page segmentation mode
+            oem: OCR engine mode
+
+        Returns:
+            Recognized text (unstripped, like pytesseract)
+        """
+        handle = self._handle(oem) if self._lib is not None else None
+        if handle is None:
+            text: str = pytesseract.image_to_string(image, config=f"--oem {oem} --psm {psm}")
+            return text
+        return self._recognize(handle, image, psm, with_confidences=False).text
+
+    def image_to_data(self, image: np.ndarray, psm: int, oem: int = 3) -> OCRReading:
+        """Recognize text and per-word confidences in one pass.
+
+        Args:
+            image: Grayscale (H, W) or color (H, W, C) uint8 image
+            psm: Page segmentation mode
+            oem: OCR engine mode
+
+        Returns:
+            OCRReading with text and word confidences
+        """
+        handle = self._handle(oem) if self._lib is not None else None
+        if handle is None:
+            data = pytesseract.image_to_data(
+                image, config=f"--oem {oem} --psm {psm}", output_type=pytesseract.Output.DICT
+            )
+            return reading_from_data(data)
+        return self._recognize(handle, image, psm, with_confidences=True)
+
+    def _recognize(
+        self, handle: int, image: np.ndarray, psm: int, with_confidences: bool
+    ) -> OCRReading:
+        """Recognize an in-memory image on a native handle."""
+        pixels = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = pixels.shape[:2]
+        channels = 1 if pixels.ndim == 2 else pixels.shape[2]
+
+        lib = self._lib
+        if lib is None:
+            raise RuntimeError("libtesseract is not loaded")
+        lib.TessBaseAPISetPageSegMode(handle, psm)
+        lib.TessBaseAPISetImage(
+            handle, pixels.ctypes.data, width, height, channels, pixels.strides[0]
+        )
+        try:
+            text = ""
+            text_ptr = lib.TessBaseAPIGetUTF8Text(handle)
+            if text_ptr:
+                try:
+                    text = ctypes.string_at(text_ptr).decode("utf-8", errors="replace")
+                finally:
+                    lib.TessDeleteText(text_ptr)
+
+            confidences: List[float] = []
+            if with_confidences:
+                conf_ptr = lib.TessBaseAPIAllWordConfidences(handle)
+                if conf_ptr:
+                    try:
+                        index = 0
+                        while conf_ptr[index] != -1:
+                            confidences.append(float(conf_ptr[index]))
+                            index += 1
+                    finally:
+                        lib.TessDeleteIntArray(conf_ptr)
+            return OCRReading(text=text, word_confidences=confidences)
+        finally:
+            lib.TessBaseAPIClear(handle)
+
+    def close(self) -> None:
+        """Release every API handle created by this engine."""
+        with self._lock:
+            handles, self._handles = self._handles, []
+        lib = self._lib
+        if lib is not None:
+            for handle in handles:
+                lib.TessBaseAPIEnd(handle)
+                lib.TessBaseAPIDelete(handle)
+        self._local = threading.local()
+
+
+_default_engine: Optional[TesseractEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_tesseract_engine() -> TesseractEngine:
+    """Get the shared process-wide Tesseract engine (configured from OCR settings)."""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            settings = get_ocr_settings()
+            _default_engine = TesseractEngine(
+                library_path=settings.ocr_tesseract_library,
+                persistent=settings.ocr_tesseract_persistent_engine,
+            )
+            atexit.register(_default_engine.close)
+    return _default_engine
+
+
+# Convenience functions
+def tesseract_image_to_string(image: np.ndarray, psm: int, oem: int = 3) -> str:
+    """Recognize text with the shared Tesseract engine, through the OCR result cache."""
+    engine = get_tesseract_engine()
+    return cached_ocr(
+        hash_array(image),
+        None,
+        "tesseract",
+        engine.version,
+        # Native and pytesseract output differ in formatting
+        (engine.language, oem, psm, engine.is_native),
+        lambda: engine.image_to_string(image, psm=psm, oem=oem),
+    )
+
+
+def tesseract_image_to_data(image: np.ndarray, psm: int, oem: int = 3) -> OCRReading:
+    """Recognize text and word confidences with the shared engine, through the result cache."""
+    engine = get_tesseract_engine()
+    payload = cached_ocr(
+        hash_array(image),
+        None,
+        "tesseract_data",
+        engine.version,
+        (engine.language, oem, psm, engine.is_native),
+        lambda: engine.image_to_data(image, psm=psm, oem=oem).model_dump_json(),
+    )
+    return OCRReading.model_validate_json(payload)
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Array-backed statistics for every power level combination in a character pool.
+
+``CharacterBuild.statistics`` builds a pydantic model per access, which is fine
+for one build but dominates the cost of a pool-wide sweep (characters x 64 level
+combinations). This module computes the same ``CharacterStatistics`` fields for
+all combinations at once as NumPy columns (structure of arrays), one row per
+(character, special level, common 1 level, common 2 level).
+"""
+
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Optional, Tuple
+
+import numpy as np
+
+from scripts.models.character_build import CharacterStatistics
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_probabilities import get_single_die_stats
+from scripts.models.game_mechanics import DiceFaceSymbol, DiceType
+from scripts.models.power_combination import PowerEffect, create_power_effect_from_level
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
+    from scripts.models.character_pool import CharacterPool
+
+POWER_LEVELS: Final[int] = 4
+COMBINATIONS_PER_CHARACTER: Final[int] = POWER_LEVELS**3
+COMMON_POWER_SLOTS: Final[int] = 2
+BASE_BLACK_DICE: Final[int] = 3
+
+# Per-effect attributes gathered into (characters, slots, levels) arrays
+EFFECT_ATTRIBUTES: Final[Tuple[str, ...]] = (
+    "green_dice_added",
+    "black_dice_added",
+    "rerolls_added",
+    "wounds_healed",
+    "stress_healed",
+    "elder_signs_as_successes",
+)
+
+# "Any number" elder sign conversion in effect arrays (more than any roll can show)
+ANY_ELDER_SIGNS: Final[int] = np.iinfo(np.int16).max
+
+# Per-row elder sign conversion cap (0 = none, ANY_ELDER_SIGNS = any number, written
+# as null in the columnar index); a table column that is not a CharacterStatistics field
+ELDER_CONVERSION_COLUMN: Final[str] = "elder_signs_as_successes"
+
+# Columnar statistics index layout (bump when it changes)
+STATISTICS_INDEX_VERSION: Final[int] = 3
+STATISTICS_DECIMALS: Final[int] = 6
+
+# All (special, common 1, common 2) levels in row order
+LEVEL_GRID: Final[np.ndarray] = np.array(
+    list(itertools.product(range(1, POWER_LEVELS + 1), repeat=3)), dtype=np.int8
+)
+
+
+class BuildStatisticsTable:
+    """Structure-of-arrays table of ``CharacterStatistics`` for many builds.
+
+    Rows are ordered by character, then special, common 1 and common 2 level,
+    so a row index is ``character * 64 + (special-1) * 16 + (common1-1) * 4 + (common2-1)``.
+
+    Attributes:
+        character_names: Character name per character index
+        character_index: Character index per row
+        levels: (rows, 3) array of (special, common 1, common 2) levels
+        columns: CharacterStatistics field name -> per-row values, plus
+            ELDER_CONVERSION_COLUMN
+    """
+
+    __slots__ = ("character_names", "character_index", "levels", "columns")
+
+    def __init__(
+        self,
+        character_names: List[str],
+        character_index: np.ndarray,
+        levels: np.ndarray,
+        columns: Dict[str, np.ndarray],
+    ):
+        """Initialize from precomputed columns."""
+        self.character_names = character_names
+        self.character_index = character_index
+        self.levels = levels
+        self.columns = columns
+
+    def __len__(self) -> int:
+        """Number of rows (builds)."""
+        return int(self.character_index.size)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one statistics column.
+
+        Args:
+            name: CharacterStatistics field name
+
+        Returns:
+            Per-row values
+        """
+        if name not in self.columns:
+            raise KeyError(f"Unknown statistics column: {name}")
+        return self.columns[name]
+
+    def row_index(
+        self, character_name: str, special_level: int, common_1_level: int, common_2_level: int
+    ) -> int:
+        """Get the row index of one build.
+
+        Args:
+            character_name: Character name (case-insensitive)
+            special_level: Special power level (1-4)
+            common_1_level: First common power level (1-4)
+            common_2_level: Second common power level (1-4)
+
+        Returns:
+            Row index into every column
+        """
+        lowered = [name.lower() for name in self.character_names]
+        if character_name.lower() not in lowered:
+            raise KeyError(f"Character not in table: {character_name}")
+        for level in (special_level, common_1_level, common_2_level):
+            if not 1 <= level <= POWER_LEVELS:
+                raise ValueError(f"Power level must be 1-{POWER_LEVELS}: {level}")
+        return (
+            lowered.index(character_name.lower()) * COMBINATIONS_PER_CHARACTER
+            + (special_level - 1) * POWER_LEVELS**2
+            + (common_1_level - 1) * POWER_LEVELS
+            + (common_2_level - 1)
+        )
+
+    def statistics(self, row: int) -> CharacterStatistics:
+        """Convert one row back into a CharacterStatistics model."""
+        return CharacterStatistics(
+            **{
+                name: values[row].item()
+                for name, values in self.columns.items()
+                if name in CharacterStatistics.model_fields
+            }
+        )
+
+    def to_columnar(
+        self, character_ids: Optional[List[str]] = None, decimals: int = STATISTICS_DECIMALS
+    ) -> Dict[str, Any]:
+        """Convert the table to a JSON-serializable columnar index.
+
+        Rows follow the table layout, so row ``character * 64 + combination``
+        belongs to ``characters[character]`` at ``levels[combination]``; neither
+        is repeated per row.
+
+        Args:
+            character_ids: Identifier per character index (default: character names)
+            decimals: Decimal places kept for float columns
+
+        Returns:
+            Dictionary with ``characters`` (id table), ``levels`` (64 level
+            combinations) and ``columns`` (one list per statistic; in the
+            ELDER_CONVERSION_COLUMN, null means any number of elder signs)
+        """
+        ids = self.character_names if character_ids is None else character_ids
+        if len(ids) != len(self.character_names):
+            raise ValueError(f"Expected {len(self.character_names)} character ids, got {len(ids)}")
+        columns: Dict[str, List[object]] = {}
+        for name, values in self.columns.items():
+            if np.issubdtype(values.dtype, np.floating):
+                columns[name] = np.round(values, decimals).tolist()
+            else:
+                columns[name] = values.astype(np.int64).tolist()
+        columns[ELDER_CONVERSION_COLUMN] = [
+            None if cap == ANY_ELDER_SIGNS else cap for cap in columns[ELDER_CONVERSION_COLUMN]
+        ]
+        return {
+            "version": STATISTICS_INDEX_VERSION,
+            "rows_per_character": COMBINATIONS_PER_CHARACTER,
+            "characters": [
+                {"id": character_id, "name": name}
+                for character_id, name in zip(ids, self.character_names)
+            ],
+            "levels": LEVEL_GRID.astype(np.int64).tolist(),
+            "columns": columns,
+        }
+
+    def to_records(self) -> List[Dict[str, object]]:
+        """Convert the table to a list of dictionaries (one per build)."""
+        names = np.array(self.character_names, dtype=object)[self.character_index]
+        records = []
+        for row in range(len(self)):
+            record: Dict[str, object] = {
+                "character_name": names[row],
+                "special_power_level": int(self.levels[row, 0]),
+                "common_power_1_level": int(self.levels[row, 1]),
+                "common_power_2_level": int(self.levels[row, 2]),
+            }
+            record.update({name: values[row].item() for name, values in self.columns.items()})
+            records.append(record)
+        return records
+
+
+def _effect_arrays(
+    pool: "CharacterPool", power_data: Dict[str, "CommonPower"]
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """Gather per-level effect attributes for each character's common powers.
+
+    Returns:
+        (attribute -> (characters, slots, levels) array, "instead" mask, effect present mask)
+    """
+    shape = (len(pool.characters), COMMON_POWER_SLOTS, POWER_LEVELS)
+    attributes = {name: np.zeros(shape, dtype=np.int16) for name in EFFECT_ATTRIBUTES}
+    replaces = np.zeros(shape, dtype=bool)
+    present = np.zeros(shape, dtype=bool)
+
+    effects: Dict[Tuple[str, int], PowerEffect] = {}
+    for power_name, power in power_data.items():
+        for level_data in power.levels:
+            effects.setdefault(
+                (power_name, level_data.level),
+                create_power_effect_from_level(power_name, level_data),
+            )
+
+    for c, build in enumerate(pool.characters):
+        names = (build.common_power_1_name, build.common_power_2_name)
+        for slot, slot_power in enumerate(names):
+            if slot_power is None:
+                continue
+            for level in range(1, POWER_LEVELS + 1):
+                effect = effects.get((slot_power, level))
+                if effect is None:
+                    continue
+                present[c, slot, level - 1] = True
+                replaces[c, slot, level - 1] = effect.replaces_previous
+                for name in EFFECT_ATTRIBUTES:
+                    value = getattr(effect, name)
+                    attributes[name][c, slot, level - 1] = (
+                        ANY_ELDER_SIGNS if value is None else value
+                    )
+    return attributes, replaces, present
+
+
+def _apply_elder_conversion(
+    black: np.ndarray,
+    green: np.ndarray,
+    conversion: np.ndarray,
+    expected_successes: np.ndarray,
+    prob_success: np.ndarray,
+) -> np.ndarray:
+    """Overwrite success columns of converting rows with exact converted values.
+
+    Mirrors ``calculate_with_elder_conversion``: one converted distribution per
+    distinct (black, green, cap) pool, scattered back to its rows.
+
+    Returns:
+        Expected elder signs counted as successes per row (0 where none convert)
+    """
+    converted = np.zeros(black.shape, dtype=np.float64)
+    rows = np.flatnonzero(conversion)
+    if rows.size == 0:
+        return converted
+    pools, inverse = np.unique(
+        np.stack([black[rows], green[rows], conversion[rows]], axis=1), axis=0, return_inverse=True
+    )
+    values = np.empty((len(pools), 3))
+    for i, (b, g, cap) in enumerate(pools.tolist()):
+        plain = get_roll_distribution(b, g)
+        distribution = get_roll_distribution(b, g, None if cap == ANY_ELDER_SIGNS else cap)
+        expected = distribution.expected(DiceFaceSymbol.SUCCESS)
+        values[i] = (
+            expected,
+            distribution.prob_at_least(DiceFaceSymbol.SUCCESS, 1),
+            expected - plain.expected(DiceFaceSymbol.SUCCESS),
+        )
+    inverse = inverse.reshape(-1)
+    expected_successes[rows] = values[inverse, 0]
+    prob_success[rows] = values[inverse, 1]
+    converted[rows] = values[inverse, 2]
+    return converted
+
+
+def compute_pool_statistics(
+    pool: "CharacterPool",
+    power_data: Optional[Dict[str, "CommonPower"]] = None,
+    green_dice_bonus: Optional[int] = None,
+) -> BuildStatisticsTable:
+    """Compute statistics for all 4x4x4 level combinations of every character.
+
+    Values match ``CharacterBuild.statistics`` for the same build, including its
+    conventions (effects with an "instead" clause do not add dice or rerolls;
+    special power data is not loaded yet, so special levels don't change stats).
+
+    Args:
+        pool: Character pool to evaluate
+        power_data: Dictionary mapping power names to CommonPower objects
+            (default: loaded from the pool's data directory)
+        green_dice_bonus: Red swirl green dice for every character
+            (default: each build's own insanity track)
+
+    Returns:
+        BuildStatisticsTable with one row per (character, level combination)
+    """
+    if power_data is None:
+        power_data = pool.power_data()
+
+    attributes, replaces, present = _effect_arrays(pool, power_data)
+    characters = len(pool.characters)
+
+    # Gather each combination's two common power levels: (characters, 64, slots)
+    level_index = LEVEL_GRID[:, 1:].astype(np.intp) - 1
+    slots = np.arange(COMMON_POWER_SLOTS)
+
+    def per_slot(values: np.ndarray) -> np.ndarray:
+        return values[:, slots, level_index]
+
+    counted = per_slot(~replaces & present)
+    slot_present = per_slot(present)
+
+    def total(name: str, only_counted: bool) -> np.ndarray:
+        values = per_slot(attributes[name])
+        mask = counted if only_counted else slot_present
+        summed: np.ndarray = (values * mask).sum(axis=2)
+        return summed.reshape(-1)
+
+    base_green = np.repeat(
+        np.array(
+            [
+                build.insanity_track.green_dice_bonus
+                if green_dice_bonus is None
+                else green_dice_bonus
+                for build in pool.characters
+            ]
+        ),
+        COMBINATIONS_PER_CHARACTER,
+    )
+    black = BASE_BLACK_DICE + total("black_dice_added", True)
+    green = base_green + total("green_dice_added", True)
+
+    black_die = get_single_die_stats(DiceType.BLACK)
+    green_die = get_single_die_stats(DiceType.GREEN)
+
+    expected_elder = black_die.elder_sign_prob * black + green_die.elder_sign_prob * green
+    expected_successes = (
+        black_die.expected_successes * black + green_die.expected_successes * green
+    ).astype(np.float64)
+    prob_success = (
+        1.0 - (1.0 - black_die.success_prob) ** black * (1.0 - green_die.success_prob) ** green
+    )
+    # Conversions don't stack; the most generous effect present applies
+    conversion = (per_slot(attributes["elder_signs_as_successes"]) * slot_present).max(axis=2)
+    converted = _apply_elder_conversion(
+        black, green, conversion.reshape(-1), expected_successes, prob_success
+    )
+
+    columns: Dict[str, np.ndarray] = {
+        "total_black_dice": black,
+        "total_green_dice": green,
+        "total_dice": black + green,
+        "expected_successes": expected_successes,
+        "expected_tentacles": black_die.tentacle_prob * black,
+        "expected_elder_signs": expected_elder,
+        "prob_at_least_1_success": prob_success,
+        "prob_at_least_1_tentacle": 1.0 - (1.0 - black_die.tentacle_prob) ** black,
+        "prob_at_least_1_elder": 1.0
+        - (1.0 - black_die.elder_sign_prob) ** black * (1.0 - green_die.elder_sign_prob) ** green,
+        "max_possible_successes": black + green,
+        "elder_signs_converted_to_successes": converted,
+        ELDER_CONVERSION_COLUMN: conversion.reshape(-1),
+        "wounds_healed_per_turn": total("wounds_healed", False),
+        "stress_healed_per_turn": total("stress_healed", False),
+        "rerolls_per_roll": total("rerolls_added", True),
+        "free_actions_per_turn": ((per_slot(attributes["rerolls_added"]) > 0) & slot_present)
+        .sum(axis=2)
+        .reshape(-1),
+        # Deliberately mirror CharacterBuild.statistics, which reports healing as reductions
+        "wound_reduction": total("wounds_healed", False),
+        "sanity_reduction": total("stress_healed", False),
+    }
+
+    return BuildStatisticsTable(
+        character_names=[build.character_name for build in pool.characters],
+        character_index=np.repeat(np.arange(characters), COMBINATIONS_PER_CHARACTER),
+        levels=np.tile(LEVEL_GRID, (characters, 1)),
+        columns=columns,
+    )
@@ -13,6 +13,7 @@ from scripts.models.character import (
     CharacterData,
     CommonPowerLevelData,
 )
+from scripts.models.dice_fast_stats import get_fast_combined_stats
 from scripts.models.game_mechanics import HealthTrack, InsanityTrack, StressTrack
 from scripts.models.power_combination import (
     PowerCombination,
@@ -154,8 +155,10 @@ class CharacterBuild(BaseModel):
         calculator = PowerCombinationCalculator()
         combination = self.power_combination
 
-        # Calculate base dice statistics
-        base_stats = calculator.calculate_combined_stats(combination)
+        # Calculate base dice statistics (fast path; only plain values are read)
+        base_stats = get_fast_combined_stats(
+            combination.total_black_dice, combination.total_green_dice
+        )
 
         # Calculate with elder sign conversion
         enhanced_stats = calculator.calculate_with_elder_conversion(combination)
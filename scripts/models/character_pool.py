@@ -6,21 +6,63 @@ Models for managing pools of characters from different seasons.
 """
 
 import json
+import operator
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 from scripts.models.character import CharacterData
 from scripts.models.character_build import CharacterBuild
 from scripts.models.constants import Season
 
 if TYPE_CHECKING:
+    from scripts.models.build_statistics import BuildStatisticsTable
     from scripts.models.character import CommonPower
 
 
+CHARACTERS_SUBDIR = "characters"
+NON_CHARACTER_DIRS = ["character-book.pdf", ".git", "__pycache__"]
+
+
+class CharacterPoolIndex:
+    """In-memory lookups over a pool's characters.
+
+    Attributes:
+        by_name: Lowercased character name to build (first build wins on duplicates)
+        by_season: Season to builds, in pool order
+        by_common_power: Lowercased common power name to builds, in pool order
+        seasons: Lowercased character name to season (None if unknown)
+    """
+
+    __slots__ = ("by_name", "by_season", "by_common_power", "seasons")
+
+    def __init__(self, characters: List[CharacterBuild], seasons: Dict[str, Optional[Season]]):
+        """Build every lookup in one pass over the characters."""
+        self.by_name: Dict[str, CharacterBuild] = {}
+        self.by_season: Dict[Season, List[CharacterBuild]] = {}
+        self.by_common_power: Dict[str, List[CharacterBuild]] = {}
+        self.seasons = seasons
+
+        for build in characters:
+            key = build.character_name.lower()
+            self.by_name.setdefault(key, build)
+            season = seasons.get(key)
+            if season is not None:
+                self.by_season.setdefault(season, []).append(build)
+            for power_name in {build.common_power_1_name, build.common_power_2_name}:
+                if power_name:
+                    self.by_common_power.setdefault(power_name.lower(), []).append(build)
+
+
 class CharacterPool(BaseModel):
-    """Represents a pool of characters from specified seasons."""
+    """Represents a pool of characters from specified seasons.
+
+    Lookups and filters are served from a CharacterPoolIndex built on first use
+    and rebuilt when ``characters`` no longer holds the same build objects
+    (replaced list, appended, removed or swapped builds). Call ``reindex()``
+    after editing a build's fields in place (e.g. renaming a common power).
+    """
 
     season_filters: List[Season] = Field(
         default_factory=list, description="Seasons included in this pool"
@@ -30,6 +72,12 @@ class CharacterPool(BaseModel):
     )
     data_dir: Path = Field(default=Path("data"), description="Data directory path")
 
+    # Season of each character keyed by lowercased name (None: not found in data_dir)
+    _seasons: Dict[str, Optional[Season]] = PrivateAttr(default_factory=dict)
+    _index: Optional[CharacterPoolIndex] = PrivateAttr(default=None)
+    # Builds the index was made from; holding them keeps their ids from being reused
+    _indexed_builds: List[CharacterBuild] = PrivateAttr(default_factory=list)
+
     @computed_field
     @property
     def character_count(self) -> int:
@@ -42,12 +90,50 @@ class CharacterPool(BaseModel):
         """List of character names in the pool."""
         return [char.character_name for char in self.characters]
 
+    @property
+    def index(self) -> CharacterPoolIndex:
+        """Lookup index over the current characters."""
+        indexed = self._indexed_builds
+        if (
+            self._index is None
+            or len(indexed) != len(self.characters)
+            or not all(map(operator.is_, indexed, self.characters))
+        ):
+            self._resolve_missing_seasons()
+            self._index = CharacterPoolIndex(self.characters, self._seasons)
+            self._indexed_builds = list(self.characters)
+        return self._index
+
+    def reindex(self) -> None:
+        """Drop the lookup index so the next lookup rebuilds it."""
+        self._index = None
+
+    def add_character(self, build: CharacterBuild, season: Optional[Season] = None) -> None:
+        """Add a character build, recording its season for season lookups."""
+        if season is not None:
+            self._seasons[build.character_name.lower()] = season
+        self.characters.append(build)
+        self.reindex()
+
     def get_character(self, name: str) -> Optional[CharacterBuild]:
         """Get a character build by name."""
-        for char in self.characters:
-            if char.character_name.lower() == name.lower():
-                return char
-        return None
+        return self.index.by_name.get(name.lower())
+
+    def get_character_season(self, name: str) -> Optional[Season]:
+        """Get the season a character was loaded from."""
+        return self.index.seasons.get(name.lower())
+
+    def characters_in_season(self, season: Season) -> List[CharacterBuild]:
+        """Get every character build from a season."""
+        return list(self.index.by_season.get(season, []))
+
+    def characters_with_common_power(self, power_name: str) -> List[CharacterBuild]:
+        """Get every character build that has a common power (case insensitive)."""
+        return list(self.index.by_common_power.get(power_name.lower(), []))
+
+    def power_data(self) -> Dict[str, "CommonPower"]:
+        """Load the common powers of this pool's data directory, keyed by name."""
+        return self._load_common_powers()
 
     @classmethod
     def from_seasons(
@@ -55,6 +141,7 @@ class CharacterPool(BaseModel):
         seasons: List[Season],
         data_dir: Path = Path("data"),
         power_data: Optional[Dict[str, "CommonPower"]] = None,
+        use_cache: bool = True,
     ) -> "CharacterPool":
         """Create CharacterPool from list of seasons.
 
@@ -62,10 +149,18 @@ class CharacterPool(BaseModel):
             seasons: List of seasons to include
             data_dir: Root data directory
             power_data: Dictionary mapping power names to CommonPower objects
+            use_cache: Load through the on-disk snapshot, rebuilding only characters
+                whose files changed (ignored when power_data is given, since the
+                snapshot resolves powers from common_powers.json)
 
         Returns:
             CharacterPool with all characters from specified seasons
         """
+        if use_cache and power_data is None:
+            from scripts.models.character_pool_cache import load_cached_pool
+
+            return load_cached_pool(seasons, data_dir)
+
         pool = cls(season_filters=seasons, data_dir=data_dir)
         pool.load_characters_from_seasons(seasons, power_data)
         return pool
@@ -86,36 +181,58 @@ class CharacterPool(BaseModel):
         if power_data is None:
             power_data = self._load_common_powers()
 
-        # Load characters from each season
+        for season, json_file in self._character_files(seasons):
+            build = self._build_character(json_file, power_data)
+            if build is not None:
+                self.add_character(build, season)
+
+    def _character_files(self, seasons: List[Season]) -> Iterator[Tuple[Season, Path]]:
+        """Yield (season, character.json path) for every character in the given seasons.
+
+        Characters live either directly in the season directory or under its
+        ``characters/`` subdirectory.
+        """
         for season in seasons:
-            season_dir = self.data_dir / season.value
-            if not season_dir.exists():
-                continue
+            for char_dir in self._character_dirs(season):
+                json_file = char_dir / "character.json"
+                if json_file.exists():
+                    yield season, json_file
+
+    def _character_dirs(self, season: Season) -> Iterator[Path]:
+        """Yield every character directory of a season."""
+        season_dir = self.data_dir / season.value
+        if not season_dir.exists():
+            return
+        if (season_dir / CHARACTERS_SUBDIR).is_dir():
+            season_dir = season_dir / CHARACTERS_SUBDIR
 
-            # Find all character directories
-            for char_dir in season_dir.iterdir():
-                if not char_dir.is_dir():
-                    continue
+        # Find all character directories
+        for char_dir in season_dir.iterdir():
+            if not char_dir.is_dir():
+                continue
 
-                # Skip non-character directories
-                if char_dir.name in ["character-book.pdf", ".git", "__pycache__"]:
-                    continue
+            # Skip non-character directories
+            if char_dir.name in NON_CHARACTER_DIRS:
+                continue
 
-                # Load character data
-                char_data = self._load_character_data(char_dir)
-                if char_data is None:
-                    continue
+            yield char_dir
 
-                # Create character build (default levels)
-                build = CharacterBuild.from_character_data(
-                    char_data,
-                    special_power_level=1,
-                    common_power_1_level=1,
-                    common_power_2_level=1,
-                    power_data=power_data,
-                )
+    def _build_character(
+        self, json_file: Path, power_data: Dict[str, "CommonPower"]
+    ) -> Optional[CharacterBuild]:
+        """Parse a character.json file into a build at default levels."""
+        char_data = self._load_character_data(json_file.parent)
+        if char_data is None:
+            return None
 
-                self.characters.append(build)
+        # Create character build (default levels)
+        return CharacterBuild.from_character_data(
+            char_data,
+            special_power_level=1,
+            common_power_1_level=1,
+            common_power_2_level=1,
+            power_data=power_data,
+        )
 
     def _load_character_data(self, char_dir: Path) -> Optional[CharacterData]:
         """Load character data from JSON file."""
@@ -148,23 +265,53 @@ class CharacterPool(BaseModel):
         except Exception:
             return {}
 
+    def statistics_table(
+        self, power_data: Optional[Dict[str, "CommonPower"]] = None
+    ) -> "BuildStatisticsTable":
+        """Compute statistics for every power level combination of every character.
+
+        Args:
+            power_data: Dictionary mapping power names to CommonPower objects
+
+        Returns:
+            BuildStatisticsTable with one row per (character, level combination)
+        """
+        from scripts.models.build_statistics import compute_pool_statistics
+
+        return compute_pool_statistics(self, power_data)
+
     def filter_by_season(self, season: Season) -> "CharacterPool":
         """Create a new pool filtered by season."""
         filtered = CharacterPool(
             season_filters=[season],
             data_dir=self.data_dir,
         )
-        filtered.characters = [
-            char for char in self.characters if self._get_character_season(char) == season
-        ]
+        for build in self.index.by_season.get(season, []):
+            filtered.add_character(build, season)
         return filtered
 
-    def _get_character_season(self, character: CharacterBuild) -> Optional[Season]:
-        """Determine which season a character belongs to."""
-        # Check each season directory
+    def _resolve_missing_seasons(self) -> None:
+        """Record seasons for characters added without one (one directory listing per season).
+
+        Builds appended directly to ``characters`` have no recorded season; they
+        are matched by name against the season directories on the first index
+        build that sees them.
+        """
+        missing = {
+            build.character_name.lower()
+            for build in self.characters
+            if build.character_name.lower() not in self._seasons
+        }
+        if not missing:
+            return
         for season in Season:
-            season_dir = self.data_dir / season.value
-            char_dir = season_dir / character.character_name.lower()
-            if char_dir.exists():
-                return season
-        return None
+            if not missing:
+                break
+            for char_dir in self._character_dirs(season):
+                name = char_dir.name.lower()
+                if name in missing:
+                    self._seasons[name] = season
+                    missing.discard(name)
+        # Don't probe again for characters that have no directory
+        for name in missing:
+            self._seasons[name] = None
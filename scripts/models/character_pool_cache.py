@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Binary snapshot cache for CharacterPool loading.
+
+Loading a pool parses every ``character.json`` into ``CharacterData`` and
+resolves power level data from ``common_powers.json``. The snapshot pickles the
+built ``CharacterBuild`` objects (private power level data included) together
+with the ``(mtime_ns, size)`` stamp of each source file and a fingerprint of
+the pickled models' schemas. On the next load only
+characters whose file changed, appeared or disappeared are re-parsed; a change
+to ``common_powers.json`` re-resolves power data for every character but still
+reuses the parsed ``CharacterData``. A change to the model classes (fields,
+types or defaults) changes the fingerprint and discards the snapshot.
+
+One snapshot file is kept per data directory and covers every season loaded
+through it, so loading a different season subset extends the same snapshot.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Final, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from scripts.models.character import CommonPower, CommonPowerLevelData
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.constants import Season
+from scripts.models.power_combination import PowerEffect
+
+# Bump when the snapshot layout changes, or when model behavior changes without
+# any schema change (2: capped elder sign conversion in PowerEffect)
+POOL_SNAPSHOT_VERSION: Final[int] = 2
+DEFAULT_CACHE_DIR: Final[Path] = Path(__file__).parent.parent.parent / ".generated" / "pool"
+SNAPSHOT_FILENAME_PREFIX: Final[str] = "character_pool"
+COMMON_POWERS_FILENAME: Final[str] = "common_powers.json"
+
+# (mtime in nanoseconds, size in bytes) of a source file
+SourceStamp = Tuple[int, int]
+
+# Models pickled in snapshots (directly or as private data) or interpreting them
+SNAPSHOT_MODELS: Final[Tuple[Type[BaseModel], ...]] = (
+    CharacterBuild,
+    CommonPower,
+    CommonPowerLevelData,
+    PowerEffect,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def model_schema_fingerprint() -> str:
+    """Hash the JSON schemas of the snapshot models (fields, types and defaults)."""
+    schemas = [[model.__name__, model.model_json_schema()] for model in SNAPSHOT_MODELS]
+    return hashlib.sha256(json.dumps(schemas, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def file_stamp(path: Path) -> Optional[SourceStamp]:
+    """Get the (mtime_ns, size) stamp of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class SnapshotEntry:
+    """Cached build for one character.json (build is None if the file failed to parse)."""
+
+    stamp: SourceStamp
+    build: Optional[CharacterBuild]
+
+
+@dataclass
+class PoolSnapshot:
+    """Everything persisted in a snapshot file."""
+
+    version: int = POOL_SNAPSHOT_VERSION
+    schema: str = field(default_factory=model_schema_fingerprint)
+    powers_stamp: Optional[SourceStamp] = None
+    # Keyed by character.json path relative to the data directory
+    entries: Dict[str, SnapshotEntry] = field(default_factory=dict)
+
+
+@dataclass
+class SnapshotStats:
+    """What the last load did."""
+
+    reused: int = 0
+    rebuilt: int = 0
+    removed: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether the snapshot needs to be written back."""
+        return self.rebuilt > 0 or self.removed > 0
+
+
+class CharacterPoolCache:
+    """Load character pools through an on-disk snapshot.
+
+    Args:
+        data_dir: Root data directory
+        cache_dir: Directory holding snapshot files
+    """
+
+    def __init__(self, data_dir: Path = Path("data"), cache_dir: Path = DEFAULT_CACHE_DIR):
+        """Initialize paths for a data directory's snapshot."""
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        self.stats = SnapshotStats()
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Snapshot file for this data directory."""
+        key = hashlib.sha256(str(self.data_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{SNAPSHOT_FILENAME_PREFIX}_v{POOL_SNAPSHOT_VERSION}_{key}.pkl"
+
+    def read_snapshot(self) -> PoolSnapshot:
+        """Read the snapshot file (an empty snapshot if missing, stale or unreadable)."""
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception:
+            return PoolSnapshot()
+        if (
+            not isinstance(snapshot, PoolSnapshot)
+            or snapshot.version != POOL_SNAPSHOT_VERSION
+            or getattr(snapshot, "schema", None) != model_schema_fingerprint()
+        ):
+            return PoolSnapshot()
+        return snapshot
+
+    def write_snapshot(self, snapshot: PoolSnapshot) -> Path:
+        """Atomically write the snapshot file."""
+        path = self.snapshot_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def load(self, seasons: List[Season]) -> CharacterPool:
+        """Load a pool, re-parsing only characters whose source files changed.
+
+        Args:
+            seasons: List of seasons to include
+
+        Returns:
+            CharacterPool equal to CharacterPool.from_seasons(seasons, data_dir)
+        """
+        pool = CharacterPool(season_filters=seasons, data_dir=self.data_dir)
+        snapshot = self.read_snapshot()
+        self.stats = SnapshotStats()
+
+        powers_stamp = file_stamp(self.data_dir / COMMON_POWERS_FILENAME)
+        powers_changed = powers_stamp != snapshot.powers_stamp
+        power_data: Optional[Dict[str, CommonPower]] = None
+
+        seen = set()
+        for season, json_file in pool._character_files(seasons):
+            key = json_file.relative_to(self.data_dir).as_posix()
+            seen.add(key)
+            stamp = file_stamp(json_file)
+            entry = snapshot.entries.get(key)
+
+            if entry is not None and entry.stamp == stamp and not powers_changed:
+                self.stats.reused += 1
+                build = entry.build
+            else:
+                if power_data is None:
+                    power_data = pool.power_data()
+                if entry is not None and entry.stamp == stamp and entry.build is not None:
+                    # Only the power data changed: keep the parsed CharacterData
+                    build = self._rebuild(entry.build, power_data)
+                else:
+                    build = pool._build_character(json_file, power_data)
+                snapshot.entries[key] = SnapshotEntry(stamp=stamp or (0, 0), build=build)
+                self.stats.rebuilt += 1
+
+            if build is not None:
+                pool.add_character(build, season)
+
+        # Drop characters deleted from the seasons just scanned
+        scanned = tuple(f"{season.value}/" for season in seasons)
+        for key in [k for k in snapshot.entries if k.startswith(scanned) and k not in seen]:
+            del snapshot.entries[key]
+            self.stats.removed += 1
+
+        if powers_changed:
+            # Entries of seasons not scanned still hold old power data
+            for key in [k for k in snapshot.entries if not k.startswith(scanned)]:
+                del snapshot.entries[key]
+                self.stats.removed += 1
+            snapshot.powers_stamp = powers_stamp
+
+        if self.stats.changed or powers_changed:
+            self.write_snapshot(snapshot)
+        return pool
+
+    @staticmethod
+    def _rebuild(build: CharacterBuild, power_data: Dict[str, "CommonPower"]) -> CharacterBuild:
+        """Re-resolve power level data for a cached build."""
+        if build.character_data is None:
+            return build
+        return CharacterBuild.from_character_data(
+            build.character_data,
+            special_power_level=1,
+            common_power_1_level=1,
+            common_power_2_level=1,
+            power_data=power_data,
+        )
+
+
+# Convenience functions
+def load_cached_pool(
+    seasons: List[Season],
+    data_dir: Path = Path("data"),
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> CharacterPool:
+    """Load a character pool through the snapshot cache.
+
+    Args:
+        seasons: List of seasons to include
+        data_dir: Root data directory
+        cache_dir: Directory holding snapshot files
+
+    Returns:
+        CharacterPool with all characters from specified seasons
+    """
+    return CharacterPoolCache(data_dir, cache_dir).load(seasons)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Exact outcome distributions for Cthulhu: Death May Die dice rolls.
+
+Builds the full joint probability mass function over (successes, tentacles,
+elder signs) for any mix of black and green dice. Each die is described by a
+generating polynomial derived from its faces in ``game_mechanics.py``; a roll
+is the convolution of those polynomials, stored as a dense NumPy array so
+marginal and threshold queries are simple array reductions.
+"""
+
+from typing import Dict, Final, Optional, Tuple, Union
+
+import numpy as np
+
+from scripts.models.game_mechanics import (
+    BonusDice,
+    DiceFaceSymbol,
+    DiceType,
+    StandardDice,
+)
+
+# Axis order of every joint PMF array: pmf[successes, tentacles, elder_signs]
+SYMBOL_AXES: Final[Tuple[DiceFaceSymbol, ...]] = (
+    DiceFaceSymbol.SUCCESS,
+    DiceFaceSymbol.TENTACLE,
+    DiceFaceSymbol.ELDER_SIGN,
+)
+SUCCESS_AXIS: Final[int] = 0
+TENTACLE_AXIS: Final[int] = 1
+ELDER_SIGN_AXIS: Final[int] = 2
+
+
+def symbol_axis(symbol: DiceFaceSymbol) -> int:
+    """Get the PMF axis that counts a symbol.
+
+    Args:
+        symbol: Dice face symbol (blank has no axis)
+
+    Returns:
+        Axis index into a joint PMF array
+    """
+    try:
+        return SYMBOL_AXES.index(symbol)
+    except ValueError:
+        raise ValueError(f"Symbol has no distribution axis: {symbol}") from None
+
+
+def face_generating_polynomial(dice: Union[StandardDice, BonusDice]) -> np.ndarray:
+    """Build the generating polynomial of a single die.
+
+    The result is a 3D array where ``poly[s, t, e]`` is the probability that one
+    roll of the die shows ``s`` successes, ``t`` tentacles and ``e`` elder signs.
+
+    Args:
+        dice: Dice model with faces
+
+    Returns:
+        Generating polynomial coefficients as a float64 array
+    """
+    counts = [tuple(face.symbols.count(symbol) for symbol in SYMBOL_AXES) for face in dice.faces]
+    shape = tuple(max(c[axis] for c in counts) + 1 for axis in range(len(SYMBOL_AXES)))
+    poly = np.zeros(shape, dtype=np.float64)
+    for face, idx in zip(dice.faces, counts):
+        poly[idx] += face.probability
+    return poly
+
+
+def convolve_pmf(pmf: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Convolve a joint PMF with a (small) kernel PMF.
+
+    Equivalent to multiplying the two generating polynomials. The loop runs over
+    the non-zero kernel coefficients only, so adding one die costs a handful of
+    shifted array additions regardless of how large ``pmf`` is.
+
+    Args:
+        pmf: Joint PMF array
+        kernel: Joint PMF array of the distribution being added (e.g. one die)
+
+    Returns:
+        Joint PMF of the sum of both distributions
+    """
+    out_shape = tuple(a + b - 1 for a, b in zip(pmf.shape, kernel.shape))
+    out = np.zeros(out_shape, dtype=np.float64)
+    for idx in zip(*np.nonzero(kernel)):
+        target = tuple(slice(i, i + n) for i, n in zip(idx, pmf.shape))
+        out[target] += kernel[idx] * pmf
+    return out
+
+
+def convert_elder_signs(pmf: np.ndarray, max_count: Optional[int] = None) -> np.ndarray:
+    """Count elder signs as successes, up to a cap per roll.
+
+    Moves the probability of every outcome ``(s, t, e)`` to
+    ``(s + min(e, max_count), t, e)``: the success axis counts converted elder
+    signs, while the elder sign axis keeps the number rolled, so elder sign and
+    tentacle marginals are unchanged and every success threshold includes the
+    conversion.
+
+    Args:
+        pmf: Joint PMF array indexed as ``pmf[..., successes, tentacles, elder_signs]``
+            (leading axes index independent pools)
+        max_count: Elder signs that may count as successes (None = any number)
+
+    Returns:
+        Joint PMF with converted elder signs added to successes
+    """
+    size_s, size_t, size_e = pmf.shape[-3:]
+    cap = size_e - 1 if max_count is None else min(max(max_count, 0), size_e - 1)
+    out = np.zeros((*pmf.shape[:-3], size_s + cap, size_t, size_e), dtype=np.float64)
+    for elder in range(size_e):
+        converted = min(elder, cap)
+        out[..., converted : converted + size_s, :, elder] = pmf[..., elder]
+    return out
+
+
+class RollDistribution:
+    """Exact joint distribution of successes, tentacles and elder signs for one roll.
+
+    Wraps a read-only ``pmf[successes, tentacles, elder_signs]`` array. Marginals
+    and a 3D cumulative table are computed lazily on first use, so repeated
+    threshold queries are O(1) array lookups.
+    """
+
+    __slots__ = ("black_dice", "green_dice", "pmf", "_marginals", "_cumulative")
+
+    def __init__(self, black_dice: int, green_dice: int, pmf: np.ndarray):
+        """Initialize from dice counts and a joint PMF array.
+
+        Args:
+            black_dice: Number of black dice rolled
+            green_dice: Number of green dice rolled
+            pmf: Joint PMF indexed as ``pmf[successes, tentacles, elder_signs]``
+        """
+        if pmf.ndim != len(SYMBOL_AXES):
+            raise ValueError(f"Joint PMF must have {len(SYMBOL_AXES)} axes, got {pmf.ndim}")
+        pmf.setflags(write=False)
+        self.black_dice = black_dice
+        self.green_dice = green_dice
+        self.pmf = pmf
+        self._marginals: Dict[int, np.ndarray] = {}
+        self._cumulative: Optional[np.ndarray] = None
+
+    @property
+    def total_dice(self) -> int:
+        """Total number of dice rolled."""
+        return self.black_dice + self.green_dice
+
+    @property
+    def max_successes(self) -> int:
+        """Largest success count with non-zero support."""
+        return self.pmf.shape[SUCCESS_AXIS] - 1
+
+    @property
+    def max_tentacles(self) -> int:
+        """Largest tentacle count with non-zero support."""
+        return self.pmf.shape[TENTACLE_AXIS] - 1
+
+    @property
+    def max_elder_signs(self) -> int:
+        """Largest elder sign count with non-zero support."""
+        return self.pmf.shape[ELDER_SIGN_AXIS] - 1
+
+    def marginal(self, symbol: DiceFaceSymbol) -> np.ndarray:
+        """Get the marginal PMF for one symbol.
+
+        Args:
+            symbol: Symbol to keep (success, tentacle or elder sign)
+
+        Returns:
+            Array where ``result[k]`` is P(exactly k of that symbol)
+        """
+        axis = symbol_axis(symbol)
+        marginal = self._marginals.get(axis)
+        if marginal is None:
+            other_axes = tuple(a for a in range(self.pmf.ndim) if a != axis)
+            marginal = self.pmf.sum(axis=other_axes)
+            marginal.setflags(write=False)
+            self._marginals[axis] = marginal
+        return marginal
+
+    def survival(self, symbol: DiceFaceSymbol) -> np.ndarray:
+        """Get P(at least k) of a symbol for every k.
+
+        Args:
+            symbol: Symbol to query
+
+        Returns:
+            Array where ``result[k]`` is P(count >= k); ``result[0]`` is 1.0
+        """
+        return np.cumsum(self.marginal(symbol)[::-1])[::-1]
+
+    def expected(self, symbol: DiceFaceSymbol) -> float:
+        """Get the expected count of a symbol.
+
+        Args:
+            symbol: Symbol to query
+
+        Returns:
+            Expected number of that symbol per roll
+        """
+        marginal = self.marginal(symbol)
+        return float(np.dot(np.arange(marginal.size), marginal))
+
+    def prob_at_least(self, symbol: DiceFaceSymbol, count: int) -> float:
+        """Get the probability of rolling at least ``count`` of a symbol.
+
+        Args:
+            symbol: Symbol to query
+            count: Minimum number of that symbol
+
+        Returns:
+            P(count of symbol >= count)
+        """
+        marginal = self.marginal(symbol)
+        if count <= 0:
+            return 1.0
+        if count >= marginal.size:
+            return 0.0
+        return float(marginal[count:].sum())
+
+    def prob(
+        self,
+        min_successes: int = 0,
+        max_successes: Optional[int] = None,
+        min_tentacles: int = 0,
+        max_tentacles: Optional[int] = None,
+        min_elder_signs: int = 0,
+        max_elder_signs: Optional[int] = None,
+    ) -> float:
+        """Get the probability that all counts fall in the given inclusive ranges.
+
+        Example: P(>=3 successes with <=1 tentacle) is
+        ``dist.prob(min_successes=3, max_tentacles=1)``.
+
+        Args:
+            min_successes: Minimum successes (inclusive)
+            max_successes: Maximum successes (inclusive, None = unbounded)
+            min_tentacles: Minimum tentacles (inclusive)
+            max_tentacles: Maximum tentacles (inclusive, None = unbounded)
+            min_elder_signs: Minimum elder signs (inclusive)
+            max_elder_signs: Maximum elder signs (inclusive, None = unbounded)
+
+        Returns:
+            Probability of the joint event
+        """
+        bounds = (
+            (min_successes, max_successes),
+            (min_tentacles, max_tentacles),
+            (min_elder_signs, max_elder_signs),
+        )
+        lows = []
+        highs = []
+        for axis, (low, high) in enumerate(bounds):
+            size = self.pmf.shape[axis]
+            low = max(low, 0)
+            high = size - 1 if high is None else min(high, size - 1)
+            if low > high:
+                return 0.0
+            lows.append(low)
+            highs.append(high + 1)
+
+        # Inclusion-exclusion over the 8 corners of the query box
+        cumulative = self._cumulative_table()
+        total = 0.0
+        for corner in range(8):
+            idx = []
+            sign = 1.0
+            for axis in range(3):
+                if corner >> axis & 1:
+                    idx.append(lows[axis])
+                    sign = -sign
+                else:
+                    idx.append(highs[axis])
+            total += sign * cumulative[idx[0], idx[1], idx[2]]
+        return float(min(max(total, 0.0), 1.0))
+
+    def _cumulative_table(self) -> np.ndarray:
+        """Get the zero-padded 3D cumulative sum (summed-area table) of the PMF."""
+        if self._cumulative is None:
+            cumulative = np.zeros(tuple(n + 1 for n in self.pmf.shape), dtype=np.float64)
+            cumulative[1:, 1:, 1:] = self.pmf.cumsum(0).cumsum(1).cumsum(2)
+            cumulative.setflags(write=False)
+            self._cumulative = cumulative
+        return self._cumulative
+
+    def get_summary(self) -> str:
+        """Get a human-readable summary of the distribution."""
+        return (
+            f"{self.black_dice} black + {self.green_dice} green = {self.total_dice} dice: "
+            f"E[successes]={self.expected(DiceFaceSymbol.SUCCESS):.2f}, "
+            f"E[tentacles]={self.expected(DiceFaceSymbol.TENTACLE):.2f}, "
+            f"E[elder signs]={self.expected(DiceFaceSymbol.ELDER_SIGN):.2f}"
+        )
+
+
+class RollDistributionCalculator:
+    """Build exact roll distributions by convolving per-die generating polynomials.
+
+    Joint PMFs are memoized per (black, green) pool; each new pool is derived from
+    a smaller cached one by adding a single die. Distributions with elder sign
+    conversion are memoized per (black, green, conversion cap).
+    """
+
+    def __init__(self):
+        """Initialize with standard dice configurations."""
+        self.black_kernel = face_generating_polynomial(StandardDice())  # type: ignore[call-arg]
+        self.green_kernel = face_generating_polynomial(BonusDice())  # type: ignore[call-arg]
+        self._pmf_cache: Dict[Tuple[int, int], np.ndarray] = {
+            (0, 0): np.ones((1, 1, 1), dtype=np.float64)
+        }
+        self._distribution_cache: Dict[Tuple[int, int, Optional[int]], RollDistribution] = {}
+
+    def get_kernel(self, dice_type: DiceType) -> np.ndarray:
+        """Get the generating polynomial for one die of a type.
+
+        Args:
+            dice_type: Type of dice (DiceType.BLACK or DiceType.GREEN)
+
+        Returns:
+            Generating polynomial array
+        """
+        if dice_type == DiceType.BLACK:
+            return self.black_kernel
+        if dice_type == DiceType.GREEN:
+            return self.green_kernel
+        raise ValueError(f"Unknown dice type: {dice_type}")
+
+    def joint_pmf(self, black_count: int, green_count: int) -> np.ndarray:
+        """Get the joint PMF array for a dice pool.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+
+        Returns:
+            Read-only array indexed as ``pmf[successes, tentacles, elder_signs]``
+        """
+        if black_count < 0 or green_count < 0:
+            raise ValueError(f"Dice counts must be non-negative: {black_count}, {green_count}")
+
+        key = (black_count, green_count)
+        cached = self._pmf_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Walk black dice up at green=0, then add green dice, reusing any cached pool
+        b = black_count
+        while (b, 0) not in self._pmf_cache:
+            b -= 1
+        for count in range(b + 1, black_count + 1):
+            self._store(
+                (count, 0), convolve_pmf(self._pmf_cache[(count - 1, 0)], self.black_kernel)
+            )
+
+        g = green_count
+        while (black_count, g) not in self._pmf_cache:
+            g -= 1
+        for count in range(g + 1, green_count + 1):
+            previous = self._pmf_cache[(black_count, count - 1)]
+            self._store((black_count, count), convolve_pmf(previous, self.green_kernel))
+
+        return self._pmf_cache[key]
+
+    def calculate_distribution(
+        self, black_count: int, green_count: int, elder_signs_as_successes: Optional[int] = 0
+    ) -> RollDistribution:
+        """Get the exact outcome distribution for a dice pool.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+            elder_signs_as_successes: Elder signs that count as successes
+                (0 = none, None = any number); see ``convert_elder_signs``
+
+        Returns:
+            RollDistribution for the pool (shared, cached instance)
+        """
+        if elder_signs_as_successes is not None and elder_signs_as_successes < 0:
+            raise ValueError(
+                f"Elder sign conversion must be non-negative: {elder_signs_as_successes}"
+            )
+        key = (black_count, green_count, elder_signs_as_successes)
+        distribution = self._distribution_cache.get(key)
+        if distribution is None:
+            pmf = self.joint_pmf(black_count, green_count)
+            if elder_signs_as_successes != 0:
+                pmf = convert_elder_signs(pmf, elder_signs_as_successes)
+            distribution = RollDistribution(black_count, green_count, pmf)
+            self._distribution_cache[key] = distribution
+        return distribution
+
+    def _store(self, key: Tuple[int, int], pmf: np.ndarray) -> None:
+        """Cache a computed joint PMF as read-only."""
+        pmf.setflags(write=False)
+        self._pmf_cache[key] = pmf
+
+
+_default_calculator: Optional[RollDistributionCalculator] = None
+
+
+def get_distribution_calculator() -> RollDistributionCalculator:
+    """Get the shared module-level distribution calculator."""
+    global _default_calculator
+    if _default_calculator is None:
+        _default_calculator = RollDistributionCalculator()
+    return _default_calculator
+
+
+# Convenience functions
+def get_roll_distribution(
+    black_count: int, green_count: int, elder_signs_as_successes: Optional[int] = 0
+) -> RollDistribution:
+    """Get the exact outcome distribution for rolling multiple dice.
+
+    Args:
+        black_count: Number of black dice
+        green_count: Number of green dice
+        elder_signs_as_successes: Elder signs that count as successes
+            (0 = none, None = any number)
+
+    Returns:
+        RollDistribution for the pool
+    """
+    return get_distribution_calculator().calculate_distribution(
+        black_count, green_count, elder_signs_as_successes
+    )
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Lightweight fast-path counterparts of the dice probability models.
+
+``SingleDieStats``, ``CombinedRollStats`` and ``PowerImpact`` are pydantic models
+whose ``computed_field`` properties are re-evaluated on every access and whose
+construction runs validation. The frozen, slotted dataclasses here compute every
+derived value once at construction and are cheap to build, so they suit inner
+loops; convert with ``to_model()`` only where a pydantic model is needed
+(serialization, public return values).
+
+Values are identical to the pydantic models, including their conventions.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Final, Tuple
+
+from scripts.models.dice_probabilities import (
+    CombinedRollStats,
+    PowerImpact,
+    SingleDieStats,
+    get_single_die_stats,
+)
+from scripts.models.game_mechanics import DiceType
+
+SIGNIFICANT_IMPROVEMENT_PERCENT: Final[float] = 10.0
+COMBINED_STATS_CACHE_SIZE: Final[int] = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class FastSingleDieStats:
+    """Precomputed statistics for a single die."""
+
+    dice_type: DiceType
+    face_probabilities: Tuple[Tuple[str, float], ...]
+    success_prob: float
+    pure_success_prob: float
+    tentacle_prob: float
+    elder_sign_prob: float
+    blank_prob: float
+    expected_successes: float
+
+    @classmethod
+    def from_model(cls, stats: SingleDieStats) -> "FastSingleDieStats":
+        """Evaluate every computed field of a SingleDieStats once."""
+        return cls(
+            dice_type=stats.dice_type,
+            face_probabilities=tuple(sorted(stats.face_probabilities.items())),
+            success_prob=stats.success_prob,
+            pure_success_prob=stats.pure_success_prob,
+            tentacle_prob=stats.tentacle_prob,
+            elder_sign_prob=stats.elder_sign_prob,
+            blank_prob=stats.blank_prob,
+            expected_successes=stats.expected_successes,
+        )
+
+    def to_model(self) -> SingleDieStats:
+        """Convert to the pydantic model."""
+        probabilities: Dict[str, float] = dict(self.face_probabilities)
+        return SingleDieStats(dice_type=self.dice_type, face_probabilities=probabilities)
+
+
+@dataclass(frozen=True, slots=True)
+class FastCombinedRollStats:
+    """Precomputed statistics for rolling black and green dice together."""
+
+    black_dice: int
+    green_dice: int
+    black_stats: FastSingleDieStats = field(repr=False)
+    green_stats: FastSingleDieStats = field(repr=False)
+    total_dice: int
+    expected_successes: float
+    expected_tentacles: float
+    expected_elder_signs: float
+    prob_at_least_1_success: float
+    prob_at_least_1_tentacle: float
+    prob_at_least_1_elder: float
+    max_possible_successes: int
+
+    @classmethod
+    def from_counts(
+        cls,
+        black_count: int,
+        green_count: int,
+        black_stats: FastSingleDieStats,
+        green_stats: FastSingleDieStats,
+    ) -> "FastCombinedRollStats":
+        """Compute combined statistics from dice counts.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+            black_stats: Statistics for a single black die
+            green_stats: Statistics for a single green die
+
+        Returns:
+            FastCombinedRollStats with every value precomputed
+        """
+        if black_count < 0 or green_count < 0:
+            raise ValueError(f"Dice counts must be non-negative: {black_count}, {green_count}")
+        total = black_count + green_count
+        return cls(
+            black_dice=black_count,
+            green_dice=green_count,
+            black_stats=black_stats,
+            green_stats=green_stats,
+            total_dice=total,
+            expected_successes=black_stats.expected_successes * black_count
+            + green_stats.expected_successes * green_count,
+            expected_tentacles=black_stats.tentacle_prob * black_count,
+            expected_elder_signs=black_stats.elder_sign_prob * black_count
+            + green_stats.elder_sign_prob * green_count,
+            prob_at_least_1_success=1.0
+            - (1.0 - black_stats.success_prob) ** black_count
+            * (1.0 - green_stats.success_prob) ** green_count,
+            prob_at_least_1_tentacle=1.0 - (1.0 - black_stats.tentacle_prob) ** black_count,
+            prob_at_least_1_elder=1.0
+            - (1.0 - black_stats.elder_sign_prob) ** black_count
+            * (1.0 - green_stats.elder_sign_prob) ** green_count,
+            max_possible_successes=total,
+        )
+
+    @property
+    def success_percentage(self) -> float:
+        """Probability of at least 1 success as a percentage."""
+        return self.prob_at_least_1_success * 100.0
+
+    @property
+    def tentacle_percentage(self) -> float:
+        """Probability of at least 1 tentacle as a percentage."""
+        return self.prob_at_least_1_tentacle * 100.0
+
+    @property
+    def elder_percentage(self) -> float:
+        """Probability of at least 1 elder sign as a percentage."""
+        return self.prob_at_least_1_elder * 100.0
+
+    def to_model(self) -> CombinedRollStats:
+        """Convert to the pydantic model."""
+        return CombinedRollStats.from_counts(
+            self.black_dice,
+            self.green_dice,
+            self.black_stats.to_model(),
+            self.green_stats.to_model(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FastPowerImpact:
+    """Precomputed comparison of base and enhanced dice pools."""
+
+    base: FastCombinedRollStats
+    enhanced: FastCombinedRollStats
+    expected_successes_increase: float
+    expected_successes_percent_increase: float
+    max_successes_increase: int
+    tentacle_risk: float
+    is_significant_improvement: bool
+    total_dice_increase: int
+
+    @classmethod
+    def from_stats(
+        cls, base: FastCombinedRollStats, enhanced: FastCombinedRollStats
+    ) -> "FastPowerImpact":
+        """Compute improvement metrics between two pools."""
+        increase = enhanced.expected_successes - base.expected_successes
+        percent = increase / base.expected_successes * 100 if base.expected_successes > 0 else 0.0
+        return cls(
+            base=base,
+            enhanced=enhanced,
+            expected_successes_increase=increase,
+            expected_successes_percent_increase=percent,
+            max_successes_increase=enhanced.max_possible_successes - base.max_possible_successes,
+            tentacle_risk=enhanced.expected_tentacles,
+            is_significant_improvement=percent > SIGNIFICANT_IMPROVEMENT_PERCENT,
+            total_dice_increase=enhanced.total_dice - base.total_dice,
+        )
+
+    def to_model(self) -> PowerImpact:
+        """Convert to the pydantic model."""
+        return PowerImpact(base=self.base.to_model(), enhanced=self.enhanced.to_model())
+
+
+# Convenience functions
+@lru_cache(maxsize=None)
+def get_fast_single_die_stats(dice_type: DiceType) -> FastSingleDieStats:
+    """Get fast-path statistics for a single die (cached per dice type)."""
+    return FastSingleDieStats.from_model(get_single_die_stats(dice_type))
+
+
+@lru_cache(maxsize=COMBINED_STATS_CACHE_SIZE)
+def get_fast_combined_stats(black_count: int, green_count: int) -> FastCombinedRollStats:
+    """Get fast-path statistics for a dice pool (cached; instances are immutable).
+
+    Args:
+        black_count: Number of black dice
+        green_count: Number of green dice
+
+    Returns:
+        FastCombinedRollStats for the pool
+    """
+    return FastCombinedRollStats.from_counts(
+        black_count,
+        green_count,
+        get_fast_single_die_stats(DiceType.BLACK),
+        get_fast_single_die_stats(DiceType.GREEN),
+    )
+
+
+def get_fast_power_impact(
+    base_black: int, base_green: int, power_adds_green: int
+) -> FastPowerImpact:
+    """Get the fast-path impact of a power that adds green dice.
+
+    Args:
+        base_black: Base number of black dice (usually 3)
+        base_green: Base number of green dice (usually 0)
+        power_adds_green: Number of green dice the power adds
+
+    Returns:
+        FastPowerImpact comparing base vs enhanced statistics
+    """
+    return FastPowerImpact.from_stats(
+        get_fast_combined_stats(base_black, base_green),
+        get_fast_combined_stats(base_black, base_green + power_adds_green),
+    )
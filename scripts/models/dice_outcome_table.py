@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Precomputed on-disk table of dice roll outcome distributions.
+
+Stores the exact joint PMF for every (black, green) pool up to a configurable
+maximum in a single ``.npy`` file that is memory-mapped on load, so a lookup
+is an array index instead of a convolution. The file name embeds a format
+version and a fingerprint of the dice face definitions in ``game_mechanics.py``;
+editing the faces changes the fingerprint and the table is rebuilt on next use.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Final, Optional, Tuple, Union
+
+import numpy as np
+
+from scripts.models.dice_distribution import (
+    RollDistribution,
+    RollDistributionCalculator,
+    convert_elder_signs,
+    face_generating_polynomial,
+    get_roll_distribution,
+)
+from scripts.models.game_mechanics import BonusDice, StandardDice
+
+# Bump when the on-disk layout changes
+OUTCOME_TABLE_VERSION: Final[int] = 1
+DEFAULT_MAX_BLACK_DICE: Final[int] = 12
+DEFAULT_MAX_GREEN_DICE: Final[int] = 12
+DEFAULT_TABLE_DIR: Final[Path] = Path(__file__).parent.parent.parent / ".generated" / "dice"
+TABLE_FILENAME_PREFIX: Final[str] = "dice_outcomes"
+
+
+def dice_faces_fingerprint(
+    black_dice: Optional[StandardDice] = None, green_dice: Optional[BonusDice] = None
+) -> str:
+    """Hash the dice face definitions that the outcome table is derived from.
+
+    Args:
+        black_dice: Black dice model (default: StandardDice())
+        green_dice: Green dice model (default: BonusDice())
+
+    Returns:
+        Hex digest that changes whenever any face's symbols or probability change
+    """
+    black_dice = black_dice or StandardDice()  # type: ignore[call-arg]
+    green_dice = green_dice or BonusDice()  # type: ignore[call-arg]
+    payload = {
+        "version": OUTCOME_TABLE_VERSION,
+        "dice": [
+            [[[s.value for s in face.symbols], face.probability] for face in dice.faces]
+            for dice in (black_dice, green_dice)
+        ],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_table_path(table_dir: Path = DEFAULT_TABLE_DIR, fingerprint: Optional[str] = None) -> Path:
+    """Get the outcome table file path for the current face definitions.
+
+    Args:
+        table_dir: Directory holding outcome tables
+        fingerprint: Face fingerprint (default: computed from current dice)
+
+    Returns:
+        Path to the versioned ``.npy`` table file
+    """
+    fingerprint = fingerprint or dice_faces_fingerprint()
+    return table_dir / f"{TABLE_FILENAME_PREFIX}_v{OUTCOME_TABLE_VERSION}_{fingerprint[:16]}.npy"
+
+
+class DiceOutcomeTable:
+    """Memory-mapped lookup table of joint PMFs indexed by (black, green) dice counts.
+
+    The backing array has shape ``(max_black + 1, max_green + 1, S, T, E)`` where
+    the trailing axes are the joint PMF of the largest pool, zero-padded for
+    smaller pools.
+    """
+
+    def __init__(self, table: np.ndarray, path: Optional[Path] = None):
+        """Initialize from a loaded (typically memory-mapped) table array.
+
+        Args:
+            table: Array of shape (max_black + 1, max_green + 1, S, T, E)
+            path: File the table was loaded from, if any
+        """
+        if table.ndim != 5:
+            raise ValueError(f"Outcome table must have 5 axes, got {table.ndim}")
+        self.table = table
+        self.path = path
+        self._black_kernel_shape, self._green_kernel_shape = _kernel_shapes()
+        self._distributions: Dict[Tuple[int, int], RollDistribution] = {}
+
+    @property
+    def max_black_dice(self) -> int:
+        """Largest black dice count in the table."""
+        return self.table.shape[0] - 1
+
+    @property
+    def max_green_dice(self) -> int:
+        """Largest green dice count in the table."""
+        return self.table.shape[1] - 1
+
+    def contains(self, black_count: int, green_count: int) -> bool:
+        """Check whether a pool is covered by the table."""
+        return 0 <= black_count <= self.max_black_dice and 0 <= green_count <= self.max_green_dice
+
+    def pmf(self, black_count: int, green_count: int) -> np.ndarray:
+        """Get the joint PMF of a pool as a view into the table.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+
+        Returns:
+            Array indexed as ``pmf[successes, tentacles, elder_signs]``, trimmed
+            to the pool's support
+        """
+        if not self.contains(black_count, green_count):
+            raise ValueError(
+                f"Pool {black_count} black + {green_count} green is outside the table "
+                f"({self.max_black_dice} black x {self.max_green_dice} green)"
+            )
+        support = _support_shape(
+            black_count, green_count, self._black_kernel_shape, self._green_kernel_shape
+        )
+        return self.table[black_count, green_count, : support[0], : support[1], : support[2]]
+
+    def distribution(self, black_count: int, green_count: int) -> RollDistribution:
+        """Get the outcome distribution of a pool from the table.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+
+        Returns:
+            RollDistribution backed by the table (cached per pool)
+        """
+        key = (black_count, green_count)
+        distribution = self._distributions.get(key)
+        if distribution is None:
+            distribution = RollDistribution(black_count, green_count, self.pmf(*key))
+            self._distributions[key] = distribution
+        return distribution
+
+    def threshold_matrix(
+        self,
+        black_counts: np.ndarray,
+        green_counts: np.ndarray,
+        elder_signs_as_successes: Union[bool, int, None] = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get P(>= k successes) and P(>= k tentacles) for many pools at once.
+
+        ``black_counts`` and ``green_counts`` are broadcast against each other,
+        so passing a column and a row gives a full grid.
+
+        Args:
+            black_counts: Black dice count per pool
+            green_counts: Green dice count per pool
+            elder_signs_as_successes: Elder signs counted as successes per roll
+                (False/0 = none, True/None = any number, n = at most n; see
+                ``convert_elder_signs``)
+
+        Returns:
+            (successes, tentacles): arrays of shape ``pools_shape + (K,)`` whose
+            entry ``[..., k]`` is P(>= k successes) / P(>= k tentacles)
+        """
+        black, green = np.broadcast_arrays(np.asarray(black_counts), np.asarray(green_counts))
+        if black.size and (
+            black.min() < 0
+            or green.min() < 0
+            or black.max() > self.max_black_dice
+            or green.max() > self.max_green_dice
+        ):
+            raise ValueError(
+                f"Pools must lie within the table "
+                f"({self.max_black_dice} black x {self.max_green_dice} green)"
+            )
+
+        pmfs = self.table[black, green]  # pools_shape + (S, T, E)
+        tentacles = pmfs.sum(axis=(-3, -1))
+        if elder_signs_as_successes is True:
+            elder_signs_as_successes = None
+        if elder_signs_as_successes is None or elder_signs_as_successes > 0:
+            pmfs = convert_elder_signs(pmfs, elder_signs_as_successes)
+        successes = pmfs.sum(axis=(-2, -1))
+
+        def survival(marginal: np.ndarray) -> np.ndarray:
+            return np.flip(np.cumsum(np.flip(marginal, axis=-1), axis=-1), axis=-1)
+
+        return survival(successes), survival(tentacles)
+
+
+def _kernel_shapes() -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Get the generating polynomial shapes of one black and one green die."""
+    black = face_generating_polynomial(StandardDice())  # type: ignore[call-arg]
+    green = face_generating_polynomial(BonusDice())  # type: ignore[call-arg]
+    return black.shape, green.shape
+
+
+def _support_shape(
+    black_count: int,
+    green_count: int,
+    black_shape: Tuple[int, ...],
+    green_shape: Tuple[int, ...],
+) -> Tuple[int, ...]:
+    """Get the joint PMF shape for a pool from the per-die kernel shapes."""
+    return tuple(
+        (b - 1) * black_count + (g - 1) * green_count + 1 for b, g in zip(black_shape, green_shape)
+    )
+
+
+def build_outcome_table(
+    max_black: int = DEFAULT_MAX_BLACK_DICE,
+    max_green: int = DEFAULT_MAX_GREEN_DICE,
+    table_dir: Path = DEFAULT_TABLE_DIR,
+) -> Path:
+    """Precompute every pool's joint PMF and write the table to disk.
+
+    The file is written to a temporary name and atomically renamed, so readers
+    never see a partial table. Tables left over from older face definitions or
+    format versions are removed.
+
+    Args:
+        max_black: Largest black dice count to include
+        max_green: Largest green dice count to include
+        table_dir: Output directory
+
+    Returns:
+        Path to the written table
+    """
+    if max_black < 0 or max_green < 0:
+        raise ValueError(f"Table dimensions must be non-negative: {max_black}, {max_green}")
+
+    calculator = RollDistributionCalculator()
+    full_shape = _support_shape(
+        max_black, max_green, calculator.black_kernel.shape, calculator.green_kernel.shape
+    )
+    table = np.zeros((max_black + 1, max_green + 1, *full_shape), dtype=np.float64)
+    for black in range(max_black + 1):
+        for green in range(max_green + 1):
+            pmf = calculator.joint_pmf(black, green)
+            table[black, green, : pmf.shape[0], : pmf.shape[1], : pmf.shape[2]] = pmf
+
+    table_dir.mkdir(parents=True, exist_ok=True)
+    path = get_table_path(table_dir)
+    fd, tmp_name = tempfile.mkstemp(dir=table_dir, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, table)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    for stale in table_dir.glob(f"{TABLE_FILENAME_PREFIX}_v*.npy"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return path
+
+
+def load_outcome_table(
+    max_black: int = DEFAULT_MAX_BLACK_DICE,
+    max_green: int = DEFAULT_MAX_GREEN_DICE,
+    table_dir: Path = DEFAULT_TABLE_DIR,
+    build_if_missing: bool = True,
+) -> Optional[DiceOutcomeTable]:
+    """Memory-map the outcome table, rebuilding it if stale or too small.
+
+    Args:
+        max_black: Smallest acceptable black dice coverage
+        max_green: Smallest acceptable green dice coverage
+        table_dir: Directory holding outcome tables
+        build_if_missing: Build the table when no usable one exists
+
+    Returns:
+        DiceOutcomeTable, or None if no usable table exists and building is disabled
+    """
+    path = get_table_path(table_dir)
+    if path.exists():
+        table = np.load(path, mmap_mode="r")
+        if table.shape[0] > max_black and table.shape[1] > max_green:
+            return DiceOutcomeTable(table, path)
+        # Grow to cover both the existing and the requested range
+        max_black = max(max_black, table.shape[0] - 1)
+        max_green = max(max_green, table.shape[1] - 1)
+        del table
+
+    if not build_if_missing:
+        return None
+
+    path = build_outcome_table(max_black, max_green, table_dir)
+    return DiceOutcomeTable(np.load(path, mmap_mode="r"), path)
+
+
+_default_table: Optional[DiceOutcomeTable] = None
+
+
+def get_outcome_table() -> DiceOutcomeTable:
+    """Get the shared outcome table, loading or building it on first use."""
+    global _default_table
+    if _default_table is None:
+        table = load_outcome_table()
+        if table is None:
+            raise RuntimeError(
+                f"Could not load or build the dice outcome table in {DEFAULT_TABLE_DIR}"
+            )
+        _default_table = table
+    return _default_table
+
+
+def lookup_distribution(
+    black_count: int, green_count: int, table: Optional[DiceOutcomeTable] = None
+) -> RollDistribution:
+    """Get a pool's outcome distribution, preferring the precomputed table.
+
+    Pools outside the table fall back to in-memory convolution.
+
+    Args:
+        black_count: Number of black dice
+        green_count: Number of green dice
+        table: Table to use (default: shared table from get_outcome_table())
+
+    Returns:
+        RollDistribution for the pool
+    """
+    table = table or get_outcome_table()
+    if table.contains(black_count, green_count):
+        return table.distribution(black_count, green_count)
+    return get_roll_distribution(black_count, green_count)
@@ -7,10 +7,12 @@ when rolling combinations of black and green dice.
 """
 
 from collections import defaultdict
-from typing import Dict, Final, Union
+from typing import Dict, Final, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, computed_field
 
+from scripts.models.dice_distribution import RollDistribution
+from scripts.models.dice_outcome_table import DiceOutcomeTable, lookup_distribution
 from scripts.models.game_mechanics import (
     BonusDice,
     DiceFaceSymbol,
@@ -48,7 +50,9 @@ class SingleDieStats(BaseModel):
     face_probabilities: Dict[str, float] = Field(..., description="Probability of each symbol type")
 
     @classmethod
-    def from_dice(cls, dice_type: DiceType, dice: Union[StandardDice, BonusDice]) -> "SingleDieStats":
+    def from_dice(
+        cls, dice_type: DiceType, dice: Union[StandardDice, BonusDice]
+    ) -> "SingleDieStats":
         """Create SingleDieStats from a dice model by computing probabilities.
 
         Args:
@@ -283,6 +287,11 @@ class CombinedRollStats(BaseModel):
         """Probability of at least 1 elder sign as a percentage."""
         return self.prob_at_least_1_elder * 100.0
 
+    @property
+    def distribution(self) -> RollDistribution:
+        """Exact joint outcome distribution of the pool (from the outcome table)."""
+        return get_probability_calculator().calculate_distribution(self.black_dice, self.green_dice)
+
     def get_summary(self) -> str:
         """Get a human-readable summary of the roll statistics."""
         return (
@@ -375,10 +384,19 @@ class PowerImpact(BaseModel):
 class DiceProbabilityCalculator:
     """Calculate probabilities for dice roll outcomes."""
 
-    def __init__(self):
-        """Initialize with standard dice configurations."""
+    def __init__(self, outcome_table: Optional[DiceOutcomeTable] = None):
+        """Initialize with standard dice configurations.
+
+        Args:
+            outcome_table: Table for joint distributions (default: shared table,
+                loaded on first use)
+        """
         self.black_dice = StandardDice()  # type: ignore[call-arg]
         self.green_dice = BonusDice()  # type: ignore[call-arg]
+        self.outcome_table = outcome_table
+        self._single_die_stats: Dict[DiceType, SingleDieStats] = {}
+        self._combined_stats: Dict[Tuple[int, int], CombinedRollStats] = {}
+        self._power_impacts: Dict[Tuple[int, int, int], PowerImpact] = {}
 
     def get_face_probabilities(self, dice_type: DiceType) -> Dict[str, float]:
         """Get probability of each symbol type for a single die.
@@ -417,8 +435,13 @@ class DiceProbabilityCalculator:
             dice_type: Type of dice (DiceType.BLACK or DiceType.GREEN)
 
         Returns:
-            SingleDieStats model with all statistics computed
+            SingleDieStats model with all statistics computed (a copy of the
+            per-dice-type cache entry, so callers may modify it)
         """
+        cached = self._single_die_stats.get(dice_type)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         if dice_type == DiceType.BLACK:
             dice: Union[StandardDice, BonusDice] = self.black_dice
         elif dice_type == DiceType.GREEN:
@@ -426,7 +449,9 @@ class DiceProbabilityCalculator:
         else:
             raise ValueError(f"Unknown dice type: {dice_type}")
 
-        return SingleDieStats.from_dice(dice_type, dice)
+        stats = SingleDieStats.from_dice(dice_type, dice)
+        self._single_die_stats[dice_type] = stats
+        return stats.model_copy(deep=True)
 
     def calculate_combined_stats(self, black_count: int, green_count: int) -> CombinedRollStats:
         """Calculate statistics for rolling multiple dice.
@@ -436,12 +461,34 @@ class DiceProbabilityCalculator:
             green_count: Number of green dice
 
         Returns:
-            CombinedRollStats model with combined statistics computed
+            CombinedRollStats model with combined statistics computed (a copy of
+            the per-pool cache entry, so callers may modify it)
         """
+        key = (black_count, green_count)
+        cached = self._combined_stats.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         black_stats = self.calculate_single_die_stats(DiceType.BLACK)
         green_stats = self.calculate_single_die_stats(DiceType.GREEN)
+        stats = CombinedRollStats.from_counts(black_count, green_count, black_stats, green_stats)
+        self._combined_stats[key] = stats
+        return stats.model_copy(deep=True)
 
-        return CombinedRollStats.from_counts(black_count, green_count, black_stats, green_stats)
+    def calculate_distribution(self, black_count: int, green_count: int) -> RollDistribution:
+        """Get the exact joint outcome distribution of a pool.
+
+        Pools within the outcome table are an array index into it; larger pools
+        fall back to convolution.
+
+        Args:
+            black_count: Number of black dice
+            green_count: Number of green dice
+
+        Returns:
+            RollDistribution for the pool
+        """
+        return lookup_distribution(black_count, green_count, table=self.outcome_table)
 
     def calculate_power_impact(
         self, base_black: int, base_green: int, power_adds_green: int
@@ -454,12 +501,30 @@ class DiceProbabilityCalculator:
             power_adds_green: Number of green dice the power adds
 
         Returns:
-            PowerImpact model comparing base vs enhanced statistics
+            PowerImpact model comparing base vs enhanced statistics (a copy of
+            the cache entry, so callers may modify it)
         """
+        key = (base_black, base_green, power_adds_green)
+        cached = self._power_impacts.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         base_stats = self.calculate_combined_stats(base_black, base_green)
         enhanced_stats = self.calculate_combined_stats(base_black, base_green + power_adds_green)
+        impact = PowerImpact(base=base_stats, enhanced=enhanced_stats)
+        self._power_impacts[key] = impact
+        return impact.model_copy(deep=True)
+
+
+_default_calculator: Optional[DiceProbabilityCalculator] = None
 
-        return PowerImpact(base=base_stats, enhanced=enhanced_stats)
+
+def get_probability_calculator() -> DiceProbabilityCalculator:
+    """Get the shared module-level probability calculator."""
+    global _default_calculator
+    if _default_calculator is None:
+        _default_calculator = DiceProbabilityCalculator()
+    return _default_calculator
 
 
 # Convenience functions
@@ -472,7 +537,7 @@ def get_single_die_stats(dice_type: DiceType) -> SingleDieStats:
     Returns:
         SingleDieStats model with statistics
     """
-    calculator = DiceProbabilityCalculator()
+    calculator = get_probability_calculator()
     return calculator.calculate_single_die_stats(dice_type)
 
 
@@ -486,10 +551,24 @@ def get_combined_stats(black_count: int, green_count: int) -> CombinedRollStats:
     Returns:
         CombinedRollStats model with statistics
     """
-    calculator = DiceProbabilityCalculator()
+    calculator = get_probability_calculator()
     return calculator.calculate_combined_stats(black_count, green_count)
 
 
+def get_roll_distribution_for_pool(black_count: int, green_count: int) -> RollDistribution:
+    """Get the exact joint outcome distribution of a pool from the outcome table.
+
+    Args:
+        black_count: Number of black dice
+        green_count: Number of green dice
+
+    Returns:
+        RollDistribution for the pool
+    """
+    calculator = get_probability_calculator()
+    return calculator.calculate_distribution(black_count, green_count)
+
+
 def analyze_power_dice_impact(
     base_black: int, base_green: int, power_adds_green: int
 ) -> PowerImpact:
@@ -503,5 +582,5 @@ def analyze_power_dice_impact(
     Returns:
         PowerImpact model with complete analysis
     """
-    calculator = DiceProbabilityCalculator()
+    calculator = get_probability_calculator()
     return calculator.calculate_power_impact(base_black, base_green, power_adds_green)
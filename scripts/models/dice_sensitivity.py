@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Batched "what-if" sensitivity analysis for dice pool changes.
+
+``DiceProbabilityCalculator.calculate_power_impact`` compares one base pool with
+one enhanced pool. This module takes many builds and a matrix of candidate
+changes at once and returns the change in every roll metric for every
+(build, change) pair as NumPy arrays.
+
+A build is a row ``(black dice, green dice, elder conversion, rerolls)`` where
+elder conversion is the number of elder signs that may count as successes
+(0 = none, ANY_ELDER_SIGNS = any number). A change is a row of deltas in the
+same order; results are clipped to zero and ANY_ELDER_SIGNS, so ``+1`` in the
+elder column raises a cap by one and ``-ANY_ELDER_SIGNS``/``+ANY_ELDER_SIGNS``
+turns conversion off/fully on.
+
+Metrics are computed once per distinct resulting pool (exact joint PMFs, and
+the optimal reroll policy for pools with rerolls) and cached on the analyzer;
+the deltas are then a single gather and subtraction over all pairs.
+"""
+
+import itertools
+from typing import TYPE_CHECKING, Dict, Final, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from scripts.models.build_statistics import ANY_ELDER_SIGNS, ELDER_CONVERSION_COLUMN
+from scripts.models.dice_distribution import get_distribution_calculator
+from scripts.models.reroll_solver import get_reroll_solver
+
+if TYPE_CHECKING:
+    from scripts.models.build_statistics import BuildStatisticsTable
+    from scripts.models.character_build import CharacterBuild
+
+# Columns of build and change rows
+BLACK_DICE: Final[int] = 0
+GREEN_DICE: Final[int] = 1
+ELDER_CONVERSION: Final[int] = 2
+REROLLS: Final[int] = 3
+POOL_COLUMNS: Final[Tuple[str, ...]] = ("black_dice", "green_dice", "elder_conversion", "rerolls")
+
+# Metric order of result arrays
+METRICS: Final[Tuple[str, ...]] = (
+    "expected_successes",
+    "expected_tentacles",
+    "expected_elder_signs",
+    "prob_at_least_1_success",
+    "prob_at_least_1_tentacle",
+    "prob_at_least_target",
+)
+
+DEFAULT_TARGET_SUCCESSES: Final[int] = 1
+
+# (black dice, green dice, elder conversion, rerolls)
+PoolKey = Tuple[int, int, int, int]
+
+
+class SensitivityResult:
+    """Metrics of base builds and every candidate change.
+
+    Attributes:
+        metrics: Metric names, in the order of the last array axis
+        base: (builds, metrics) metrics of the unchanged builds
+        changed: (builds, changes, metrics) metrics after each change
+        pools: (builds, changes, 4) pools after each change
+    """
+
+    __slots__ = ("metrics", "base", "changed", "pools")
+
+    def __init__(
+        self,
+        metrics: Tuple[str, ...],
+        base: np.ndarray,
+        changed: np.ndarray,
+        pools: np.ndarray,
+    ):
+        """Initialize from computed arrays."""
+        self.metrics = metrics
+        self.base = base
+        self.changed = changed
+        self.pools = pools
+
+    @property
+    def deltas(self) -> np.ndarray:
+        """(builds, changes, metrics) change of every metric."""
+        return self.changed - self.base[:, np.newaxis, :]
+
+    def delta(self, metric: str) -> np.ndarray:
+        """Get the (builds, changes) deltas of one metric.
+
+        Args:
+            metric: Name from METRICS
+
+        Returns:
+            Change of the metric for every (build, change) pair
+        """
+        if metric not in self.metrics:
+            raise KeyError(f"Unknown metric: {metric}")
+        index = self.metrics.index(metric)
+        return self.changed[:, :, index] - self.base[:, np.newaxis, index]
+
+
+class DiceSensitivityAnalyzer:
+    """Evaluate batches of candidate pool changes against many builds.
+
+    Args:
+        target_successes: Successes needed for ``prob_at_least_target`` (and the
+            objective the reroll policy optimizes)
+    """
+
+    def __init__(self, target_successes: int = DEFAULT_TARGET_SUCCESSES):
+        """Initialize with an empty per-pool metric cache."""
+        if target_successes < 0:
+            raise ValueError(f"Target successes must be non-negative: {target_successes}")
+        self.target_successes = target_successes
+        self._pool_metrics: Dict[PoolKey, np.ndarray] = {}
+
+    def pool_metrics(self, black: int, green: int, elder: int, rerolls: int) -> np.ndarray:
+        """Metrics of one pool, in METRICS order (cached).
+
+        ``elder`` is the elder sign conversion cap; caps of at least the dice
+        rolled (including ANY_ELDER_SIGNS) are the same pool. Pools with rerolls
+        use the final outcome distribution of the optimal reroll policy for
+        ``target_successes``.
+        """
+        elder = min(elder, black + green)
+        key = (black, green, elder, rerolls)
+        cached = self._pool_metrics.get(key)
+        if cached is not None:
+            return cached
+
+        if rerolls > 0:
+            cap = None if elder == black + green else elder
+            solver = get_reroll_solver(self.target_successes, cap)
+            pmf = solver.solve(black, green, rerolls).distribution.pmf
+        else:
+            pmf = get_distribution_calculator().joint_pmf(black, green)
+
+        successes = np.arange(pmf.shape[0])[:, np.newaxis, np.newaxis]
+        tentacles = np.arange(pmf.shape[1])[np.newaxis, :, np.newaxis]
+        elder_signs = np.arange(pmf.shape[2])[np.newaxis, np.newaxis, :]
+        counted = successes + np.minimum(elder_signs, elder)
+
+        metrics = np.array(
+            [
+                float((pmf * counted).sum()),
+                float((pmf * tentacles).sum()),
+                float((pmf * elder_signs).sum()),
+                float(pmf[np.broadcast_to(counted >= 1, pmf.shape)].sum()),
+                float(pmf[:, 1:, :].sum()),
+                float(pmf[np.broadcast_to(counted >= self.target_successes, pmf.shape)].sum()),
+            ]
+        )
+        metrics.setflags(write=False)
+        self._pool_metrics[key] = metrics
+        return metrics
+
+    def analyze(self, builds: np.ndarray, changes: np.ndarray) -> SensitivityResult:
+        """Apply every change to every build.
+
+        Args:
+            builds: (builds, 4) integer rows of (black, green, elder conversion, rerolls)
+            changes: (changes, 4) integer rows of deltas in the same order
+
+        Returns:
+            SensitivityResult with base and changed metrics
+        """
+        builds = _as_pool_matrix(builds, "builds")
+        changes = _as_pool_matrix(changes, "changes")
+        if (builds < 0).any() or (builds[:, ELDER_CONVERSION] > ANY_ELDER_SIGNS).any():
+            raise ValueError(
+                f"Build counts must be non-negative and elder conversion at most {ANY_ELDER_SIGNS}"
+            )
+
+        pools = builds[:, np.newaxis, :] + changes[np.newaxis, :, :]
+        np.maximum(pools, 0, out=pools)
+        np.minimum(pools[..., ELDER_CONVERSION], ANY_ELDER_SIGNS, out=pools[..., ELDER_CONVERSION])
+
+        # Base builds and changed pools share one metric table
+        stacked = np.concatenate([builds, pools.reshape(-1, len(POOL_COLUMNS))])
+        # Caps beyond the dice rolled convert every elder sign; folding them keeps keys small
+        stacked[:, ELDER_CONVERSION] = np.minimum(
+            stacked[:, ELDER_CONVERSION], stacked[:, BLACK_DICE] + stacked[:, GREEN_DICE]
+        )
+        # One integer key per pool makes deduplication a 1-D unique
+        dims = tuple(int(d) for d in stacked.max(axis=0) + 1)
+        keys = np.ravel_multi_index(tuple(stacked.T), dims)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        table = np.stack(
+            [
+                self.pool_metrics(*(int(v) for v in row))
+                for row in np.column_stack(np.unravel_index(unique, dims))
+            ]
+        )
+        gathered = table[inverse.reshape(-1)]
+
+        count = builds.shape[0]
+        return SensitivityResult(
+            METRICS,
+            gathered[:count],
+            gathered[count:].reshape(count, changes.shape[0], len(METRICS)),
+            pools,
+        )
+
+
+def _as_pool_matrix(rows: np.ndarray, name: str) -> np.ndarray:
+    """Validate and copy a (n, 4) integer pool matrix."""
+    matrix = np.array(rows, dtype=np.int64, ndmin=2)
+    if matrix.ndim != 2 or matrix.shape[1] != len(POOL_COLUMNS):
+        raise ValueError(f"{name} must have shape (n, {len(POOL_COLUMNS)}), got {matrix.shape}")
+    return matrix
+
+
+def candidate_changes(
+    black: Iterable[int] = (0,),
+    green: Iterable[int] = (0,),
+    elder: Iterable[int] = (0,),
+    rerolls: Iterable[int] = (0,),
+) -> np.ndarray:
+    """Build a change matrix from every combination of per-column deltas.
+
+    Example: ``candidate_changes(black=(-1, 0, 1), green=(0, 1, 2))`` gives 9 rows.
+
+    Returns:
+        (changes, 4) integer array
+    """
+    return np.array(list(itertools.product(black, green, elder, rerolls)), dtype=np.int64)
+
+
+def builds_from_statistics_table(table: "BuildStatisticsTable") -> np.ndarray:
+    """Pool rows for every row of a BuildStatisticsTable."""
+    return np.column_stack(
+        [
+            table.column("total_black_dice"),
+            table.column("total_green_dice"),
+            table.column(ELDER_CONVERSION_COLUMN),
+            table.column("rerolls_per_roll"),
+        ]
+    ).astype(np.int64)
+
+
+def builds_from_character_builds(builds: Sequence["CharacterBuild"]) -> np.ndarray:
+    """Pool rows for character builds at their current levels."""
+    rows = []
+    for build in builds:
+        stats = build.statistics
+        conversion = build.power_combination.elder_sign_conversion
+        rows.append(
+            (
+                stats.total_black_dice,
+                stats.total_green_dice,
+                ANY_ELDER_SIGNS if conversion is None else conversion,
+                stats.rerolls_per_roll,
+            )
+        )
+    return np.array(rows, dtype=np.int64).reshape(-1, len(POOL_COLUMNS))
+
+
+# Convenience functions
+_analyzers: Dict[int, DiceSensitivityAnalyzer] = {}
+
+
+def get_sensitivity_analyzer(
+    target_successes: int = DEFAULT_TARGET_SUCCESSES,
+) -> DiceSensitivityAnalyzer:
+    """Get a shared analyzer for a target, so per-pool metrics are reused."""
+    analyzer = _analyzers.get(target_successes)
+    if analyzer is None:
+        analyzer = DiceSensitivityAnalyzer(target_successes)
+        _analyzers[target_successes] = analyzer
+    return analyzer
+
+
+def analyze_what_if(
+    builds: np.ndarray,
+    changes: np.ndarray,
+    target_successes: int = DEFAULT_TARGET_SUCCESSES,
+) -> SensitivityResult:
+    """Apply every candidate change to every build.
+
+    Args:
+        builds: (builds, 4) rows of (black, green, elder conversion, rerolls)
+        changes: (changes, 4) rows of deltas in the same order
+        target_successes: Successes needed for ``prob_at_least_target``
+
+    Returns:
+        SensitivityResult with base and changed metrics
+    """
+    return get_sensitivity_analyzer(target_successes).analyze(builds, changes)
@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""
+Vectorized Monte Carlo simulation of Cthulhu: Death May Die dice rolls.
+
+Rolls are simulated in large batches with a NumPy ``Generator``: each batch is a
+face-index matrix (one row per roll, one column per die) mapped through lookup
+tables, and power rules are applied as vectorized masks over that matrix. This
+covers effects the closed-form models can't express (conditional bonus dice,
+"instead" replacements, reroll heuristics) and gives an independent check of
+the exact distributions in ``dice_distribution.py``.
+
+Face ids are shared across colours: black faces come first, then green faces,
+then one "absent" id used for conditional dice that were not added to a roll.
+"""
+
+import math
+from typing import TYPE_CHECKING, Dict, Final, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from scripts.models.dice_distribution import RollDistribution
+from scripts.models.game_mechanics import BonusDice, DiceFaceSymbol, StandardDice
+
+if TYPE_CHECKING:
+    from scripts.models.power_combination import PowerCombination
+
+DEFAULT_BATCH_SIZE: Final[int] = 1_000_000
+DEFAULT_MAX_ROLLS: Final[int] = 50_000_000
+DEFAULT_CONFIDENCE: Final[float] = 0.95
+DEFAULT_CONDITION_PROBABILITY: Final[float] = 0.5
+
+# Reroll priorities (higher is rerolled first)
+REROLL_PRIORITY_KEEP: Final[int] = 0
+REROLL_PRIORITY_FAILED: Final[int] = 1
+REROLL_PRIORITY_FAILED_TENTACLE: Final[int] = 2
+
+
+class FaceTables:
+    """Lookup tables mapping face ids to symbol counts for vectorized rolls."""
+
+    def __init__(self):
+        """Build tables from the standard black and green dice definitions."""
+        black = StandardDice()  # type: ignore[call-arg]
+        green = BonusDice()  # type: ignore[call-arg]
+        faces = list(black.faces) + list(green.faces)
+
+        self.black_count = len(black.faces)
+        self.green_count = len(green.faces)
+        self.green_offset = self.black_count
+        self.absent_id = self.black_count + self.green_count
+
+        # Per-face symbol counts; the trailing row is the "absent" face
+        counts = np.zeros((len(faces) + 1, 3), dtype=np.int16)
+        for i, face in enumerate(faces):
+            counts[i] = [
+                face.symbols.count(DiceFaceSymbol.SUCCESS),
+                face.symbols.count(DiceFaceSymbol.TENTACLE),
+                face.symbols.count(DiceFaceSymbol.ELDER_SIGN),
+            ]
+        self.successes = counts[:, 0]
+        self.tentacles = counts[:, 1]
+        self.elder_signs = counts[:, 2]
+
+        # Colour offset for rerolling a face id into a fresh face of the same colour
+        self.colour_offset = np.full(len(faces) + 1, -1, dtype=np.int16)
+        self.colour_offset[: self.black_count] = 0
+        self.colour_offset[self.black_count : self.absent_id] = self.green_offset
+
+        self.black_cdf = np.cumsum([face.probability for face in black.faces])
+        self.green_cdf = np.cumsum([face.probability for face in green.faces])
+        self.black_uniform = bool(np.allclose(np.diff(self.black_cdf), 1.0 / self.black_count))
+        self.green_uniform = bool(np.allclose(np.diff(self.green_cdf), 1.0 / self.green_count))
+
+        priority = np.full(len(faces) + 1, REROLL_PRIORITY_KEEP, dtype=np.int8)
+        failed = (self.successes == 0) & (np.arange(len(faces) + 1) != self.absent_id)
+        priority[failed] = REROLL_PRIORITY_FAILED
+        priority[failed & (self.tentacles > 0)] = REROLL_PRIORITY_FAILED_TENTACLE
+        self.reroll_priority = priority
+
+    def sample(
+        self, rng: np.random.Generator, rows: int, dice: int, green: bool = False
+    ) -> np.ndarray:
+        """Sample a (rows, dice) face-id matrix for one colour.
+
+        Args:
+            rng: Random generator
+            rows: Number of rolls
+            dice: Dice per roll
+            green: Sample green faces instead of black
+
+        Returns:
+            uint8 matrix of face ids
+        """
+        count, cdf, uniform = (
+            (self.green_count, self.green_cdf, self.green_uniform)
+            if green
+            else (self.black_count, self.black_cdf, self.black_uniform)
+        )
+        offset = self.green_offset if green else 0
+        if uniform:
+            ids = rng.integers(0, count, size=(rows, dice), dtype=np.uint8)
+        else:
+            ids = np.searchsorted(cdf, rng.random((rows, dice)), side="right").astype(np.uint8)
+            np.minimum(ids, count - 1, out=ids)
+        if offset:
+            ids += np.uint8(offset)
+        return ids
+
+
+class RollBatch:
+    """A batch of simulated rolls under construction.
+
+    Attributes:
+        faces: (rolls, dice) matrix of face ids
+        bonus_successes: Extra successes per roll from rules (e.g. elder conversion)
+        elder_signs_spent: Elder signs per roll already counted as successes (they
+            stay on the elder sign axis, as in ``convert_elder_signs``; this only
+            stops repeat conversions from counting them twice)
+    """
+
+    __slots__ = ("faces", "bonus_successes", "elder_signs_spent")
+
+    def __init__(self, faces: np.ndarray):
+        """Initialize from a face-id matrix."""
+        self.faces = faces
+        self.bonus_successes = np.zeros(faces.shape[0], dtype=np.int16)
+        self.elder_signs_spent = np.zeros(faces.shape[0], dtype=np.int16)
+
+    @property
+    def rolls(self) -> int:
+        """Number of rolls in the batch."""
+        return self.faces.shape[0]
+
+    def outcome_codes(self, face_codes: np.ndarray, side: int) -> np.ndarray:
+        """Pack each roll's (successes, tentacles, elder signs) into one integer.
+
+        Args:
+            face_codes: Per-face ``(s * side + t) * side + e`` lookup table
+            side: Radix for the tentacle and elder sign axes (max dice + 1)
+
+        Returns:
+            int64 array of packed outcome codes, one per roll
+        """
+        # Per-axis counts stay below ``side``, so summing packed faces never carries
+        codes = face_codes[self.faces].sum(axis=1, dtype=np.int64)
+        codes += self.bonus_successes.astype(np.int64) * (side * side)
+        return codes
+
+
+class SimulationRule(BaseModel):
+    """Base class for a power rule applied to simulated rolls."""
+
+    # Rules run in ascending stage order: add dice, reroll, then count symbols
+    stage: int = Field(default=0, description="Application order")
+
+    def extra_dice(self) -> Tuple[int, int]:
+        """Get (black, green) dice this rule may add to a roll."""
+        return (0, 0)
+
+    def apply(
+        self, batch: RollBatch, rng: np.random.Generator, tables: FaceTables, column: int
+    ) -> None:
+        """Apply the rule to a batch in place.
+
+        Args:
+            batch: Rolls to modify
+            rng: Random generator
+            tables: Face lookup tables
+            column: First face column reserved for this rule's extra dice
+        """
+
+
+class BonusDiceRule(SimulationRule):
+    """Add dice to a roll, optionally only when a condition holds.
+
+    Conditions in power text ("when attacking", "if in darkness") can't be
+    evaluated from the dice alone, so each is modelled as holding independently
+    with ``condition_probability`` per roll.
+    """
+
+    stage: int = Field(default=0, description="Application order")
+    black_dice: int = Field(default=0, ge=0, description="Black dice added")
+    green_dice: int = Field(default=0, ge=0, description="Green dice added")
+    condition_probability: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Probability the condition holds on a roll"
+    )
+
+    def extra_dice(self) -> Tuple[int, int]:
+        """Get (black, green) dice this rule may add to a roll."""
+        return (self.black_dice, self.green_dice)
+
+    def apply(
+        self, batch: RollBatch, rng: np.random.Generator, tables: FaceTables, column: int
+    ) -> None:
+        """Mark this rule's dice absent on rolls where the condition fails."""
+        if self.condition_probability >= 1.0:
+            return
+        width = self.black_dice + self.green_dice
+        inactive = rng.random(batch.rolls) >= self.condition_probability
+        batch.faces[inactive, column : column + width] = tables.absent_id
+
+
+class RerollRule(SimulationRule):
+    """Use rerolls greedily, one die at a time.
+
+    While a roll is short of ``target_successes``, reroll a failed die,
+    preferring faces that show a tentacle. Once the target is met, only
+    tentacle faces without a success are rerolled (they can't lose a success).
+    This mirrors the optimal policy of ``reroll_solver`` for the common cases
+    and is cheap enough to vectorize.
+    """
+
+    stage: int = Field(default=1, description="Application order")
+    rerolls: int = Field(default=0, ge=0, description="Rerolls per roll")
+    target_successes: int = Field(default=1, ge=0, description="Successes the roll is aiming for")
+
+    def apply(
+        self, batch: RollBatch, rng: np.random.Generator, tables: FaceTables, column: int
+    ) -> None:
+        """Reroll up to ``rerolls`` dice per roll."""
+        rows = np.arange(batch.rolls)
+        for _ in range(self.rerolls):
+            successes = tables.successes[batch.faces].sum(axis=1)
+            priority = tables.reroll_priority[batch.faces]
+            short = successes < self.target_successes
+            priority[~short] = np.where(
+                priority[~short] == REROLL_PRIORITY_FAILED_TENTACLE,
+                REROLL_PRIORITY_FAILED_TENTACLE,
+                REROLL_PRIORITY_KEEP,
+            )
+            choice = priority.argmax(axis=1)
+            active = priority[rows, choice] > REROLL_PRIORITY_KEEP
+            if not active.any():
+                break
+
+            chosen_rows = rows[active]
+            chosen = batch.faces[chosen_rows, choice[active]]
+            offsets = tables.colour_offset[chosen]
+            green = offsets > 0
+            fresh = np.empty(chosen.shape, dtype=np.uint8)
+            if (~green).any():
+                fresh[~green] = tables.sample(rng, int((~green).sum()), 1)[:, 0]
+            if green.any():
+                fresh[green] = tables.sample(rng, int(green.sum()), 1, green=True)[:, 0]
+            batch.faces[chosen_rows, choice[active]] = fresh
+
+
+class ElderSignConversionRule(SimulationRule):
+    """Count elder signs as successes, up to an optional cap per roll."""
+
+    stage: int = Field(default=2, description="Application order")
+    max_count: Optional[int] = Field(
+        default=None, ge=0, description="Elder signs that may count as successes (None = any)"
+    )
+
+    def apply(
+        self, batch: RollBatch, rng: np.random.Generator, tables: FaceTables, column: int
+    ) -> None:
+        """Count elder signs not yet converted as successes."""
+        available = tables.elder_signs[batch.faces].sum(axis=1, dtype=np.int16)
+        available -= batch.elder_signs_spent
+        converted = available if self.max_count is None else np.minimum(available, self.max_count)
+        batch.bonus_successes += converted
+        batch.elder_signs_spent += converted
+
+
+class SimulationResult:
+    """Aggregated outcome of a Monte Carlo run.
+
+    Only the joint histogram of (successes, tentacles, elder signs) is kept, so
+    memory does not grow with the number of rolls.
+    """
+
+    __slots__ = ("black_dice", "green_dice", "histogram", "rolls", "seed", "converged")
+
+    def __init__(
+        self,
+        black_dice: int,
+        green_dice: int,
+        histogram: np.ndarray,
+        seed: Optional[int],
+        converged: bool,
+    ):
+        """Initialize from a joint count histogram."""
+        self.black_dice = black_dice
+        self.green_dice = green_dice
+        self.histogram = histogram
+        self.rolls = int(histogram.sum())
+        self.seed = seed
+        self.converged = converged
+
+    def distribution(self) -> RollDistribution:
+        """Get the empirical joint distribution."""
+        return RollDistribution(
+            self.black_dice, self.green_dice, self.histogram / max(self.rolls, 1)
+        )
+
+    def expected(self, symbol: DiceFaceSymbol) -> float:
+        """Get the sample mean of a symbol count."""
+        return self.distribution().expected(symbol)
+
+    def prob_at_least(self, symbol: DiceFaceSymbol, count: int) -> float:
+        """Get the empirical P(count of symbol >= count)."""
+        return self.distribution().prob_at_least(symbol, count)
+
+    def proportion_interval(
+        self, symbol: DiceFaceSymbol, count: int, confidence: float = DEFAULT_CONFIDENCE
+    ) -> Tuple[float, float]:
+        """Get the Wilson score interval for P(count of symbol >= count).
+
+        Args:
+            symbol: Symbol to query
+            count: Minimum number of that symbol
+            confidence: Two-sided confidence level
+
+        Returns:
+            (lower, upper) bounds
+        """
+        return wilson_interval(self.prob_at_least(symbol, count), self.rolls, confidence)
+
+    def mean_interval(
+        self, symbol: DiceFaceSymbol, confidence: float = DEFAULT_CONFIDENCE
+    ) -> Tuple[float, float]:
+        """Get the normal-approximation interval for the mean of a symbol count."""
+        mean, half_width = _mean_half_width(
+            self.distribution().marginal(symbol), self.rolls, confidence
+        )
+        return (mean - half_width, mean + half_width)
+
+
+def _z_score(confidence: float) -> float:
+    """Two-sided standard normal quantile for a confidence level."""
+    # Inverse of erf via bisection keeps this dependency-free
+    target = confidence
+    low, high = 0.0, 10.0
+    for _ in range(60):
+        mid = (low + high) / 2
+        if math.erf(mid / math.sqrt(2)) < target:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def wilson_interval(
+    p: float, n: int, confidence: float = DEFAULT_CONFIDENCE
+) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion.
+
+    Args:
+        p: Observed proportion
+        n: Number of trials
+        confidence: Two-sided confidence level
+
+    Returns:
+        (lower, upper) bounds
+    """
+    if n <= 0:
+        return (0.0, 1.0)
+    z = _z_score(confidence)
+    denominator = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return (max(0.0, centre - half_width), min(1.0, centre + half_width))
+
+
+def _mean_half_width(marginal: np.ndarray, n: int, confidence: float) -> Tuple[float, float]:
+    """Mean and CI half-width of a count variable from its empirical marginal."""
+    values = np.arange(marginal.size)
+    mean = float(np.dot(values, marginal))
+    variance = float(np.dot((values - mean) ** 2, marginal))
+    if n <= 1:
+        return mean, math.inf
+    return mean, _z_score(confidence) * math.sqrt(variance / n)
+
+
+class DiceSimulator:
+    """Seedable, batched Monte Carlo engine for dice rolls with power rules.
+
+    Args:
+        seed: Seed or SeedSequence for reproducible runs (None = fresh entropy)
+    """
+
+    def __init__(self, seed: Union[int, np.random.SeedSequence, None] = None):
+        """Initialize the random generator and face lookup tables."""
+        self.seed_sequence = (
+            seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        )
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self.tables = FaceTables()
+
+    def roll_batch(
+        self, black_dice: int, green_dice: int, rolls: int, rules: Sequence[SimulationRule] = ()
+    ) -> RollBatch:
+        """Roll one batch and apply rules.
+
+        Args:
+            black_dice: Base black dice per roll
+            green_dice: Base green dice per roll
+            rolls: Number of rolls in the batch
+            rules: Power rules to apply
+
+        Returns:
+            RollBatch with final faces and rule adjustments
+        """
+        ordered = sorted(rules, key=lambda rule: rule.stage)
+        extra = [rule.extra_dice() for rule in ordered]
+        total_black = black_dice + sum(b for b, _ in extra)
+        total_green = green_dice + sum(g for _, g in extra)
+
+        # Column layout: base black, base green, then each rule's (black, green) block
+        faces = np.empty((rolls, total_black + total_green), dtype=np.uint8)
+        faces[:, :black_dice] = self.tables.sample(self.rng, rolls, black_dice)
+        faces[:, black_dice : black_dice + green_dice] = self.tables.sample(
+            self.rng, rolls, green_dice, green=True
+        )
+        columns: List[int] = []
+        column = black_dice + green_dice
+        for rule_black, rule_green in extra:
+            columns.append(column)
+            faces[:, column : column + rule_black] = self.tables.sample(self.rng, rolls, rule_black)
+            faces[:, column + rule_black : column + rule_black + rule_green] = self.tables.sample(
+                self.rng, rolls, rule_green, green=True
+            )
+            column += rule_black + rule_green
+
+        batch = RollBatch(faces)
+        for rule, rule_column in zip(ordered, columns):
+            rule.apply(batch, self.rng, self.tables, rule_column)
+        return batch
+
+    def simulate(
+        self,
+        black_dice: int,
+        green_dice: int,
+        rules: Sequence[SimulationRule] = (),
+        max_rolls: int = DEFAULT_MAX_ROLLS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        tolerance: Optional[float] = None,
+        target_successes: Optional[int] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+    ) -> SimulationResult:
+        """Simulate rolls in batches until converged or ``max_rolls`` is reached.
+
+        Convergence is checked after each batch: with ``target_successes`` set,
+        the Wilson interval half-width of P(successes >= target) must be within
+        ``tolerance``; otherwise the interval half-width of mean successes must be.
+        Without a tolerance, exactly ``max_rolls`` rolls are simulated.
+
+        Args:
+            black_dice: Base black dice per roll
+            green_dice: Base green dice per roll
+            rules: Power rules to apply
+            max_rolls: Upper bound on rolls simulated
+            batch_size: Rolls per vectorized batch
+            tolerance: Target confidence-interval half-width for early stopping
+            target_successes: Success threshold monitored for convergence
+            confidence: Confidence level used for the convergence check
+
+        Returns:
+            SimulationResult with the joint outcome histogram
+        """
+        if black_dice < 0 or green_dice < 0:
+            raise ValueError(f"Dice counts must be non-negative: {black_dice}, {green_dice}")
+        if batch_size <= 0 or max_rolls <= 0:
+            raise ValueError(
+                f"Batch size and max rolls must be positive: {batch_size}, {max_rolls}"
+            )
+
+        extra = [rule.extra_dice() for rule in rules]
+        max_dice = black_dice + green_dice + sum(b + g for b, g in extra)
+        side = max_dice + 1
+        # Converted elder signs can put up to two successes on one die
+        shape = (2 * max_dice + 1, side, side)
+        face_codes = (
+            self.tables.successes.astype(np.int64) * side + self.tables.tentacles
+        ) * side + self.tables.elder_signs
+        counts = np.zeros(shape[0] * side * side, dtype=np.int64)
+
+        done = 0
+        converged = False
+        while done < max_rolls:
+            rolls = min(batch_size, max_rolls - done)
+            batch = self.roll_batch(black_dice, green_dice, rolls, rules)
+            counts += np.bincount(batch.outcome_codes(face_codes, side), minlength=counts.size)
+            done += rolls
+
+            if (
+                tolerance is not None
+                and self._half_width(counts.reshape(shape), target_successes, confidence)
+                <= tolerance
+            ):
+                converged = True
+                break
+
+        histogram = _trim(counts.reshape(shape))
+        return SimulationResult(
+            black_dice=black_dice + sum(b for b, _ in extra),
+            green_dice=green_dice + sum(g for _, g in extra),
+            histogram=histogram,
+            seed=self.seed_sequence.entropy
+            if isinstance(self.seed_sequence.entropy, int)
+            else None,
+            converged=converged,
+        )
+
+    def simulate_combination(
+        self,
+        combination: "PowerCombination",
+        target_successes: int = 1,
+        condition_probability: float = DEFAULT_CONDITION_PROBABILITY,
+        **kwargs,
+    ) -> SimulationResult:
+        """Simulate a power combination's dice pool with its rules applied.
+
+        Args:
+            combination: Power combination to simulate
+            target_successes: Success target used by reroll rules and convergence
+            condition_probability: Probability each conditional effect is active
+            **kwargs: Passed through to simulate()
+
+        Returns:
+            SimulationResult for the combination
+        """
+        rules = rules_from_combination(combination, target_successes, condition_probability)
+        return self.simulate(
+            combination.base_black_dice,
+            combination.base_green_dice,
+            rules,
+            target_successes=target_successes,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _half_width(
+        counts: np.ndarray, target_successes: Optional[int], confidence: float
+    ) -> float:
+        """Current confidence-interval half-width of the monitored statistic."""
+        n = int(counts.sum())
+        success_marginal = counts.sum(axis=(1, 2)) / n
+        if target_successes is not None:
+            low, high = wilson_interval(
+                float(success_marginal[target_successes:].sum()), n, confidence
+            )
+            return (high - low) / 2
+        return _mean_half_width(success_marginal, n, confidence)[1]
+
+
+def _trim(histogram: np.ndarray) -> np.ndarray:
+    """Trim trailing all-zero planes from a 3D histogram."""
+    nonzero = np.nonzero(histogram)
+    if not nonzero[0].size:
+        return histogram[:1, :1, :1]
+    return histogram[: nonzero[0].max() + 1, : nonzero[1].max() + 1, : nonzero[2].max() + 1].copy()
+
+
+def rules_from_combination(
+    combination: "PowerCombination",
+    target_successes: int = 1,
+    condition_probability: float = DEFAULT_CONDITION_PROBABILITY,
+) -> List[SimulationRule]:
+    """Translate a power combination's effects into simulation rules.
+
+    Effects are grouped by power; an effect with an "instead" clause
+    (``replaces_previous``) replaces lower levels of the same power rather than
+    stacking with them. Conditional effects add their dice only with
+    ``condition_probability``.
+
+    Args:
+        combination: Power combination to translate
+        target_successes: Success target for reroll rules
+        condition_probability: Probability each conditional effect is active
+
+    Returns:
+        List of rules, excluding the combination's base dice
+    """
+    active: Dict[str, list] = {}
+    for effect in sorted(combination.effects, key=lambda e: e.level):
+        if effect.replaces_previous:
+            active[effect.power_name] = [effect]
+        else:
+            active.setdefault(effect.power_name, []).append(effect)
+
+    rules: List[SimulationRule] = []
+    rerolls = 0
+    conversion_caps: List[Optional[int]] = []
+    for effects in active.values():
+        for effect in effects:
+            if effect.black_dice_added or effect.green_dice_added:
+                rules.append(
+                    BonusDiceRule(
+                        black_dice=effect.black_dice_added,
+                        green_dice=effect.green_dice_added,
+                        condition_probability=(
+                            condition_probability if effect.is_conditional else 1.0
+                        ),
+                    )
+                )
+            rerolls += effect.rerolls_added
+            if effect.elder_signs_as_successes != 0:
+                conversion_caps.append(effect.elder_signs_as_successes)
+
+    if rerolls:
+        rules.append(RerollRule(rerolls=rerolls, target_successes=target_successes))
+    if conversion_caps:
+        # None (any number) beats every cap
+        max_count = None if None in conversion_caps else max(conversion_caps)
+        rules.append(ElderSignConversionRule(max_count=max_count))
+    return rules
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Vectorized full-game turn simulation for character builds.
+
+Plays many independent episodes of one investigator at once. Every episode's
+tracks (insanity slot, wounds, stress, turn of each red swirl) live in compact
+integer arrays, and each step of a turn is a masked array operation over all
+episodes still alive; dice come from ``DiceSimulator.roll_batch`` with the
+build's power rules applied.
+
+A turn follows ``TurnStructure``:
+
+1. Investigator actions: each action is a Rest (``RestAction`` healing points,
+   wounds first, then stress) when wounds reach the encounter's rest threshold,
+   otherwise an Attack roll.
+2. Enemy phase: each enemy attack is a defence roll; every success cancels one
+   wound of the attack and the rest are taken.
+3. End of turn: the build's per-turn healing is applied.
+
+Every roll's tentacles advance insanity, stopping at the next red swirl for
+that roll (``InsanityTrack.take_tentacles_in_roll``); red swirls are level-ups
+and the green dice bonus follows the current slot. An episode ends when wounds
+or insanity reach their death threshold, or after ``max_turns`` turns.
+"""
+
+from typing import TYPE_CHECKING, Final, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from scripts.models.dice_simulation import (
+    DEFAULT_CONDITION_PROBABILITY,
+    DiceSimulator,
+    SimulationRule,
+    rules_from_combination,
+)
+from scripts.models.game_mechanics import GameMechanics
+
+if TYPE_CHECKING:
+    from scripts.models.character_build import CharacterBuild
+
+DEFAULT_EPISODES: Final[int] = 10_000
+DEFAULT_MAX_TURNS: Final[int] = 30
+
+# Episode end causes
+CAUSE_SURVIVED: Final[int] = 0
+CAUSE_WOUNDS: Final[int] = 1
+CAUSE_MADNESS: Final[int] = 2
+
+# Level-up turn of a red swirl that was never reached
+NOT_REACHED: Final[int] = -1
+
+
+class EncounterProfile(BaseModel):
+    """Enemy pressure and play policy for simulated games."""
+
+    enemy_attacks_per_turn: int = Field(default=1, ge=0, description="Enemy attacks per turn")
+    wounds_per_attack: int = Field(
+        default=2, ge=0, description="Wounds dealt by an attack before defence successes"
+    )
+    stress_per_turn: int = Field(default=0, ge=0, description="Stress taken each enemy phase")
+    rest_wound_threshold: int = Field(
+        default=3, ge=1, description="Rest instead of attacking at this many wounds"
+    )
+    target_successes: int = Field(
+        default=1, ge=0, description="Successes each roll aims for (guides rerolls)"
+    )
+    condition_probability: float = Field(
+        default=DEFAULT_CONDITION_PROBABILITY,
+        ge=0.0,
+        le=1.0,
+        description="Probability each conditional power effect is active on a roll",
+    )
+    max_turns: int = Field(default=DEFAULT_MAX_TURNS, ge=1, description="Turns per episode")
+
+
+class GameState:
+    """Per-episode track state of a batch of games.
+
+    Attributes:
+        insanity: Current insanity slot
+        wounds: Damage taken
+        stress: Current stress
+        successes: Attack successes rolled so far
+        end_turn: Turn the episode ended on (0 = still running)
+        cause: Episode end cause (CAUSE_* constants)
+        level_up_turns: (episodes, red swirls) turn each red swirl was reached
+    """
+
+    __slots__ = (
+        "insanity",
+        "wounds",
+        "stress",
+        "successes",
+        "end_turn",
+        "cause",
+        "level_up_turns",
+    )
+
+    def __init__(self, episodes: int, red_swirls: int, insanity: int, wounds: int, stress: int):
+        """Initialize every episode at the given track positions."""
+        self.insanity = np.full(episodes, insanity, dtype=np.int16)
+        self.wounds = np.full(episodes, wounds, dtype=np.int16)
+        self.stress = np.full(episodes, stress, dtype=np.int16)
+        self.successes = np.zeros(episodes, dtype=np.int32)
+        self.end_turn = np.zeros(episodes, dtype=np.int16)
+        self.cause = np.full(episodes, CAUSE_SURVIVED, dtype=np.int8)
+        self.level_up_turns = np.full((episodes, red_swirls), NOT_REACHED, dtype=np.int16)
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Mask of episodes still running."""
+        return self.end_turn == 0
+
+
+class GameSimulationResult:
+    """Outcome of a batch of simulated games for one build.
+
+    Attributes:
+        turns_survived: Full turns completed per episode (max_turns if it survived)
+        cause: Episode end cause per episode (CAUSE_* constants)
+        level_up_turns: (episodes, red swirls) turn each red swirl was reached
+            (NOT_REACHED if never)
+        successes: Attack successes per episode
+        max_turns: Turn limit of the episodes
+    """
+
+    __slots__ = ("turns_survived", "cause", "level_up_turns", "successes", "max_turns")
+
+    def __init__(self, state: GameState, max_turns: int):
+        """Summarize a finished game state."""
+        ended = state.end_turn > 0
+        self.turns_survived = np.where(ended, state.end_turn - 1, max_turns).astype(np.int16)
+        self.cause = state.cause
+        self.level_up_turns = state.level_up_turns
+        self.successes = state.successes
+        self.max_turns = max_turns
+
+    @property
+    def episodes(self) -> int:
+        """Number of simulated episodes."""
+        return int(self.turns_survived.size)
+
+    @property
+    def mean_survival(self) -> float:
+        """Mean full turns survived."""
+        return float(self.turns_survived.mean())
+
+    @property
+    def survival_rate(self) -> float:
+        """Fraction of episodes alive after max_turns."""
+        return float(np.mean(self.cause == CAUSE_SURVIVED))
+
+    def cause_rate(self, cause: int) -> float:
+        """Fraction of episodes that ended with the given cause."""
+        return float(np.mean(self.cause == cause))
+
+    def survival_curve(self) -> np.ndarray:
+        """Fraction of episodes alive after each turn (index 0 = start of game)."""
+        counts = np.bincount(self.turns_survived, minlength=self.max_turns + 1)
+        return 1.0 - np.concatenate(([0], np.cumsum(counts[:-1]))) / self.episodes
+
+    @property
+    def level_up_rate(self) -> np.ndarray:
+        """Fraction of episodes that reached each red swirl."""
+        return (self.level_up_turns != NOT_REACHED).mean(axis=0)
+
+    @property
+    def mean_level_up_turns(self) -> np.ndarray:
+        """Mean turn each red swirl was reached, over episodes reaching it (NaN if none)."""
+        reached = self.level_up_turns != NOT_REACHED
+        totals = np.where(reached, self.level_up_turns, 0).sum(axis=0)
+        counts = reached.sum(axis=0)
+        return np.divide(
+            totals, counts, out=np.full(counts.shape, np.nan), where=counts > 0
+        ).astype(float)
+
+    @property
+    def mean_successes_per_turn(self) -> float:
+        """Attack successes per turn played, over all episodes."""
+        turns = np.where(self.cause == CAUSE_SURVIVED, self.max_turns, self.turns_survived + 1)
+        return float(self.successes.sum() / turns.sum())
+
+
+class GameSimulator:
+    """Batched simulator of investigator turns.
+
+    Args:
+        mechanics: Game rules (tracks, turn structure); default GameMechanics()
+        seed: Seed or SeedSequence for reproducible runs (None = fresh entropy)
+    """
+
+    def __init__(
+        self,
+        mechanics: Optional[GameMechanics] = None,
+        seed: Union[int, np.random.SeedSequence, None] = None,
+    ):
+        """Initialize rules, dice simulator and insanity lookup tables."""
+        self.mechanics = mechanics or GameMechanics()
+        self.dice = DiceSimulator(seed)
+
+        track = self.mechanics.default_insanity_track
+        slots = np.arange(track.death_threshold + 1)
+        swirls = np.asarray(track.red_swirl_slots)
+        # Per insanity slot: highest slot one roll may reach, green dice bonus, swirl number
+        self.roll_limit = np.array(
+            [
+                swirls[swirls > slot].min() if (swirls > slot).any() else track.death_threshold
+                for slot in slots
+            ],
+            dtype=np.int16,
+        )
+        grants = np.isin(np.arange(1, len(swirls) + 1), track.green_dice_red_swirls)
+        self.green_bonus = np.array(
+            [int((grants & (swirls <= slot)).sum()) for slot in slots], dtype=np.int16
+        )
+        self.swirl_number = np.zeros(slots.size, dtype=np.int16)
+        self.swirl_number[swirls] = np.arange(1, len(swirls) + 1)
+
+    def simulate(
+        self,
+        build: "CharacterBuild",
+        episodes: int = DEFAULT_EPISODES,
+        profile: Optional[EncounterProfile] = None,
+    ) -> GameSimulationResult:
+        """Play a batch of games with one build.
+
+        Episodes start from the build's current track positions.
+
+        Args:
+            build: Character build to play
+            episodes: Number of independent games
+            profile: Encounter and policy (default EncounterProfile())
+
+        Returns:
+            GameSimulationResult with survival and level-up timing per episode
+        """
+        if episodes <= 0:
+            raise ValueError(f"Episodes must be positive: {episodes}")
+        profile = profile or EncounterProfile()
+        mechanics = self.mechanics
+        combination = build.power_combination
+        rules = rules_from_combination(
+            combination, profile.target_successes, profile.condition_probability
+        )
+        wounds_healed, stress_healed = combination.total_healing
+
+        state = GameState(
+            episodes,
+            len(mechanics.default_insanity_track.red_swirl_slots),
+            insanity=build.insanity_track.current_insanity,
+            wounds=build.health_track.damage_taken,
+            stress=build.stress_track.current_stress,
+        )
+        turn_structure = mechanics.turn_structure
+        healing_points = turn_structure.rest_action.healing_points
+        max_stress = mechanics.default_stress_track.max_stress
+
+        for turn in range(1, profile.max_turns + 1):
+            for _ in range(turn_structure.actions_per_turn):
+                alive = state.alive
+                resting = alive & (state.wounds >= profile.rest_wound_threshold)
+                self._rest(state, resting, healing_points)
+                attacking = np.flatnonzero(alive & ~resting)
+                successes = self._roll(state, attacking, combination.base_black_dice, rules, turn)
+                state.successes[attacking] += successes
+
+            for _ in range(profile.enemy_attacks_per_turn):
+                defending = np.flatnonzero(state.alive)
+                blocked = self._roll(state, defending, combination.base_black_dice, rules, turn)
+                state.wounds[defending] += np.maximum(
+                    profile.wounds_per_attack - blocked, 0
+                ).astype(np.int16)
+                self._check_deaths(state, defending, turn)
+
+            alive = state.alive
+            state.stress[alive] = np.minimum(
+                state.stress[alive] + profile.stress_per_turn, max_stress
+            )
+            state.wounds[alive] = np.maximum(state.wounds[alive] - wounds_healed, 0)
+            state.stress[alive] = np.maximum(state.stress[alive] - stress_healed, 0)
+            if not alive.any():
+                break
+
+        return GameSimulationResult(state, profile.max_turns)
+
+    def _rest(self, state: GameState, resting: np.ndarray, healing_points: int) -> None:
+        """Spend rest healing points on wounds first, then stress."""
+        if not resting.any():
+            return
+        wounds = state.wounds[resting]
+        healed = np.minimum(wounds, healing_points)
+        state.wounds[resting] = wounds - healed
+        state.stress[resting] = np.maximum(state.stress[resting] - (healing_points - healed), 0)
+
+    def _roll(
+        self,
+        state: GameState,
+        episodes: np.ndarray,
+        black_dice: int,
+        rules: Sequence[SimulationRule],
+        turn: int,
+    ) -> np.ndarray:
+        """Roll once for each given episode and apply the roll's tentacles.
+
+        Episodes are grouped by their red swirl green dice bonus, so each group
+        is one vectorized batch.
+
+        Returns:
+            Successes per rolled episode (in the order of ``episodes``)
+        """
+        successes = np.zeros(episodes.size, dtype=np.int16)
+        if episodes.size == 0:
+            return successes
+        tables = self.dice.tables
+        green = self.green_bonus[state.insanity[episodes]]
+        for bonus in np.unique(green):
+            group = np.flatnonzero(green == bonus)
+            batch = self.dice.roll_batch(black_dice, int(bonus), group.size, rules)
+            successes[group] = tables.successes[batch.faces].sum(axis=1) + batch.bonus_successes
+            tentacles = tables.tentacles[batch.faces].sum(axis=1, dtype=np.int16)
+
+            rolled = episodes[group]
+            before = state.insanity[rolled]
+            after = np.minimum(before + tentacles, self.roll_limit[before])
+            state.insanity[rolled] = after
+
+            # Each roll stops at the next red swirl, so at most one is reached per roll
+            reached = (after != before) & (self.swirl_number[after] > 0)
+            # and insanity never decreases, so each swirl is recorded once
+            state.level_up_turns[rolled[reached], self.swirl_number[after[reached]] - 1] = turn
+        self._check_deaths(state, episodes, turn)
+        return successes
+
+    def _check_deaths(self, state: GameState, episodes: np.ndarray, turn: int) -> None:
+        """End episodes whose wounds or insanity reached a death threshold."""
+        mechanics = self.mechanics
+        running = episodes[state.end_turn[episodes] == 0]
+        madness = state.insanity[running] >= mechanics.default_insanity_track.death_threshold
+        wounds = state.wounds[running] >= mechanics.default_health_track.death_threshold
+        dead = running[madness | wounds]
+        state.end_turn[dead] = turn
+        state.cause[running[wounds]] = CAUSE_WOUNDS
+        state.cause[running[madness & ~wounds]] = CAUSE_MADNESS
+
+
+# Convenience functions
+def simulate_build(
+    build: "CharacterBuild",
+    episodes: int = DEFAULT_EPISODES,
+    profile: Optional[EncounterProfile] = None,
+    seed: Union[int, np.random.SeedSequence, None] = None,
+) -> GameSimulationResult:
+    """Play a batch of games with one build.
+
+    Args:
+        build: Character build to play
+        episodes: Number of independent games
+        profile: Encounter and policy (default EncounterProfile())
+        seed: Seed for reproducible runs
+
+    Returns:
+        GameSimulationResult for the build
+    """
+    return GameSimulator(seed=seed).simulate(build, episodes, profile)
+
+
+def rank_builds_by_survival(
+    builds: Sequence["CharacterBuild"],
+    episodes: int = DEFAULT_EPISODES,
+    profile: Optional[EncounterProfile] = None,
+    seed: Union[int, np.random.SeedSequence, None] = None,
+) -> List[Tuple["CharacterBuild", GameSimulationResult]]:
+    """Rank builds by mean turns survived in simulated games.
+
+    Each build gets its own random stream spawned from ``seed``, so a build's
+    result doesn't depend on the other builds in the list.
+
+    Args:
+        builds: Builds to compare
+        episodes: Games per build
+        profile: Encounter and policy shared by all builds
+        seed: Root seed for reproducible rankings
+
+    Returns:
+        (build, result) pairs, longest mean survival first
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    results = [
+        (build, GameSimulator(seed=child).simulate(build, episodes, profile))
+        for build, child in zip(builds, root.spawn(len(builds)))
+    ]
+    return sorted(results, key=lambda item: item[1].mean_survival, reverse=True)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Incremental recomputation of pool statistics when power data changes.
+
+A row of the batch statistics table (character, special, common 1, common 2
+level) only reads two entries of ``common_powers.json``: the first common power
+at the common 1 level and the second at the common 2 level. The dependency
+graph records, for every (power name, level) entry, the rows that read it.
+
+The statistics store persists the table together with a fingerprint of every
+power level entry it was computed from. On refresh the current power data is
+fingerprinted, the changed entries are looked up in the graph, and only the
+characters owning affected rows are recomputed; everything else is reused. A
+tweak to one power level touches 16 rows per character that has the power.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Final, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from scripts.models.build_statistics import (
+    COMBINATIONS_PER_CHARACTER,
+    LEVEL_GRID,
+    BuildStatisticsTable,
+    compute_pool_statistics,
+)
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
+    from scripts.models.character_pool import CharacterPool
+
+# Bump when the store layout changes
+STATISTICS_STORE_VERSION: Final[int] = 3
+DEFAULT_STORE_DIR: Final[Path] = Path(__file__).parent.parent.parent / ".generated" / "stats"
+STORE_FILENAME: Final[str] = f"build_statistics_v{STATISTICS_STORE_VERSION}.npz"
+
+# (common power name, level)
+PowerLevelKey = Tuple[str, int]
+
+
+def power_level_fingerprints(power_data: Dict[str, "CommonPower"]) -> Dict[PowerLevelKey, str]:
+    """Hash every power level entry.
+
+    Args:
+        power_data: Dictionary mapping power names to CommonPower objects
+
+    Returns:
+        Dictionary mapping (power name, level) to a digest of that level's data
+    """
+    fingerprints = {}
+    for power_name, power in power_data.items():
+        for level_data in power.levels:
+            payload = json.dumps(level_data.model_dump(mode="json"), sort_keys=True)
+            fingerprints[(power_name, level_data.level)] = hashlib.sha256(
+                payload.encode("utf-8")
+            ).hexdigest()
+    return fingerprints
+
+
+def changed_power_levels(
+    old: Dict[PowerLevelKey, str], new: Dict[PowerLevelKey, str]
+) -> Set[PowerLevelKey]:
+    """Get power level entries that were added, removed or edited."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def pool_signature(pool: "CharacterPool") -> List[List[object]]:
+    """Per-character inputs other than power data that the table depends on."""
+    return [
+        [
+            build.character_name,
+            build.common_power_1_name,
+            build.common_power_2_name,
+            build.insanity_track.green_dice_bonus,
+        ]
+        for build in pool.characters
+    ]
+
+
+class StatisticsDependencyGraph:
+    """Which table rows read which power level entries.
+
+    Args:
+        pool: Character pool the table rows belong to
+    """
+
+    def __init__(self, pool: "CharacterPool"):
+        """Record the rows depending on each (power name, level) entry."""
+        rows: Dict[PowerLevelKey, List[np.ndarray]] = {}
+        offsets = np.arange(COMBINATIONS_PER_CHARACTER)
+        for character, build in enumerate(pool.characters):
+            base = character * COMBINATIONS_PER_CHARACTER
+            names = (build.common_power_1_name, build.common_power_2_name)
+            for slot, power_name in enumerate(names):
+                if power_name is None:
+                    continue
+                levels = LEVEL_GRID[:, slot + 1]
+                for level in np.unique(levels):
+                    key = (power_name, int(level))
+                    rows.setdefault(key, []).append(base + offsets[levels == level])
+        self.rows: Dict[PowerLevelKey, np.ndarray] = {
+            key: np.unique(np.concatenate(parts)) for key, parts in rows.items()
+        }
+
+    def dependents(self, keys: Iterable[PowerLevelKey]) -> np.ndarray:
+        """Get the sorted row indices depending on any of the given entries."""
+        parts = [self.rows[key] for key in keys if key in self.rows]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(parts))
+
+
+class StatisticsStore:
+    """Persisted statistics table with the power fingerprints it was computed from.
+
+    Args:
+        path: Store file (``.npz``)
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE_DIR / STORE_FILENAME):
+        """Initialize store location."""
+        self.path = path
+
+    def save(
+        self,
+        table: BuildStatisticsTable,
+        fingerprints: Dict[PowerLevelKey, str],
+        signature: List[List[object]],
+    ) -> Path:
+        """Atomically write the table and its inputs."""
+        metadata = {
+            "version": STATISTICS_STORE_VERSION,
+            "character_names": table.character_names,
+            "signature": signature,
+            "fingerprints": [
+                [name, level, digest] for (name, level), digest in fingerprints.items()
+            ],
+        }
+        payload: Dict[str, Any] = {
+            "metadata": np.array(json.dumps(metadata)),
+            "character_index": table.character_index,
+            "levels": table.levels,
+        }
+        payload.update({f"column_{name}": values for name, values in table.columns.items()})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **payload)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return self.path
+
+    def load(
+        self,
+    ) -> Optional[Tuple[BuildStatisticsTable, Dict[PowerLevelKey, str], List[List[object]]]]:
+        """Read the store.
+
+        Returns:
+            (table, fingerprints, pool signature), or None if missing, stale or unreadable
+        """
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                metadata = json.loads(str(data["metadata"]))
+                if metadata.get("version") != STATISTICS_STORE_VERSION:
+                    return None
+                columns = {
+                    key[len("column_") :]: data[key]
+                    for key in data.files
+                    if key.startswith("column_")
+                }
+                table = BuildStatisticsTable(
+                    character_names=list(metadata["character_names"]),
+                    character_index=data["character_index"],
+                    levels=data["levels"],
+                    columns=columns,
+                )
+        except Exception:
+            return None
+        fingerprints = {(name, level): digest for name, level, digest in metadata["fingerprints"]}
+        return table, fingerprints, metadata["signature"]
+
+
+class IncrementalStatistics:
+    """Keep a pool's statistics table up to date with power data edits.
+
+    Args:
+        pool: Character pool
+        store: Persisted store (None = keep in memory only)
+    """
+
+    def __init__(self, pool: "CharacterPool", store: Optional[StatisticsStore] = None):
+        """Initialize the dependency graph for the pool."""
+        self.pool = pool
+        self.store = store
+        self.graph = StatisticsDependencyGraph(pool)
+        self.table: Optional[BuildStatisticsTable] = None
+        self.fingerprints: Dict[PowerLevelKey, str] = {}
+        self.last_recomputed = np.empty(0, dtype=np.intp)
+
+    def refresh(
+        self, power_data: Optional[Dict[str, "CommonPower"]] = None
+    ) -> BuildStatisticsTable:
+        """Bring the table up to date, recomputing only rows whose power data changed.
+
+        Args:
+            power_data: Dictionary mapping power names to CommonPower objects
+                (default: loaded from the pool's data directory)
+
+        Returns:
+            Up-to-date BuildStatisticsTable
+        """
+        if power_data is None:
+            power_data = self.pool.power_data()
+        fingerprints = power_level_fingerprints(power_data)
+        signature = pool_signature(self.pool)
+
+        if self.table is None and self.store is not None:
+            stored = self.store.load()
+            if stored is not None and stored[2] == signature:
+                self.table, self.fingerprints = stored[0], stored[1]
+
+        if self.table is None:
+            self.table = compute_pool_statistics(self.pool, power_data)
+            self.last_recomputed = np.arange(len(self.table))
+        else:
+            changed = changed_power_levels(self.fingerprints, fingerprints)
+            self.last_recomputed = self.graph.dependents(changed)
+            if self.last_recomputed.size == 0 and fingerprints == self.fingerprints:
+                return self.table
+            self._recompute_rows(self.last_recomputed, power_data)
+
+        self.fingerprints = fingerprints
+        if self.store is not None:
+            self.store.save(self.table, fingerprints, signature)
+        return self.table
+
+    def _recompute_rows(self, rows: np.ndarray, power_data: Dict[str, "CommonPower"]) -> None:
+        """Recompute the given rows in place from the affected characters only."""
+        if rows.size == 0:
+            return
+        from scripts.models.character_pool import CharacterPool
+
+        assert self.table is not None
+        characters = np.unique(rows // COMBINATIONS_PER_CHARACTER)
+        builds = [self.pool.characters[int(c)] for c in characters]
+        used = {
+            name
+            for build in builds
+            for name in (build.common_power_1_name, build.common_power_2_name)
+        }
+        partial = compute_pool_statistics(
+            CharacterPool(characters=builds, data_dir=self.pool.data_dir),
+            {name: power for name, power in power_data.items() if name in used},
+        )
+
+        # Row r of the full table is row (position of its character) * 64 + r % 64 here
+        position = np.searchsorted(characters, rows // COMBINATIONS_PER_CHARACTER)
+        source = position * COMBINATIONS_PER_CHARACTER + rows % COMBINATIONS_PER_CHARACTER
+        for name, values in self.table.columns.items():
+            if not values.flags.writeable:
+                values = self.table.columns[name] = values.copy()
+            values[rows] = partial.columns[name][source]
+
+
+# Convenience functions
+def refresh_pool_statistics(
+    pool: "CharacterPool",
+    power_data: Optional[Dict[str, "CommonPower"]] = None,
+    store_path: Path = DEFAULT_STORE_DIR / STORE_FILENAME,
+) -> BuildStatisticsTable:
+    """Update a pool's persisted statistics table, recomputing only changed rows.
+
+    Args:
+        pool: Character pool
+        power_data: Dictionary mapping power names to CommonPower objects
+            (default: loaded from the pool's data directory)
+        store_path: Store file
+
+    Returns:
+        Up-to-date BuildStatisticsTable
+    """
+    return IncrementalStatistics(pool, StatisticsStore(store_path)).refresh(power_data)
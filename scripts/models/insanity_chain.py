@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Absorbing Markov chain model of insanity track progression.
+
+Each roll moves the insanity marker forward by the number of tentacles rolled,
+stopping at the next red swirl (``InsanityTrack.take_tentacles_in_roll``). The
+chain has one state per slot (1-21); slot 21 (death) is absorbing. Transition
+rows come from the exact tentacle distribution of the dice pool at that slot,
+which grows as red swirls unlock green dice.
+
+The track only moves forward, so the transient block is upper triangular and
+the fundamental matrix is a cheap triangular solve; distributions over time are
+obtained by propagating a state vector rather than forming matrix powers.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Final, Optional
+
+import numpy as np
+
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.game_mechanics import DiceFaceSymbol, InsanityTrack
+
+if TYPE_CHECKING:
+    from scripts.models.character_build import CharacterBuild
+
+DEFAULT_HORIZON: Final[int] = 200
+START_SLOT: Final[int] = 1
+
+
+class InsanityMarkovChain:
+    """Transition matrix over insanity slots with absorption at death.
+
+    Args:
+        tentacle_pmf_for_slot: Function returning P(tentacles = k) per roll at a slot
+        track: Track layout (red swirls, death threshold); defaults to the standard track
+        stop_at_red_swirl: Whether a roll's tentacles stop at the next red swirl
+    """
+
+    def __init__(
+        self,
+        tentacle_pmf_for_slot: Callable[[int], np.ndarray],
+        track: Optional[InsanityTrack] = None,
+        stop_at_red_swirl: bool = True,
+    ):
+        """Build the transition matrix."""
+        self.track = track or InsanityTrack()
+        self.stop_at_red_swirl = stop_at_red_swirl
+        self.death_slot = self.track.death_threshold
+        self.slots = list(range(START_SLOT, self.death_slot + 1))
+        self.transition = self._build_transition(tentacle_pmf_for_slot)
+        self._fundamental: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_pool(
+        cls,
+        black_dice: int = 3,
+        green_dice: int = 0,
+        track: Optional[InsanityTrack] = None,
+        stop_at_red_swirl: bool = True,
+    ) -> "InsanityMarkovChain":
+        """Build a chain for a dice pool that gains green dice at red swirls.
+
+        Args:
+            black_dice: Black dice rolled at every slot
+            green_dice: Green dice before any red swirl bonus
+            track: Track layout (defaults to the standard track)
+            stop_at_red_swirl: Whether a roll's tentacles stop at the next red swirl
+
+        Returns:
+            InsanityMarkovChain for the pool
+        """
+        layout = track or InsanityTrack()
+        cache: Dict[int, np.ndarray] = {}
+
+        def tentacle_pmf(slot: int) -> np.ndarray:
+            green = (
+                green_dice + layout.model_copy(update={"current_insanity": slot}).green_dice_bonus
+            )
+            if green not in cache:
+                cache[green] = get_roll_distribution(black_dice, green).marginal(
+                    DiceFaceSymbol.TENTACLE
+                )
+            return cache[green]
+
+        return cls(tentacle_pmf, layout, stop_at_red_swirl)
+
+    @classmethod
+    def from_build(
+        cls, build: "CharacterBuild", stop_at_red_swirl: bool = True
+    ) -> "InsanityMarkovChain":
+        """Build a chain for a character build's dice pool.
+
+        Args:
+            build: Character build (its current red swirl bonus is removed from the base pool)
+            stop_at_red_swirl: Whether a roll's tentacles stop at the next red swirl
+
+        Returns:
+            InsanityMarkovChain for the build
+        """
+        combination = build.power_combination
+        base_green = combination.total_green_dice - build.insanity_track.green_dice_bonus
+        return cls.from_pool(
+            combination.total_black_dice,
+            max(0, base_green),
+            build.insanity_track,
+            stop_at_red_swirl,
+        )
+
+    def _next_slot(self, slot: int, tentacles: int) -> int:
+        """Slot reached from ``slot`` after rolling ``tentacles`` tentacles."""
+        target = min(slot + tentacles, self.death_slot)
+        if self.stop_at_red_swirl and tentacles > 0:
+            for swirl in self.track.red_swirl_slots:
+                if slot < swirl <= target:
+                    return swirl
+        return target
+
+    def _build_transition(self, tentacle_pmf_for_slot: Callable[[int], np.ndarray]) -> np.ndarray:
+        """Assemble the row-stochastic transition matrix."""
+        size = len(self.slots)
+        transition = np.zeros((size, size))
+        for slot in self.slots:
+            row = self.index(slot)
+            if slot >= self.death_slot:
+                transition[row, row] = 1.0
+                continue
+            for tentacles, probability in enumerate(tentacle_pmf_for_slot(slot)):
+                if probability > 0:
+                    transition[row, self.index(self._next_slot(slot, tentacles))] += probability
+        return transition
+
+    def index(self, slot: int) -> int:
+        """State index of an insanity slot."""
+        if not START_SLOT <= slot <= self.death_slot:
+            raise ValueError(f"Insanity slot out of range: {slot}")
+        return slot - START_SLOT
+
+    @property
+    def transient(self) -> np.ndarray:
+        """Transition block among living slots (Q)."""
+        last = self.index(self.death_slot)
+        return self.transition[:last, :last]
+
+    @property
+    def fundamental(self) -> np.ndarray:
+        """Fundamental matrix N = (I - Q)^-1 (expected visits between living slots)."""
+        if self._fundamental is None:
+            q = self.transient
+            self._fundamental = np.linalg.solve(np.eye(q.shape[0]) - q, np.eye(q.shape[0]))
+        return self._fundamental
+
+    def expected_rolls_to_death(self, start_slot: int = START_SLOT) -> float:
+        """Expected number of rolls until the marker reaches death.
+
+        Args:
+            start_slot: Current insanity slot
+
+        Returns:
+            Expected rolls (inf if death is unreachable)
+        """
+        if start_slot >= self.death_slot:
+            return 0.0
+        if np.any(np.isclose(np.diag(self.transient), 1.0)):
+            # Some slot can never be left (no tentacles possible)
+            return float("inf")
+        return float(self.fundamental[self.index(start_slot)].sum())
+
+    def hitting_probabilities(self, start_slot: int = START_SLOT) -> Dict[int, float]:
+        """Probability of ever landing on each slot.
+
+        Args:
+            start_slot: Current insanity slot
+
+        Returns:
+            Dictionary mapping slot to the probability the marker stops on it
+        """
+        if np.any(np.isclose(np.diag(self.transient), 1.0)):
+            raise ValueError("Hitting probabilities need every living slot to be escapable")
+        n = self.fundamental
+        start = self.index(start_slot)
+        probabilities = {
+            slot: float(n[start, self.index(slot)] / n[self.index(slot), self.index(slot)])
+            for slot in self.slots[:-1]
+            if slot >= start_slot
+        }
+        probabilities[self.death_slot] = 1.0
+        return probabilities
+
+    def state_distributions(
+        self, horizon: int = DEFAULT_HORIZON, start_slot: int = START_SLOT
+    ) -> np.ndarray:
+        """Distribution over slots after each roll.
+
+        Args:
+            horizon: Number of rolls
+            start_slot: Current insanity slot
+
+        Returns:
+            Array of shape (horizon + 1, slots); row n is the distribution after n rolls
+        """
+        distributions = np.zeros((horizon + 1, len(self.slots)))
+        distributions[0, self.index(start_slot)] = 1.0
+        for step in range(horizon):
+            distributions[step + 1] = distributions[step] @ self.transition
+        return distributions
+
+    def survival_curve(
+        self, horizon: int = DEFAULT_HORIZON, start_slot: int = START_SLOT
+    ) -> np.ndarray:
+        """P(still alive after n rolls) for n = 0..horizon."""
+        distributions = self.state_distributions(horizon, start_slot)
+        return 1.0 - distributions[:, self.index(self.death_slot)]
+
+    def arrival_time_distribution(
+        self, slot: int, horizon: int = DEFAULT_HORIZON, start_slot: int = START_SLOT
+    ) -> np.ndarray:
+        """Distribution of the roll on which the marker first reaches ``slot`` or beyond.
+
+        Args:
+            slot: Target slot (e.g. a red swirl)
+            horizon: Number of rolls
+            start_slot: Current insanity slot
+
+        Returns:
+            Array of length horizon + 1; entry n is P(first arrival on roll n).
+            Mass missing from the total arrived after the horizon.
+        """
+        reached = np.array([s >= slot for s in self.slots])
+        cumulative = self.state_distributions(horizon, start_slot)[:, reached].sum(axis=1)
+        # The track never moves backwards, so "at or beyond" is monotone in n
+        return np.diff(cumulative, prepend=0.0)
+
+    def red_swirl_arrival_times(
+        self, horizon: int = DEFAULT_HORIZON, start_slot: int = START_SLOT
+    ) -> Dict[int, np.ndarray]:
+        """Arrival time distribution for each red swirl not yet reached.
+
+        Returns:
+            Dictionary mapping red swirl number (1-6) to its arrival distribution
+        """
+        distributions = self.state_distributions(horizon, start_slot)
+        arrivals: Dict[int, np.ndarray] = {}
+        for number, swirl in enumerate(self.track.red_swirl_slots, start=1):
+            if swirl <= start_slot:
+                continue
+            reached = np.array([s >= swirl for s in self.slots])
+            arrivals[number] = np.diff(distributions[:, reached].sum(axis=1), prepend=0.0)
+        return arrivals
+
+    def expected_red_swirl_arrivals(self, start_slot: int = START_SLOT) -> Dict[int, float]:
+        """Expected rolls until each remaining red swirl is reached.
+
+        Returns:
+            Dictionary mapping red swirl number (1-6) to expected rolls
+        """
+        q = self.transient
+        expected: Dict[int, float] = {}
+        for number, swirl in enumerate(self.track.red_swirl_slots, start=1):
+            if swirl <= start_slot:
+                continue
+            # Slots below the swirl form their own transient block
+            below = self.index(swirl)
+            visits = np.linalg.solve(np.eye(below) - q[:below, :below], np.ones(below))
+            expected[number] = float(visits[self.index(start_slot)])
+        return expected
+
+
+def expected_rolls_between(tentacle_pmf: np.ndarray, start_slot: int, end_slot: int) -> float:
+    """Expected rolls to move the marker from ``start_slot`` to ``end_slot`` or beyond.
+
+    With the stop-at-red-swirl rule and ``end_slot`` the next red swirl (or
+    death), this is the expected time spent between two consecutive swirls.
+
+    Args:
+        tentacle_pmf: P(tentacles = k) per roll
+        start_slot: Current insanity slot
+        end_slot: Slot to reach
+
+    Returns:
+        Expected rolls (inf if no tentacle can be rolled)
+    """
+    pmf = np.asarray(tentacle_pmf, dtype=float)
+    stay = pmf[0] if pmf.size else 1.0
+    if stay >= 1.0:
+        return float("inf") if end_slot > start_slot else 0.0
+
+    # remaining[d] = expected rolls with d slots left to go, filled from d = 1 upwards
+    distance = max(0, end_slot - start_slot)
+    remaining = np.zeros(distance + 1)
+    for d in range(1, distance + 1):
+        moves = min(d - 1, pmf.size - 1)
+        onward = float(np.dot(pmf[1 : moves + 1], remaining[d - 1 : d - moves - 1 : -1]))
+        remaining[d] = (1.0 + onward) / (1.0 - stay)
+    return float(remaining[distance])
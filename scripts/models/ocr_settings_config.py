@@ -35,8 +35,15 @@ class OCRSettingsConfig(BaseSettings):
 
     ocr_tesseract_default_psm_mode: int = Field(default=3, ge=0, le=13)
     ocr_tesseract_default_oem_mode: int = Field(default=3, ge=0, le=3)
+    ocr_tesseract_persistent_engine: bool = Field(default=True)
+    ocr_tesseract_library: str = Field(default="")
     ocr_preprocessing_enhance_contrast: bool = Field(default=True)
     ocr_preprocessing_denoise_strength: int = Field(default=10, ge=0, le=100)
+    ocr_preprocessing_cache_max_mb: int = Field(default=256, ge=0)
+    ocr_result_cache_enabled: bool = Field(default=True)
+    ocr_result_cache_max_mb: int = Field(default=512, ge=0)
+    ocr_cascade_enabled: bool = Field(default=True)
+    ocr_cascade_min_confidence: float = Field(default=75.0, ge=0, le=100)
 
     @classmethod
     def load_from_file(cls, file_path: Optional[Path] = None) -> "OCRSettingsConfig":
@@ -71,12 +78,21 @@ class OCRSettingsConfig(BaseSettings):
             ocr = data.get("ocr", {})
             tesseract = ocr.get("tesseract", {})
             preprocessing = ocr.get("preprocessing", {})
+            result_cache = ocr.get("result_cache", {})
+            cascade = ocr.get("cascade", {})
 
             return cls(
                 ocr_tesseract_default_psm_mode=tesseract.get("default_psm_mode", 3),
                 ocr_tesseract_default_oem_mode=tesseract.get("default_oem_mode", 3),
+                ocr_tesseract_persistent_engine=tesseract.get("persistent_engine", True),
+                ocr_tesseract_library=tesseract.get("library", ""),
                 ocr_preprocessing_enhance_contrast=preprocessing.get("enhance_contrast", True),
                 ocr_preprocessing_denoise_strength=preprocessing.get("denoise_strength", 10),
+                ocr_preprocessing_cache_max_mb=preprocessing.get("cache_max_mb", 256),
+                ocr_result_cache_enabled=result_cache.get("enabled", True),
+                ocr_result_cache_max_mb=result_cache.get("max_mb", 512),
+                ocr_cascade_enabled=cascade.get("enabled", True),
+                ocr_cascade_min_confidence=cascade.get("min_confidence", 75.0),
             )
         except Exception as e:
             print(
@@ -6,11 +6,15 @@ Models for analyzing character play strategies and recommending approaches.
 """
 
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from pydantic import BaseModel, Field, computed_field
 
 from scripts.models.character_build import CharacterBuild, CharacterStatistics
+from scripts.models.upgrade_optimizer import UpgradeObjective, UpgradePathOptimizer
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
 
 
 class Playstyle(str, Enum):
@@ -61,7 +65,22 @@ class PlayStrategy(BaseModel):
 
 
 class PlayStrategyAnalyzer:
-    """Analyzes character builds and generates play strategies."""
+    """Analyzes character builds and generates play strategies.
+
+    Args:
+        power_data: Dictionary mapping power names to CommonPower objects, used to
+            plan upgrade paths (no path is generated without it)
+        upgrade_objective: What the upgrade path maximizes
+    """
+
+    def __init__(
+        self,
+        power_data: Optional[Dict[str, "CommonPower"]] = None,
+        upgrade_objective: UpgradeObjective = UpgradeObjective.EXPECTED_SUCCESSES,
+    ):
+        """Initialize analyzer with power data for upgrade planning."""
+        self.power_data = power_data
+        self.upgrade_optimizer = UpgradePathOptimizer(upgrade_objective)
 
     def analyze(
         self, build: CharacterBuild, stats: Optional[CharacterStatistics] = None
@@ -171,8 +190,7 @@ class PlayStrategyAnalyzer:
     def _generate_upgrade_path(
         self, build: CharacterBuild, upgrades: List[UpgradeRecommendation]
     ) -> List[str]:
-        """Generate recommended upgrade path."""
-        # TODO: Implement upgrade path generation
-        # For now, return empty list
-
-        return []
+        """Generate recommended upgrade path (power upgraded at each remaining red swirl)."""
+        if self.power_data is None:
+            return []
+        return self.upgrade_optimizer.optimize_build(build, self.power_data).steps
@@ -5,17 +5,21 @@ Power Combination Models
 Models for combining multiple powers and calculating their combined effects.
 """
 
+import re
 from typing import Dict, List, Optional, Set
 
 from pydantic import BaseModel, Field, computed_field
 
 from scripts.models.character import CommonPowerLevelData
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_fast_stats import get_fast_combined_stats
 from scripts.models.dice_probabilities import (
     CombinedRollStats,
     DiceProbabilityCalculator,
     SingleDieStats,
 )
-from scripts.models.game_mechanics import BonusDice, DiceType, StandardDice
+from scripts.models.game_mechanics import BonusDice, DiceFaceSymbol, DiceType, StandardDice
+from scripts.models.reroll_solver import get_reroll_solver
 
 
 class PowerEffect(BaseModel):
@@ -26,8 +30,9 @@ class PowerEffect(BaseModel):
     green_dice_added: int = Field(default=0, ge=0, description="Green dice added")
     black_dice_added: int = Field(default=0, ge=0, description="Black dice added")
     elder_signs_as_successes: Optional[int] = Field(
-        default=None,
-        description="Number of elder signs that count as successes (None = any number)",
+        default=0,
+        ge=0,
+        description="Number of elder signs that count as successes (0 = none, None = any number)",
     )
     rerolls_added: int = Field(default=0, ge=0, description="Rerolls added")
     wounds_healed: int = Field(default=0, ge=0, description="Wounds healed")
@@ -91,13 +96,13 @@ class PowerCombination(BaseModel):
     @computed_field  # type: ignore[prop-decorator]
     @property
     def elder_sign_conversion(self) -> Optional[int]:
-        """Get elder sign to success conversion (None = any number)."""
-        # Find the highest level conversion (later levels replace earlier)
-        conversion = None
-        for effect in sorted(self.effects, key=lambda e: e.level, reverse=True):
-            if effect.elder_signs_as_successes is not None:
-                conversion = effect.elder_signs_as_successes
-                break
+        """Get elder sign to success conversion (0 = none, None = any number)."""
+        # Conversions don't stack; the most generous one applies
+        conversion: Optional[int] = 0
+        for effect in self.effects:
+            if effect.elder_signs_as_successes is None:
+                return None
+            conversion = max(conversion, effect.elder_signs_as_successes)
         return conversion
 
     @computed_field  # type: ignore[prop-decorator]
@@ -147,13 +152,21 @@ class PowerCombinationCalculator:
     def calculate_with_elder_conversion(self, combination: PowerCombination) -> Dict[str, float]:
         """Calculate statistics including elder sign to success conversion.
 
+        Conversion is applied to the exact outcome distribution (see
+        ``convert_elder_signs``), so a cap of N converts ``min(elder signs, N)``
+        on each roll and success probabilities include it, not just the mean.
+
         Args:
             combination: Power combination to analyze
 
         Returns:
-            Dictionary with enhanced statistics
+            Dictionary with enhanced statistics; ``elder_signs_converted`` (expected
+            elder signs counted as successes per roll) is present only when the
+            combination converts elder signs
         """
-        base_stats = self.calculate_combined_stats(combination)
+        black_count = combination.total_black_dice
+        green_count = combination.total_green_dice
+        base_stats = get_fast_combined_stats(black_count, green_count)
         conversion = combination.elder_sign_conversion
 
         stats = {
@@ -164,19 +177,44 @@ class PowerCombinationCalculator:
             "prob_at_least_1_tentacle": base_stats.prob_at_least_1_tentacle,
         }
 
-        # Apply elder sign conversion
-        if conversion is not None:
-            # Each elder sign counts as success
-            # Expected successes increase by expected elder signs
-            stats["expected_successes"] += base_stats.expected_elder_signs
-            stats["elder_signs_converted"] = base_stats.expected_elder_signs
-        elif conversion is None and base_stats.expected_elder_signs > 0:
-            # "Any number" conversion - all elder signs become successes
-            stats["expected_successes"] += base_stats.expected_elder_signs
-            stats["elder_signs_converted"] = base_stats.expected_elder_signs
+        if conversion != 0:
+            plain = get_roll_distribution(black_count, green_count)
+            converted = get_roll_distribution(black_count, green_count, conversion)
+            expected = converted.expected(DiceFaceSymbol.SUCCESS)
+            stats["expected_successes"] = expected
+            stats["prob_at_least_1_success"] = converted.prob_at_least(DiceFaceSymbol.SUCCESS, 1)
+            stats["elder_signs_converted"] = expected - plain.expected(DiceFaceSymbol.SUCCESS)
 
         return stats
 
+    def calculate_with_rerolls(
+        self, combination: PowerCombination, target_successes: int
+    ) -> Dict[str, float]:
+        """Calculate statistics when the combination's rerolls are used optimally.
+
+        Args:
+            combination: Power combination to analyze
+            target_successes: Successes needed for the roll
+
+        Returns:
+            Dictionary with reroll-aware statistics
+        """
+        solver = get_reroll_solver(target_successes, combination.elder_sign_conversion)
+        solution = solver.solve_combination(combination)
+        distribution = solution.distribution
+
+        return {
+            "target_successes": float(target_successes),
+            "rerolls": float(solution.rerolls),
+            "prob_at_least_target": solution.success_probability,
+            "prob_at_least_target_without_rerolls": solution.base_success_probability,
+            "reroll_gain": solution.reroll_gain,
+            "expected_rerolls_used": solution.expected_rerolls_used,
+            "expected_successes": distribution.expected(DiceFaceSymbol.SUCCESS),
+            "expected_tentacles": distribution.expected(DiceFaceSymbol.TENTACLE),
+            "expected_elder_signs": distribution.expected(DiceFaceSymbol.ELDER_SIGN),
+        }
+
     def compare_combinations(
         self, base: PowerCombination, enhanced: PowerCombination
     ) -> Dict[str, float]:
@@ -224,17 +262,12 @@ def create_power_effect_from_level(
     stats = level_data.statistics
 
     # Determine elder sign conversion from effect description
-    elder_conversion = None
-    if "count" in level_data.effect.lower() and "elder sign" in level_data.effect.lower():
-        if "any number" in level_data.effect.lower():
-            elder_conversion = None  # Any number
-        else:
-            # Try to extract number (e.g., "count 1 elder sign")
-            import re
-
-            match = re.search(r"count\s+(\d+)\s+elder", level_data.effect.lower())
-            if match:
-                elder_conversion = int(match.group(1))
+    elder_conversion: Optional[int] = 0
+    effect_text = level_data.effect.lower()
+    if "count" in effect_text and "elder sign" in effect_text:
+        # "Counts 1 elder sign(s) as success(es)"; "any" or an unparsed count = any number
+        match = re.search(r"counts?\s+(\d+)\s+elder", effect_text)
+        elder_conversion = int(match.group(1)) if match and "any" not in effect_text else None
 
     return PowerEffect(
         power_name=power_name,
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Optimal reroll policy solver for Cthulhu: Death May Die dice rolls.
+
+Each reroll lets an investigator reroll one die after seeing the whole roll
+(rulebook p.11), and the result is seen before deciding on the next reroll.
+The solver runs a dynamic program over roll states (how many dice of each
+colour show each face) and rerolls remaining, choosing at every step whether to
+stop or which face to reroll. The objective is lexicographic: maximize
+P(successes >= target), then minimize expected tentacles.
+
+State values are memoized on the solver, so evaluating many pools against the
+same objective (e.g. every character in a pool) shares all sub-results.
+"""
+
+import itertools
+import math
+from typing import TYPE_CHECKING, Dict, Final, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from scripts.models.dice_distribution import RollDistribution, get_distribution_calculator
+from scripts.models.game_mechanics import DiceType
+
+if TYPE_CHECKING:
+    from scripts.models.power_combination import PowerCombination
+
+# Scores closer than this are treated as ties (ties keep the cheaper action)
+SCORE_TOLERANCE: Final[float] = 1e-12
+
+Face = Tuple[int, int, int]  # (successes, tentacles, elder signs) shown by one die
+FaceCounts = Tuple[int, ...]  # Number of dice showing each face class
+RerollAction = Tuple[DiceType, Face]  # Reroll one die of this colour showing this face
+StateKey = Tuple[FaceCounts, FaceCounts, int]
+
+
+def _face_classes(kernel: np.ndarray) -> Tuple[Tuple[Face, ...], Tuple[float, ...]]:
+    """Split a die's generating polynomial into its distinct faces and probabilities."""
+    faces: Tuple[Face, ...] = tuple(
+        (int(s), int(t), int(e)) for s, t, e in zip(*np.nonzero(kernel))
+    )
+    return faces, tuple(float(kernel[face]) for face in faces)
+
+
+def _compositions(total: int, parts: int) -> Iterable[Tuple[int, ...]]:
+    """Yield every way to split ``total`` dice across ``parts`` face classes."""
+    for dividers in itertools.combinations(range(total + parts - 1), parts - 1):
+        bounds = (-1, *dividers, total + parts - 1)
+        yield tuple(bounds[i + 1] - bounds[i] - 1 for i in range(parts))
+
+
+def _multinomial(counts: FaceCounts, probs: Tuple[float, ...]) -> float:
+    """Probability of rolling exactly ``counts`` of each face class."""
+    result = float(math.factorial(sum(counts)))
+    for count, prob in zip(counts, probs):
+        result *= prob**count / math.factorial(count)
+    return result
+
+
+class RerollSolution:
+    """Optimal reroll policy result for one dice pool.
+
+    Holds the exact final outcome distribution (before any elder sign
+    conversion) when the optimal policy is followed, plus summary values.
+    """
+
+    __slots__ = (
+        "black_dice",
+        "green_dice",
+        "rerolls",
+        "target_successes",
+        "success_probability",
+        "base_success_probability",
+        "expected_rerolls_used",
+        "distribution",
+    )
+
+    def __init__(
+        self,
+        black_dice: int,
+        green_dice: int,
+        rerolls: int,
+        target_successes: int,
+        success_probability: float,
+        base_success_probability: float,
+        expected_rerolls_used: float,
+        distribution: RollDistribution,
+    ):
+        """Initialize from solver results."""
+        self.black_dice = black_dice
+        self.green_dice = green_dice
+        self.rerolls = rerolls
+        self.target_successes = target_successes
+        self.success_probability = success_probability
+        self.base_success_probability = base_success_probability
+        self.expected_rerolls_used = expected_rerolls_used
+        self.distribution = distribution
+
+    @property
+    def reroll_gain(self) -> float:
+        """Increase in P(reaching target) from using rerolls optimally."""
+        return self.success_probability - self.base_success_probability
+
+    def get_summary(self) -> str:
+        """Get a human-readable summary of the solution."""
+        return (
+            f"{self.black_dice} black + {self.green_dice} green, {self.rerolls} rerolls: "
+            f"P(>= {self.target_successes} successes) {self.base_success_probability:.1%} -> "
+            f"{self.success_probability:.1%} "
+            f"({self.expected_rerolls_used:.2f} rerolls used on average)"
+        )
+
+
+class RerollPolicySolver:
+    """Dynamic-programming solver for the optimal reroll policy.
+
+    Args:
+        target_successes: Successes needed for the roll to count as a success
+        elder_signs_as_successes: Elder signs that may count as successes when
+            scoring (0 = none, None = any number)
+    """
+
+    def __init__(self, target_successes: int, elder_signs_as_successes: Optional[int] = 0):
+        """Initialize solver for a fixed objective."""
+        if target_successes < 0:
+            raise ValueError(f"Target successes must be non-negative: {target_successes}")
+        self.target_successes = target_successes
+        self.elder_signs_as_successes = elder_signs_as_successes
+
+        calculator = get_distribution_calculator()
+        self.black_faces, self.black_probs = _face_classes(calculator.black_kernel)
+        self.green_faces, self.green_probs = _face_classes(calculator.green_kernel)
+
+        # (state, rerolls) -> (score, expected tentacles, expected rerolls used, action)
+        self._memo: Dict[StateKey, Tuple[float, float, float, Optional[RerollAction]]] = {}
+        self._solutions: Dict[Tuple[int, int, int], RerollSolution] = {}
+        self._black_outcomes: Dict[FaceCounts, Face] = {}
+        self._green_outcomes: Dict[FaceCounts, Face] = {}
+        self._transition_cache: Dict[
+            Tuple[DiceType, FaceCounts, int], List[Tuple[float, FaceCounts]]
+        ] = {}
+
+    @property
+    def states_evaluated(self) -> int:
+        """Number of memoized (state, rerolls) entries."""
+        return len(self._memo)
+
+    def _color_tables(
+        self, dice_type: DiceType
+    ) -> Tuple[Tuple[Face, ...], Tuple[float, ...], Dict[FaceCounts, Face]]:
+        """Get the faces, probabilities and outcome cache for one dice colour."""
+        if dice_type == DiceType.BLACK:
+            return self.black_faces, self.black_probs, self._black_outcomes
+        return self.green_faces, self.green_probs, self._green_outcomes
+
+    def _color_outcome(self, dice_type: DiceType, counts: FaceCounts) -> Face:
+        """Total (successes, tentacles, elder signs) shown by the dice of one colour."""
+        faces, _, cache = self._color_tables(dice_type)
+        outcome = cache.get(counts)
+        if outcome is None:
+            outcome = (
+                sum(c * f[0] for c, f in zip(counts, faces)),
+                sum(c * f[1] for c, f in zip(counts, faces)),
+                sum(c * f[2] for c, f in zip(counts, faces)),
+            )
+            cache[counts] = outcome
+        return outcome
+
+    def _outcome(self, black: FaceCounts, green: FaceCounts) -> Face:
+        """Total (successes, tentacles, elder signs) shown by a roll state."""
+        b = self._color_outcome(DiceType.BLACK, black)
+        g = self._color_outcome(DiceType.GREEN, green)
+        return b[0] + g[0], b[1] + g[1], b[2] + g[2]
+
+    def _meets_target(self, outcome: Face) -> float:
+        """Score a final outcome: 1.0 if it reaches the target, else 0.0."""
+        successes, _, elder_signs = outcome
+        if self.elder_signs_as_successes is None:
+            successes += elder_signs
+        else:
+            successes += min(elder_signs, self.elder_signs_as_successes)
+        return 1.0 if successes >= self.target_successes else 0.0
+
+    def _transitions(
+        self, dice_type: DiceType, counts: FaceCounts, face_index: int
+    ) -> List[Tuple[float, FaceCounts]]:
+        """Face counts of one colour after rerolling one die, with probabilities."""
+        key = (dice_type, counts, face_index)
+        cached = self._transition_cache.get(key)
+        if cached is None:
+            _, probs, _ = self._color_tables(dice_type)
+            removed = list(counts)
+            removed[face_index] -= 1
+            cached = []
+            for i, prob in enumerate(probs):
+                new_counts = list(removed)
+                new_counts[i] += 1
+                cached.append((prob, tuple(new_counts)))
+            self._transition_cache[key] = cached
+        return cached
+
+    def _successors(
+        self, black: FaceCounts, green: FaceCounts, action: RerollAction
+    ) -> List[Tuple[float, FaceCounts, FaceCounts]]:
+        """States reachable by rerolling one die, with their probabilities."""
+        dice_type, face = action
+        faces, _, _ = self._color_tables(dice_type)
+        if dice_type == DiceType.BLACK:
+            return [
+                (prob, counts, green)
+                for prob, counts in self._transitions(dice_type, black, faces.index(face))
+            ]
+        return [
+            (prob, black, counts)
+            for prob, counts in self._transitions(dice_type, green, faces.index(face))
+        ]
+
+    def _actions(self, black: FaceCounts, green: FaceCounts) -> List[RerollAction]:
+        """Distinct reroll choices available in a state."""
+        actions: List[RerollAction] = []
+        for count, face in zip(black, self.black_faces):
+            if count:
+                actions.append((DiceType.BLACK, face))
+        for count, face in zip(green, self.green_faces):
+            if count:
+                actions.append((DiceType.GREEN, face))
+        return actions
+
+    def evaluate(
+        self, black: FaceCounts, green: FaceCounts, rerolls: int
+    ) -> Tuple[float, float, float, Optional[RerollAction]]:
+        """Evaluate a roll state under the optimal policy.
+
+        Args:
+            black: Number of black dice showing each black face class
+            green: Number of green dice showing each green face class
+            rerolls: Rerolls remaining
+
+        Returns:
+            Tuple of (P(reach target), expected tentacles, expected rerolls used,
+            best action or None to stop)
+        """
+        key = (black, green, rerolls)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        outcome = self._outcome(black, green)
+        best: Tuple[float, float, float, Optional[RerollAction]] = (
+            self._meets_target(outcome),
+            float(outcome[1]),
+            0.0,
+            None,
+        )
+
+        # Bound: target met with no tentacles cannot be improved, so stop
+        if rerolls > 0 and not (best[0] == 1.0 and outcome[1] == 0):
+            for action in self._actions(black, green):
+                score = tentacles = used = 0.0
+                for prob, next_black, next_green in self._successors(black, green, action):
+                    s, t, u, _ = self.evaluate(next_black, next_green, rerolls - 1)
+                    score += prob * s
+                    tentacles += prob * t
+                    used += prob * u
+                candidate = (score, tentacles, used + 1.0, action)
+                if candidate[0] > best[0] + SCORE_TOLERANCE or (
+                    abs(candidate[0] - best[0]) <= SCORE_TOLERANCE
+                    and candidate[1] < best[1] - SCORE_TOLERANCE
+                ):
+                    best = candidate
+
+        self._memo[key] = best
+        return best
+
+    def best_action(
+        self, black: FaceCounts, green: FaceCounts, rerolls: int
+    ) -> Optional[RerollAction]:
+        """Get the optimal next reroll for a roll state.
+
+        Args:
+            black: Number of black dice showing each black face class
+            green: Number of green dice showing each green face class
+            rerolls: Rerolls remaining
+
+        Returns:
+            (dice type, face) of the die to reroll, or None to stop
+        """
+        return self.evaluate(black, green, rerolls)[3]
+
+    def solve(self, black_dice: int, green_dice: int, rerolls: int) -> RerollSolution:
+        """Solve a dice pool and build its exact outcome distribution.
+
+        Args:
+            black_dice: Number of black dice
+            green_dice: Number of green dice
+            rerolls: Rerolls available for this roll
+
+        Returns:
+            RerollSolution for the pool (cached per pool)
+        """
+        if black_dice < 0 or green_dice < 0 or rerolls < 0:
+            raise ValueError(f"Counts must be non-negative: {black_dice}, {green_dice}, {rerolls}")
+
+        pool_key = (black_dice, green_dice, rerolls)
+        cached = self._solutions.get(pool_key)
+        if cached is not None:
+            return cached
+
+        calculator = get_distribution_calculator()
+        shape = calculator.joint_pmf(black_dice, green_dice).shape
+        pmf = np.zeros(shape, dtype=np.float64)
+
+        # Forward pass: push probability mass from the initial roll along the policy
+        layer: Dict[Tuple[FaceCounts, FaceCounts], float] = {}
+        for black in _compositions(black_dice, len(self.black_faces)):
+            p_black = _multinomial(black, self.black_probs)
+            for green in _compositions(green_dice, len(self.green_faces)):
+                layer[(black, green)] = p_black * _multinomial(green, self.green_probs)
+
+        success_probability = 0.0
+        base_success_probability = 0.0
+        expected_used = 0.0
+        for remaining in range(rerolls, -1, -1):
+            next_layer: Dict[Tuple[FaceCounts, FaceCounts], float] = {}
+            for (black, green), mass in layer.items():
+                score, _, used, action = self.evaluate(black, green, remaining)
+                if remaining == rerolls:
+                    success_probability += mass * score
+                    expected_used += mass * used
+                    base_success_probability += mass * self._meets_target(
+                        self._outcome(black, green)
+                    )
+                if action is None:
+                    pmf[self._outcome(black, green)] += mass
+                    continue
+                for prob, next_black, next_green in self._successors(black, green, action):
+                    state = (next_black, next_green)
+                    next_layer[state] = next_layer.get(state, 0.0) + mass * prob
+            layer = next_layer
+
+        solution = RerollSolution(
+            black_dice=black_dice,
+            green_dice=green_dice,
+            rerolls=rerolls,
+            target_successes=self.target_successes,
+            success_probability=success_probability,
+            base_success_probability=base_success_probability,
+            expected_rerolls_used=expected_used,
+            distribution=RollDistribution(black_dice, green_dice, pmf),
+        )
+        self._solutions[pool_key] = solution
+        return solution
+
+    def solve_batch(
+        self, pools: Iterable[Tuple[int, int, int]]
+    ) -> Dict[Tuple[int, int, int], RerollSolution]:
+        """Solve many (black, green, rerolls) pools, sharing memoized states.
+
+        Args:
+            pools: Iterable of (black dice, green dice, rerolls)
+
+        Returns:
+            Dictionary mapping each pool to its solution
+        """
+        return {pool: self.solve(*pool) for pool in pools}
+
+    def solve_combination(self, combination: "PowerCombination") -> RerollSolution:
+        """Solve the dice pool and rerolls of a power combination.
+
+        Args:
+            combination: Power combination to analyze
+
+        Returns:
+            RerollSolution for the combination's dice and total rerolls
+        """
+        return self.solve(
+            combination.total_black_dice, combination.total_green_dice, combination.total_rerolls
+        )
+
+
+_solvers: Dict[Tuple[int, Optional[int]], RerollPolicySolver] = {}
+
+
+def get_reroll_solver(
+    target_successes: int, elder_signs_as_successes: Optional[int] = 0
+) -> RerollPolicySolver:
+    """Get a shared solver for an objective, so memoized states are reused.
+
+    Args:
+        target_successes: Successes needed
+        elder_signs_as_successes: Elder signs that may count as successes (None = any)
+
+    Returns:
+        Shared RerollPolicySolver instance
+    """
+    key = (target_successes, elder_signs_as_successes)
+    solver = _solvers.get(key)
+    if solver is None:
+        solver = RerollPolicySolver(target_successes, elder_signs_as_successes)
+        _solvers[key] = solver
+    return solver
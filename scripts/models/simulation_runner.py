@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Multi-process sharded runner for Monte Carlo dice simulations.
+
+Each simulation task is split into fixed-size shards that run in a
+``ProcessPoolExecutor``. Random streams come from ``SeedSequence.spawn``: the
+root seed spawns one child per task and each task spawns one child per shard,
+so results depend only on the seed and the task list, never on the number of
+workers or the order shards finish in. Workers return aggregated outcome
+histograms only, so memory stays flat however many rolls are simulated.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from scripts.models.character_build import CharacterBuild
+from scripts.models.dice_simulation import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONDITION_PROBABILITY,
+    DiceSimulator,
+    SimulationResult,
+    SimulationRule,
+    rules_from_combination,
+)
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
+    from scripts.models.character_pool import CharacterPool
+
+DEFAULT_SHARD_ROLLS: Final[int] = 2_000_000
+DEFAULT_TASK_ROLLS: Final[int] = 10_000_000
+POWER_LEVELS: Final[Tuple[int, ...]] = (1, 2, 3, 4)
+
+# (special power level, common power 1 level, common power 2 level)
+LevelCombination = Tuple[int, int, int]
+
+
+class SimulationTask(BaseModel):
+    """One dice pool (plus power rules) to simulate."""
+
+    label: str = Field(..., description="Unique key for the task's result")
+    black_dice: int = Field(default=3, ge=0, description="Base black dice")
+    green_dice: int = Field(default=0, ge=0, description="Base green dice")
+    rules: List[SimulationRule] = Field(default_factory=list, description="Power rules to apply")
+    rolls: int = Field(default=DEFAULT_TASK_ROLLS, gt=0, description="Total rolls to simulate")
+
+
+def _run_shard(
+    task: SimulationTask, seed: np.random.SeedSequence, rolls: int, batch_size: int
+) -> Tuple[str, np.ndarray, int, int]:
+    """Simulate one shard of a task in a worker process.
+
+    Args:
+        task: Task to simulate
+        seed: Independent seed for this shard
+        rolls: Rolls in this shard
+        batch_size: Rolls per vectorized batch
+
+    Returns:
+        (task label, outcome histogram, total black dice, total green dice)
+    """
+    result = DiceSimulator(seed=seed).simulate(
+        task.black_dice, task.green_dice, task.rules, max_rolls=rolls, batch_size=batch_size
+    )
+    return task.label, result.histogram, result.black_dice, result.green_dice
+
+
+def merge_histograms(histograms: Iterable[np.ndarray]) -> np.ndarray:
+    """Sum outcome histograms of possibly different (trimmed) shapes."""
+    histograms = list(histograms)
+    shape = tuple(max(h.shape[axis] for h in histograms) for axis in range(3))
+    merged = np.zeros(shape, dtype=np.int64)
+    for histogram in histograms:
+        s, t, e = histogram.shape
+        merged[:s, :t, :e] += histogram
+    return merged
+
+
+class ShardedSimulationRunner:
+    """Run many simulation tasks across processes with deterministic seeding.
+
+    Args:
+        seed: Root seed (None = fresh entropy)
+        workers: Worker processes (None = CPU count, 1 = run in this process)
+        shard_rolls: Rolls per shard
+        batch_size: Rolls per vectorized batch inside a shard
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        shard_rolls: int = DEFAULT_SHARD_ROLLS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize runner settings."""
+        if shard_rolls <= 0:
+            raise ValueError(f"Shard rolls must be positive: {shard_rolls}")
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_rolls = shard_rolls
+        self.batch_size = batch_size
+
+    def shards(
+        self, tasks: Sequence[SimulationTask]
+    ) -> List[Tuple[SimulationTask, np.random.SeedSequence, int]]:
+        """Split tasks into (task, seed, rolls) shards.
+
+        Shard seeds depend only on the root seed, the task's position and the
+        shard index.
+        """
+        root = np.random.SeedSequence(self.seed)
+        shards = []
+        for task, task_seed in zip(tasks, root.spawn(len(tasks))):
+            count = -(-task.rolls // self.shard_rolls)
+            for index, shard_seed in enumerate(task_seed.spawn(count)):
+                rolls = min(self.shard_rolls, task.rolls - index * self.shard_rolls)
+                shards.append((task, shard_seed, rolls))
+        return shards
+
+    def run(self, tasks: Sequence[SimulationTask]) -> Dict[str, SimulationResult]:
+        """Simulate all tasks and aggregate each task's shards.
+
+        Args:
+            tasks: Tasks to simulate (labels must be unique)
+
+        Returns:
+            Dictionary mapping task label to its aggregated SimulationResult
+        """
+        labels = [task.label for task in tasks]
+        if len(set(labels)) != len(labels):
+            raise ValueError("Simulation task labels must be unique")
+
+        shards = self.shards(tasks)
+        columns = list(zip(*shards)) if shards else [(), (), ()]
+        batch_sizes = [self.batch_size] * len(shards)
+        if self.workers == 1:
+            outputs = list(map(_run_shard, *columns, batch_sizes))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                chunksize = max(1, len(shards) // (self.workers * 4))
+                outputs = list(executor.map(_run_shard, *columns, batch_sizes, chunksize=chunksize))
+
+        grouped: Dict[str, List[np.ndarray]] = {}
+        dice: Dict[str, Tuple[int, int]] = {}
+        for label, histogram, black, green in outputs:
+            grouped.setdefault(label, []).append(histogram)
+            dice[label] = (black, green)
+
+        return {
+            label: SimulationResult(
+                black_dice=dice[label][0],
+                green_dice=dice[label][1],
+                histogram=merge_histograms(grouped[label]),
+                seed=self.seed,
+                converged=False,
+            )
+            for label in labels
+        }
+
+
+def build_label(build: CharacterBuild) -> str:
+    """Result key for a character build at its current levels."""
+    return (
+        f"{build.character_name}"
+        f"/{build.special_power_level}"
+        f"/{build.common_power_1_level}"
+        f"/{build.common_power_2_level}"
+    )
+
+
+def tasks_from_pool(
+    pool: "CharacterPool",
+    level_combinations: Optional[Iterable[LevelCombination]] = None,
+    power_data: Optional[Dict[str, "CommonPower"]] = None,
+    rolls: int = DEFAULT_TASK_ROLLS,
+    target_successes: int = 1,
+    condition_probability: float = DEFAULT_CONDITION_PROBABILITY,
+) -> List[SimulationTask]:
+    """Build simulation tasks for every character and level combination in a pool.
+
+    Args:
+        pool: Character pool to sweep
+        level_combinations: (special, common 1, common 2) levels (default: all 4x4x4)
+        power_data: Dictionary mapping power names to CommonPower objects
+            (default: loaded from the pool's data directory)
+        rolls: Rolls per task
+        target_successes: Success target for reroll rules
+        condition_probability: Probability each conditional effect is active
+
+    Returns:
+        One task per (character, level combination)
+    """
+    combinations = list(
+        level_combinations
+        if level_combinations is not None
+        else itertools.product(POWER_LEVELS, repeat=3)
+    )
+    if power_data is None:
+        power_data = pool.power_data()
+
+    tasks: List[SimulationTask] = []
+    for character in pool.characters:
+        if character.character_data is None:
+            continue
+        for special, common_1, common_2 in combinations:
+            build = CharacterBuild.from_character_data(
+                character.character_data,
+                special_power_level=special,
+                common_power_1_level=common_1,
+                common_power_2_level=common_2,
+                power_data=power_data,
+            )
+            combination = build.power_combination
+            tasks.append(
+                SimulationTask(
+                    label=build_label(build),
+                    black_dice=combination.base_black_dice,
+                    green_dice=combination.base_green_dice,
+                    rules=rules_from_combination(
+                        combination, target_successes, condition_probability
+                    ),
+                    rolls=rolls,
+                )
+            )
+    return tasks
+
+
+def simulate_pool(
+    pool: "CharacterPool",
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    **kwargs,
+) -> Dict[str, SimulationResult]:
+    """Simulate every character and level combination in a pool.
+
+    Args:
+        pool: Character pool to sweep
+        seed: Root seed for reproducible sweeps
+        workers: Worker processes (None = CPU count)
+        **kwargs: Passed through to tasks_from_pool()
+
+    Returns:
+        Dictionary mapping "name/special/common1/common2" to SimulationResult
+    """
+    return ShardedSimulationRunner(seed=seed, workers=workers).run(tasks_from_pool(pool, **kwargs))
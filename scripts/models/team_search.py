@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Team composition search across a character pool.
+
+Each character is reduced to a feature vector taken from the batch statistics
+table (expected successes and tentacles, healing, rerolls, green dice). A
+team's score is an additive part (successes minus tentacle risk, summed over
+members) plus complementarity terms: team totals of healing, rerolls and green
+dice count only up to a cap, so a team gains more from covering a missing role
+than from stacking one it already has.
+
+Because the capped terms are submodular, a member's standalone gain bounds its
+gain in any larger team. The branch-and-bound search uses that to prune partial
+teams whose best possible completion can't enter the current top K, and splits
+the search by first member across processes.
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Final, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from scripts.models.build_statistics import compute_pool_statistics
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
+    from scripts.models.character_pool import CharacterPool
+
+DEFAULT_TEAM_SIZE: Final[int] = 4
+DEFAULT_TOP_K: Final[int] = 10
+
+# Slack for rounding in the upper bound, so exact ties are never pruned
+BOUND_TOLERANCE: Final[float] = 1e-9
+
+# Statistics columns used as capped team features, in vector order
+COMPLEMENTARY_FEATURES: Final[Tuple[str, ...]] = (
+    "wounds_healed_per_turn",
+    "stress_healed_per_turn",
+    "rerolls_per_roll",
+    "total_green_dice",
+)
+
+# (score, team member indices) as found by one search worker
+TeamCandidate = Tuple[float, Tuple[int, ...]]
+
+
+class TeamWeights(BaseModel):
+    """Weights and caps for team scoring."""
+
+    success_weight: float = Field(default=1.0, ge=0, description="Weight per expected success")
+    tentacle_weight: float = Field(default=0.5, ge=0, description="Penalty per expected tentacle")
+    wound_healing_weight: float = Field(default=1.0, ge=0, description="Weight per wound healed")
+    wound_healing_cap: float = Field(default=2.0, ge=0, description="Team wound healing counted")
+    stress_healing_weight: float = Field(default=1.0, ge=0, description="Weight per stress healed")
+    stress_healing_cap: float = Field(default=2.0, ge=0, description="Team stress healing counted")
+    reroll_weight: float = Field(default=0.75, ge=0, description="Weight per reroll")
+    reroll_cap: float = Field(default=2.0, ge=0, description="Team rerolls counted")
+    green_dice_weight: float = Field(default=0.5, ge=0, description="Weight per green die")
+    green_dice_cap: float = Field(default=3.0, ge=0, description="Team green dice counted")
+
+    def complementary_weights(self) -> np.ndarray:
+        """Weights for COMPLEMENTARY_FEATURES."""
+        return np.array(
+            [
+                self.wound_healing_weight,
+                self.stress_healing_weight,
+                self.reroll_weight,
+                self.green_dice_weight,
+            ]
+        )
+
+    def complementary_caps(self) -> np.ndarray:
+        """Caps for COMPLEMENTARY_FEATURES."""
+        return np.array(
+            [
+                self.wound_healing_cap,
+                self.stress_healing_cap,
+                self.reroll_cap,
+                self.green_dice_cap,
+            ]
+        )
+
+
+class TeamResult(BaseModel):
+    """A scored team."""
+
+    members: List[str] = Field(default_factory=list, description="Character names")
+    score: float = Field(default=0.0, description="Team score")
+    breakdown: Dict[str, float] = Field(
+        default_factory=dict, description="Score contribution by component"
+    )
+
+
+class TeamFeatures:
+    """Per-character feature vectors for team scoring.
+
+    Attributes:
+        names: Character names
+        additive: (characters,) weighted successes minus tentacle risk
+        complementary: (characters, features) values of COMPLEMENTARY_FEATURES
+    """
+
+    __slots__ = ("names", "additive", "complementary")
+
+    def __init__(self, names: List[str], additive: np.ndarray, complementary: np.ndarray):
+        """Initialize from precomputed arrays."""
+        self.names = names
+        self.additive = additive
+        self.complementary = complementary
+
+    @classmethod
+    def from_pool(
+        cls,
+        pool: "CharacterPool",
+        weights: TeamWeights,
+        power_data: Optional[Dict[str, "CommonPower"]] = None,
+    ) -> "TeamFeatures":
+        """Extract features from each build's current power levels.
+
+        Args:
+            pool: Character pool
+            weights: Team scoring weights
+            power_data: Dictionary mapping power names to CommonPower objects
+                (default: loaded from the pool's data directory)
+
+        Returns:
+            TeamFeatures with one row per character
+        """
+        table = compute_pool_statistics(pool, power_data)
+        rows = [
+            table.row_index(
+                build.character_name,
+                build.special_power_level,
+                build.common_power_1_level,
+                build.common_power_2_level,
+            )
+            for build in pool.characters
+        ]
+        additive = (
+            weights.success_weight * table.column("expected_successes")[rows]
+            - weights.tentacle_weight * table.column("expected_tentacles")[rows]
+        )
+        complementary = np.column_stack(
+            [table.column(name)[rows].astype(float) for name in COMPLEMENTARY_FEATURES]
+        )
+        return cls([build.character_name for build in pool.characters], additive, complementary)
+
+
+def _team_score(
+    additive: np.ndarray,
+    complementary: np.ndarray,
+    weights: np.ndarray,
+    caps: np.ndarray,
+    members: Sequence[int],
+) -> float:
+    """Score of a team given feature arrays."""
+    members = list(members)
+    capped = np.minimum(complementary[members].sum(axis=0), caps)
+    return float(additive[members].sum() + np.dot(weights, capped))
+
+
+def _search_first_members(
+    additive: np.ndarray,
+    complementary: np.ndarray,
+    weights: np.ndarray,
+    caps: np.ndarray,
+    first_members: Sequence[int],
+    team_size: int,
+    top_k: int,
+) -> Tuple[List[TeamCandidate], int]:
+    """Branch-and-bound over teams whose lowest-index member is in ``first_members``.
+
+    Characters are expected in descending standalone value so good teams are
+    found early and the pruning threshold rises quickly. Ties are broken by the
+    team's indices (lower first), as in the final merge, so the teams kept don't
+    depend on how first members are split between workers.
+
+    Returns:
+        (top-K candidates found, partial teams pruned)
+    """
+    count = additive.size
+    # Min-heap on (score, negated team): the root is the worst team kept
+    heap: List[Tuple[float, Tuple[int, ...], Tuple[int, ...]]] = []
+    pruned = 0
+
+    def offer(score: float, team: Tuple[int, ...]) -> None:
+        entry = (score, tuple(-member for member in team), team)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def expand(team: List[int], current_add: float, current_sum: np.ndarray) -> None:
+        nonlocal pruned
+        start = team[-1] + 1
+        left = team_size - len(team)
+        if left == 0:
+            offer(_team_score(additive, complementary, weights, caps, team), tuple(team))
+            return
+        if count - start < left:
+            return
+        headroom = np.maximum(caps - current_sum, 0.0)
+        current = current_add + float(np.dot(weights, np.minimum(current_sum, caps)))
+
+        if left == 1:
+            # Score every completion at once
+            totals = np.minimum(current_sum + complementary[start:], caps)
+            scores = current_add + additive[start:] + totals @ weights
+            if len(heap) == top_k:
+                candidates = np.flatnonzero(scores >= heap[0][0])
+            else:
+                candidates = np.argsort(-scores, kind="stable")[:top_k]
+            for offset in candidates:
+                offer(float(scores[offset]), (*team, start + int(offset)))
+            return
+
+        # A member's gain in this team never exceeds its gain against the headroom
+        gains = additive[start:] + np.minimum(complementary[start:], headroom) @ weights
+        best = (
+            np.partition(gains, gains.size - left)[-left:].sum()
+            if gains.size > left
+            else gains.sum()
+        )
+        # Teams tying the worst kept score may still win the tie-break
+        if len(heap) == top_k and current + best < heap[0][0] - BOUND_TOLERANCE:
+            pruned += 1
+            return
+
+        for member in range(start, count - left + 1):
+            expand(
+                [*team, member],
+                current_add + float(additive[member]),
+                current_sum + complementary[member],
+            )
+
+    for first in first_members:
+        expand([first], float(additive[first]), complementary[first].copy())
+    return [(score, team) for score, _, team in heap], pruned
+
+
+class TeamSearch:
+    """Find the top-K teams in a pool by branch-and-bound.
+
+    Args:
+        features: Per-character feature vectors
+        weights: Team scoring weights
+        team_size: Investigators per team
+        top_k: Number of teams to return
+        workers: Worker processes (None = CPU count, 1 = run in this process)
+    """
+
+    def __init__(
+        self,
+        features: TeamFeatures,
+        weights: Optional[TeamWeights] = None,
+        team_size: int = DEFAULT_TEAM_SIZE,
+        top_k: int = DEFAULT_TOP_K,
+        workers: Optional[int] = 1,
+    ):
+        """Initialize search settings and sort characters by standalone value."""
+        if team_size < 1 or top_k < 1:
+            raise ValueError(f"Team size and top K must be positive: {team_size}, {top_k}")
+        self.features = features
+        self.weights = weights or TeamWeights()
+        self.team_size = team_size
+        self.top_k = top_k
+        self.workers = workers or os.cpu_count() or 1
+        self.pruned = 0
+
+        self._weights = self.weights.complementary_weights()
+        self._caps = self.weights.complementary_caps()
+        standalone = (
+            features.additive + np.minimum(features.complementary, self._caps) @ self._weights
+        )
+        # Stable sort keeps pool order among equal characters
+        self._order = np.argsort(-standalone, kind="stable")
+        self._additive = features.additive[self._order]
+        self._complementary = features.complementary[self._order]
+
+    def search(self) -> List[TeamResult]:
+        """Run the search.
+
+        Returns:
+            Up to top_k teams, best first
+        """
+        count = self._additive.size
+        if count < self.team_size:
+            return []
+        firsts = list(range(count - self.team_size + 1))
+
+        if self.workers == 1:
+            chunks = [firsts]
+        else:
+            # Round-robin so every chunk mixes early (expensive) and late first members
+            chunk_count = min(len(firsts), self.workers * 4)
+            chunks = [firsts[i::chunk_count] for i in range(chunk_count)]
+
+        args = [
+            (
+                self._additive,
+                self._complementary,
+                self._weights,
+                self._caps,
+                chunk,
+                self.team_size,
+                self.top_k,
+            )
+            for chunk in chunks
+        ]
+        if self.workers == 1:
+            outputs = [_search_first_members(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                outputs = list(executor.map(_search_first_members, *zip(*args)))
+
+        candidates = [candidate for heap, _ in outputs for candidate in heap]
+        self.pruned = sum(pruned for _, pruned in outputs)
+        candidates.sort(key=lambda c: (-c[0], c[1]))
+        return [self._to_result(team) for _, team in candidates[: self.top_k]]
+
+    def score(self, members: Sequence[str]) -> TeamResult:
+        """Score a specific team by character names."""
+        positions = {name: i for i, name in enumerate(self.features.names)}
+        inverse = np.empty_like(self._order)
+        inverse[self._order] = np.arange(self._order.size)
+        return self._to_result(tuple(int(inverse[positions[name]]) for name in members))
+
+    def _to_result(self, team: Tuple[int, ...]) -> TeamResult:
+        """Convert sorted-order indices into a TeamResult with a score breakdown."""
+        members = list(team)
+        totals = np.minimum(self._complementary[members].sum(axis=0), self._caps)
+        breakdown = {"individual": float(self._additive[members].sum())}
+        for name, weight, total in zip(COMPLEMENTARY_FEATURES, self._weights, totals):
+            breakdown[name] = float(weight * total)
+        return TeamResult(
+            members=[self.features.names[int(self._order[i])] for i in members],
+            score=_team_score(
+                self._additive, self._complementary, self._weights, self._caps, members
+            ),
+            breakdown=breakdown,
+        )
+
+
+def find_best_teams(
+    pool: "CharacterPool",
+    power_data: Optional[Dict[str, "CommonPower"]] = None,
+    weights: Optional[TeamWeights] = None,
+    team_size: int = DEFAULT_TEAM_SIZE,
+    top_k: int = DEFAULT_TOP_K,
+    workers: Optional[int] = None,
+) -> List[TeamResult]:
+    """Find the best teams in a character pool.
+
+    Args:
+        pool: Character pool
+        power_data: Dictionary mapping power names to CommonPower objects
+        weights: Team scoring weights
+        team_size: Investigators per team
+        top_k: Number of teams to return
+        workers: Worker processes (None = CPU count)
+
+    Returns:
+        Up to top_k teams, best first
+    """
+    weights = weights or TeamWeights()
+    features = TeamFeatures.from_pool(pool, weights, power_data)
+    return TeamSearch(features, weights, team_size, top_k, workers).search()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Upgrade path optimizer over the six red swirl level-ups.
+
+Each red swirl on the insanity track grants one level-up for the special power
+or one of the two common powers. The game is split into phases between
+swirls; a path is scored by summing, over phases, the expected rolls spent in
+that phase times the value of a roll with the levels (and red swirl green
+dice) held during it. Phase lengths come from the pool's tentacle
+distribution, so adding black dice also shortens the game.
+
+The search is a DP over (levels, swirls taken) with memoization, plus
+branch-and-bound: a child is skipped when its phase value plus the best
+possible value of every later phase can't beat the best child found so far.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Final, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from scripts.models.build_statistics import (
+    COMBINATIONS_PER_CHARACTER,
+    POWER_LEVELS,
+    BuildStatisticsTable,
+    compute_pool_statistics,
+)
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.game_mechanics import DiceFaceSymbol, InsanityTrack
+from scripts.models.insanity_chain import START_SLOT, expected_rolls_between
+
+if TYPE_CHECKING:
+    from scripts.models.character import CommonPower
+    from scripts.models.character_build import CharacterBuild
+    from scripts.models.character_pool import CharacterPool
+
+# Level tuple order: (special, common 1, common 2)
+Levels = Tuple[int, int, int]
+
+SPECIAL_POWER_INDEX: Final[int] = 0
+# Common powers are tried before the special power so equal-value upgrades favour them
+UPGRADE_ORDER: Final[Tuple[int, ...]] = (1, 2, SPECIAL_POWER_INDEX)
+DEFAULT_SPECIAL_POWER_NAME: Final[str] = "Special Power"
+
+
+class UpgradeObjective(str, Enum):
+    """What an upgrade path maximizes."""
+
+    EXPECTED_SUCCESSES = "expected_successes"  # Total expected successes over the game
+    SURVIVAL = "survival"  # Expected rolls before death by insanity
+    WEIGHTED = "weighted"  # success_weight * successes + survival_weight * rolls
+
+
+class UpgradePath(BaseModel):
+    """Optimal sequence of level-ups for one character."""
+
+    character_name: str = Field(..., description="Character name")
+    objective: UpgradeObjective = Field(..., description="Objective maximized")
+    steps: List[str] = Field(default_factory=list, description="Power upgraded at each red swirl")
+    levels: List[Levels] = Field(
+        default_factory=list, description="(special, common 1, common 2) levels after each step"
+    )
+    score: float = Field(default=0.0, description="Objective value of the path")
+
+
+def _level_row(levels: Levels) -> int:
+    """Row offset of a level combination within a character's 64 rows."""
+    special, common_1, common_2 = levels
+    return (special - 1) * POWER_LEVELS**2 + (common_1 - 1) * POWER_LEVELS + (common_2 - 1)
+
+
+class UpgradePathOptimizer:
+    """Find the best level-up order for every character in a pool.
+
+    Args:
+        objective: What to maximize
+        success_weight: Weight of expected successes (WEIGHTED objective)
+        survival_weight: Weight of expected rolls survived (WEIGHTED objective)
+        track: Insanity track layout (defaults to the standard track)
+    """
+
+    def __init__(
+        self,
+        objective: UpgradeObjective = UpgradeObjective.EXPECTED_SUCCESSES,
+        success_weight: float = 1.0,
+        survival_weight: float = 1.0,
+        track: Optional[InsanityTrack] = None,
+    ):
+        """Initialize objective weights and phase boundaries."""
+        self.objective = objective
+        if objective == UpgradeObjective.EXPECTED_SUCCESSES:
+            self.success_weight, self.survival_weight = 1.0, 0.0
+        elif objective == UpgradeObjective.SURVIVAL:
+            self.success_weight, self.survival_weight = 0.0, 1.0
+        else:
+            self.success_weight, self.survival_weight = success_weight, survival_weight
+
+        self.track = track or InsanityTrack()
+        # Phase k runs from the k-th boundary to the next; boundary 0 is the start slot
+        self.boundaries = [START_SLOT, *self.track.red_swirl_slots, self.track.death_threshold]
+        self.level_ups = len(self.track.red_swirl_slots)
+        self._duration_cache: Dict[Tuple[int, int], float] = {}
+        self.states_evaluated = 0
+        self.states_pruned = 0
+
+    def phase_duration(self, phase: int, black_dice: int) -> float:
+        """Expected rolls spent in a phase with a given number of black dice."""
+        key = (phase, black_dice)
+        if key not in self._duration_cache:
+            # Only black dice have tentacle faces
+            pmf = get_roll_distribution(black_dice, 0).marginal(DiceFaceSymbol.TENTACLE)
+            self._duration_cache[key] = expected_rolls_between(
+                pmf, self.boundaries[phase], self.boundaries[phase + 1]
+            )
+        return self._duration_cache[key]
+
+    def phase_tables(
+        self, pool: "CharacterPool", power_data: Dict[str, "CommonPower"]
+    ) -> List[BuildStatisticsTable]:
+        """Statistics tables for every phase (green dice grow at red swirls)."""
+        tables = []
+        for boundary in self.boundaries[:-1]:
+            bonus = self.track.model_copy(update={"current_insanity": boundary}).green_dice_bonus
+            tables.append(compute_pool_statistics(pool, power_data, green_dice_bonus=bonus))
+        return tables
+
+    def phase_values(self, tables: List[BuildStatisticsTable]) -> np.ndarray:
+        """Objective value of each phase for every row.
+
+        Returns:
+            Array of shape (phases, rows)
+        """
+        values = np.empty((len(tables), len(tables[0])))
+        for phase, table in enumerate(tables):
+            black = table.column("total_black_dice")
+            durations = np.array([self.phase_duration(phase, int(b)) for b in black])
+            per_roll = self.success_weight * table.column("expected_successes")
+            values[phase] = durations * (per_roll + self.survival_weight)
+        return values
+
+    def _solve_character(
+        self, values: np.ndarray, start_levels: Levels, swirls_taken: int
+    ) -> Tuple[float, List[int]]:
+        """DP with branch-and-bound for one character's (phases, 64) value block.
+
+        Returns:
+            (score of remaining phases, power index upgraded at each remaining swirl)
+        """
+        phases = values.shape[0]
+        # best_after[k] bounds the value of phases k..end from above
+        best_after = np.zeros(phases + 1)
+        for phase in range(phases - 1, -1, -1):
+            best_after[phase] = best_after[phase + 1] + values[phase].max()
+
+        memo: Dict[Tuple[Levels, int], Tuple[float, Optional[int]]] = {}
+
+        def solve(levels: Levels, taken: int) -> float:
+            key = (levels, taken)
+            if key in memo:
+                return memo[key][0]
+            self.states_evaluated += 1
+
+            children: List[Tuple[float, Optional[int], Levels]] = []
+            if taken < self.level_ups:
+                for power in UPGRADE_ORDER:
+                    if levels[power] < POWER_LEVELS:
+                        child = list(levels)
+                        child[power] += 1
+                        child_levels: Levels = (child[0], child[1], child[2])
+                        children.append(
+                            (values[taken + 1, _level_row(child_levels)], power, child_levels)
+                        )
+                if not children:
+                    # Everything is maxed: the swirl passes without a level-up
+                    children.append((values[taken + 1, _level_row(levels)], None, levels))
+
+            best_value, best_power, found = 0.0, None, False
+            # Most promising child first tightens the bound early
+            for phase_value, child_power, child_levels in sorted(children, key=lambda c: -c[0]):
+                if found and phase_value + best_after[taken + 2] <= best_value:
+                    self.states_pruned += 1
+                    continue
+                value = phase_value + solve(child_levels, taken + 1)
+                if not found or value > best_value:
+                    best_value, best_power, found = value, child_power, True
+            memo[key] = (best_value, best_power)
+            return best_value
+
+        score = values[swirls_taken, _level_row(start_levels)] + solve(start_levels, swirls_taken)
+
+        path: List[int] = []
+        levels, taken = start_levels, swirls_taken
+        while taken < self.level_ups:
+            power = memo[(levels, taken)][1]
+            if power is not None:
+                path.append(power)
+                child = list(levels)
+                child[power] += 1
+                levels = (child[0], child[1], child[2])
+            taken += 1
+        return score, path
+
+    def optimize_pool(
+        self,
+        pool: "CharacterPool",
+        power_data: Optional[Dict[str, "CommonPower"]] = None,
+    ) -> Dict[str, UpgradePath]:
+        """Find the optimal upgrade path for every character in a pool.
+
+        Each character starts from its build's current levels and red swirls
+        already reached.
+
+        Args:
+            pool: Character pool
+            power_data: Dictionary mapping power names to CommonPower objects
+                (default: loaded from the pool's data directory)
+
+        Returns:
+            Dictionary mapping character name to UpgradePath
+        """
+        if power_data is None:
+            power_data = pool.power_data()
+        values = self.phase_values(self.phase_tables(pool, power_data))
+
+        paths: Dict[str, UpgradePath] = {}
+        for index, build in enumerate(pool.characters):
+            block = values[
+                :, index * COMBINATIONS_PER_CHARACTER : (index + 1) * COMBINATIONS_PER_CHARACTER
+            ]
+            start: Levels = (
+                build.special_power_level,
+                build.common_power_1_level,
+                build.common_power_2_level,
+            )
+            taken = min(build.insanity_track.red_swirls_reached, self.level_ups)
+            score, powers = self._solve_character(block, start, taken)
+            paths[build.character_name] = self._to_path(build, start, score, powers)
+        return paths
+
+    def optimize_build(
+        self, build: "CharacterBuild", power_data: Dict[str, "CommonPower"]
+    ) -> UpgradePath:
+        """Find the optimal upgrade path for a single build."""
+        from scripts.models.character_pool import CharacterPool
+
+        pool = CharacterPool(characters=[build])
+        return self.optimize_pool(pool, power_data)[build.character_name]
+
+    def _to_path(
+        self, build: "CharacterBuild", start: Levels, score: float, powers: List[int]
+    ) -> UpgradePath:
+        """Convert power indices into an UpgradePath."""
+        special_name = DEFAULT_SPECIAL_POWER_NAME
+        if build.character_data is not None and build.character_data.special_power is not None:
+            special_name = build.character_data.special_power.name
+        names = (
+            special_name,
+            build.common_power_1_name or "Common Power 1",
+            build.common_power_2_name or "Common Power 2",
+        )
+
+        steps, levels = [], []
+        current = list(start)
+        for power in powers:
+            current[power] += 1
+            steps.append(names[power])
+            levels.append((current[0], current[1], current[2]))
+        return UpgradePath(
+            character_name=build.character_name,
+            objective=self.objective,
+            steps=steps,
+            levels=levels,
+            score=float(score),
+        )
@@ -12,7 +12,6 @@ from typing import Final, Optional
 try:
     import cv2
     import numpy as np
-    import pytesseract
 except ImportError as e:
     print(
         f"Error: Missing required dependency: {e.name}\n\n"
@@ -24,6 +23,8 @@ except ImportError as e:
     )
     raise
 
+from scripts.core.parsing.ocr_result_cache import cached_ocr, hash_file
+from scripts.core.parsing.tesseract_engine import get_tesseract_engine, tesseract_image_to_string
 from scripts.models.ocr_settings_config import get_ocr_settings
 
 # Load OCR settings from TOML config
@@ -106,17 +107,24 @@ def extract_text_from_image(
     Raises:
         ValueError: If image cannot be read or processed
     """
-    try:
+
+    def extract() -> str:
         # Preprocess image with enhanced settings
         processed_img = preprocess_image_for_ocr(
             image_path, enhance_contrast=enhance_contrast, denoise_strength=denoise_strength
         )
+        return tesseract_image_to_string(processed_img, psm=psm_mode, oem=oem_mode).strip()
 
-        # Use pytesseract to extract text
-        custom_config = f"--oem {oem_mode} --psm {psm_mode}"
-        text: str = pytesseract.image_to_string(processed_img, config=custom_config)
-
-        return text.strip()
+    try:
+        # Served from the OCR result cache when this image was read with the same settings
+        return cached_ocr(
+            hash_file(image_path),
+            None,
+            "extract_text_from_image",
+            get_tesseract_engine().version,
+            (psm_mode, oem_mode, enhance_contrast, denoise_strength),
+            extract,
+        )
     except Exception as e:
         raise ValueError(f"Error extracting text from {image_path}: {e}") from e
 
@@ -144,14 +152,28 @@ def extract_text_from_image_region(
     Returns:
         Extracted text from region
     """
-    # Read and preprocess full image
-    processed_img = preprocess_image_for_ocr(image_path)
-
-    # Extract region
-    region = processed_img[y : y + height, x : x + width]
 
-    # Extract text from region
-    custom_config = f"--oem {DEFAULT_OEM_MODE} --psm {psm_mode}"
-    text: str = pytesseract.image_to_string(region, config=custom_config)
-
-    return text.strip()
+    def extract() -> str:
+        # Read and preprocess full image
+        processed_img = preprocess_image_for_ocr(image_path)
+
+        # Extract region
+        region = processed_img[y : y + height, x : x + width]
+
+        # Extract text from region
+        return tesseract_image_to_string(region, psm=psm_mode, oem=DEFAULT_OEM_MODE).strip()
+
+    # Preprocessing reads its settings from ocr_settings.toml, so they are part of the key
+    return cached_ocr(
+        hash_file(image_path),
+        (x, y, width, height),
+        "extract_text_from_image_region",
+        get_tesseract_engine().version,
+        (
+            psm_mode,
+            DEFAULT_OEM_MODE,
+            _ocr_settings.ocr_preprocessing_enhance_contrast,
+            _ocr_settings.ocr_preprocessing_denoise_strength,
+        ),
+        extract,
+    )
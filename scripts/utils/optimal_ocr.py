@@ -1210,6 +1210,7 @@ def extract_common_powers_from_back_card(
 
     try:
         from scripts.core.parsing.layout import CardLayoutExtractor
+        from scripts.core.parsing.ocr_cascade import run_cascade
     except ImportError:
         # Fallback
         back_text = extract_back_card_with_optimal_strategy(image_path, config)
@@ -1261,36 +1262,40 @@ def extract_common_powers_from_back_card(
         strategies_to_try = [s for s in strategies_to_try if s not in seen and not seen.add(s)]
 
         # Try each region with each strategy and collect powers
-        # Strategy: For each region, try strategies in order and use the first that finds powers
+        # Strategy: For each region, run strategies as a cascade (ordered by their
+        # historical cost and hit rate) and use the first that finds powers
         # If a region finds exactly 2 powers with any strategy, use that immediately
         # Otherwise, collect one power from each region (Region 1 = first power, Region 2 = second power)
         found_powers: List[str] = []
         region_powers: List[List[str]] = []  # Powers found in each region
 
+        def find_powers(region: Tuple[int, int, int, int], power_strategy: str):
+            return lambda: _extract_common_powers_from_region(image_path, region, power_strategy)
+
         for region in regions_to_try:
-            # Try each strategy for this region until we find at least one power
+            # Stop at the first strategy that finds at least one power: matching
+            # against known power names validates the OCR, and trying more
+            # strategies only adds false positives
+            cascade = run_cascade(
+                "common_powers",
+                [
+                    (power_strategy, find_powers(region, power_strategy))
+                    for power_strategy in strategies_to_try
+                ],
+                accept=lambda powers: bool(powers),
+                score=len,
+            )
+            region_powers_found = cascade.value or []
+
+            # If this strategy found exactly 2 powers, use it immediately (perfect match)
+            if len(region_powers_found) == 2:
+                return region_powers_found[:COMMON_POWER_MAX_POWERS]
+
+            # Collect unique powers from this region
             region_powers_this_region: List[str] = []
-            for power_strategy in strategies_to_try:
-                try:
-                    region_powers_found = _extract_common_powers_from_region(
-                        image_path, region, power_strategy
-                    )
-                    # If this strategy found exactly 2 powers, use it immediately (perfect match)
-                    if len(region_powers_found) == 2:
-                        return region_powers_found[:COMMON_POWER_MAX_POWERS]
-
-                    # Collect unique powers from this region
-                    for power in region_powers_found:
-                        if power not in region_powers_this_region:
-                            region_powers_this_region.append(power)
-
-                    # If we found at least one power with this strategy, prefer it
-                    # (don't try other strategies for this region to avoid false positives)
-                    if region_powers_this_region:
-                        break
-                except Exception:
-                    # If a strategy fails, continue with next strategy
-                    continue
+            for power in region_powers_found:
+                if power not in region_powers_this_region:
+                    region_powers_this_region.append(power)
 
             # Store powers found in this region
             region_powers.append(region_powers_this_region)
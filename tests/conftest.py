@@ -3,7 +3,27 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(autouse=True)
+def isolated_ocr_result_cache(monkeypatch):
+    """Keep tests from reading or writing the persistent OCR result cache."""
+    from scripts.core.parsing import ocr_result_cache
+
+    monkeypatch.setattr(
+        ocr_result_cache, "_default_cache", ocr_result_cache.OCRResultCache(enabled=False)
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_cascade_history(monkeypatch):
+    """Keep tests from reading or writing the persistent OCR cascade history."""
+    from scripts.core.parsing import ocr_cascade
+
+    monkeypatch.setattr(ocr_cascade, "_default_history", ocr_cascade.CascadeHistory(path=None))
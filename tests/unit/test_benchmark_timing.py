@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the benchmark timing and baseline helpers.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.timing import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+
+def result(name: str, p50: float) -> BenchmarkResult:
+    """Result whose runs all take p50 seconds."""
+    return BenchmarkResult.from_runs(name, 1, [p50] * 5)
+
+
+class TestMeasure:
+    """Test measure()."""
+
+    def test_warmup_and_repeat(self):
+        """Warmup runs execute but are not reported."""
+        calls = []
+        outcome = measure("noop", lambda: calls.append(1), warmup=2, repeat=4, number=3)
+
+        assert len(calls) == (2 + 4) * 3
+        assert len(outcome.runs) == 4
+        assert outcome.number == 3
+        assert outcome.min <= outcome.p50 <= outcome.p90 <= outcome.p99
+
+    def test_calibrates_calls_per_run(self):
+        """Fast operations get many calls per run."""
+        outcome = measure("noop", lambda: None, warmup=0, repeat=2, min_run_seconds=0.001)
+
+        assert outcome.number > 1
+
+    def test_percentiles(self):
+        """Percentiles summarize the per-call run times."""
+        summary = BenchmarkResult.from_runs("x", 1, [float(i) for i in range(1, 101)])
+
+        assert summary.p50 == pytest.approx(50.5)
+        assert summary.p90 == pytest.approx(90.1)
+        assert summary.min == 1.0
+
+
+class TestBaseline:
+    """Test baseline saving and regression detection."""
+
+    def test_round_trip_keeps_other_entries(self, tmp_path):
+        """Saving merges into an existing baseline."""
+        path = tmp_path / "baseline.json"
+        save_baseline([result("a", 1.0)], path)
+        save_baseline([result("b", 2.0)], path)
+
+        saved = load_baseline(path)
+        assert saved["a"]["p50"] == 1.0
+        assert saved["b"]["p50"] == 2.0
+        assert "runs" not in saved["a"]
+
+    def test_unsupported_version(self, tmp_path):
+        """Baselines from another format version are rejected."""
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"version": 0, "benchmarks": {}}))
+
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_find_regressions(self):
+        """Only medians past the threshold are regressions."""
+        baseline = {"fast": {"p50": 1.0}, "slow": {"p50": 1.0}}
+        current = [result("fast", 1.2), result("slow", 1.3), result("new", 9.0)]
+
+        regressions = find_regressions(current, baseline, threshold=0.25)
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].ratio == pytest.approx(1.3)
+
+
+class TestCases:
+    """Test the registered benchmark cases."""
+
+    def test_expected_cases_registered(self):
+        """The model operations the suite tracks are all registered."""
+        assert {
+            "get_combined_stats",
+            "character_build_statistics",
+            "character_pool_from_seasons",
+            "play_strategy_analyze",
+        } <= set(BENCHMARKS)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for array-backed pool build statistics.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.models.build_statistics import (
+    ANY_ELDER_SIGNS,
+    COMBINATIONS_PER_CHARACTER,
+    ELDER_CONVERSION_COLUMN,
+    compute_pool_statistics,
+)
+from scripts.models.character import CharacterData, CommonPower
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+
+COMMON_POWERS_FILE = Path(__file__).parent.parent.parent / "data" / "common_powers.json"
+
+
+@pytest.fixture(scope="module")
+def power_data():
+    """Common powers from the repository data."""
+    with open(COMMON_POWERS_FILE, encoding="utf-8") as f:
+        return {entry["name"]: CommonPower.from_dict(entry) for entry in json.load(f)}
+
+
+@pytest.fixture(scope="module")
+def characters(power_data):
+    """Character data covering every pair of consecutive common powers."""
+    names = sorted(power_data)
+    return [
+        CharacterData(name=f"Tester {i}", common_powers=[names[i], names[(i + 1) % len(names)]])
+        for i in range(len(names))
+    ]
+
+
+class TestComputePoolStatistics:
+    """Test compute_pool_statistics."""
+
+    def test_matches_character_build_statistics(self, power_data, characters):
+        """Every row equals CharacterBuild.statistics for that build."""
+        pool = CharacterPool(characters=[CharacterBuild.from_character_data(c) for c in characters])
+        table = compute_pool_statistics(pool, power_data)
+
+        assert len(table) == len(characters) * COMBINATIONS_PER_CHARACTER
+        for character in characters:
+            for levels in [(1, 1, 1), (2, 4, 3), (4, 2, 1), (3, 3, 4)]:
+                build = CharacterBuild.from_character_data(
+                    character, *levels, power_data=power_data
+                )
+                row = table.row_index(character.name, *levels)
+                expected = build.statistics.model_dump()
+                actual = table.statistics(row).model_dump()
+                assert actual.keys() == expected.keys()
+                for key, value in expected.items():
+                    assert actual[key] == pytest.approx(value), (character.name, levels, key)
+
+    def test_row_layout(self, power_data, characters):
+        """Rows are ordered by character then level combination."""
+        pool = CharacterPool(
+            characters=[CharacterBuild.from_character_data(c) for c in characters[:2]]
+        )
+        table = pool.statistics_table(power_data)
+        row = table.row_index(characters[1].name.upper(), 2, 3, 4)
+
+        assert table.character_index[row] == 1
+        assert tuple(table.levels[row]) == (2, 3, 4)
+        record = table.to_records()[row]
+        assert record["character_name"] == characters[1].name
+        assert record["common_power_2_level"] == 4
+
+    def test_unknown_lookups(self, power_data, characters):
+        """Unknown characters, columns and levels raise."""
+        pool = CharacterPool(characters=[CharacterBuild.from_character_data(characters[0])])
+        table = compute_pool_statistics(pool, power_data)
+
+        with pytest.raises(KeyError):
+            table.row_index("Nobody", 1, 1, 1)
+        with pytest.raises(KeyError):
+            table.column("luck")
+        with pytest.raises(ValueError):
+            table.row_index(characters[0].name, 5, 1, 1)
+
+    def test_columnar_index(self, power_data, characters):
+        """The columnar index holds one list per statistic in table row order."""
+        pool = CharacterPool(
+            characters=[CharacterBuild.from_character_data(c) for c in characters[:3]]
+        )
+        table = compute_pool_statistics(pool, power_data)
+        index = json.loads(json.dumps(table.to_columnar(["a", "b", "c"])))
+
+        assert [entry["id"] for entry in index["characters"]] == ["a", "b", "c"]
+        assert len(index["levels"]) == index["rows_per_character"] == COMBINATIONS_PER_CHARACTER
+        row = table.row_index(characters[2].name, 4, 1, 3)
+        combination = row % COMBINATIONS_PER_CHARACTER
+        assert index["levels"][combination] == [4, 1, 3]
+        for name, values in table.columns.items():
+            assert len(index["columns"][name]) == len(table)
+            value = values[row].item()
+            if name == ELDER_CONVERSION_COLUMN and value == ANY_ELDER_SIGNS:
+                value = None
+            assert index["columns"][name][row] == pytest.approx(value, abs=1e-6)
+
+        with pytest.raises(ValueError):
+            table.to_columnar(["a"])
+
+    def test_columnar_index_any_elder_signs(self, power_data, characters):
+        """Unlimited elder sign conversion is published as null, not the sentinel."""
+        pool = CharacterPool(characters=[CharacterBuild.from_character_data(characters[0])])
+        table = compute_pool_statistics(pool, power_data)
+        table.columns[ELDER_CONVERSION_COLUMN][:2] = (ANY_ELDER_SIGNS, 1)
+
+        caps = table.to_columnar()["columns"][ELDER_CONVERSION_COLUMN]
+        assert caps[:2] == [None, 1]
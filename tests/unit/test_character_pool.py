@@ -3,9 +3,12 @@
 Unit tests for CharacterPool model.
 """
 
+import json
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
@@ -80,3 +83,92 @@ class TestCharacterPool:
         found = pool.get_character("TEST")
         assert found is not None
         assert found.character_name == "Test"
+
+    def test_power_data(self):
+        """Test power_data loads the data directory's common powers by name."""
+        pool = CharacterPool(data_dir=Path("data"))
+
+        power_data = pool.power_data()
+
+        assert "Marksman" in power_data
+        assert power_data["Marksman"].name == "Marksman"
+        assert CharacterPool(data_dir=Path("/nonexistent")).power_data() == {}
+
+
+def write_character(data_dir: Path, season: Season, name: str, powers: list) -> None:
+    """Write a minimal character.json under the season's characters/ directory."""
+    char_dir = data_dir / season.value / "characters" / name.lower()
+    char_dir.mkdir(parents=True)
+    payload = {"name": name, "common_powers": powers}
+    (char_dir / "character.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+@pytest.fixture
+def loaded_pool(tmp_path):
+    """Pool loaded from a two-season data directory."""
+    write_character(tmp_path, Season.SEASON1, "Adam", ["Marksman", "Toughness"])
+    write_character(tmp_path, Season.SEASON1, "Ahmed", ["Brawling", "Marksman"])
+    write_character(tmp_path, Season.SEASON2, "Borden", ["Swiftness", "Stealth"])
+    return CharacterPool.from_seasons([Season.SEASON1, Season.SEASON2], tmp_path, power_data={})
+
+
+class TestCharacterPoolIndex:
+    """Test CharacterPool lookups served from its index."""
+
+    def test_filter_by_season(self, loaded_pool):
+        """Test filtering uses the seasons recorded at load time."""
+        season1 = loaded_pool.filter_by_season(Season.SEASON1)
+
+        assert sorted(season1.character_names) == ["Adam", "Ahmed"]
+        assert season1.season_filters == [Season.SEASON1]
+        assert season1.get_character_season("adam") == Season.SEASON1
+        assert loaded_pool.filter_by_season(Season.SEASON3).character_count == 0
+
+    def test_filter_does_not_touch_filesystem(self, loaded_pool, monkeypatch):
+        """Test lookups after load make no filesystem calls."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("filesystem accessed")
+
+        monkeypatch.setattr(Path, "exists", fail)
+        monkeypatch.setattr(Path, "iterdir", fail)
+        assert loaded_pool.filter_by_season(Season.SEASON2).character_names == ["Borden"]
+        assert loaded_pool.get_character("BORDEN") is not None
+
+    def test_characters_with_common_power(self, loaded_pool):
+        """Test common power lookup is case insensitive."""
+        names = [b.character_name for b in loaded_pool.characters_with_common_power("marksman")]
+
+        assert sorted(names) == ["Adam", "Ahmed"]
+        assert loaded_pool.characters_with_common_power("Arcane Mastery") == []
+
+    def test_index_follows_appends(self, loaded_pool):
+        """Test builds appended to characters are picked up by lookups."""
+        loaded_pool.characters.append(
+            CharacterBuild(character_name="Kate", common_power_1_name="Stealth")
+        )
+
+        assert loaded_pool.get_character("kate") is not None
+        assert len(loaded_pool.characters_with_common_power("Stealth")) == 2
+
+    def test_index_follows_same_length_edits(self, loaded_pool):
+        """Test replacing or swapping builds without changing the length rebuilds lookups."""
+        assert loaded_pool.get_character("adam") is not None
+        loaded_pool.characters[0] = CharacterBuild(character_name="Kate")
+
+        assert loaded_pool.get_character("adam") is None
+        assert loaded_pool.get_character("kate") is not None
+
+        loaded_pool.characters.pop(1)
+        loaded_pool.characters.append(CharacterBuild(character_name="Jim"))
+
+        assert loaded_pool.get_character("ahmed") is None
+        assert loaded_pool.get_character("jim") is not None
+
+    def test_appended_character_season_resolved_from_directories(self, loaded_pool, tmp_path):
+        """Test a build added without a season is matched to its season directory."""
+        write_character(tmp_path, Season.SEASON3, "Kate", [])
+        loaded_pool.characters.append(CharacterBuild(character_name="Kate"))
+
+        assert loaded_pool.get_character_season("Kate") == Season.SEASON3
+        assert loaded_pool.filter_by_season(Season.SEASON3).character_names == ["Kate"]
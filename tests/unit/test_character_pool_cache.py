@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CharacterPool snapshot cache.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from scripts.models import character_pool_cache
+from scripts.models.character_pool import CharacterPool
+from scripts.models.character_pool_cache import CharacterPoolCache
+from scripts.models.constants import Season
+
+COMMON_POWERS_FILE = Path(__file__).parent.parent.parent / "data" / "common_powers.json"
+
+
+def write_character(data_dir: Path, season: Season, name: str, powers: list) -> Path:
+    """Write a minimal character.json under the season's characters/ directory."""
+    char_dir = data_dir / season.value / "characters" / name.lower()
+    char_dir.mkdir(parents=True, exist_ok=True)
+    json_file = char_dir / "character.json"
+    json_file.write_text(json.dumps({"name": name, "common_powers": powers}), encoding="utf-8")
+    return json_file
+
+
+def touch(path: Path) -> None:
+    """Move a file's mtime forward so its stamp changes."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Data directory with two seasons of characters."""
+    data = tmp_path / "data"
+    data.mkdir()
+    shutil.copy(COMMON_POWERS_FILE, data / "common_powers.json")
+    write_character(data, Season.SEASON1, "Adam", ["Marksman", "Toughness"])
+    write_character(data, Season.SEASON1, "Ahmed", ["Brawling", "Stealth"])
+    write_character(data, Season.SEASON2, "Borden", ["Swiftness", "Arcane Mastery"])
+    return data
+
+
+@pytest.fixture
+def cache(data_dir, tmp_path):
+    """Cache writing snapshots into the test's temp directory."""
+    return CharacterPoolCache(data_dir, tmp_path / "cache")
+
+
+def names(pool: CharacterPool) -> list:
+    """Sorted character names in a pool."""
+    return sorted(pool.character_names)
+
+
+class TestCharacterPoolCache:
+    """Test CharacterPoolCache."""
+
+    def test_matches_uncached_load(self, cache, data_dir):
+        """Test a cached pool matches a freshly parsed pool, power data included."""
+        seasons = [Season.SEASON1, Season.SEASON2]
+        expected = CharacterPool.from_seasons(seasons, data_dir, use_cache=False)
+        cache.load(seasons)
+        cached = cache.load(seasons)
+
+        assert cache.stats.reused == 3
+        assert cache.stats.rebuilt == 0
+        assert names(cached) == names(expected) == ["Adam", "Ahmed", "Borden"]
+        for build in cached.characters:
+            fresh = expected.get_character(build.character_name)
+            assert build.model_dump() == fresh.model_dump()
+            assert build._common_power_1_data == fresh._common_power_1_data
+            assert build._common_power_1_data is not None
+            assert build.statistics == fresh.statistics
+
+    def test_rebuilds_only_changed_files(self, cache, data_dir):
+        """Test only the modified character is re-parsed."""
+        cache.load([Season.SEASON1])
+        json_file = write_character(data_dir, Season.SEASON1, "Adam", ["Stealth", "Toughness"])
+        touch(json_file)
+
+        pool = cache.load([Season.SEASON1])
+        assert cache.stats.rebuilt == 1
+        assert cache.stats.reused == 1
+        assert pool.get_character("Adam").common_power_1_name == "Stealth"
+
+    def test_added_and_removed_characters(self, cache, data_dir):
+        """Test new files are parsed and deleted files dropped."""
+        cache.load([Season.SEASON1])
+        write_character(data_dir, Season.SEASON1, "Kate", ["Marksman", "Stealth"])
+        shutil.rmtree(data_dir / Season.SEASON1.value / "characters" / "ahmed")
+
+        pool = cache.load([Season.SEASON1])
+        assert names(pool) == ["Adam", "Kate"]
+        assert cache.stats.rebuilt == 1
+        assert cache.stats.removed == 1
+
+    def test_common_powers_change_rebuilds_all(self, cache, data_dir):
+        """Test editing common_powers.json re-resolves every character's power data."""
+        cache.load([Season.SEASON1])
+        powers_file = data_dir / "common_powers.json"
+        powers = [p for p in json.loads(powers_file.read_text()) if p["name"] != "Marksman"]
+        powers_file.write_text(json.dumps(powers), encoding="utf-8")
+        touch(powers_file)
+
+        pool = cache.load([Season.SEASON1])
+        assert cache.stats.rebuilt == 2
+        assert pool.get_character("Adam")._common_power_1_data is None
+
+    def test_season_subsets_share_snapshot(self, cache):
+        """Test loading another season extends the same snapshot."""
+        cache.load([Season.SEASON1])
+        cache.load([Season.SEASON2])
+        pool = cache.load([Season.SEASON1, Season.SEASON2])
+
+        assert cache.stats.reused == 3
+        assert names(pool) == ["Adam", "Ahmed", "Borden"]
+
+    def test_corrupt_snapshot_is_ignored(self, cache):
+        """Test an unreadable snapshot file triggers a full rebuild."""
+        cache.load([Season.SEASON1])
+        cache.snapshot_path.write_bytes(b"not a pickle")
+
+        pool = cache.load([Season.SEASON1])
+        assert cache.stats.rebuilt == 2
+        assert names(pool) == ["Adam", "Ahmed"]
+
+    def test_schema_change_discards_snapshot(self, cache):
+        """Test a snapshot written under different model schemas triggers a full rebuild."""
+        cache.load([Season.SEASON1])
+        snapshot = cache.read_snapshot()
+        snapshot.schema = "stale"
+        cache.write_snapshot(snapshot)
+
+        pool = cache.load([Season.SEASON1])
+        assert cache.stats.rebuilt == 2
+        assert names(pool) == ["Adam", "Ahmed"]
+
+    def test_from_seasons_characters_subdirectory(self, data_dir):
+        """Test from_seasons finds characters under a season's characters/ directory."""
+        seasons = [Season.SEASON2]
+        assert names(CharacterPool.from_seasons(seasons, data_dir, use_cache=False)) == ["Borden"]
+
+    def test_from_seasons_uses_cache_by_default(self, data_dir, tmp_path, monkeypatch):
+        """Test from_seasons loads through the snapshot unless power data is given."""
+        cache = CharacterPoolCache(data_dir, tmp_path / "cache")
+        monkeypatch.setattr(
+            character_pool_cache, "load_cached_pool", lambda seasons, data_dir: cache.load(seasons)
+        )
+
+        pool = CharacterPool.from_seasons([Season.SEASON1], data_dir)
+        assert cache.stats.rebuilt == 2
+        assert names(pool) == ["Adam", "Ahmed"]
+
+        CharacterPool.from_seasons([Season.SEASON1], data_dir, power_data={})
+        assert cache.stats.rebuilt == 2
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unit tests for exact dice roll distributions.
+
+Checks the convolution engine against brute-force enumeration of dice faces.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from scripts.models.dice_distribution import (
+    RollDistributionCalculator,
+    convert_elder_signs,
+    convolve_pmf,
+    face_generating_polynomial,
+    get_roll_distribution,
+)
+from scripts.models.game_mechanics import BonusDice, DiceFaceSymbol, StandardDice
+
+
+def enumerate_pmf(black_count: int, green_count: int) -> dict:
+    """Brute-force the joint PMF by enumerating every face combination."""
+    faces = [StandardDice().faces] * black_count + [BonusDice().faces] * green_count
+    pmf: dict = {}
+    for roll in itertools.product(*faces):
+        key = tuple(
+            sum(face.symbols.count(symbol) for face in roll)
+            for symbol in (
+                DiceFaceSymbol.SUCCESS,
+                DiceFaceSymbol.TENTACLE,
+                DiceFaceSymbol.ELDER_SIGN,
+            )
+        )
+        prob = 1.0
+        for face in roll:
+            prob *= face.probability
+        pmf[key] = pmf.get(key, 0.0) + prob
+    return pmf
+
+
+class TestGeneratingPolynomial:
+    """Test per-die generating polynomials."""
+
+    def test_black_die_polynomial(self):
+        """Black die: 2 success, 1 success+tentacle, 1 tentacle, 1 elder, 1 blank."""
+        poly = face_generating_polynomial(StandardDice())
+
+        assert poly.sum() == pytest.approx(1.0)
+        assert poly[1, 0, 0] == pytest.approx(2 / 6)
+        assert poly[1, 1, 0] == pytest.approx(1 / 6)
+        assert poly[0, 1, 0] == pytest.approx(1 / 6)
+        assert poly[0, 0, 1] == pytest.approx(1 / 6)
+        assert poly[0, 0, 0] == pytest.approx(1 / 6)
+
+    def test_green_die_has_no_tentacles(self):
+        """Green die polynomial has no tentacle axis support."""
+        poly = face_generating_polynomial(BonusDice())
+
+        assert poly.shape[1] == 1
+        assert poly[1, 0, 1] == pytest.approx(1 / 6)
+        assert poly[0, 0, 0] == pytest.approx(2 / 6)
+
+    def test_convolve_identity(self):
+        """Convolving with the unit PMF returns the same distribution."""
+        poly = face_generating_polynomial(StandardDice())
+        result = convolve_pmf(np.ones((1, 1, 1)), poly)
+
+        np.testing.assert_allclose(result, poly)
+
+
+class TestRollDistribution:
+    """Test RollDistribution queries."""
+
+    @pytest.mark.parametrize("black,green", [(0, 0), (1, 0), (0, 2), (3, 0), (3, 2), (2, 3)])
+    def test_matches_enumeration(self, black, green):
+        """Joint PMF matches brute-force enumeration."""
+        dist = RollDistributionCalculator().calculate_distribution(black, green)
+        expected = enumerate_pmf(black, green)
+
+        assert dist.pmf.sum() == pytest.approx(1.0)
+        for key, prob in expected.items():
+            assert dist.pmf[key] == pytest.approx(prob)
+
+    def test_expected_values(self):
+        """Expected counts are linear in dice counts."""
+        dist = get_roll_distribution(3, 2)
+
+        assert dist.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(2.5)
+        assert dist.expected(DiceFaceSymbol.TENTACLE) == pytest.approx(3 * 2 / 6)
+        assert dist.expected(DiceFaceSymbol.ELDER_SIGN) == pytest.approx(3 / 6 + 2 * 2 / 6)
+
+    def test_joint_threshold_query(self):
+        """Box queries match summing the enumerated PMF."""
+        dist = get_roll_distribution(3, 2)
+        expected = sum(p for (s, t, _e), p in enumerate_pmf(3, 2).items() if s >= 3 and t <= 1)
+
+        assert dist.prob(min_successes=3, max_tentacles=1) == pytest.approx(expected)
+        assert dist.prob() == pytest.approx(1.0)
+        assert dist.prob(min_successes=dist.max_successes + 1) == 0.0
+
+    def test_marginal_and_survival(self):
+        """Marginals sum to one and survival starts at one."""
+        dist = get_roll_distribution(4, 1)
+        survival = dist.survival(DiceFaceSymbol.SUCCESS)
+
+        assert dist.marginal(DiceFaceSymbol.SUCCESS).sum() == pytest.approx(1.0)
+        assert survival[0] == pytest.approx(1.0)
+        assert survival[2] == pytest.approx(dist.prob_at_least(DiceFaceSymbol.SUCCESS, 2))
+        assert dist.prob_at_least(DiceFaceSymbol.TENTACLE, 0) == 1.0
+        assert dist.prob_at_least(DiceFaceSymbol.TENTACLE, 99) == 0.0
+
+    def test_pmf_is_read_only(self):
+        """Cached PMF arrays cannot be mutated by callers."""
+        dist = get_roll_distribution(2, 0)
+
+        with pytest.raises(ValueError):
+            dist.pmf[0, 0, 0] = 1.0
+
+    def test_calculator_caches_distributions(self):
+        """Repeated requests return the same cached object."""
+        calculator = RollDistributionCalculator()
+
+        assert calculator.calculate_distribution(3, 1) is calculator.calculate_distribution(3, 1)
+
+    def test_negative_counts_rejected(self):
+        """Negative dice counts raise ValueError."""
+        with pytest.raises(ValueError):
+            RollDistributionCalculator().joint_pmf(-1, 0)
+
+
+class TestElderSignConversion:
+    """Test exact elder sign to success conversion."""
+
+    @pytest.mark.parametrize("cap", [1, 2, None])
+    def test_matches_enumeration(self, cap):
+        """Converted PMF moves min(elder signs, cap) into successes for every outcome."""
+        dist = get_roll_distribution(2, 2, cap)
+        expected: dict = {}
+        for (s, t, e), prob in enumerate_pmf(2, 2).items():
+            key = (s + (e if cap is None else min(e, cap)), t, e)
+            expected[key] = expected.get(key, 0.0) + prob
+
+        assert dist.pmf.sum() == pytest.approx(1.0)
+        for idx in zip(*np.nonzero(dist.pmf)):
+            assert dist.pmf[idx] == pytest.approx(expected.pop(tuple(int(i) for i in idx)))
+        assert not expected
+
+    def test_marginals_other_than_successes_unchanged(self):
+        """Tentacle and elder sign marginals are the rolled counts."""
+        plain = get_roll_distribution(3, 2)
+        converted = get_roll_distribution(3, 2, 1)
+
+        for symbol in (DiceFaceSymbol.TENTACLE, DiceFaceSymbol.ELDER_SIGN):
+            np.testing.assert_allclose(converted.marginal(symbol), plain.marginal(symbol))
+
+    def test_cap_orders_threshold_probabilities(self):
+        """Raising the cap never lowers a success threshold probability."""
+        probs = [
+            get_roll_distribution(3, 2, cap).prob_at_least(DiceFaceSymbol.SUCCESS, 3)
+            for cap in (0, 1, 2, None)
+        ]
+
+        assert probs == sorted(probs)
+        assert probs[1] > probs[0]
+
+    def test_zero_cap_is_identity(self):
+        """A cap of 0 leaves the PMF unchanged."""
+        pmf = get_roll_distribution(3, 1).pmf
+
+        np.testing.assert_array_equal(convert_elder_signs(pmf, 0), pmf)
+        assert get_roll_distribution(3, 1, 0) is get_roll_distribution(3, 1)
+
+    def test_cached_per_pool_and_cap(self):
+        """Each (pool, cap) is computed once."""
+        calculator = RollDistributionCalculator()
+
+        assert calculator.calculate_distribution(3, 1, 1) is calculator.calculate_distribution(
+            3, 1, 1
+        )
+        assert calculator.calculate_distribution(3, 1, 1) is not (
+            calculator.calculate_distribution(3, 1, None)
+        )
+
+    def test_negative_cap_rejected(self):
+        """Negative caps raise ValueError."""
+        with pytest.raises(ValueError):
+            get_roll_distribution(3, 1, -1)
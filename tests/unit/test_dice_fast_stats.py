@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fast-path dice statistics types.
+"""
+
+import dataclasses
+
+import pytest
+
+from scripts.models.dice_fast_stats import (
+    FastCombinedRollStats,
+    get_fast_combined_stats,
+    get_fast_power_impact,
+    get_fast_single_die_stats,
+)
+from scripts.models.dice_probabilities import (
+    analyze_power_dice_impact,
+    get_combined_stats,
+    get_single_die_stats,
+)
+from scripts.models.game_mechanics import DiceType
+
+COMBINED_FIELDS = [
+    "total_dice",
+    "expected_successes",
+    "expected_tentacles",
+    "expected_elder_signs",
+    "prob_at_least_1_success",
+    "prob_at_least_1_tentacle",
+    "prob_at_least_1_elder",
+    "max_possible_successes",
+    "success_percentage",
+    "tentacle_percentage",
+    "elder_percentage",
+]
+
+
+class TestFastSingleDieStats:
+    """Test FastSingleDieStats."""
+
+    @pytest.mark.parametrize("dice_type", [DiceType.BLACK, DiceType.GREEN])
+    def test_matches_model(self, dice_type):
+        """Every precomputed value equals the pydantic computed field."""
+        fast = get_fast_single_die_stats(dice_type)
+        model = get_single_die_stats(dice_type)
+
+        for name in ("success_prob", "tentacle_prob", "elder_sign_prob", "expected_successes"):
+            assert getattr(fast, name) == pytest.approx(getattr(model, name))
+        assert fast.to_model() == model
+
+    def test_frozen(self):
+        """Fast-path instances are immutable."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_fast_single_die_stats(DiceType.BLACK).success_prob = 1.0  # type: ignore[misc]
+
+
+class TestFastCombinedRollStats:
+    """Test FastCombinedRollStats."""
+
+    @pytest.mark.parametrize("black,green", [(0, 0), (3, 0), (3, 2), (6, 4)])
+    def test_matches_model(self, black, green):
+        """Combined values equal CombinedRollStats."""
+        fast = get_fast_combined_stats(black, green)
+        model = get_combined_stats(black, green)
+
+        for name in COMBINED_FIELDS:
+            assert getattr(fast, name) == pytest.approx(getattr(model, name)), name
+        assert fast.to_model().model_dump() == model.model_dump()
+
+    def test_cached_and_validated(self):
+        """Pools are cached and negative counts rejected."""
+        assert get_fast_combined_stats(3, 1) is get_fast_combined_stats(3, 1)
+        black = get_fast_single_die_stats(DiceType.BLACK)
+        with pytest.raises(ValueError):
+            FastCombinedRollStats.from_counts(-1, 0, black, black)
+
+
+class TestFastPowerImpact:
+    """Test FastPowerImpact."""
+
+    def test_matches_model(self):
+        """Improvement metrics equal PowerImpact."""
+        fast = get_fast_power_impact(3, 0, 2)
+        model = analyze_power_dice_impact(3, 0, 2)
+
+        assert fast.expected_successes_increase == pytest.approx(
+            model.improvement.expected_successes_increase
+        )
+        assert fast.expected_successes_percent_increase == pytest.approx(
+            model.improvement.expected_successes_percent_increase
+        )
+        assert fast.is_significant_improvement == model.improvement.is_significant_improvement
+        assert fast.total_dice_increase == model.total_dice_increase
+        assert fast.to_model().model_dump() == model.model_dump()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the precomputed dice outcome table.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.models import dice_outcome_table
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_outcome_table import (
+    build_outcome_table,
+    dice_faces_fingerprint,
+    get_table_path,
+    load_outcome_table,
+    lookup_distribution,
+)
+from scripts.models.game_mechanics import BonusDice, DiceFaceSymbol
+from scripts.models.power_combination import PowerEffect
+
+
+class TestDiceOutcomeTable:
+    """Test building and loading the outcome table."""
+
+    def test_build_and_load(self, tmp_path):
+        """Built table is memory-mapped and matches in-memory convolution."""
+        path = build_outcome_table(4, 3, tmp_path)
+        table = load_outcome_table(4, 3, tmp_path)
+
+        assert path == get_table_path(tmp_path)
+        assert table is not None
+        assert isinstance(table.table, np.memmap)
+        assert table.max_black_dice == 4
+        assert table.max_green_dice == 3
+        for black in range(5):
+            for green in range(4):
+                np.testing.assert_allclose(
+                    table.pmf(black, green), get_roll_distribution(black, green).pmf
+                )
+
+    def test_distribution_queries(self, tmp_path):
+        """Table-backed distributions answer the same queries."""
+        table = load_outcome_table(3, 2, tmp_path)
+        expected = get_roll_distribution(3, 2)
+        dist = table.distribution(3, 2)
+
+        assert dist.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(2.5)
+        assert dist.prob(min_successes=3, max_tentacles=1) == pytest.approx(
+            expected.prob(min_successes=3, max_tentacles=1)
+        )
+        assert table.distribution(3, 2) is dist
+
+    def test_out_of_range_pool(self, tmp_path):
+        """Pools beyond the table raise, and lookup falls back to convolution."""
+        table = load_outcome_table(2, 1, tmp_path)
+
+        assert not table.contains(3, 0)
+        with pytest.raises(ValueError):
+            table.pmf(3, 0)
+        dist = lookup_distribution(3, 0, table=table)
+        assert dist.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(1.5)
+
+    def test_grows_when_too_small(self, tmp_path):
+        """Requesting a larger table rebuilds it."""
+        load_outcome_table(2, 2, tmp_path)
+        table = load_outcome_table(5, 1, tmp_path)
+
+        assert table.max_black_dice == 5
+        assert table.max_green_dice == 2
+
+    def test_no_build_returns_none(self, tmp_path):
+        """With building disabled, a missing table returns None."""
+        assert load_outcome_table(2, 2, tmp_path, build_if_missing=False) is None
+
+    def test_face_change_invalidates_table(self, tmp_path, monkeypatch):
+        """A new face fingerprint selects a new file and removes the stale one."""
+        old_path = build_outcome_table(2, 2, tmp_path)
+
+        green = BonusDice()
+        green.faces[0].probability = 0.0
+        assert dice_faces_fingerprint(green_dice=green) != dice_faces_fingerprint()
+
+        monkeypatch.setattr(dice_outcome_table, "dice_faces_fingerprint", lambda: "f" * 64)
+        assert load_outcome_table(2, 2, tmp_path, build_if_missing=False) is None
+
+        new_path = build_outcome_table(2, 2, tmp_path)
+        assert new_path != old_path
+        assert not old_path.exists()
+
+
+class TestThresholdMatrix:
+    """Test vectorized threshold probabilities."""
+
+    def test_matches_distribution(self, tmp_path):
+        """Every grid entry matches the pool's own survival function."""
+        table = load_outcome_table(4, 2, tmp_path)
+        successes, tentacles = table.threshold_matrix(
+            np.arange(5)[:, np.newaxis], np.arange(3)[np.newaxis, :]
+        )
+
+        assert successes.shape[:2] == (5, 3)
+        for black in range(5):
+            for green in range(3):
+                dist = get_roll_distribution(black, green)
+                for k in range(successes.shape[-1]):
+                    assert successes[black, green, k] == pytest.approx(
+                        dist.prob_at_least(DiceFaceSymbol.SUCCESS, k)
+                    )
+                for k in range(tentacles.shape[-1]):
+                    assert tentacles[black, green, k] == pytest.approx(
+                        dist.prob_at_least(DiceFaceSymbol.TENTACLE, k)
+                    )
+
+    def test_elder_signs_as_successes(self, tmp_path):
+        """Counting elder signs shifts mass to higher success thresholds."""
+        table = load_outcome_table(3, 1, tmp_path)
+        pmf = get_roll_distribution(3, 1).pmf
+        successes, _ = table.threshold_matrix(np.array([3]), np.array([1]), True)
+
+        s, _, e = np.indices(pmf.shape)
+        for k in range(successes.shape[-1]):
+            assert successes[0, k] == pytest.approx(pmf[s + e >= k].sum())
+
+    def test_capped_elder_sign_conversion(self, tmp_path):
+        """A capped conversion counts at most that many elder signs."""
+        table = load_outcome_table(3, 2, tmp_path)
+        pmf = get_roll_distribution(3, 2).pmf
+        successes, _ = table.threshold_matrix(np.array([3]), np.array([2]), 1)
+
+        s, _, e = np.indices(pmf.shape)
+        for k in range(successes.shape[-1]):
+            assert successes[0, k] == pytest.approx(pmf[s + np.minimum(e, 1) >= k].sum())
+
+    def test_power_rows_use_their_own_conversion(self, tmp_path, monkeypatch):
+        """Matrix rows apply each power's capped conversion; the global flag is base-only."""
+        from scripts.core.analysis import power
+
+        monkeypatch.setattr(
+            power,
+            "load_outcome_table",
+            lambda black, green: load_outcome_table(black, green, tmp_path),
+        )
+        effect = PowerEffect(power_name="Arcane", level=1, elder_signs_as_successes=1)
+        rows = power.build_threshold_matrix([effect], [3], [1], elder_signs_as_successes=False)
+        base, arcane = rows
+
+        pmf = get_roll_distribution(3, 1).pmf
+        s, _, e = np.indices(pmf.shape)
+        assert base["p_successes_ge_3"] == pytest.approx(pmf[s >= 3].sum())
+        assert arcane["p_successes_ge_3"] == pytest.approx(pmf[s + np.minimum(e, 1) >= 3].sum())
+        assert arcane["total_black_dice"] == 3
+        assert arcane["elder_signs_as_successes"] == 1
+
+    def test_out_of_range(self, tmp_path):
+        """Pools beyond the table are rejected."""
+        table = load_outcome_table(2, 1, tmp_path)
+
+        with pytest.raises(ValueError):
+            table.threshold_matrix(np.array([3]), np.array([0]))
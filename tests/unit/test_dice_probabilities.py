@@ -7,6 +7,7 @@ Tests the encapsulated Pydantic models and their computed fields.
 
 import pytest
 
+from scripts.models.dice_outcome_table import load_outcome_table
 from scripts.models.dice_probabilities import (
     BASE_BLACK_DICE_COUNT,
     BASE_GREEN_DICE_COUNT,
@@ -225,3 +226,35 @@ class TestDiceProbabilityCalculator:
             DiceFaceSymbol.TENTACLE.value not in green_probs
             or green_probs.get(DiceFaceSymbol.TENTACLE.value, 0.0) == 0.0
         )
+
+    def test_cached_models_are_copies(self):
+        """Test repeated pool queries return equal models that callers can't corrupt."""
+        calculator = DiceProbabilityCalculator()
+
+        stats = calculator.calculate_combined_stats(3, 1)
+        assert stats == calculator.calculate_combined_stats(3, 1)
+        stats.black_dice = 9
+        stats.green_stats.face_probabilities.clear()
+        assert calculator.calculate_combined_stats(3, 1).black_dice == 3
+        assert calculator.calculate_combined_stats(3, 1).green_stats.face_probabilities
+
+        impact = calculator.calculate_power_impact(3, 0, 2)
+        assert impact == calculator.calculate_power_impact(3, 0, 2)
+        impact.enhanced.green_dice = 0
+        assert calculator.calculate_power_impact(3, 0, 2).enhanced.green_dice == 2
+
+        die = calculator.calculate_single_die_stats(DiceType.BLACK)
+        die.face_probabilities.clear()
+        assert calculator.calculate_single_die_stats(DiceType.BLACK).face_probabilities
+
+    def test_distribution_comes_from_outcome_table(self, tmp_path):
+        """Test joint distributions are served by the outcome table."""
+        table = load_outcome_table(4, 2, tmp_path)
+        calculator = DiceProbabilityCalculator(outcome_table=table)
+
+        assert calculator.calculate_distribution(3, 1) is table.distribution(3, 1)
+        # Pools beyond the table fall back to convolution
+        dist = calculator.calculate_distribution(5, 0)
+        assert dist.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(
+            calculator.calculate_combined_stats(5, 0).expected_successes
+        )
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batched dice sensitivity analysis.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.models.build_statistics import ANY_ELDER_SIGNS, ELDER_CONVERSION_COLUMN
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_sensitivity import (
+    METRICS,
+    DiceSensitivityAnalyzer,
+    builds_from_statistics_table,
+    candidate_changes,
+)
+from scripts.models.game_mechanics import DiceFaceSymbol
+from scripts.models.reroll_solver import get_reroll_solver
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer with a two-success target."""
+    return DiceSensitivityAnalyzer(target_successes=2)
+
+
+class TestDiceSensitivityAnalyzer:
+    """Test DiceSensitivityAnalyzer."""
+
+    def test_pool_metrics_match_distribution(self, analyzer):
+        """Test metrics without rerolls come from the exact joint distribution."""
+        metrics = dict(zip(METRICS, analyzer.pool_metrics(3, 2, 0, 0)))
+        dist = get_roll_distribution(3, 2)
+
+        assert metrics["expected_successes"] == pytest.approx(dist.expected(DiceFaceSymbol.SUCCESS))
+        assert metrics["expected_tentacles"] == pytest.approx(
+            dist.expected(DiceFaceSymbol.TENTACLE)
+        )
+        assert metrics["prob_at_least_1_tentacle"] == pytest.approx(
+            dist.prob_at_least(DiceFaceSymbol.TENTACLE, 1)
+        )
+        assert metrics["prob_at_least_target"] == pytest.approx(
+            dist.prob_at_least(DiceFaceSymbol.SUCCESS, 2)
+        )
+
+    def test_elder_conversion_counts_elder_signs(self, analyzer):
+        """Test conversion adds expected elder signs to expected successes."""
+        off = dict(zip(METRICS, analyzer.pool_metrics(3, 1, 0, 0)))
+        on = dict(zip(METRICS, analyzer.pool_metrics(3, 1, ANY_ELDER_SIGNS, 0)))
+
+        assert on["expected_successes"] == pytest.approx(
+            off["expected_successes"] + off["expected_elder_signs"]
+        )
+        assert on["prob_at_least_target"] > off["prob_at_least_target"]
+        assert on["expected_tentacles"] == off["expected_tentacles"]
+
+    def test_capped_elder_conversion(self, analyzer):
+        """Test a conversion cap counts at most that many elder signs."""
+        capped = analyzer.pool_metrics(3, 1, 1, 0)
+        dist = get_roll_distribution(3, 1, 1)
+
+        assert dict(zip(METRICS, capped))["expected_successes"] == pytest.approx(
+            dist.expected(DiceFaceSymbol.SUCCESS)
+        )
+        assert (capped < analyzer.pool_metrics(3, 1, ANY_ELDER_SIGNS, 0)).any()
+        np.testing.assert_array_equal(
+            analyzer.pool_metrics(3, 1, 4, 1), analyzer.pool_metrics(3, 1, ANY_ELDER_SIGNS, 1)
+        )
+        solution = get_reroll_solver(2, 1).solve(3, 1, 1)
+        assert dict(zip(METRICS, analyzer.pool_metrics(3, 1, 1, 1)))[
+            "prob_at_least_target"
+        ] == pytest.approx(solution.success_probability)
+
+    def test_rerolls_use_optimal_policy(self, analyzer):
+        """Test pools with rerolls match the reroll solver."""
+        metrics = dict(zip(METRICS, analyzer.pool_metrics(3, 0, 0, 1)))
+        solution = get_reroll_solver(2).solve(3, 0, 1)
+
+        assert metrics["prob_at_least_target"] == pytest.approx(solution.success_probability)
+
+    def test_analyze_shapes_and_deltas(self, analyzer):
+        """Test every (build, change) pair gets a delta for every metric."""
+        builds = np.array([[3, 0, 0, 0], [4, 1, 1, 0]])
+        changes = candidate_changes(black=(-1, 0, 1), green=(0, 1))
+        result = analyzer.analyze(builds, changes)
+
+        assert result.base.shape == (2, len(METRICS))
+        assert result.changed.shape == (2, 6, len(METRICS))
+        assert result.deltas.shape == (2, 6, len(METRICS))
+        for b, build in enumerate(builds):
+            for c, change in enumerate(changes):
+                expected = analyzer.pool_metrics(*(build + change)) - analyzer.pool_metrics(*build)
+                np.testing.assert_allclose(result.deltas[b, c], expected)
+
+    def test_no_change_has_zero_delta(self, analyzer):
+        """Test the identity change leaves every metric unchanged."""
+        result = analyzer.analyze(np.array([[3, 2, 1, 0]]), np.zeros((1, 4), dtype=int))
+
+        np.testing.assert_array_equal(result.deltas, 0.0)
+
+    def test_changes_are_clipped(self, analyzer):
+        """Test dice counts stop at zero and elder conversion at ANY_ELDER_SIGNS."""
+        result = analyzer.analyze(
+            np.array([[1, 0, ANY_ELDER_SIGNS, 0]]), np.array([[-3, -1, 1, 0]])
+        )
+
+        np.testing.assert_array_equal(result.pools[0, 0], [0, 0, ANY_ELDER_SIGNS, 0])
+        assert result.delta("expected_successes")[0, 0] < 0
+
+    def test_invalid_input(self, analyzer):
+        """Test malformed matrices are rejected."""
+        with pytest.raises(ValueError):
+            analyzer.analyze(np.array([[3, 0, 0]]), np.zeros((1, 4), dtype=int))
+        with pytest.raises(ValueError):
+            analyzer.analyze(
+                np.array([[3, 0, ANY_ELDER_SIGNS + 1, 0]]), np.zeros((1, 4), dtype=int)
+            )
+        with pytest.raises(KeyError):
+            analyzer.analyze(np.array([[3, 0, 0, 0]]), np.zeros((1, 4), dtype=int)).delta("luck")
+
+
+class TestBuildRows:
+    """Test pool rows derived from build statistics."""
+
+    def test_builds_from_statistics_table(self):
+        """Test table columns map onto (black, green, elder, rerolls)."""
+
+        class Table:
+            columns = {
+                "total_black_dice": np.array([3, 4]),
+                "total_green_dice": np.array([0, 2]),
+                ELDER_CONVERSION_COLUMN: np.array([0, 2]),
+                "rerolls_per_roll": np.array([0, 1]),
+            }
+
+            def column(self, name):
+                return self.columns[name]
+
+        rows = builds_from_statistics_table(Table())
+        np.testing.assert_array_equal(rows, [[3, 0, 0, 0], [4, 2, 2, 1]])
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized Monte Carlo dice simulator.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_simulation import (
+    BonusDiceRule,
+    DiceSimulator,
+    ElderSignConversionRule,
+    RerollRule,
+    rules_from_combination,
+    wilson_interval,
+)
+from scripts.models.game_mechanics import DiceFaceSymbol
+from scripts.models.power_combination import PowerCombination, PowerEffect
+from scripts.models.reroll_solver import RerollPolicySolver
+
+
+class TestDiceSimulator:
+    """Test DiceSimulator against exact distributions."""
+
+    def test_plain_roll_matches_exact(self):
+        """Without rules the empirical PMF converges to the exact one."""
+        result = DiceSimulator(seed=1).simulate(3, 2, max_rolls=400_000)
+        exact = get_roll_distribution(3, 2)
+        empirical = result.distribution()
+
+        assert result.rolls == 400_000
+        assert empirical.pmf.shape == exact.pmf.shape
+        np.testing.assert_allclose(empirical.pmf, exact.pmf, atol=3e-3)
+        low, high = result.mean_interval(DiceFaceSymbol.SUCCESS)
+        assert low <= exact.expected(DiceFaceSymbol.SUCCESS) <= high
+
+    def test_seed_is_reproducible(self):
+        """The same seed gives the same histogram."""
+        first = DiceSimulator(seed=7).simulate(2, 1, max_rolls=10_000, batch_size=3_000)
+        second = DiceSimulator(seed=7).simulate(2, 1, max_rolls=10_000, batch_size=3_000)
+
+        np.testing.assert_array_equal(first.histogram, second.histogram)
+
+    def test_unconditional_bonus_dice(self):
+        """An always-on bonus green die matches the larger exact pool."""
+        rules = [BonusDiceRule(green_dice=1)]
+        result = DiceSimulator(seed=2).simulate(3, 0, rules, max_rolls=300_000)
+
+        assert result.green_dice == 1
+        assert result.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(
+            get_roll_distribution(3, 1).expected(DiceFaceSymbol.SUCCESS), abs=0.01
+        )
+
+    def test_conditional_bonus_dice_mix(self):
+        """A conditional die contributes in proportion to its activation rate."""
+        rules = [BonusDiceRule(black_dice=2, condition_probability=0.25)]
+        result = DiceSimulator(seed=3).simulate(2, 0, rules, max_rolls=300_000)
+
+        expected = 0.75 * 1.0 + 0.25 * 2.0
+        assert result.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(expected, abs=0.01)
+
+    def test_elder_conversion_cap(self):
+        """Capped conversion moves at most the cap from elder signs to successes."""
+        rules = [ElderSignConversionRule(max_count=1)]
+        result = DiceSimulator(seed=4).simulate(0, 3, rules, max_rolls=200_000)
+        dist = result.distribution()
+
+        # Each green die shows an elder sign with probability 1/3
+        p_any_elder = 1 - (2 / 3) ** 3
+        assert dist.expected(DiceFaceSymbol.SUCCESS) == pytest.approx(1.5 + p_any_elder, abs=0.01)
+
+    def test_capped_conversion_matches_exact_marginals(self):
+        """Capped conversion keeps rolled elder signs, like the exact distribution."""
+        rules = [ElderSignConversionRule(max_count=1)]
+        result = DiceSimulator(seed=5).simulate(3, 2, rules, max_rolls=400_000)
+        empirical = result.distribution()
+        exact = get_roll_distribution(3, 2, 1)
+
+        for symbol in (DiceFaceSymbol.SUCCESS, DiceFaceSymbol.TENTACLE, DiceFaceSymbol.ELDER_SIGN):
+            simulated = empirical.marginal(symbol)
+            expected = exact.marginal(symbol)
+            size = max(simulated.size, expected.size)
+            np.testing.assert_allclose(
+                np.pad(simulated, (0, size - simulated.size)),
+                np.pad(expected, (0, size - expected.size)),
+                atol=3e-3,
+                err_msg=symbol.value,
+            )
+
+    def test_single_reroll_matches_solver(self):
+        """Greedy rerolls agree with the exact policy on a simple pool."""
+        rules = [RerollRule(rerolls=1, target_successes=1)]
+        result = DiceSimulator(seed=5).simulate(1, 0, rules, max_rolls=200_000)
+        exact = RerollPolicySolver(1).solve(1, 0, 1)
+
+        low, high = result.proportion_interval(DiceFaceSymbol.SUCCESS, 1, confidence=0.999)
+        assert low <= exact.success_probability <= high
+
+    def test_early_stop_on_tolerance(self):
+        """Simulation stops once the interval is narrower than the tolerance."""
+        result = DiceSimulator(seed=6).simulate(
+            3, 0, max_rolls=10_000_000, batch_size=50_000, tolerance=0.005, target_successes=2
+        )
+
+        assert result.converged
+        assert result.rolls < 10_000_000
+        low, high = result.proportion_interval(DiceFaceSymbol.SUCCESS, 2)
+        assert (high - low) / 2 <= 0.005
+
+    def test_negative_counts_rejected(self):
+        """Negative dice counts raise ValueError."""
+        with pytest.raises(ValueError):
+            DiceSimulator().simulate(-1, 0)
+
+
+class TestRulesFromCombination:
+    """Test translating power combinations into simulation rules."""
+
+    def test_instead_replaces_lower_level(self):
+        """An "instead" effect replaces earlier levels of the same power."""
+        combination = PowerCombination(
+            effects=[
+                PowerEffect(power_name="Marksman", level=1, green_dice_added=1),
+                PowerEffect(
+                    power_name="Marksman", level=2, black_dice_added=1, replaces_previous=True
+                ),
+                PowerEffect(power_name="Stealth", level=1, green_dice_added=1, is_conditional=True),
+                PowerEffect(power_name="Luck", level=1, rerolls_added=2),
+            ]
+        )
+        rules = rules_from_combination(combination, target_successes=2)
+        bonus = [rule for rule in rules if isinstance(rule, BonusDiceRule)]
+
+        assert [(r.black_dice, r.green_dice) for r in bonus] == [(1, 0), (0, 1)]
+        assert bonus[1].condition_probability == 0.5
+        assert any(isinstance(r, RerollRule) and r.rerolls == 2 for r in rules)
+
+    def test_simulate_combination(self):
+        """Combination simulation includes its bonus dice."""
+        combination = PowerCombination(
+            effects=[PowerEffect(power_name="Marksman", level=1, green_dice_added=1)]
+        )
+        result = DiceSimulator(seed=8).simulate_combination(combination, max_rolls=20_000)
+
+        assert (result.black_dice, result.green_dice) == (3, 1)
+
+
+class TestWilsonInterval:
+    """Test wilson_interval."""
+
+    def test_bounds(self):
+        """Interval contains the estimate and stays inside [0, 1]."""
+        low, high = wilson_interval(0.0, 100)
+        assert low == 0.0 and 0.0 < high < 0.1
+        low, high = wilson_interval(0.5, 10_000)
+        assert low < 0.5 < high
+        assert high - low == pytest.approx(2 * 1.96 * 0.005, rel=0.01)
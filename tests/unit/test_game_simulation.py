@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized game simulator.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts.models.character import CharacterData, CommonPower
+from scripts.models.character_build import CharacterBuild
+from scripts.models.game_mechanics import InsanityTrack
+from scripts.models.game_simulation import (
+    CAUSE_MADNESS,
+    CAUSE_SURVIVED,
+    CAUSE_WOUNDS,
+    NOT_REACHED,
+    EncounterProfile,
+    GameSimulator,
+    rank_builds_by_survival,
+    simulate_build,
+)
+
+COMMON_POWERS_FILE = Path(__file__).parent.parent.parent / "data" / "common_powers.json"
+
+
+@pytest.fixture(scope="module")
+def power_data():
+    """Common powers from the repository data."""
+    with open(COMMON_POWERS_FILE, encoding="utf-8") as f:
+        return {entry["name"]: CommonPower.from_dict(entry) for entry in json.load(f)}
+
+
+def make_build(name: str = "Tester") -> CharacterBuild:
+    """Build without power data (3 black dice, no rules)."""
+    return CharacterBuild(character_name=name)
+
+
+class TestGameSimulator:
+    """Test GameSimulator."""
+
+    def test_lookup_tables_follow_insanity_track(self):
+        """Test per-slot tables agree with InsanityTrack."""
+        simulator = GameSimulator(seed=0)
+        for slot in range(1, 21):
+            track = InsanityTrack(current_insanity=slot)
+            assert simulator.green_bonus[slot] == track.green_dice_bonus
+            expected = track.next_red_swirl or track.death_threshold
+            assert simulator.roll_limit[slot] == expected
+
+    def test_seed_is_reproducible(self):
+        """Test the same seed gives identical episodes."""
+        first = simulate_build(make_build(), episodes=500, seed=7)
+        second = simulate_build(make_build(), episodes=500, seed=7)
+
+        np.testing.assert_array_equal(first.turns_survived, second.turns_survived)
+        np.testing.assert_array_equal(first.level_up_turns, second.level_up_turns)
+
+    def test_no_enemy_pressure_only_madness_kills(self):
+        """Test without enemy attacks every death comes from the insanity track."""
+        profile = EncounterProfile(enemy_attacks_per_turn=0, max_turns=200)
+        result = simulate_build(make_build(), episodes=2000, profile=profile, seed=1)
+
+        assert result.cause_rate(CAUSE_WOUNDS) == 0.0
+        assert result.cause_rate(CAUSE_MADNESS) == pytest.approx(1.0)
+        # Dying of madness means every red swirl was passed on the way
+        assert (result.level_up_turns != NOT_REACHED).all()
+        turns = result.level_up_turns.astype(int)
+        assert (np.diff(turns, axis=1) >= 0).all()
+
+    def test_no_threats_survives_every_turn(self):
+        """Test episodes run to max_turns when nothing can hurt the investigator."""
+        profile = EncounterProfile(enemy_attacks_per_turn=0, max_turns=5)
+        simulator = GameSimulator(seed=2)
+        simulator.dice.tables.tentacles[:] = 0
+        result = simulator.simulate(make_build(), episodes=100, profile=profile)
+
+        assert result.survival_rate == 1.0
+        assert result.mean_survival == 5.0
+        assert (result.cause == CAUSE_SURVIVED).all()
+        np.testing.assert_array_equal(result.survival_curve(), np.ones(6))
+
+    def test_overwhelming_attacks_kill_on_first_turn(self):
+        """Test an unblockable attack larger than the health track kills immediately."""
+        profile = EncounterProfile(wounds_per_attack=100)
+        result = simulate_build(make_build(), episodes=200, profile=profile, seed=3)
+
+        assert (result.turns_survived == 0).all()
+        assert result.cause_rate(CAUSE_SURVIVED) == 0.0
+
+    def test_survival_curve_is_non_increasing(self):
+        """Test the survival curve starts at 1 and never rises."""
+        result = simulate_build(make_build(), episodes=2000, seed=4)
+        curve = result.survival_curve()
+
+        assert curve[0] == 1.0
+        assert (np.diff(curve) <= 1e-12).all()
+        assert curve[-1] == pytest.approx(result.survival_rate)
+
+    def test_invalid_episodes_raise(self):
+        """Test a non-positive episode count is rejected."""
+        with pytest.raises(ValueError):
+            GameSimulator(seed=0).simulate(make_build(), episodes=0)
+
+
+class TestRankBuildsBySurvival:
+    """Test rank_builds_by_survival."""
+
+    def test_green_dice_survive_longer(self, power_data):
+        """Test extra green dice block more wounds without extra tentacles."""
+        weak = CharacterBuild.from_character_data(
+            CharacterData(name="Weak", common_powers=["Swiftness"]), power_data=power_data
+        )
+        # Marksman level 2 adds 2 green dice
+        strong = CharacterBuild.from_character_data(
+            CharacterData(name="Strong", common_powers=["Marksman"]),
+            common_power_1_level=2,
+            power_data=power_data,
+        )
+        profile = EncounterProfile(
+            enemy_attacks_per_turn=2, wounds_per_attack=3, condition_probability=1.0
+        )
+        ranking = rank_builds_by_survival([weak, strong], episodes=3000, profile=profile, seed=5)
+
+        assert [build.character_name for build, _ in ranking] == ["Strong", "Weak"]
+        assert ranking[0][1].cause_rate(CAUSE_WOUNDS) < ranking[1][1].cause_rate(CAUSE_WOUNDS)
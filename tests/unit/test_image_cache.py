@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared image and preprocessing cache.
+"""
+
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from scripts.core.parsing import image_cache
+from scripts.core.parsing.image_cache import (
+    GRAY,
+    ImageCache,
+    get_image_cache,
+    read_bgr,
+    read_gray,
+)
+from scripts.core.parsing.ocr_engines import preprocess_enhanced
+
+
+@pytest.fixture
+def card_image(tmp_path):
+    """Small noisy test image written to disk."""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(40, 60, 3), dtype=np.uint8)
+    path = tmp_path / "card.png"
+    cv2.imwrite(str(path), image)
+    return path
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    """Fresh process-wide cache for the duration of a test."""
+    cache = ImageCache(1024 * 1024)
+    monkeypatch.setattr(image_cache, "_default_cache", cache)
+    return cache
+
+
+class TestImageCache:
+    """Test ImageCache."""
+
+    def test_hit_and_miss_counts(self, card_image):
+        """Test the second lookup is served from the cache."""
+        cache = ImageCache(1024 * 1024)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.zeros((4, 4), dtype=np.uint8)
+
+        first = cache.get(card_image, GRAY, compute)
+        second = cache.get(card_image, GRAY, compute)
+
+        assert first is second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_results_are_read_only(self, card_image):
+        """Test cached arrays cannot be modified in place."""
+        cache = ImageCache(1024 * 1024)
+        value = cache.get(card_image, GRAY, lambda: np.zeros((4, 4), dtype=np.uint8))
+
+        with pytest.raises(ValueError):
+            value[0, 0] = 1
+
+    def test_evicts_least_recently_used_over_budget(self, card_image):
+        """Test the byte budget evicts the oldest untouched entry."""
+        cache = ImageCache(200)
+
+        def make():
+            return np.zeros(100, dtype=np.uint8)
+
+        cache.get(card_image, ("a",), make)
+        cache.get(card_image, ("b",), make)
+        cache.get(card_image, ("a",), make)  # refresh "a"
+        cache.get(card_image, ("c",), make)
+
+        assert cache.evictions == 1
+        assert cache.current_bytes == 200
+        signatures = {key[3] for key in cache._entries}
+        assert signatures == {("a",), ("c",)}
+
+    def test_oversized_arrays_are_not_stored(self, card_image):
+        """Test arrays larger than the whole budget bypass the cache."""
+        cache = ImageCache(10)
+        cache.get(card_image, GRAY, lambda: np.zeros(100, dtype=np.uint8))
+
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+    def test_modified_file_invalidates_entries(self, card_image):
+        """Test a new mtime produces a new key."""
+        cache = ImageCache(1024 * 1024)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.zeros(4, dtype=np.uint8)
+
+        cache.get(card_image, GRAY, compute)
+        stat = os.stat(card_image)
+        os.utime(card_image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cache.get(card_image, GRAY, compute)
+
+        assert len(calls) == 2
+
+
+class TestSharedIntermediates:
+    """Test the shared decode and preprocessing helpers."""
+
+    def test_decode_is_shared(self, card_image, shared_cache):
+        """Test grayscale reuses the cached decode."""
+        np.testing.assert_array_equal(read_bgr(card_image), cv2.imread(str(card_image)))
+        read_gray(card_image)
+        read_gray(card_image)
+
+        assert get_image_cache() is shared_cache
+        assert shared_cache.misses == 2  # bgr, gray
+        assert shared_cache.hits == 2  # bgr reused by gray, gray reused
+
+    def test_unreadable_image_raises(self, tmp_path, shared_cache):
+        """Test a file OpenCV cannot decode raises ValueError."""
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+
+        with pytest.raises(ValueError):
+            read_bgr(path)
+
+    def test_preprocess_matches_uncached_pipeline(self, card_image, shared_cache):
+        """Test a cached preprocessing strategy gives the original output."""
+        gray = cv2.cvtColor(cv2.imread(str(card_image)), cv2.COLOR_BGR2GRAY)
+        enhanced = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+        _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        expected = cv2.fastNlMeansDenoising(binary, None, 10, 7, 21)
+
+        np.testing.assert_array_equal(preprocess_enhanced(card_image), expected)
+        hits = shared_cache.hits
+        np.testing.assert_array_equal(preprocess_enhanced(card_image), expected)
+        assert shared_cache.hits == hits + 1
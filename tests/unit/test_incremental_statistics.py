@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for incremental statistics recomputation.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scripts.models.build_statistics import compute_pool_statistics
+from scripts.models.character import CharacterData, CommonPower
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.incremental_statistics import (
+    IncrementalStatistics,
+    StatisticsDependencyGraph,
+    StatisticsStore,
+    changed_power_levels,
+    power_level_fingerprints,
+)
+
+COMMON_POWERS_FILE = Path(__file__).parent.parent.parent / "data" / "common_powers.json"
+
+
+@pytest.fixture(scope="module")
+def raw_powers():
+    """Common powers JSON from the repository data."""
+    with open(COMMON_POWERS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def to_power_data(raw):
+    """Parse common powers JSON into CommonPower objects."""
+    return {entry["name"]: CommonPower.from_dict(entry) for entry in raw}
+
+
+def edit_level(raw, power_name: str, level: int, description: str):
+    """Copy of the JSON with one level's description replaced."""
+    edited = copy.deepcopy(raw)
+    for entry in edited:
+        if entry["name"] == power_name:
+            for level_dict in entry["levels"]:
+                if level_dict["level"] == level:
+                    level_dict["description"] = description
+    return edited
+
+
+@pytest.fixture
+def pool(raw_powers):
+    """Pool covering every pair of consecutive common powers."""
+    names = sorted(entry["name"] for entry in raw_powers)
+    characters = [
+        CharacterData(name=f"Tester {i}", common_powers=[names[i], names[(i + 1) % len(names)]])
+        for i in range(len(names))
+    ]
+    return CharacterPool(characters=[CharacterBuild.from_character_data(c) for c in characters])
+
+
+def assert_tables_equal(actual, expected):
+    """Assert two statistics tables hold the same values."""
+    assert actual.character_names == expected.character_names
+    for name, values in expected.columns.items():
+        np.testing.assert_array_equal(actual.columns[name], values, err_msg=name)
+
+
+class TestFingerprints:
+    """Test power level fingerprints."""
+
+    def test_only_edited_level_changes(self, raw_powers):
+        """Test editing one level changes exactly that entry's fingerprint."""
+        before = power_level_fingerprints(to_power_data(raw_powers))
+        after = power_level_fingerprints(
+            to_power_data(edit_level(raw_powers, "Marksman", 2, "Gain 2 green dice."))
+        )
+
+        assert changed_power_levels(before, after) == {("Marksman", 2)}
+        assert changed_power_levels(before, before) == set()
+
+
+class TestStatisticsDependencyGraph:
+    """Test StatisticsDependencyGraph."""
+
+    def test_rows_read_the_entry(self, pool):
+        """Test dependents are exactly the rows at that level of that power."""
+        graph = StatisticsDependencyGraph(pool)
+        power_name = pool.characters[0].common_power_1_name
+        rows = graph.dependents([(power_name, 3)])
+
+        # One character has it as power 1, another as power 2; 16 rows each
+        assert rows.size == 32
+        table = compute_pool_statistics(pool, {})
+        for row in rows:
+            build = pool.characters[int(table.character_index[row])]
+            slot = 1 if build.common_power_1_name == power_name else 2
+            assert table.levels[row, slot] == 3
+
+    def test_unknown_entry_has_no_dependents(self, pool):
+        """Test entries no build uses select nothing."""
+        assert StatisticsDependencyGraph(pool).dependents([("Nonexistent", 1)]).size == 0
+
+
+class TestIncrementalStatistics:
+    """Test IncrementalStatistics."""
+
+    def test_edit_recomputes_only_dependents(self, pool, raw_powers):
+        """Test an edit recomputes only affected rows and matches a full recompute."""
+        stats = IncrementalStatistics(pool)
+        stats.refresh(to_power_data(raw_powers))
+        assert stats.last_recomputed.size == 64 * len(pool.characters)
+
+        edited = to_power_data(
+            edit_level(raw_powers, "Marksman", 2, "Gain 3 green dice when attacking.")
+        )
+        table = stats.refresh(edited)
+
+        assert stats.last_recomputed.size == 32
+        assert_tables_equal(table, compute_pool_statistics(pool, edited))
+
+    def test_unchanged_data_recomputes_nothing(self, pool, raw_powers):
+        """Test refreshing with identical power data is a no-op."""
+        stats = IncrementalStatistics(pool)
+        stats.refresh(to_power_data(raw_powers))
+        stats.refresh(to_power_data(raw_powers))
+
+        assert stats.last_recomputed.size == 0
+
+    def test_store_round_trip(self, pool, raw_powers, tmp_path):
+        """Test a new process resumes from the persisted store."""
+        store = StatisticsStore(tmp_path / "stats.npz")
+        IncrementalStatistics(pool, store).refresh(to_power_data(raw_powers))
+
+        edited = to_power_data(edit_level(raw_powers, "Toughness", 1, "Gain 1 black die."))
+        resumed = IncrementalStatistics(pool, store)
+        table = resumed.refresh(edited)
+
+        assert resumed.last_recomputed.size == 32
+        assert_tables_equal(table, compute_pool_statistics(pool, edited))
+        assert_tables_equal(store.load()[0], table)
+
+    def test_store_ignored_for_different_pool(self, pool, raw_powers, tmp_path):
+        """Test a store computed for other characters triggers a full recompute."""
+        store = StatisticsStore(tmp_path / "stats.npz")
+        IncrementalStatistics(pool, store).refresh(to_power_data(raw_powers))
+
+        other = CharacterPool(characters=pool.characters[:2])
+        stats = IncrementalStatistics(other, store)
+        stats.refresh(to_power_data(raw_powers))
+
+        assert stats.last_recomputed.size == 128
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the insanity track Markov chain.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.models.game_mechanics import InsanityTrack
+from scripts.models.insanity_chain import InsanityMarkovChain
+
+
+def constant_chain(pmf, stop_at_red_swirl: bool = True) -> InsanityMarkovChain:
+    """Chain with the same tentacle distribution at every slot."""
+    return InsanityMarkovChain(lambda slot: np.array(pmf), stop_at_red_swirl=stop_at_red_swirl)
+
+
+class TestInsanityMarkovChain:
+    """Test InsanityMarkovChain."""
+
+    def test_transitions_match_track(self):
+        """Each transition lands where InsanityTrack.take_tentacles_in_roll does."""
+        chain = constant_chain([1.0])
+        for slot in range(1, 21):
+            for tentacles in range(0, 6):
+                track = InsanityTrack(current_insanity=slot)
+                track.take_tentacles_in_roll(tentacles)
+                assert chain._next_slot(slot, tentacles) == track.current_insanity
+
+    def test_rows_are_stochastic(self):
+        """Every row of the transition matrix sums to one."""
+        chain = InsanityMarkovChain.from_pool(3, 0)
+
+        assert chain.transition.shape == (21, 21)
+        np.testing.assert_allclose(chain.transition.sum(axis=1), 1.0)
+        assert np.allclose(np.tril(chain.transition, -1), 0.0)
+
+    def test_one_tentacle_per_roll(self):
+        """Exactly one tentacle per roll takes 20 rolls to die."""
+        chain = constant_chain([0.0, 1.0])
+
+        assert chain.expected_rolls_to_death() == pytest.approx(20.0)
+        assert chain.expected_red_swirl_arrivals()[1] == pytest.approx(4.0)
+        survival = chain.survival_curve(horizon=25)
+        assert survival[19] == pytest.approx(1.0)
+        assert survival[20] == pytest.approx(0.0)
+
+    def test_geometric_rolls(self):
+        """With P(1 tentacle) = 1/2 each slot takes two rolls on average."""
+        chain = constant_chain([0.5, 0.5])
+
+        assert chain.expected_rolls_to_death() == pytest.approx(40.0)
+        arrivals = chain.arrival_time_distribution(5, horizon=400)
+        assert arrivals.sum() == pytest.approx(1.0)
+        assert np.dot(np.arange(arrivals.size), arrivals) == pytest.approx(8.0)
+
+    def test_stop_at_swirl_hits_every_swirl(self):
+        """Stopping at red swirls means every swirl is landed on."""
+        chain = constant_chain([0.2, 0.2, 0.3, 0.3])
+        hits = chain.hitting_probabilities()
+
+        for swirl in InsanityTrack().red_swirl_slots:
+            assert hits[swirl] == pytest.approx(1.0)
+        assert hits[2] < 1.0
+
+    def test_no_stop_can_skip_swirls(self):
+        """Without the stop rule a big roll can jump over a swirl."""
+        chain = constant_chain([0.0, 0.0, 1.0], stop_at_red_swirl=False)
+
+        assert chain.hitting_probabilities()[5] == pytest.approx(1.0)
+        assert chain.hitting_probabilities()[9] == pytest.approx(1.0)
+        assert chain.hitting_probabilities()[4] == pytest.approx(0.0)
+
+    def test_green_dice_pool(self):
+        """Red swirl green dice are folded into each slot's pool."""
+        with_green = InsanityMarkovChain.from_pool(3, 1)
+        without = InsanityMarkovChain.from_pool(3, 0)
+
+        assert without.expected_rolls_to_death() > 0
+        # Green dice have no tentacle faces, so extra green dice leave survival unchanged
+        assert with_green.expected_rolls_to_death() == pytest.approx(
+            without.expected_rolls_to_death()
+        )
+        swirls = without.red_swirl_arrival_times(horizon=300)
+        assert sorted(swirls) == [1, 2, 3, 4, 5, 6]
+        assert all(dist.sum() == pytest.approx(1.0) for dist in swirls.values())
+
+    def test_unescapable_slot(self):
+        """A pool with no tentacles never dies."""
+        chain = constant_chain([1.0])
+
+        assert chain.expected_rolls_to_death() == float("inf")
+        with pytest.raises(ValueError):
+            chain.hitting_probabilities()
+
+    def test_start_slot_out_of_range(self):
+        """Slots outside the track raise ValueError."""
+        with pytest.raises(ValueError):
+            constant_chain([0.0, 1.0]).index(0)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Unit tests for confidence-driven OCR cascades.
+"""
+
+import pytest
+
+from scripts.core.parsing.layout import is_valid_description, score_description_text
+from scripts.core.parsing.ocr_cascade import CascadeHistory, run_cascade
+from scripts.core.parsing.tesseract_engine import OCRReading
+
+
+def counting(calls: list, name: str, value):
+    """Candidate function returning ``value`` and recording that it ran."""
+
+    def run():
+        calls.append(name)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return run
+
+
+class TestCascadeHistory:
+    """Test CascadeHistory."""
+
+    def test_unseen_candidates_keep_declared_order(self):
+        """Test the cold-start order is the order given."""
+        history = CascadeHistory(path=None)
+
+        assert history.order("field", ["a", "b", "c"]) == ["a", "b", "c"]
+
+    def test_cheap_reliable_candidates_move_first(self):
+        """Test candidates are ordered by acceptance rate per second."""
+        history = CascadeHistory(path=None)
+        for _ in range(5):
+            history.record("field", "slow", seconds=2.0, accepted=True)
+            history.record("field", "unreliable", seconds=0.1, accepted=False)
+            history.record("field", "fast", seconds=0.1, accepted=True)
+
+        assert history.order("field", ["slow", "unreliable", "fast"]) == [
+            "fast",
+            "unreliable",
+            "slow",
+        ]
+        assert history.order("other", ["slow", "fast"]) == ["slow", "fast"]
+
+    def test_history_persists(self, tmp_path):
+        """Test history is saved as JSON and reloaded."""
+        path = tmp_path / "cascade_stats.json"
+        history = CascadeHistory(path=path)
+        history.record("field", "a", seconds=0.5, accepted=True)
+        history.save()
+
+        stats = CascadeHistory(path=path).get("field", "a")
+        assert (stats.attempts, stats.accepted, stats.seconds) == (1, 1, 0.5)
+
+    def test_unreadable_history_starts_empty(self, tmp_path):
+        """Test a corrupt history file is ignored."""
+        path = tmp_path / "cascade_stats.json"
+        path.write_text("{not json")
+
+        assert CascadeHistory(path=path).get("field", "a").attempts == 0
+
+
+class TestRunCascade:
+    """Test run_cascade."""
+
+    def test_stops_at_first_accepted(self):
+        """Test later candidates don't run once one is accepted."""
+        calls = []
+        result = run_cascade(
+            "field",
+            [
+                ("short", counting(calls, "short", "ab")),
+                ("good", counting(calls, "good", "abcdef")),
+                ("never", counting(calls, "never", "abcdefgh")),
+            ],
+            accept=lambda text: len(text) > 4,
+            score=len,
+            exhaustive=False,
+        )
+
+        assert calls == ["short", "good"]
+        assert (result.value, result.name, result.accepted, result.attempts) == (
+            "abcdef",
+            "good",
+            True,
+            2,
+        )
+
+    def test_falls_back_to_best_score(self):
+        """Test the best-scoring result is returned when none is accepted."""
+        result = run_cascade(
+            "field",
+            [("a", lambda: "abc"), ("b", lambda: "abcde"), ("c", lambda: "a")],
+            accept=lambda text: False,
+            score=len,
+            exhaustive=False,
+        )
+
+        assert (result.value, result.name, result.accepted) == ("abcde", "b", False)
+        assert [name for name, _ in result.results] == ["a", "b", "c"]
+
+    def test_exhaustive_runs_every_candidate(self):
+        """Test exhaustive mode keeps the best score even after an acceptance."""
+        calls = []
+        result = run_cascade(
+            "field",
+            [("a", counting(calls, "a", "abcde")), ("b", counting(calls, "b", "abcdefg"))],
+            accept=lambda text: len(text) > 4,
+            score=len,
+            exhaustive=True,
+        )
+
+        assert calls == ["a", "b"]
+        assert (result.value, result.accepted) == ("abcdefg", True)
+
+    def test_failures_are_recorded_and_skipped(self):
+        """Test a raising candidate counts as a rejected attempt."""
+        history = CascadeHistory(path=None)
+        result = run_cascade(
+            "field",
+            [("broken", counting([], "broken", RuntimeError("no tesseract"))), ("ok", lambda: "x")],
+            accept=bool,
+            score=len,
+            history=history,
+            exhaustive=False,
+        )
+
+        assert result.name == "ok"
+        assert history.get("field", "broken").attempts == 1
+        assert history.get("field", "broken").accepted == 0
+        assert history.get("field", "ok").accepted == 1
+
+    def test_history_reorders_next_run(self):
+        """Test a candidate accepted last time runs first next time."""
+        history = CascadeHistory(path=None)
+        candidates = [("a", lambda: ""), ("b", lambda: "text")]
+        run_cascade("field", candidates, accept=bool, score=len, history=history, exhaustive=False)
+
+        calls = []
+        run_cascade(
+            "field",
+            [("a", counting(calls, "a", "")), ("b", counting(calls, "b", "text"))],
+            accept=bool,
+            score=len,
+            history=history,
+            exhaustive=False,
+        )
+
+        assert calls == ["b"]
+
+    def test_all_failures_return_empty(self):
+        """Test no value is returned when every candidate fails."""
+        result = run_cascade(
+            "field",
+            [("a", counting([], "a", ValueError()))],
+            accept=bool,
+            score=len,
+            exhaustive=False,
+        )
+
+        assert (result.value, result.name, result.accepted, result.attempts) == (
+            None,
+            None,
+            False,
+            1,
+        )
+
+
+class TestDescriptionAcceptance:
+    """Test description validation used by the description cascade."""
+
+    PROSE = "He walked the docks at night listening for the old songs beneath the waves."
+
+    def test_confident_prose_is_accepted(self):
+        """Test confident multi-word prose passes."""
+        reading = OCRReading(text=self.PROSE, word_confidences=[90.0] * 15)
+
+        assert is_valid_description(reading, min_confidence=75)
+
+    @pytest.mark.parametrize(
+        "text, confidence",
+        [
+            (PROSE, 60.0),
+            ("Too short to be a description", 95.0),
+            ("|~ ## @@ " * 4 + PROSE, 95.0),
+        ],
+    )
+    def test_rejected_readings(self, text, confidence):
+        """Test low confidence, short or noisy readings are rejected."""
+        reading = OCRReading(text=text, word_confidences=[confidence] * 15)
+
+        assert not is_valid_description(reading, min_confidence=75)
+
+    def test_score_prefers_longer_cleaner_text(self):
+        """Test the fallback score matches the length-and-words ranking."""
+        assert score_description_text("   ") == 0
+        assert score_description_text("one two") == 7 + 10
+        assert score_description_text("one two") > score_description_text("one @@")
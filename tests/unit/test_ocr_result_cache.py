@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent OCR result cache.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from scripts.core.parsing import ocr_result_cache
+from scripts.core.parsing.ocr_engines import PIPELINE_BASIC, OCRStrategy
+from scripts.core.parsing.ocr_result_cache import (
+    OCRResultCache,
+    cached_ocr,
+    hash_array,
+    hash_file,
+    make_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty on-disk cache."""
+    return OCRResultCache(tmp_path / "results.sqlite", max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def shared_cache(monkeypatch, cache):
+    """Use an on-disk cache as the shared cache."""
+    monkeypatch.setattr(ocr_result_cache, "_default_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def card_image(tmp_path):
+    """Small test image written to disk."""
+    path = tmp_path / "card.png"
+    cv2.imwrite(str(path), np.full((20, 30), 200, dtype=np.uint8))
+    return path
+
+
+class TestKeys:
+    """Test content hashing and key construction."""
+
+    def test_every_input_changes_the_key(self):
+        """Test content, box, strategy, engine version and config all matter."""
+        base = ("hash", None, "strategy", "5.3.0", "--psm 6")
+        variants = [
+            ("other", None, "strategy", "5.3.0", "--psm 6"),
+            ("hash", (0, 0, 10, 10), "strategy", "5.3.0", "--psm 6"),
+            ("hash", None, "other", "5.3.0", "--psm 6"),
+            ("hash", None, "strategy", "5.4.0", "--psm 6"),
+            ("hash", None, "strategy", "5.3.0", "--psm 7"),
+        ]
+        keys = {make_key(*base)} | {make_key(*variant) for variant in variants}
+
+        assert len(keys) == 6
+        assert make_key(*base) == make_key(*base)
+
+    def test_hashes_follow_content(self, tmp_path):
+        """Test identical content hashes equal wherever it is stored."""
+        first, second = tmp_path / "a.bin", tmp_path / "b.bin"
+        first.write_bytes(b"pixels")
+        second.write_bytes(b"pixels")
+
+        assert hash_file(first) == hash_file(second)
+        second.write_bytes(b"other pixels")
+        assert hash_file(first) != hash_file(second)
+
+        image = np.zeros((4, 6), dtype=np.uint8)
+        assert hash_array(image) == hash_array(image.copy())
+        assert hash_array(image) != hash_array(image.reshape(6, 4))
+
+
+class TestOCRResultCache:
+    """Test OCRResultCache."""
+
+    def test_hit_and_miss_counts(self, cache):
+        """Test a stored result is served on the next lookup."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "text"
+
+        assert cache.get_or_compute("k", compute) == "text"
+        assert cache.get_or_compute("k", compute) == "text"
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_results_persist_across_instances(self, tmp_path):
+        """Test a new cache on the same file sees earlier results."""
+        path = tmp_path / "results.sqlite"
+        OCRResultCache(path).put("k", "persisted")
+
+        assert OCRResultCache(path).get("k") == "persisted"
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test the size budget evicts the oldest untouched entry."""
+        text = "x" * 100
+        entry_size = len("k1") + len(text) + ocr_result_cache.ROW_OVERHEAD_BYTES
+        cache.max_bytes = 2 * entry_size
+
+        cache.put("k1", text)
+        cache.put("k2", text)
+        cache.get("k1")  # refresh k1
+        cache.put("k3", text)
+
+        assert cache.evictions == 1
+        assert cache.get("k2") is None
+        assert cache.get("k1") == text and cache.get("k3") == text
+        assert cache.total_bytes() <= cache.max_bytes
+
+    def test_puts_keep_a_running_size(self, cache):
+        """Test puts track stored bytes without summing the table each time."""
+        cache.put("k0", "seed")
+        statements = []
+        cache._connection().set_trace_callback(statements.append)
+
+        cache.put("k1", "text")
+        cache.put("k1", "longer text")
+        cache.put("k2", "text")
+
+        assert not any("SUM(size)" in statement for statement in statements)
+        assert cache._local.stored_bytes == cache.total_bytes()
+
+    def test_failures_are_not_stored(self, cache):
+        """Test exceptions propagate without caching anything."""
+
+        def fail():
+            raise RuntimeError("tesseract crashed")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", fail)
+        assert cache.entry_count() == 0
+
+    def test_disabled_cache_always_computes(self):
+        """Test a disabled cache never stores results."""
+        cache = OCRResultCache(enabled=False)
+        cache.put("k", "text")
+
+        assert cache.get("k") is None
+        assert cache.entry_count() == 0
+
+
+class TestTransparentCaching:
+    """Test OCR entry points consult the shared cache."""
+
+    def test_cached_ocr_uses_shared_cache(self, shared_cache):
+        """Test the convenience function stores in the shared cache."""
+        cached_ocr("hash", (1, 2, 3, 4), "region", "v1", (6, 3), lambda: "first")
+
+        assert cached_ocr("hash", (1, 2, 3, 4), "region", "v1", (6, 3), lambda: "x") == "first"
+
+    def test_strategy_extract_is_cached(self, shared_cache, card_image):
+        """Test a strategy reads an image once and serves repeats from the cache."""
+        calls = []
+
+        def fake_ocr(image):
+            calls.append(image.shape)
+            return " card text "
+
+        strategy = OCRStrategy("fake_basic", PIPELINE_BASIC, fake_ocr)
+
+        assert strategy.extract(card_image) == "card text"
+        assert strategy.extract(card_image) == "card text"
+        assert calls == [(20, 30)]
+
+        # Editing the image invalidates its results
+        cv2.imwrite(str(card_image), np.full((20, 30), 50, dtype=np.uint8))
+        strategy.extract(card_image)
+        assert len(calls) == 2
+
+    def test_failed_strategy_is_retried(self, shared_cache, card_image):
+        """Test OCR errors return empty text without being cached."""
+        calls = []
+
+        def broken_ocr(image):
+            calls.append(1)
+            raise RuntimeError("engine unavailable")
+
+        strategy = OCRStrategy("broken", PIPELINE_BASIC, broken_ocr)
+
+        assert strategy.extract(card_image) == ""
+        assert strategy.extract(card_image) == ""
+        assert len(calls) == 2
+
+    def test_region_results_follow_preprocessing_settings(
+        self, shared_cache, card_image, monkeypatch
+    ):
+        """Test changing the TOML preprocessing settings invalidates region results."""
+        from scripts.utils import ocr
+
+        calls = []
+
+        def fake_image_to_string(image, psm, oem=3):
+            calls.append(psm)
+            return "region text"
+
+        monkeypatch.setattr(ocr, "tesseract_image_to_string", fake_image_to_string)
+
+        ocr.extract_text_from_image_region(card_image, 0, 0, 10, 10, psm_mode=7)
+        ocr.extract_text_from_image_region(card_image, 0, 0, 10, 10, psm_mode=7)
+        assert len(calls) == 1
+
+        denoise_strength = ocr._ocr_settings.ocr_preprocessing_denoise_strength + 5
+        monkeypatch.setattr(
+            ocr._ocr_settings, "ocr_preprocessing_denoise_strength", denoise_strength
+        )
+        ocr.extract_text_from_image_region(card_image, 0, 0, 10, 10, psm_mode=7)
+        assert len(calls) == 2
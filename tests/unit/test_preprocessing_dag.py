@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for preprocessing pipelines and the shared DAG executor.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from scripts.core.parsing import image_cache, preprocessing_dag
+from scripts.core.parsing.image_cache import ImageCache
+from scripts.core.parsing.ocr_engines import PIPELINE_ENHANCED, OCRStrategy
+from scripts.core.parsing.preprocessing_dag import PreprocessingDAG, run_pipeline
+
+GRAY_OTSU = (("gray",), ("otsu",))
+GRAY_CLAHE_OTSU = (("gray",), ("clahe", 2.0, 8), ("otsu",))
+GRAY_CLAHE_EQUALIZE = (("gray",), ("clahe", 2.0, 8), ("equalize",))
+
+
+@pytest.fixture
+def card_image(tmp_path):
+    """Small noisy test image written to disk."""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(40, 60, 3), dtype=np.uint8)
+    path = tmp_path / "card.png"
+    cv2.imwrite(str(path), image)
+    return path
+
+
+@pytest.fixture
+def operation_calls(monkeypatch):
+    """Count operation executions with a fresh shared cache."""
+    monkeypatch.setattr(image_cache, "_default_cache", ImageCache(1024 * 1024))
+    calls = []
+    counted = {}
+    for name, operation in preprocessing_dag.OPERATIONS.items():
+
+        def wrapper(image, *params, _name=name, _operation=operation):
+            calls.append(_name)
+            return _operation(image, *params)
+
+        counted[name] = wrapper
+    monkeypatch.setattr(preprocessing_dag, "OPERATIONS", counted)
+    return calls
+
+
+class TestPreprocessingDAG:
+    """Test PreprocessingDAG."""
+
+    def test_shared_prefixes_are_merged(self):
+        """Test compiling merges duplicate pipelines and common prefixes."""
+        dag = PreprocessingDAG([GRAY_OTSU, GRAY_CLAHE_OTSU, GRAY_CLAHE_EQUALIZE, GRAY_OTSU])
+
+        assert len(dag.pipelines) == 3
+        # gray, gray>otsu, gray>clahe, gray>clahe>otsu, gray>clahe>equalize
+        assert dag.operation_count == 5
+
+    def test_each_prefix_runs_once(self, card_image, operation_calls):
+        """Test a run executes every distinct operation exactly once."""
+        dag = PreprocessingDAG([GRAY_OTSU, GRAY_CLAHE_OTSU, GRAY_CLAHE_EQUALIZE])
+        outputs = dag.run(card_image)
+
+        assert sorted(operation_calls) == ["clahe", "equalize", "gray", "otsu", "otsu"]
+        assert set(outputs) == set(dag.pipelines)
+
+    def test_cached_prefixes_are_not_recomputed(self, card_image, operation_calls):
+        """Test a second run is served entirely from the image cache."""
+        dag = PreprocessingDAG([GRAY_CLAHE_OTSU])
+        first = dag.run(card_image)
+        operation_calls.clear()
+        second = dag.run(card_image)
+
+        assert operation_calls == []
+        np.testing.assert_array_equal(first[GRAY_CLAHE_OTSU], second[GRAY_CLAHE_OTSU])
+
+    def test_outputs_match_direct_computation(self, card_image, operation_calls):
+        """Test pipeline outputs equal the equivalent OpenCV calls."""
+        gray = cv2.cvtColor(cv2.imread(str(card_image)), cv2.COLOR_BGR2GRAY)
+        enhanced = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+        _, expected = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+        np.testing.assert_array_equal(run_pipeline(card_image, GRAY_CLAHE_OTSU), expected)
+
+    def test_unknown_operation_raises(self):
+        """Test pipelines naming unknown operations are rejected when compiled."""
+        with pytest.raises(ValueError):
+            PreprocessingDAG([(("gray",), ("sparkle", 3))])
+
+
+class TestPipelineStrategies:
+    """Test OCRStrategy with declared pipelines."""
+
+    def test_strategy_accepts_pipeline(self, card_image, operation_calls):
+        """Test a pipeline strategy preprocesses through the DAG."""
+        seen = []
+
+        def fake_ocr(image):
+            seen.append(image.shape)
+            return " text \n"
+
+        strategy = OCRStrategy("fake", PIPELINE_ENHANCED, fake_ocr)
+
+        assert strategy.pipeline == PIPELINE_ENHANCED
+        assert strategy.extract(card_image) == "text"
+        assert seen == [(40, 60)]
+        assert operation_calls == ["gray", "clahe", "otsu", "nl_means"]
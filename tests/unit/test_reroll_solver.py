@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the optimal reroll policy solver.
+"""
+
+import pytest
+
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.game_mechanics import DiceFaceSymbol, DiceType
+from scripts.models.power_combination import (
+    PowerCombination,
+    PowerCombinationCalculator,
+    PowerEffect,
+)
+from scripts.models.reroll_solver import RerollPolicySolver, get_reroll_solver
+
+
+def black_counts(solver: RerollPolicySolver, *faces) -> tuple:
+    """Build a black face-count tuple from (successes, tentacles, elder) faces."""
+    return tuple(faces.count(face) for face in solver.black_faces)
+
+
+class TestRerollPolicySolver:
+    """Test RerollPolicySolver."""
+
+    def test_no_rerolls_matches_distribution(self):
+        """Without rerolls the solution equals the plain roll distribution."""
+        solution = RerollPolicySolver(2).solve(3, 2, 0)
+        plain = get_roll_distribution(3, 2)
+
+        assert solution.success_probability == pytest.approx(
+            plain.prob_at_least(DiceFaceSymbol.SUCCESS, 2)
+        )
+        assert solution.reroll_gain == pytest.approx(0.0)
+        assert solution.expected_rerolls_used == 0.0
+        assert solution.distribution.pmf == pytest.approx(plain.pmf)
+
+    def test_single_die_single_reroll(self):
+        """One black die, one reroll: P(>=1 success) = 1/2 + 1/2 * 1/2."""
+        solution = RerollPolicySolver(1).solve(1, 0, 1)
+
+        assert solution.base_success_probability == pytest.approx(0.5)
+        assert solution.success_probability == pytest.approx(0.75)
+        assert solution.expected_rerolls_used == pytest.approx(0.5)
+
+    def test_two_dice_need_both(self):
+        """Two black dice, one reroll, target 2: 1/4 + P(one success) * 1/2."""
+        solution = RerollPolicySolver(2).solve(2, 0, 1)
+
+        assert solution.success_probability == pytest.approx(0.25 + 0.5 * 0.5)
+
+    def test_distribution_is_normalized(self):
+        """Final distribution under the policy sums to one and matches the score."""
+        solution = RerollPolicySolver(3).solve(3, 2, 2)
+        dist = solution.distribution
+
+        assert dist.pmf.sum() == pytest.approx(1.0)
+        assert dist.prob_at_least(DiceFaceSymbol.SUCCESS, 3) == pytest.approx(
+            solution.success_probability
+        )
+        assert solution.success_probability > solution.base_success_probability
+
+    def test_prefers_rerolling_tentacle(self):
+        """Among failed black dice, reroll the tentacle to lower tentacle risk."""
+        solver = RerollPolicySolver(1)
+        state = black_counts(solver, (0, 1, 0), (0, 0, 0))
+
+        assert solver.best_action(state, (0,) * len(solver.green_faces), 1) == (
+            DiceType.BLACK,
+            (0, 1, 0),
+        )
+
+    def test_stops_when_target_met_without_tentacles(self):
+        """No reroll is taken when it cannot improve either objective."""
+        solver = RerollPolicySolver(1)
+        state = black_counts(solver, (1, 0, 0), (0, 0, 0))
+
+        assert solver.best_action(state, (0,) * len(solver.green_faces), 2) is None
+
+    def test_elder_conversion_counts_toward_target(self):
+        """Elder signs that count as successes raise the success probability."""
+        plain = RerollPolicySolver(2).solve(3, 1, 1)
+        converted = RerollPolicySolver(2, elder_signs_as_successes=1).solve(3, 1, 1)
+        unlimited = RerollPolicySolver(2, elder_signs_as_successes=None).solve(3, 1, 1)
+
+        assert converted.success_probability > plain.success_probability
+        assert unlimited.success_probability >= converted.success_probability
+
+    def test_batch_shares_memo(self):
+        """Batch solving reuses states and caches per-pool solutions."""
+        solver = get_reroll_solver(2)
+        results = solver.solve_batch([(3, 0, 1), (3, 1, 1), (3, 0, 1)])
+
+        assert len(results) == 2
+        assert solver.solve(3, 0, 1) is results[(3, 0, 1)]
+        assert solver.states_evaluated > 0
+
+    def test_negative_counts_rejected(self):
+        """Negative inputs raise ValueError."""
+        with pytest.raises(ValueError):
+            RerollPolicySolver(1).solve(1, 0, -1)
+
+
+class TestCalculatorWithRerolls:
+    """Test PowerCombinationCalculator.calculate_with_rerolls."""
+
+    def test_rerolls_increase_success_probability(self):
+        """A combination with rerolls beats the same dice without them."""
+        combination = PowerCombination(
+            effects=[PowerEffect(power_name="Lucky", level=1, rerolls_added=2)]
+        )
+        stats = PowerCombinationCalculator().calculate_with_rerolls(combination, 2)
+
+        assert stats["rerolls"] == 2
+        assert stats["prob_at_least_target"] > stats["prob_at_least_target_without_rerolls"]
+        assert stats["reroll_gain"] > 0
+        assert stats["expected_successes"] > 1.5
+
+
+class TestCalculatorWithElderConversion:
+    """Test PowerCombinationCalculator.calculate_with_elder_conversion."""
+
+    @staticmethod
+    def combination(cap) -> PowerCombination:
+        """Three black, two green dice with one conversion effect."""
+        effect = PowerEffect(power_name="Arcane", level=1, elder_signs_as_successes=cap)
+        return PowerCombination(base_black_dice=3, base_green_dice=2, effects=[effect])
+
+    def test_no_conversion_leaves_base_stats(self):
+        """Effects without conversion don't change success statistics."""
+        stats = PowerCombinationCalculator().calculate_with_elder_conversion(self.combination(0))
+        plain = get_roll_distribution(3, 2)
+
+        assert "elder_signs_converted" not in stats
+        assert stats["expected_successes"] == pytest.approx(plain.expected(DiceFaceSymbol.SUCCESS))
+
+    def test_cap_limits_converted_elder_signs(self):
+        """A cap of 1 converts P(at least 1 elder sign) per roll, not the full expectation."""
+        calculator = PowerCombinationCalculator()
+        capped = calculator.calculate_with_elder_conversion(self.combination(1))
+        unlimited = calculator.calculate_with_elder_conversion(self.combination(None))
+        plain = get_roll_distribution(3, 2)
+
+        assert capped["elder_signs_converted"] == pytest.approx(
+            plain.prob_at_least(DiceFaceSymbol.ELDER_SIGN, 1)
+        )
+        assert unlimited["elder_signs_converted"] == pytest.approx(
+            plain.expected(DiceFaceSymbol.ELDER_SIGN)
+        )
+        assert capped["elder_signs_converted"] < unlimited["elder_signs_converted"]
+
+    def test_conversion_updates_threshold_probability(self):
+        """Converted elder signs raise P(at least 1 success)."""
+        stats = PowerCombinationCalculator().calculate_with_elder_conversion(self.combination(1))
+        plain = get_roll_distribution(3, 2)
+
+        assert stats["prob_at_least_1_success"] == pytest.approx(
+            get_roll_distribution(3, 2, 1).prob_at_least(DiceFaceSymbol.SUCCESS, 1)
+        )
+        assert stats["prob_at_least_1_success"] > plain.prob_at_least(DiceFaceSymbol.SUCCESS, 1)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the sharded simulation runner.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.models.character import CharacterData
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.dice_distribution import get_roll_distribution
+from scripts.models.dice_simulation import BonusDiceRule
+from scripts.models.game_mechanics import DiceFaceSymbol
+from scripts.models.simulation_runner import (
+    ShardedSimulationRunner,
+    SimulationTask,
+    merge_histograms,
+    tasks_from_pool,
+)
+
+
+class TestShardedSimulationRunner:
+    """Test ShardedSimulationRunner."""
+
+    def test_shards_cover_rolls(self):
+        """Shards split each task's rolls exactly."""
+        runner = ShardedSimulationRunner(seed=1, shard_rolls=300)
+        shards = runner.shards([SimulationTask(label="a", rolls=1000)])
+
+        assert [rolls for _, _, rolls in shards] == [300, 300, 300, 100]
+
+    def test_results_independent_of_workers(self):
+        """The same seed gives identical histograms in-process and across processes."""
+        tasks = [
+            SimulationTask(label="plain", black_dice=3, rolls=40_000),
+            SimulationTask(
+                label="bonus", black_dice=2, rules=[BonusDiceRule(green_dice=1)], rolls=30_000
+            ),
+        ]
+        inline = ShardedSimulationRunner(seed=3, workers=1, shard_rolls=10_000).run(tasks)
+        pooled = ShardedSimulationRunner(seed=3, workers=2, shard_rolls=10_000).run(tasks)
+
+        for label in ("plain", "bonus"):
+            np.testing.assert_array_equal(inline[label].histogram, pooled[label].histogram)
+        assert inline["plain"].rolls == 40_000
+        assert inline["bonus"].green_dice == 1
+
+    def test_aggregate_matches_exact(self):
+        """Merged shards estimate the exact distribution."""
+        results = ShardedSimulationRunner(seed=5, workers=1, shard_rolls=50_000).run(
+            [SimulationTask(label="pool", black_dice=2, green_dice=2, rolls=200_000)]
+        )
+
+        assert results["pool"].expected(DiceFaceSymbol.SUCCESS) == pytest.approx(
+            get_roll_distribution(2, 2).expected(DiceFaceSymbol.SUCCESS), abs=0.01
+        )
+
+    def test_duplicate_labels_rejected(self):
+        """Task labels must be unique."""
+        with pytest.raises(ValueError):
+            ShardedSimulationRunner(workers=1).run(
+                [SimulationTask(label="x", rolls=10), SimulationTask(label="x", rolls=10)]
+            )
+
+
+class TestTasksFromPool:
+    """Test building sweep tasks from a character pool."""
+
+    def test_one_task_per_level_combination(self):
+        """Each character gets one task per requested level combination."""
+        character = CharacterData(name="Tester", common_powers=["Marksman", "Stealth"])
+        pool = CharacterPool(characters=[CharacterBuild.from_character_data(character)])
+        tasks = tasks_from_pool(pool, [(1, 1, 1), (2, 3, 4)], power_data={}, rolls=100)
+
+        assert [task.label for task in tasks] == ["Tester/1/1/1", "Tester/2/3/4"]
+
+
+def test_merge_histograms_pads_shapes():
+    """Histograms with different trimmed shapes are summed."""
+    merged = merge_histograms(
+        [np.ones((2, 1, 1), dtype=np.int64), np.ones((1, 2, 3), dtype=np.int64)]
+    )
+
+    assert merged.shape == (2, 2, 3)
+    assert merged.sum() == 8
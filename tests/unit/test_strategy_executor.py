@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for parallel OCR strategy execution.
+"""
+
+import os
+
+import pytest
+
+from scripts.core.parsing.ocr_engines import OCRStrategy, get_all_strategies
+from scripts.core.parsing.strategy_executor import StrategyExecutor, _call_in_worker
+
+
+def describe(strategy: OCRStrategy, suffix: str) -> tuple:
+    """Strategy name, a passed-through argument and the worker's thread limit."""
+    return strategy.name, suffix, os.environ.get("OMP_THREAD_LIMIT")
+
+
+@pytest.fixture(scope="module")
+def strategy_names():
+    """Names of every registered strategy, reversed to check ordering."""
+    return [strategy.name for strategy in get_all_strategies()][::-1]
+
+
+class TestStrategyExecutor:
+    """Test StrategyExecutor."""
+
+    def test_in_process_results_are_ordered(self, strategy_names):
+        """Test a single worker runs in this process in the requested order."""
+        results = list(StrategyExecutor(workers=1).map(describe, strategy_names, "x"))
+
+        assert [name for name, _, _ in results] == strategy_names
+        assert {suffix for _, suffix, _ in results} == {"x"}
+
+    def test_process_pool_caps_threads_and_keeps_order(self, strategy_names):
+        """Test workers cap OMP threads and results come back in order."""
+        executor = StrategyExecutor(workers=2, thread_limit=1)
+        results = list(executor.map(describe, strategy_names[:6], "y"))
+
+        assert [name for name, _, _ in results] == strategy_names[:6]
+        assert {limit for _, _, limit in results} == {"1"}
+
+    def test_invalid_settings_raise(self):
+        """Test non-positive worker counts and thread limits are rejected."""
+        with pytest.raises(ValueError):
+            StrategyExecutor(workers=0)
+        with pytest.raises(ValueError):
+            StrategyExecutor(thread_limit=0)
+
+    def test_uninitialized_worker_raises(self):
+        """Test a worker call without the pool initializer fails clearly."""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            _call_in_worker(len, "basic", ())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for team composition search.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from scripts.models.character import CharacterData
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.team_search import (
+    TeamFeatures,
+    TeamSearch,
+    TeamWeights,
+    find_best_teams,
+)
+
+
+def random_features(count: int, seed: int = 0) -> TeamFeatures:
+    """Random features with sparse healing and rerolls."""
+    rng = np.random.default_rng(seed)
+    additive = rng.normal(1.5, 0.4, count)
+    complementary = rng.integers(0, 3, size=(count, 4)) * (rng.random((count, 4)) < 0.3)
+    return TeamFeatures([f"C{i}" for i in range(count)], additive, complementary.astype(float))
+
+
+def brute_force(features: TeamFeatures, weights: TeamWeights, size: int, top_k: int):
+    """Scores of the top-K teams by exhaustive search."""
+    caps = weights.complementary_caps()
+    w = weights.complementary_weights()
+    scores = [
+        features.additive[list(team)].sum()
+        + np.dot(w, np.minimum(features.complementary[list(team)].sum(axis=0), caps))
+        for team in itertools.combinations(range(len(features.names)), size)
+    ]
+    return sorted(scores, reverse=True)[:top_k]
+
+
+class TestTeamSearch:
+    """Test TeamSearch."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 4])
+    def test_matches_brute_force(self, size):
+        """Branch-and-bound returns the exhaustive top-K scores."""
+        features = random_features(18, seed=size)
+        weights = TeamWeights()
+        search = TeamSearch(features, weights, team_size=size, top_k=5)
+        results = search.search()
+
+        assert [r.score for r in results] == pytest.approx(brute_force(features, weights, size, 5))
+        assert all(len(set(r.members)) == size for r in results)
+
+    def test_negative_weights_rejected(self):
+        """Negative weights would invalidate the branch-and-bound upper bound."""
+        with pytest.raises(ValidationError):
+            TeamWeights(reroll_weight=-1.0)
+
+    def test_pruning_and_breakdown(self):
+        """Larger pools prune partial teams and breakdowns sum to the score."""
+        search = TeamSearch(random_features(40), top_k=3)
+        best = search.search()[0]
+
+        assert search.pruned > 0
+        assert sum(best.breakdown.values()) == pytest.approx(best.score)
+        assert search.score(best.members).score == pytest.approx(best.score)
+
+    def test_workers_agree(self):
+        """Multi-process search returns the same teams."""
+        features = random_features(25, seed=3)
+        single = TeamSearch(features, top_k=4, workers=1).search()
+        multi = TeamSearch(features, top_k=4, workers=2).search()
+
+        assert [r.score for r in multi] == pytest.approx([r.score for r in single])
+        assert [r.members for r in multi] == [r.members for r in single]
+
+    def test_tied_teams_independent_of_workers(self):
+        """Ties at the top-K boundary resolve the same way serially and in parallel."""
+        # Integer features make many teams score exactly the same
+        rng = np.random.default_rng(14)
+        additive = rng.integers(1, 3, 16).astype(float)
+        complementary = rng.integers(0, 2, (16, 4)) * (rng.random((16, 4)) < 0.3)
+        features = TeamFeatures([f"C{i}" for i in range(16)], additive, complementary.astype(float))
+        single = TeamSearch(features, top_k=10, workers=1).search()
+        for workers in (2, 3):
+            multi = TeamSearch(features, top_k=10, workers=workers).search()
+            assert [r.members for r in multi] == [r.members for r in single]
+
+    def test_complementarity_prefers_coverage(self):
+        """A healer beats a slightly stronger duplicate of an existing role."""
+        names = ["Striker", "Striker 2", "Healer"]
+        features = TeamFeatures(
+            names,
+            np.array([2.0, 1.9, 1.5]),
+            np.array([[0, 0, 2, 0], [0, 0, 2, 0], [2, 0, 0, 0]], dtype=float),
+        )
+        best = TeamSearch(features, team_size=2, top_k=1).search()[0]
+
+        assert sorted(best.members) == ["Healer", "Striker"]
+
+    def test_small_pool(self):
+        """Pools smaller than a team return nothing."""
+        assert TeamSearch(random_features(3), team_size=4).search() == []
+
+
+def test_find_best_teams_from_pool():
+    """Teams are searched from a character pool's builds."""
+    pool = CharacterPool(
+        characters=[
+            CharacterBuild.from_character_data(CharacterData(name=f"Investigator {i}"))
+            for i in range(6)
+        ]
+    )
+    teams = find_best_teams(pool, power_data={}, top_k=2, workers=1)
+
+    assert len(teams) == 2
+    assert len(teams[0].members) == 4
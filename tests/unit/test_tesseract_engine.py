@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent Tesseract engine.
+
+libtesseract isn't required: the native path is exercised against a fake C
+API that records calls.
+"""
+
+import ctypes
+import threading
+
+import numpy as np
+import pytest
+
+from scripts.core.parsing import tesseract_engine
+from scripts.core.parsing.tesseract_engine import TesseractEngine, reading_from_data
+
+
+class FakeTessLib:
+    """Records libtesseract C API calls."""
+
+    def __init__(self, init_status: int = 0):
+        """Initialize with the status TessBaseAPIInit2 returns."""
+        self.init_status = init_status
+        self.created = 0
+        self.calls = []
+        self._texts = []
+
+    def TessBaseAPICreate(self):
+        self.created += 1
+        return self.created
+
+    def TessBaseAPIInit2(self, handle, datapath, language, oem):
+        self.calls.append(("init", handle, language, oem))
+        return self.init_status
+
+    def TessBaseAPISetPageSegMode(self, handle, psm):
+        self.calls.append(("psm", handle, psm))
+
+    def TessBaseAPISetImage(self, handle, data, width, height, channels, stride):
+        self.calls.append(("image", handle, width, height, channels, stride))
+
+    def TessBaseAPIGetUTF8Text(self, handle):
+        buffer = ctypes.create_string_buffer(b"recognized\n")
+        self._texts.append(buffer)
+        return ctypes.addressof(buffer)
+
+    def TessDeleteText(self, pointer):
+        self.calls.append(("delete_text",))
+
+    def TessBaseAPIAllWordConfidences(self, handle):
+        confidences = (ctypes.c_int * 3)(91, 83, -1)
+        self._texts.append(confidences)
+        return confidences
+
+    def TessDeleteIntArray(self, pointer):
+        self.calls.append(("delete_ints",))
+
+    def TessBaseAPIClear(self, handle):
+        pass
+
+    def TessBaseAPIEnd(self, handle):
+        self.calls.append(("end", handle))
+
+    def TessBaseAPIDelete(self, handle):
+        self.calls.append(("delete", handle))
+
+
+@pytest.fixture
+def fallback_calls(monkeypatch):
+    """Capture pytesseract fallback calls."""
+    calls = []
+
+    def fake_image_to_string(image, config=""):
+        calls.append((image.shape, config))
+        return "fallback\n"
+
+    monkeypatch.setattr(tesseract_engine.pytesseract, "image_to_string", fake_image_to_string)
+    return calls
+
+
+def native_engine(monkeypatch, lib: FakeTessLib) -> TesseractEngine:
+    """Engine bound to a fake library."""
+    monkeypatch.setattr(tesseract_engine, "load_library", lambda path="": lib)
+    return TesseractEngine()
+
+
+class TestTesseractEngine:
+    """Test TesseractEngine."""
+
+    def test_disabled_engine_uses_pytesseract(self, fallback_calls):
+        """Test persistent=False routes through pytesseract with the same config."""
+        engine = TesseractEngine(persistent=False)
+        text = engine.image_to_string(np.zeros((5, 8), dtype=np.uint8), psm=7, oem=1)
+
+        assert not engine.is_native
+        assert text == "fallback\n"
+        assert fallback_calls == [((5, 8), "--oem 1 --psm 7")]
+
+    def test_missing_library_falls_back(self, fallback_calls):
+        """Test an unloadable library path falls back to pytesseract."""
+        engine = TesseractEngine(library_path="/nonexistent/libtesseract.so")
+
+        assert not engine.is_native
+        engine.image_to_string(np.zeros((2, 2), dtype=np.uint8), psm=6)
+        assert len(fallback_calls) == 1
+
+    def test_handle_is_reused_and_psm_switched(self, monkeypatch):
+        """Test one handle serves every PSM mode on a thread."""
+        lib = FakeTessLib()
+        engine = native_engine(monkeypatch, lib)
+        image = np.zeros((10, 20), dtype=np.uint8)
+
+        assert engine.image_to_string(image, psm=6) == "recognized\n"
+        engine.image_to_string(image, psm=11)
+
+        assert lib.created == 1
+        assert [call for call in lib.calls if call[0] == "psm"] == [("psm", 1, 6), ("psm", 1, 11)]
+        assert ("image", 1, 20, 10, 1, 20) in lib.calls
+
+    def test_color_crops_are_passed_in_memory(self, monkeypatch):
+        """Test non-contiguous color crops are passed as packed pixel buffers."""
+        lib = FakeTessLib()
+        engine = native_engine(monkeypatch, lib)
+        crop = np.zeros((30, 40, 3), dtype=np.uint8)[5:15, 10:30]
+
+        engine.image_to_string(crop, psm=7)
+
+        assert ("image", 1, 20, 10, 3, 60) in lib.calls
+
+    def test_one_handle_per_thread(self, monkeypatch):
+        """Test worker threads get their own API handle."""
+        lib = FakeTessLib()
+        engine = native_engine(monkeypatch, lib)
+        image = np.zeros((4, 4), dtype=np.uint8)
+
+        engine.image_to_string(image, psm=6)
+        worker = threading.Thread(target=engine.image_to_string, args=(image, 6))
+        worker.start()
+        worker.join()
+        engine.image_to_string(image, psm=6)
+
+        assert lib.created == 2
+
+    def test_init_failure_falls_back(self, monkeypatch, fallback_calls):
+        """Test missing language data falls back to pytesseract."""
+        lib = FakeTessLib(init_status=-1)
+        engine = native_engine(monkeypatch, lib)
+
+        assert engine.image_to_string(np.zeros((3, 3), dtype=np.uint8), psm=6) == "fallback\n"
+        assert ("delete", 1) in lib.calls
+        assert len(fallback_calls) == 1
+
+    def test_close_releases_handles(self, monkeypatch):
+        """Test close ends and deletes every created handle."""
+        lib = FakeTessLib()
+        engine = native_engine(monkeypatch, lib)
+        engine.image_to_string(np.zeros((3, 3), dtype=np.uint8), psm=6, oem=1)
+        engine.image_to_string(np.zeros((3, 3), dtype=np.uint8), psm=6, oem=3)
+
+        engine.close()
+
+        assert [call for call in lib.calls if call[0] in ("end", "delete")] == [
+            ("end", 1),
+            ("delete", 1),
+            ("end", 2),
+            ("delete", 2),
+        ]
+
+    def test_native_data_reads_word_confidences(self, monkeypatch):
+        """Test image_to_data reads the -1 terminated confidence array and frees it."""
+        lib = FakeTessLib()
+        engine = native_engine(monkeypatch, lib)
+
+        reading = engine.image_to_data(np.zeros((4, 4), dtype=np.uint8), psm=6)
+
+        assert reading.text == "recognized\n"
+        assert reading.word_confidences == [91.0, 83.0]
+        assert reading.mean_confidence == pytest.approx(87.0)
+        assert ("delete_ints",) in lib.calls
+
+    def test_fallback_data_groups_words_into_lines(self):
+        """Test pytesseract word data is rebuilt into lines and paragraphs."""
+        data = {
+            "text": ["", "Deal", "1", "damage", "Reroll", "", "Gain"],
+            "conf": [-1, 95, 90, 85, 70, -1, 60],
+            "block_num": [1, 1, 1, 1, 1, 1, 2],
+            "par_num": [1, 1, 1, 1, 1, 1, 1],
+            "line_num": [0, 1, 1, 1, 2, 2, 1],
+        }
+
+        reading = reading_from_data(data)
+
+        assert reading.text == "Deal 1 damage\nReroll\n\nGain"
+        assert reading.word_confidences == [95.0, 90.0, 85.0, 70.0, 60.0]
+
+    def test_result_cache_key_separates_native_and_fallback(self, monkeypatch, fallback_calls):
+        """Native and pytesseract results are cached under different configs."""
+        configs = []
+
+        def fake_cached_ocr(content_hash, box, strategy, engine_version, config, compute):
+            configs.append(config)
+            return compute()
+
+        monkeypatch.setattr(tesseract_engine, "cached_ocr", fake_cached_ocr)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        for engine in (
+            native_engine(monkeypatch, FakeTessLib()),
+            TesseractEngine(persistent=False),
+        ):
+            monkeypatch.setattr(
+                tesseract_engine, "get_tesseract_engine", lambda engine=engine: engine
+            )
+            tesseract_engine.tesseract_image_to_string(image, psm=6)
+
+        assert configs[0] != configs[1]
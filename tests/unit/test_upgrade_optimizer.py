@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the upgrade path optimizer.
+"""
+
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.models.character import CharacterData, CommonPower
+from scripts.models.character_build import CharacterBuild
+from scripts.models.character_pool import CharacterPool
+from scripts.models.play_strategy import PlayStrategyAnalyzer
+from scripts.models.upgrade_optimizer import (
+    UpgradeObjective,
+    UpgradePathOptimizer,
+    _level_row,
+)
+
+COMMON_POWERS_FILE = Path(__file__).parent.parent.parent / "data" / "common_powers.json"
+
+
+@pytest.fixture(scope="module")
+def power_data():
+    """Common powers from the repository data."""
+    with open(COMMON_POWERS_FILE, encoding="utf-8") as f:
+        return {entry["name"]: CommonPower.from_dict(entry) for entry in json.load(f)}
+
+
+@pytest.fixture(scope="module")
+def pool(power_data):
+    """Pool covering every pair of consecutive common powers."""
+    names = sorted(power_data)
+    characters = [
+        CharacterData(name=f"Tester {i}", common_powers=[names[i], names[(i + 1) % len(names)]])
+        for i in range(len(names))
+    ]
+    return CharacterPool(characters=[CharacterBuild.from_character_data(c) for c in characters])
+
+
+def brute_force(values, level_ups: int) -> float:
+    """Best score over every sequence of level-ups."""
+    best = float("-inf")
+    for sequence in itertools.product(range(3), repeat=level_ups):
+        levels = [1, 1, 1]
+        score = values[0, _level_row((1, 1, 1))]
+        for taken, power in enumerate(sequence, start=1):
+            if levels[power] == 4:
+                break
+            levels[power] += 1
+            score += values[taken, _level_row(tuple(levels))]
+        else:
+            best = max(best, score)
+    return best
+
+
+class TestUpgradePathOptimizer:
+    """Test UpgradePathOptimizer."""
+
+    @pytest.mark.parametrize("objective", list(UpgradeObjective))
+    def test_matches_brute_force(self, pool, power_data, objective):
+        """DP with pruning finds the same optimum as exhaustive search."""
+        optimizer = UpgradePathOptimizer(objective)
+        values = optimizer.phase_values(optimizer.phase_tables(pool, power_data))
+        paths = optimizer.optimize_pool(pool, power_data)
+
+        for index, build in enumerate(pool.characters):
+            block = values[:, index * 64 : (index + 1) * 64]
+            path = paths[build.character_name]
+            assert path.score == pytest.approx(brute_force(block, optimizer.level_ups))
+            assert len(path.steps) == 6
+            assert all(level <= 4 for levels in path.levels for level in levels)
+        assert optimizer.states_pruned > 0
+
+    def test_survival_sheds_black_dice_first(self, power_data):
+        """Survival first upgrades a power whose level 1 adds the only extra black die."""
+        shedding = [
+            name
+            for name, power in power_data.items()
+            if [level.statistics.black_dice_added for level in power.levels][:2] == [1, 0]
+        ]
+        if not shedding:
+            pytest.skip("No common power drops its black die at level 2")
+        character = CharacterData(name="Risky", common_powers=[shedding[0]])
+        build = CharacterBuild.from_character_data(character)
+        path = UpgradePathOptimizer(UpgradeObjective.SURVIVAL).optimize_build(build, power_data)
+
+        assert path.steps[0] == shedding[0]
+
+    def test_starts_from_current_swirl(self, power_data):
+        """Builds past some red swirls only plan the remaining level-ups."""
+        character = CharacterData(name="Late", common_powers=sorted(power_data)[:2])
+        build = CharacterBuild.from_character_data(character, 1, 2, 1)
+        build.insanity_track.current_insanity = 9
+        path = UpgradePathOptimizer().optimize_build(build, power_data)
+
+        assert len(path.steps) == 4
+
+
+class TestPlayStrategyUpgradePath:
+    """Test PlayStrategyAnalyzer upgrade path generation."""
+
+    def test_path_with_power_data(self, pool, power_data):
+        """With power data the analyzer returns one power per red swirl."""
+        build = pool.characters[0]
+        strategy = PlayStrategyAnalyzer(power_data=power_data).analyze(build)
+
+        assert len(strategy.upgrade_path) == 6
+        assert set(strategy.upgrade_path) <= {
+            build.common_power_1_name,
+            build.common_power_2_name,
+            "Special Power",
+        }
+
+    def test_no_power_data(self, pool):
+        """Without power data no path is generated."""
+        assert PlayStrategyAnalyzer().analyze(pool.characters[0]).upgrade_path == []